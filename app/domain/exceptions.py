@@ -0,0 +1,19 @@
+"""
+ドメイン例外
+
+このモジュールは、スクリーニング処理で発生しうる例外を定義します。
+Infrastructure層の実装はこれらを送出（または継承）し、
+Presentation層は具体的な実装に依存せずにHTTPステータスへ変換します。
+"""
+
+
+class ScreeningUnavailableError(RuntimeError):
+    """
+    スクリーニングを一時的に実行できない場合の例外
+
+    外部スコアリングAPIの障害やタイムアウトなど、リトライにより
+    回復しうる失敗を表します。Presentation層では 503 に変換されます。
+    """
+
+
+__all__ = ["ScreeningUnavailableError"]
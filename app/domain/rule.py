@@ -0,0 +1,54 @@
+"""
+スクリーニングルール
+
+このモジュールは、ルールベースのスクリーニングで使用するルールを表す
+イミュータブルな値オブジェクトを定義します。
+フレームワークに依存しない純粋なドメインモデルです。
+"""
+
+from dataclasses import dataclass
+
+from app.domain.screening_result import Verdict
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """
+    語句の出現を検出するスクリーニングルール
+
+    Attributes:
+        id: ルールの識別子（ルールセット内で一意）
+        kind: 検出の種類（Finding.kind として報告される）
+        terms: 検出する語句（全角・半角と大文字・小文字の違いは無視される）
+        verdict: 検出時の判定
+        weight: 検出時のスコアへの寄与（0.0〜1.0）
+        replacement: 検出箇所の置換文字列（書き換えない場合は None）
+
+    Examples:
+        >>> rule = Rule(
+        ...     id="gender-male-only",
+        ...     kind="discriminatory_term",
+        ...     terms=("男性限定", "男性のみ"),
+        ...     verdict=Verdict.BLOCK,
+        ... )
+        >>> rule.terms
+        ('男性限定', '男性のみ')
+    """
+
+    id: str
+    kind: str
+    terms: tuple[str, ...]
+    verdict: Verdict = Verdict.REVIEW
+    weight: float = 0.5
+    replacement: str | None = None
+
+    def __post_init__(self) -> None:
+        if not self.id:
+            raise ValueError("ルールの id は空にできません")
+        if not self.terms or not all(self.terms):
+            raise ValueError(f"ルール {self.id} には空でない語句が必要です")
+        if not 0.0 <= self.weight <= 1.0:
+            raise ValueError(f"ルール {self.id} の weight は 0.0〜1.0 です")
+
+
+__all__ = ["Rule"]
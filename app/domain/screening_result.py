@@ -0,0 +1,158 @@
+"""
+スクリーニング結果の値オブジェクト
+
+このモジュールは、スクリーニング処理の詳細な結果（スコア、判定、検出箇所）を
+表すイミュータブルな値オブジェクトを定義します。
+フレームワークに依存しない純粋なドメインモデルです。
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+
+class Verdict(StrEnum):
+    """
+    スクリーニングの判定
+
+    Attributes:
+        PASS: 問題なし
+        REVIEW: 人による確認が必要
+        BLOCK: 掲載・利用を停止すべき
+    """
+
+    PASS = "pass"
+    REVIEW = "review"
+    BLOCK = "block"
+
+    @property
+    def severity(self) -> int:
+        """
+        判定の重さ（PASS < REVIEW < BLOCK）
+
+        Examples:
+            >>> max([Verdict.REVIEW, Verdict.BLOCK], key=lambda v: v.severity)
+            <Verdict.BLOCK: 'block'>
+        """
+        return _SEVERITY[self]
+
+
+_SEVERITY = {Verdict.PASS: 0, Verdict.REVIEW: 1, Verdict.BLOCK: 2}
+
+
+@dataclass(frozen=True, slots=True)
+class Finding:
+    """
+    スクリーニングで検出された箇所
+
+    Attributes:
+        kind: 検出の種類（例: "email", "discriminatory_term"）
+        start: 入力テキスト内の開始位置（文字オフセット）
+        end: 入力テキスト内の終了位置（文字オフセット、排他的）
+        replacement: 置換後の文字列（書き換えを伴わない場合は None）
+
+    Examples:
+        >>> finding = Finding(kind="email", start=0, end=5, replacement="[EMAIL]")
+        >>> finding.end - finding.start
+        5
+    """
+
+    kind: str
+    start: int
+    end: int
+    replacement: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ScreeningResult:
+    """
+    スクリーニング結果
+
+    Attributes:
+        content: スクリーニング後のテキスト（書き換えがなければ入力と同一）
+        score: リスクスコア（0.0〜1.0、大きいほど問題が大きい）
+        verdict: スクリーニングの判定
+        findings: 検出箇所の一覧（開始位置の昇順）
+        degraded: 障害時の代替の実装（フォールバック）による暫定の結果か。
+            暫定の結果はキャッシュ等に保存せず、回復後に再びスクリーニングする
+
+    Examples:
+        >>> result = ScreeningResult(content="テキスト")
+        >>> result.verdict
+        <Verdict.PASS: 'pass'>
+        >>> result.findings
+        ()
+    """
+
+    content: str
+    score: float = 0.0
+    verdict: Verdict = Verdict.PASS
+    findings: tuple[Finding, ...] = field(default_factory=tuple)
+    degraded: bool = False
+
+
+def applied_replacements(findings: Iterable[Finding]) -> list[Finding]:
+    """
+    テキストに適用される置換を持つ検出箇所を返します
+
+    replacement を持つ検出箇所のうち、それより左の適用済みの箇所と
+    重ならないものを順に選びます（重なり合う場合は開始位置が左のものを優先）。
+    複数の検出器の結果を統合した場合のように、検出箇所は重なることがあります。
+
+    Args:
+        findings: 検出箇所（開始位置の昇順）
+
+    Returns:
+        list[Finding]: 適用される検出箇所（重ならず、開始位置の昇順）
+
+    Examples:
+        >>> applied_replacements([Finding("a", 0, 4, "X"), Finding("b", 2, 6, "Y")])
+        [Finding(kind='a', start=0, end=4, replacement='X')]
+    """
+    applied: list[Finding] = []
+    position = 0
+    for finding in findings:
+        if finding.replacement is None or finding.start < position:
+            continue
+        applied.append(finding)
+        position = finding.end
+    return applied
+
+
+def apply_replacements(content: str, findings: Iterable[Finding]) -> str:
+    """
+    検出箇所の置換をテキストに適用します
+
+    applied_replacements() で選んだ検出箇所を開始位置の順に1回の join で
+    置き換えます。重なり合う検出箇所は、開始位置が左のものを優先します。
+
+    Args:
+        content: 置換前のテキスト
+        findings: 検出箇所（開始位置の昇順）
+
+    Returns:
+        str: 置換後のテキスト（置換がなければ content そのもの）
+
+    Examples:
+        >>> apply_replacements("連絡先 a@b.jp", [Finding("email", 4, 10, "[EMAIL]")])
+        '連絡先 [EMAIL]'
+    """
+    pieces: list[str] = []
+    position = 0
+    for finding in applied_replacements(findings):
+        pieces.append(content[position : finding.start])
+        pieces.append(finding.replacement)
+        position = finding.end
+    if not pieces:
+        return content
+    pieces.append(content[position:])
+    return "".join(pieces)
+
+
+__all__ = [
+    "Finding",
+    "ScreeningResult",
+    "Verdict",
+    "applied_replacements",
+    "apply_replacements",
+]
@@ -5,8 +5,12 @@
 フレームワークに依存しない純粋なビジネスロジックのインターフェースです。
 """
 
+import asyncio
+from collections.abc import Sequence
 from typing import Protocol
 
+from app.domain.screening_result import ScreeningResult
+
 
 class ScreeningService(Protocol):
     """
@@ -36,4 +40,95 @@ class ScreeningService(Protocol):
         ...
 
 
-__all__ = ["ScreeningService"]
+class ScreeningAnalyzer(Protocol):
+    """
+    詳細なスクリーニング結果を返すサービスのインターフェース
+
+    スコアや検出箇所を算出できる実装は、screen() に加えて
+    このProtocolの analyze() を実装します。screen() の戻り値は
+    ``(await analyze(content)).content`` と一致しなければなりません。
+    """
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        スクリーニング処理を実行し、詳細な結果を返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: スコア、判定、検出箇所を含む結果
+        """
+        ...
+
+
+class BatchScreeningAnalyzer(Protocol):
+    """
+    複数コンテンツをまとめてスクリーニングできるサービスのインターフェース
+
+    モデル推論やリモート呼び出しのように、1件ずつよりもまとめて処理した方が
+    1件あたりのコストが小さい実装はこのProtocolを実装します。
+    """
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        """
+        複数コンテンツのスクリーニングを一括で実行します
+
+        Args:
+            contents: スクリーニング対象のテキストの列
+
+        Returns:
+            list[ScreeningResult]: contents と同じ順序の結果
+        """
+        ...
+
+
+async def analyze_content(service: ScreeningService, content: str) -> ScreeningResult:
+    """
+    任意の ScreeningService から詳細なスクリーニング結果を取得します
+
+    サービスが ScreeningAnalyzer を実装していれば analyze() を呼び出し、
+    そうでなければ screen() の結果をスコアなしの ScreeningResult に包みます。
+
+    Args:
+        service: ScreeningService Protocol に準拠する実装
+        content: スクリーニング対象のテキスト
+
+    Returns:
+        ScreeningResult: スクリーニング結果
+    """
+    analyze = getattr(service, "analyze", None)
+    if analyze is not None:
+        return await analyze(content)
+    return ScreeningResult(content=await service.screen(content))
+
+
+async def analyze_many_contents(
+    service: ScreeningService, contents: Sequence[str]
+) -> list[ScreeningResult]:
+    """
+    任意の ScreeningService で複数コンテンツの詳細な結果を取得します
+
+    サービスが BatchScreeningAnalyzer を実装していれば analyze_many() を
+    1回呼び出し、そうでなければ analyze_content() を並行実行します。
+
+    Args:
+        service: ScreeningService Protocol に準拠する実装
+        contents: スクリーニング対象のテキストの列
+
+    Returns:
+        list[ScreeningResult]: contents と同じ順序の結果
+    """
+    analyze_many = getattr(service, "analyze_many", None)
+    if analyze_many is not None:
+        return await analyze_many(contents)
+    return list(await asyncio.gather(*(analyze_content(service, c) for c in contents)))
+
+
+__all__ = [
+    "BatchScreeningAnalyzer",
+    "ScreeningAnalyzer",
+    "ScreeningService",
+    "analyze_content",
+    "analyze_many_contents",
+]
@@ -0,0 +1,43 @@
+"""
+トレーシングのインターフェース定義
+
+このモジュールは、処理の区間（スパン）を記録するトレーサーの契約を
+定義するProtocolを提供します。Application層はこのProtocolにのみ依存し、
+スパンの標本化・伝搬・エクスポートの実装（Infrastructure層）には依存しません。
+"""
+
+from collections.abc import Mapping
+from contextlib import AbstractContextManager
+from typing import Any, Protocol
+
+# スパンの属性値として使える型（OpenTelemetry の属性と同じ）
+AttributeValue = str | bool | int | float
+
+
+class Tracer(Protocol):
+    """
+    スパンを開始するトレーサーのインターフェース
+
+    ``with tracer.start_span(...)`` のブロックが1つのスパンとなり、
+    ブロック内で開始したスパンはその子になります。ブロックから例外が
+    送出された場合は、スパンをエラーとして記録してから再送出します。
+    """
+
+    def start_span(
+        self, name: str, attributes: Mapping[str, AttributeValue] | None = None
+    ) -> AbstractContextManager[Any]:
+        """
+        現在のスパンの子としてスパンを開始します
+
+        Args:
+            name: スパンの名前（例: ``"ScreeningUsecase.analyze"``）
+            attributes: スパンの属性
+
+        Returns:
+            AbstractContextManager: ブロックの間スパンを現在のスパンとする
+            コンテキストマネージャ
+        """
+        ...
+
+
+__all__ = ["AttributeValue", "Tracer"]
@@ -0,0 +1,381 @@
+"""
+メモリマップ可能なスクリーニング成果物（アーティファクト）
+
+このモジュールは、学習済みモデルの重みやコンパイル済みルールのオートマトンを
+ディスクに保存する形式と、それを ``mmap`` で開くローダーを提供します。
+
+成果物は1つのディレクトリで、次のファイルから成ります。
+
+- ``manifest.json``: 種類、形式バージョン、内容のハッシュ（version）、
+  各配列のファイル名・型・要素数・SHA-256、任意のメタデータ
+- ``<name>-<sha256先頭16桁>.bin``: リトルエンディアンの平坦な配列データ
+
+配列ファイルは読み取り専用で ``mmap`` されるため、読み込みはファイルサイズに
+よらず数ミリ秒で完了し、同じ成果物を開いた全ワーカープロセスが
+ページキャッシュ上の1つのコピーを共有します。
+
+同じディレクトリに再ビルドした場合も、配列ファイルは内容ごとに別名で書き込み、
+最後に manifest.json を原子的に置き換えます。既に成果物を開いている
+プロセスは古いファイルのマッピングを使い続けられます。直前のビルドの
+配列ファイルは次の再ビルドまで残すため、置き換えの直前に古い manifest.json を
+読んだプロセスも、その配列ファイルを開けます。
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+import tempfile
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# 成果物の形式バージョン
+FORMAT_VERSION = 1
+# マニフェストのファイル名
+MANIFEST_NAME = "manifest.json"
+
+# 保存できる配列の要素型（struct / memoryview の書式文字）
+_SUPPORTED_FORMATS = frozenset("bBhHiIqQfd")
+# プラットフォームで幅が変わる C の long をサイズ固定の書式に読み替える
+_LONG_FORMATS = {("l", 8): "q", ("L", 8): "Q", ("l", 4): "i", ("L", 4): "I"}
+
+
+class ArtifactError(ValueError):
+    """成果物が見つからない、または破損・不整合がある場合の例外"""
+
+
+@dataclass(frozen=True)
+class ArtifactManifest:
+    """
+    成果物のマニフェスト
+
+    Attributes:
+        kind: 成果物の種類（例: "ruleset", "ngram_model"）
+        version: 配列とメタデータから計算した内容のハッシュ
+        arrays: 配列名からファイル名・型・要素数・SHA-256 への対応
+        metadata: 成果物の種類ごとの任意のメタデータ
+        format_version: 成果物の形式バージョン
+    """
+
+    kind: str
+    version: str
+    arrays: dict[str, dict[str, Any]] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
+    format_version: int = FORMAT_VERSION
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSONに保存する辞書に変換します"""
+        return {
+            "format_version": self.format_version,
+            "kind": self.kind,
+            "version": self.version,
+            "arrays": self.arrays,
+            "metadata": self.metadata,
+        }
+
+
+class Artifact:
+    """
+    mmap で開いた成果物
+
+    配列は読み取り専用の ``memoryview`` として公開され、インデックスアクセスで
+    Python の int / float を返します。NumPy 配列が必要な場合は
+    ``np.frombuffer(artifact.array(name), dtype=...)`` でコピーせずに包めます。
+
+    Attributes:
+        path: 成果物のディレクトリ
+        manifest: 成果物のマニフェスト
+
+    Examples:
+        >>> with open_artifact("artifacts/rules", kind="ruleset") as artifact:
+        ...     char_class = artifact.array("char_class")
+        ...     char_class[0]
+        0
+    """
+
+    def __init__(self, path: Path, manifest: ArtifactManifest) -> None:
+        """
+        Artifact を初期化します（通常は open_artifact() を使用してください）
+
+        Args:
+            path: 成果物のディレクトリ
+            manifest: 読み込み済みのマニフェスト
+        """
+        self.path = path
+        self.manifest = manifest
+        self._maps: list[mmap.mmap] = []
+        self._views: dict[str, memoryview] = {}
+
+    @property
+    def version(self) -> str:
+        """成果物の内容のハッシュ"""
+        return self.manifest.version
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """成果物のメタデータ"""
+        return self.manifest.metadata
+
+    def array(self, name: str) -> memoryview:
+        """
+        配列を読み取り専用の memoryview として返します
+
+        Args:
+            name: 配列名
+
+        Returns:
+            memoryview: mmap された配列（要素型はマニフェストの dtype）
+
+        Raises:
+            ArtifactError: 配列が存在しない場合
+        """
+        view = self._views.get(name)
+        if view is None:
+            entry = self.manifest.arrays.get(name)
+            if entry is None:
+                raise ArtifactError(f"成果物に配列 {name} がありません")
+            view = self._map(entry)
+            self._views[name] = view
+        return view
+
+    def close(self) -> None:
+        """
+        マッピングを解放します
+
+        Note:
+            呼び出し元が配列の参照（NumPy 配列等）を保持している場合、
+            そのマッピングは参照がなくなるまで維持されます。
+        """
+        for view in self._views.values():
+            try:
+                view.release()
+            except BufferError:
+                pass
+        self._views.clear()
+        for mapped in self._maps:
+            try:
+                mapped.close()
+            except BufferError:
+                pass
+        self._maps.clear()
+
+    def __enter__(self) -> "Artifact":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _map(self, entry: dict[str, Any]) -> memoryview:
+        path = self.path / entry["file"]
+        size = entry["length"] * entry["itemsize"]
+        if size == 0:
+            return memoryview(b"").cast(entry["dtype"])
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            raise ArtifactError(f"{path} を開けません: {exc}") from exc
+        if len(mapped) != size:
+            mapped.close()
+            raise ArtifactError(f"{path} のサイズがマニフェストと一致しません")
+        self._maps.append(mapped)
+        return memoryview(mapped).cast(entry["dtype"])
+
+
+def write_artifact(
+    directory: str | Path,
+    kind: str,
+    arrays: Mapping[str, Any],
+    metadata: Mapping[str, Any] | None = None,
+) -> ArtifactManifest:
+    """
+    配列とメタデータを成果物として書き出します
+
+    Args:
+        directory: 出力先ディレクトリ（存在しなければ作成）
+        kind: 成果物の種類
+        arrays: 配列名から配列への対応。``array.array``、C連続の NumPy 配列など
+            バッファプロトコルに対応したオブジェクトを受け付けます。
+        metadata: JSONに変換可能なメタデータ
+
+    Returns:
+        ArtifactManifest: 書き出したマニフェスト
+
+    Raises:
+        ArtifactError: 対応していない要素型の配列が含まれる場合
+    """
+    _require_little_endian()
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    metadata = dict(metadata or {})
+
+    entries: dict[str, dict[str, Any]] = {}
+    for name, values in sorted(arrays.items()):
+        view = memoryview(values)
+        dtype = view.format.lstrip("<=@")
+        dtype = _LONG_FORMATS.get((dtype, view.itemsize), dtype)
+        if dtype not in _SUPPORTED_FORMATS or not view.c_contiguous:
+            raise ArtifactError(f"配列 {name} の形式 {view.format!r} は保存できません")
+        data = view.cast("B")
+        digest = hashlib.sha256(data).hexdigest()
+        filename = f"{name}-{digest[:16]}.bin"
+        _atomic_write(directory / filename, data)
+        entries[name] = {
+            "file": filename,
+            "dtype": dtype,
+            "itemsize": view.itemsize,
+            "length": view.nbytes // view.itemsize,
+            "sha256": digest,
+        }
+
+    previous = _referenced_files(directory)
+    manifest = ArtifactManifest(
+        kind=kind,
+        version=_content_version(kind, entries, metadata),
+        arrays=entries,
+        metadata=metadata,
+    )
+    body = json.dumps(manifest.to_dict(), ensure_ascii=False, indent=2) + "\n"
+    _atomic_write(directory / MANIFEST_NAME, body.encode("utf-8"))
+
+    # 新しいマニフェストにも直前のマニフェストにも参照されない配列ファイルを
+    # 削除する（既に mmap しているプロセスは削除後もマッピングを使い続けられる）
+    referenced = {entry["file"] for entry in entries.values()} | previous
+    for stale in directory.glob("*.bin"):
+        if stale.name not in referenced:
+            stale.unlink(missing_ok=True)
+    return manifest
+
+
+def read_manifest(directory: str | Path) -> ArtifactManifest:
+    """
+    成果物のマニフェストだけを読み込みます
+
+    Args:
+        directory: 成果物のディレクトリ
+
+    Returns:
+        ArtifactManifest: 読み込んだマニフェスト
+
+    Raises:
+        ArtifactError: マニフェストが存在しない、または形式が不正な場合
+    """
+    path = Path(directory) / MANIFEST_NAME
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise ArtifactError(f"{path} を読み込めません: {exc}") from exc
+    if raw.get("format_version") != FORMAT_VERSION:
+        raise ArtifactError(
+            f"{path} の形式バージョン {raw.get('format_version')} には対応していません"
+        )
+    return ArtifactManifest(
+        kind=raw["kind"],
+        version=raw["version"],
+        arrays=raw["arrays"],
+        metadata=raw.get("metadata", {}),
+    )
+
+
+def open_artifact(
+    directory: str | Path, *, kind: str | None = None, verify: bool = False
+) -> Artifact:
+    """
+    成果物を開き、すべての配列を mmap します
+
+    マッピングは開いた時点で確立するため、その後に同じディレクトリへ
+    再ビルドされて古い配列ファイルが削除されても読み続けられます。
+
+    Args:
+        directory: 成果物のディレクトリ
+        kind: 期待する成果物の種類（None なら検査しない）
+        verify: 配列ファイルの SHA-256 を検証するか（全データを読むため、
+            ビルド直後の確認やデプロイ時の検査向け）
+
+    Returns:
+        Artifact: 開いた成果物
+
+    Raises:
+        ArtifactError: 種類が一致しない、または検証に失敗した場合
+    """
+    _require_little_endian()
+    directory = Path(directory)
+    manifest = read_manifest(directory)
+    if kind is not None and manifest.kind != kind:
+        raise ArtifactError(
+            f"{directory} は {manifest.kind} の成果物です（期待: {kind}）"
+        )
+    if verify:
+        for name, entry in manifest.arrays.items():
+            try:
+                digest = hashlib.sha256((directory / entry["file"]).read_bytes())
+            except OSError as exc:
+                raise ArtifactError(f"配列 {name} を読み込めません: {exc}") from exc
+            if digest.hexdigest() != entry["sha256"]:
+                raise ArtifactError(f"配列 {name} のハッシュが一致しません")
+        expected = _content_version(manifest.kind, manifest.arrays, manifest.metadata)
+        if expected != manifest.version:
+            raise ArtifactError(f"{directory} の version が内容と一致しません")
+    artifact = Artifact(directory, manifest)
+    try:
+        for name in manifest.arrays:
+            artifact.array(name)
+    except ArtifactError:
+        artifact.close()
+        raise
+    return artifact
+
+
+def _referenced_files(directory: Path) -> set[str]:
+    """既存のマニフェストが参照する配列ファイル名（読めなければ空）"""
+    try:
+        manifest = read_manifest(directory)
+    except ArtifactError:
+        return set()
+    return {entry["file"] for entry in manifest.arrays.values()}
+
+
+def _content_version(
+    kind: str, entries: Mapping[str, dict[str, Any]], metadata: Mapping[str, Any]
+) -> str:
+    """種類・配列のハッシュ・メタデータから成果物の version を計算する"""
+    payload = {
+        "format_version": FORMAT_VERSION,
+        "kind": kind,
+        "arrays": {name: entry["sha256"] for name, entry in sorted(entries.items())},
+        "metadata": metadata,
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _atomic_write(path: Path, data: bytes | memoryview) -> None:
+    """一時ファイルに書いてから置き換え、読み手が書きかけの内容を見ないようにする"""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _require_little_endian() -> None:
+    if sys.byteorder != "little":
+        raise ArtifactError("成果物はリトルエンディアン環境でのみ利用できます")
+
+
+__all__ = [
+    "Artifact",
+    "ArtifactError",
+    "ArtifactManifest",
+    "FORMAT_VERSION",
+    "MANIFEST_NAME",
+    "open_artifact",
+    "read_manifest",
+    "write_artifact",
+]
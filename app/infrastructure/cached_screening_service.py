@@ -0,0 +1,248 @@
+"""
+結果キャッシュ付きスクリーニングサービス
+
+このモジュールは、任意の ScreeningService をラップしてスクリーニング結果を
+コンテンツハッシュでキャッシュするデコレーター実装を提供します。
+プロセス内のLRUキャッシュ（L1）と、ワーカー間で共有する
+SharedMemoryResultCache（L2）の2段構成で参照します。
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.domain.screening_result import Finding, ScreeningResult, Verdict
+from app.domain.screening_service import ScreeningService, analyze_content
+from app.infrastructure.service_lifecycle import (
+    close_service,
+    reload_service,
+    start_service,
+    stop_service,
+)
+from app.infrastructure.shared_memory_cache import KEY_SIZE, SharedMemoryResultCache
+
+
+@dataclass
+class CacheStats:
+    """
+    キャッシュのヒット統計
+
+    Attributes:
+        l1_hits: プロセス内キャッシュのヒット数
+        l2_hits: 共有メモリキャッシュのヒット数
+        misses: 下位サービスを呼び出した回数
+    """
+
+    l1_hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+
+
+class CachedScreeningService:
+    """
+    結果キャッシュ付きスクリーニングサービス
+
+    ScreeningService / ScreeningAnalyzer Protocol に構造的部分型付けにより
+    準拠し、ScreeningUsecase からは通常のサービスと同様に利用できます。
+    キャッシュには詳細な ScreeningResult を格納するため、screen() と
+    analyze() のどちらの呼び出しでも同じエントリを共有します。
+    スクリーニングは副作用のない純粋関数であるため、同一コンテンツの
+    結果は安全に再利用できます。
+
+    Attributes:
+        stats: キャッシュのヒット統計
+
+    Examples:
+        >>> from app.infrastructure.screening_service_impl import (
+        ...     EchoScreeningService,
+        ... )
+        >>> service = CachedScreeningService(EchoScreeningService(), l1_size=128)
+        >>> await service.screen("テスト")
+        'テスト'
+        >>> service.stats.misses
+        1
+    """
+
+    def __init__(
+        self,
+        service: ScreeningService,
+        *,
+        l1_size: int = 1024,
+        l2: SharedMemoryResultCache | None = None,
+        namespace: str = "",
+    ) -> None:
+        """
+        CachedScreeningService を初期化します
+
+        Args:
+            service: キャッシュ対象の ScreeningService 実装
+            l1_size: プロセス内LRUキャッシュの最大エントリ数（0 で無効）
+            l2: ワーカー間で共有する共有メモリキャッシュ（None で無効）
+            namespace: キャッシュキーに含める名前空間（ルールセットの
+                バージョン等。変更すると既存エントリは参照されなくなる）
+
+        Note:
+            reload() で下位サービスが新しいバージョンに差し替わった場合は、
+            名前空間をそのバージョンに切り替えます。
+        """
+        self._service = service
+        self._l1: OrderedDict[bytes, ScreeningResult] = OrderedDict()
+        self._l1_size = l1_size
+        self._l2 = l2
+        self._key_prefix = namespace.encode("utf-8") + b"\0"
+        self.stats = CacheStats()
+
+    async def screen(self, content: str) -> str:
+        """
+        キャッシュを参照し、ミスした場合のみ下位サービスでスクリーニングします
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            スクリーニング結果のテキスト
+        """
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        キャッシュを参照し、ミスした場合のみ下位サービスで詳細な結果を取得します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: スクリーニング結果
+        """
+        key = self.cache_key(content)
+
+        cached = self._l1.get(key)
+        if cached is not None:
+            self._l1.move_to_end(key)
+            self.stats.l1_hits += 1
+            return cached
+
+        if self._l2 is not None:
+            raw = self._l2.get(key)
+            if raw is not None:
+                self.stats.l2_hits += 1
+                result = decode_result(raw)
+                self._store_l1(key, result)
+                return result
+
+        self.stats.misses += 1
+        key_prefix = self._key_prefix
+        result = await analyze_content(self._service, content)
+        if key_prefix is not self._key_prefix or result.degraded:
+            # 待っている間にバージョンが切り替わった結果は古いキーに格納しない。
+            # 障害時のフォールバックの結果も回復後に返さないよう格納しない
+            return result
+        self._store_l1(key, result)
+        if self._l2 is not None:
+            self._l2.put(key, encode_result(result))
+        return result
+
+    def cache_key(self, content: str) -> bytes:
+        """
+        コンテンツから 16 バイトのキャッシュキーを計算します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            bytes: 名前空間とコンテンツの blake2b ダイジェスト
+        """
+        digest = hashlib.blake2b(self._key_prefix, digest_size=KEY_SIZE)
+        digest.update(content.encode("utf-8", errors="surrogatepass"))
+        return digest.digest()
+
+    async def start(self) -> None:
+        """下位サービスの start() フックを転送します"""
+        await start_service(self._service)
+
+    async def aclose(self) -> None:
+        """下位サービスの aclose() フックを転送します"""
+        await stop_service(self._service)
+
+    def close(self) -> None:
+        """共有メモリキャッシュと下位サービスのリソースを解放します"""
+        if self._l2 is not None:
+            self._l2.close()
+        close_service(self._service)
+
+    async def reload(self, *, force: bool = False) -> str | None:
+        """
+        下位サービスの reload() フックを転送し、差し替わった場合は名前空間を切り替えます
+
+        キャッシュキーに新しいバージョンを含めるため、古いバージョンの結果は
+        L1・L2 とも参照されなくなります。L1 は差し替え時に空にします。
+        L2 は他のワーカーと共有しているため消去せず、古いエントリは
+        新しい結果で順に上書きされます。
+
+        Args:
+            force: 入力の更新を確認せずに再読み込みするか
+
+        Returns:
+            str | None: 差し替えた場合は新しいバージョン
+        """
+        version = await reload_service(self._service, force=force)
+        if version is not None:
+            self._key_prefix = version.encode("utf-8") + b"\0"
+            self._l1.clear()
+        return version
+
+    def _store_l1(self, key: bytes, result: ScreeningResult) -> None:
+        if self._l1_size <= 0:
+            return
+        self._l1[key] = result
+        self._l1.move_to_end(key)
+        if len(self._l1) > self._l1_size:
+            self._l1.popitem(last=False)
+
+
+def encode_result(result: ScreeningResult) -> bytes:
+    """
+    ScreeningResult をコンパクトなJSONバイト列に変換します
+
+    共有メモリキャッシュや結果ストアに格納する形式です。孤立サロゲートを
+    含むテキストは UTF-8 に符号化できないため、ASCII のエスケープで出力します。
+
+    Args:
+        result: 変換するスクリーニング結果
+
+    Returns:
+        bytes: UTF-8 のJSONバイト列
+    """
+    payload = [
+        result.content,
+        result.score,
+        result.verdict.value,
+        [[f.kind, f.start, f.end, f.replacement] for f in result.findings],
+    ]
+    try:
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+    except UnicodeEncodeError:
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def decode_result(raw: bytes | str) -> ScreeningResult:
+    """
+    encode_result() で変換したJSONを ScreeningResult に復元します
+
+    Args:
+        raw: encode_result() の出力（またはそれを復号した文字列）
+
+    Returns:
+        ScreeningResult: 復元したスクリーニング結果
+    """
+    content, score, verdict, findings = json.loads(raw)
+    return ScreeningResult(
+        content=content,
+        score=score,
+        verdict=Verdict(verdict),
+        findings=tuple(Finding(*finding) for finding in findings),
+    )
+
+
+__all__ = ["CacheStats", "CachedScreeningService", "decode_result", "encode_result"]
@@ -0,0 +1,353 @@
+"""
+サーキットブレーカー付きスクリーニングサービス
+
+このモジュールは、任意の ScreeningService をラップし、下位サービスの
+エラー率（遅すぎる呼び出しを含む）がしきい値を超えた場合に呼び出しを
+遮断するデコレーター実装を提供します。遮断中はタイムアウトまで待たずに
+即座に失敗するか、より安価なローカル実装（フォールバック）で応答します。
+
+状態遷移:
+    CLOSED --(失敗率 >= しきい値)--> OPEN
+    OPEN --(reset_timeout 経過)--> HALF_OPEN
+    HALF_OPEN --(試行が成功)--> CLOSED
+    HALF_OPEN --(試行が失敗)--> OPEN
+"""
+
+import dataclasses
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TypeVar
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.domain.screening_result import ScreeningResult
+from app.domain.screening_service import (
+    ScreeningService,
+    analyze_content,
+    analyze_many_contents,
+)
+from app.infrastructure.service_lifecycle import (
+    close_service,
+    reload_service,
+    start_service,
+    stop_service,
+)
+
+T = TypeVar("T")
+
+
+class CircuitState(StrEnum):
+    """
+    サーキットブレーカーの状態
+
+    Attributes:
+        CLOSED: 通常どおり下位サービスを呼び出す
+        OPEN: 下位サービスを呼び出さずに即座に失敗（またはフォールバック）する
+        HALF_OPEN: 回復を確認するため限られた数の試行を通す
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ScreeningUnavailableError):
+    """サーキットが開いているため呼び出しを遮断した場合の例外"""
+
+
+@dataclass
+class CircuitBreakerStats:
+    """
+    サーキットブレーカーの統計
+
+    Attributes:
+        calls: 下位サービスを呼び出した回数
+        failures: 例外で失敗した回数
+        slow_calls: slow_call_threshold を超えた回数
+        rejected: 遮断により下位サービスを呼び出さなかった回数
+        fallbacks: フォールバック実装で応答した回数
+        opened: サーキットが開いた回数
+    """
+
+    calls: int = 0
+    failures: int = 0
+    slow_calls: int = 0
+    rejected: int = 0
+    fallbacks: int = 0
+    opened: int = 0
+
+
+class CircuitBreakerScreeningService:
+    """
+    サーキットブレーカー付きスクリーニングサービス
+
+    ScreeningService / ScreeningAnalyzer / BatchScreeningAnalyzer Protocol に
+    構造的部分型付けにより準拠します。直近 window 回の呼び出しのうち、
+    例外または slow_call_threshold を超えた呼び出しの割合が
+    failure_rate_threshold 以上になるとサーキットを開きます。
+
+    Attributes:
+        stats: 呼び出しと遮断の統計
+
+    Examples:
+        >>> service = CircuitBreakerScreeningService(
+        ...     remote_service,
+        ...     fallback=EchoScreeningService(),
+        ...     failure_rate_threshold=0.5,
+        ...     slow_call_threshold=0.5,
+        ... )
+        >>> await service.screen("テキスト")
+        'テキスト'
+        >>> service.state
+        <CircuitState.CLOSED: 'closed'>
+
+    Note:
+        フォールバックを指定しない場合、遮断中の呼び出しは CircuitOpenError
+        （ScreeningUnavailableError のサブクラス）を送出し、API は 503 を返します。
+    """
+
+    def __init__(
+        self,
+        service: ScreeningService,
+        *,
+        fallback: ScreeningService | None = None,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: float | None = None,
+        window: int = 20,
+        min_calls: int = 10,
+        reset_timeout: float = 5.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        CircuitBreakerScreeningService を初期化します
+
+        Args:
+            service: 保護する下位サービス
+            fallback: 遮断中および失敗時に使用するローカル実装（None で即座に失敗）
+            failure_rate_threshold: サーキットを開く失敗率（0.0〜1.0）
+            slow_call_threshold: これを超えた呼び出しを失敗とみなす秒数
+                （None なら遅延は失敗とみなさない）
+            window: 失敗率を計算する直近の呼び出し数
+            min_calls: 失敗率を評価し始める最小の呼び出し数
+            reset_timeout: OPEN から HALF_OPEN に移るまでの秒数
+            half_open_max_calls: HALF_OPEN で同時に通す試行の数
+            clock: 単調増加する時刻を返す関数（テスト用）
+
+        Raises:
+            ValueError: しきい値や件数が範囲外の場合
+        """
+        if not 0.0 < failure_rate_threshold <= 1.0:
+            raise ValueError("failure_rate_threshold は 0 より大きく 1 以下です")
+        if window < 1 or not 1 <= min_calls <= window:
+            raise ValueError("min_calls は 1 以上 window 以下である必要があります")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls は 1 以上である必要があります")
+        self._service = service
+        self._fallback = fallback
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_threshold = slow_call_threshold
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._min_calls = min_calls
+        self._reset_timeout = reset_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self.stats = CircuitBreakerStats()
+
+    @property
+    def state(self) -> CircuitState:
+        """現在の状態（reset_timeout が経過していれば HALF_OPEN）"""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_in_flight = 0
+        return self._state
+
+    async def screen(self, content: str) -> str:
+        """
+        サーキットが閉じていれば下位サービスでスクリーニングします
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            スクリーニング結果のテキスト
+
+        Raises:
+            CircuitOpenError: 遮断中でフォールバックがない場合
+        """
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        サーキットが閉じていれば下位サービスで詳細な結果を取得します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: スクリーニング結果
+
+        Raises:
+            CircuitOpenError: 遮断中でフォールバックがない場合
+        """
+        return await self._call(
+            lambda service: analyze_content(service, content),
+            _mark_degraded,
+        )
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        """
+        バッチ全体を1回の呼び出しとして保護し、詳細な結果を取得します
+
+        Args:
+            contents: スクリーニング対象のテキストの列
+
+        Returns:
+            list[ScreeningResult]: contents と同じ順序の結果
+
+        Raises:
+            CircuitOpenError: 遮断中でフォールバックがない場合
+        """
+        return await self._call(
+            lambda service: analyze_many_contents(service, contents),
+            _mark_all_degraded,
+        )
+
+    async def start(self) -> None:
+        """下位サービスとフォールバックの start() フックを転送します"""
+        await start_service(self._service)
+        if self._fallback is not None:
+            await start_service(self._fallback)
+
+    async def aclose(self) -> None:
+        """下位サービスとフォールバックの aclose() フックを転送します"""
+        await stop_service(self._service)
+        if self._fallback is not None:
+            await stop_service(self._fallback)
+
+    def close(self) -> None:
+        """下位サービスとフォールバックの close() フックを転送します"""
+        close_service(self._service)
+        if self._fallback is not None:
+            close_service(self._fallback)
+
+    async def reload(self, *, force: bool = False) -> str | None:
+        """下位サービスの reload() フックを転送します"""
+        return await reload_service(self._service, force=force)
+
+    async def _call(
+        self,
+        call: Callable[[ScreeningService], Awaitable[T]],
+        degrade: Callable[[T], T],
+    ) -> T:
+        """
+        状態に応じて下位サービスまたはフォールバックを呼び出す
+
+        フォールバックの結果は degrade で暫定の結果として印を付ける。
+        """
+        if not self._acquire():
+            self.stats.rejected += 1
+            return await self._fall_back(
+                call, degrade, CircuitOpenError("サーキットが開いています")
+            )
+
+        self.stats.calls += 1
+        started = self._clock()
+        try:
+            result = await call(self._service)
+        except Exception as exc:
+            self.stats.failures += 1
+            self._record(failed=True)
+            return await self._fall_back(call, degrade, exc)
+        except BaseException:
+            # キャンセルされた呼び出しは成否を評価せず、試行の実行枠だけを返す
+            self._release()
+            raise
+
+        slow = (
+            self._slow_call_threshold is not None
+            and self._clock() - started > self._slow_call_threshold
+        )
+        if slow:
+            self.stats.slow_calls += 1
+        self._record(failed=slow)
+        return result
+
+    async def _fall_back(
+        self,
+        call: Callable[[ScreeningService], Awaitable[T]],
+        degrade: Callable[[T], T],
+        exc: Exception,
+    ) -> T:
+        if self._fallback is None:
+            raise exc
+        self.stats.fallbacks += 1
+        return degrade(await call(self._fallback))
+
+    def _acquire(self) -> bool:
+        """呼び出しを通してよいかを判定する"""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN:
+            if self._half_open_in_flight < self._half_open_max_calls:
+                self._half_open_in_flight += 1
+                return True
+        return False
+
+    def _release(self) -> None:
+        """結果を記録せずに HALF_OPEN の試行の実行枠を返す"""
+        if self._state is CircuitState.HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def _record(self, *, failed: bool) -> None:
+        """呼び出し結果を記録し、必要に応じて状態を遷移させる"""
+        if self._state is CircuitState.HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+            if failed:
+                self._open()
+            else:
+                self._state = CircuitState.CLOSED
+                self._outcomes.clear()
+            return
+        if self._state is CircuitState.OPEN:
+            # 開く前に開始した呼び出しの結果は評価しない
+            return
+
+        self._outcomes.append(failed)
+        if len(self._outcomes) >= self._min_calls:
+            failure_rate = sum(self._outcomes) / len(self._outcomes)
+            if failure_rate >= self._failure_rate_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        self.stats.opened += 1
+
+
+def _mark_degraded(result: ScreeningResult) -> ScreeningResult:
+    """フォールバックの結果を暫定の結果（degraded）として印を付ける"""
+    return dataclasses.replace(result, degraded=True)
+
+
+def _mark_all_degraded(results: list[ScreeningResult]) -> list[ScreeningResult]:
+    """フォールバックのバッチの結果をすべて暫定の結果として印を付ける"""
+    return [_mark_degraded(result) for result in results]
+
+
+__all__ = [
+    "CircuitBreakerScreeningService",
+    "CircuitBreakerStats",
+    "CircuitOpenError",
+    "CircuitState",
+]
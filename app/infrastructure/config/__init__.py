@@ -0,0 +1,9 @@
+"""
+設定管理パッケージ
+
+このパッケージは、環境変数から読み込むアプリケーション設定を提供します。
+"""
+
+from app.infrastructure.config.settings import Settings, get_settings
+
+__all__ = ["Settings", "get_settings"]
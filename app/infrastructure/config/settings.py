@@ -0,0 +1,319 @@
+"""
+アプリケーション設定
+
+このモジュールは、pydantic-settings を使用して環境変数から
+型安全に設定を読み込みます。環境変数名は ``SCREENING_`` を接頭辞とし、
+フィールド名を大文字にしたものです（例: ``SCREENING_WORKERS``）。
+"""
+
+import os
+from functools import lru_cache
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# スクリーニングの実装の名前（screening_backend 等で指定する）
+ScreeningBackend = Literal["echo", "remote", "ngram", "rules", "pii"]
+
+
+class Settings(BaseSettings):
+    """
+    アプリケーション設定
+
+    Attributes:
+        host: サーバーのバインドアドレス
+        port: サーバーのリッスンポート
+        workers: フォークするワーカープロセス数
+        backlog: listen ソケットの接続待ちキュー長
+        timeout_keep_alive: Keep-Alive 接続のアイドルタイムアウト（秒）
+        limit_concurrency: ワーカーあたりの同時接続・タスク上限（超過時は 503）
+        timeout_graceful_shutdown: グレースフルシャットダウンの待機上限（秒）
+        cache_size: プロセス内結果キャッシュ（L1）の最大エントリ数（0 で無効）
+        shared_cache_capacity: ワーカー間共有結果キャッシュ（L2）の
+            最大エントリ数（0 で無効）
+        shared_cache_slot_size: 共有結果キャッシュの1エントリのバイト数
+        near_duplicate_capacity: 近似重複の索引に登録する最大件数（0 で無効）
+        near_duplicate_threshold: 近似重複とみなす推定 Jaccard 類似度の下限
+        near_duplicate_window: 近似重複の索引に登録を保持する秒数
+        batch_max_size: マイクロバッチの最大件数（0 でバッチ化しない）
+        batch_max_wait_ms: マイクロバッチで最初の1件を待たせる最大時間（ミリ秒）
+        screening_backend: スクリーニングの実装
+            （"echo"、"remote"、"ngram"、"rules" または "pii"）
+        ngram_model_path: n-gram線形モデル（``.npz`` または成果物ディレクトリ）のパス
+        ngram_review_threshold: n-gram モデルの REVIEW のしきい値
+            （None ならモデルの値）
+        ngram_block_threshold: n-gram モデルの BLOCK のしきい値
+            （None ならモデルの値）
+        rules_artifact_path: ルールセット成果物のディレクトリ
+        rules_source_path: ルールソース（JSON）のパス（指定した場合は成果物の
+            代わりに起動時・再読み込み時にコンパイル）
+        rules_reload_interval: ルールセットの更新を確認する間隔（秒、0 で無効）
+        pipeline_detectors: パイプラインの検出器に使う実装の並び
+            （空ならパイプラインを使わない。先頭は単独で実行し、BLOCK で
+            以降を打ち切る。2番目以降は並行に実行する）
+        ensemble_backends: アンサンブルで並行に呼び出す実装の並び
+            （空ならアンサンブルを使わない。screening_backend より優先）
+        ensemble_strategy: アンサンブルの判定の統合方法
+            （max: 最も重い判定、vote: 重み付き多数決）
+        ensemble_timeout_ms: アンサンブルの各実装の持ち時間（ミリ秒、0 で無制限）
+        remote_base_url: 外部スコアリングAPIのベースURL
+        remote_timeout: 外部スコアリングAPIのタイムアウト（秒）
+        remote_max_connections: コネクションプールの最大接続数
+        remote_max_keepalive_connections: Keep-Alive で保持する最大接続数
+        remote_keepalive_expiry: アイドル接続を保持する秒数
+        remote_http2: HTTP/2 を使用するか（h2 がある場合のみ有効）
+        breaker_enabled: サーキットブレーカーを有効にするか
+        breaker_failure_rate: サーキットを開く失敗率（0.0〜1.0）
+        breaker_slow_call_ms: これを超えた呼び出しを失敗とみなすミリ秒
+            （None なら遅延は失敗とみなさない）
+        breaker_window: 失敗率を計算する直近の呼び出し数
+        breaker_min_calls: 失敗率を評価し始める最小の呼び出し数
+        breaker_reset_timeout: サーキットを開いてから試行を再開するまでの秒数
+        breaker_fallback: 遮断中に使うローカル実装（"none" なら 503 を返す）
+        hedge_enabled: ヘッジリクエストを有効にするか
+        hedge_quantile: ヘッジ遅延に使うレイテンシのパーセンタイル
+        hedge_initial_delay_ms: レイテンシのサンプルが揃うまでのヘッジ遅延
+        stream_chunk_size: ストリーミングで1回にスクリーニングする最大文字数
+        stream_heartbeat_interval: ストリーミングのハートビート間隔（秒、0 で無効）
+        websocket_max_in_flight: WebSocket の1接続で同時に処理するメッセージ数
+        rate_limit_per_second: クライアントごとに毎秒補充するリクエスト数
+            （0 でレート制限を無効化）
+        rate_limit_burst: クライアントごとに連続して許可するリクエスト数
+        rate_limit_max_clients: レート制限の状態を保持するクライアント数の上限
+        rate_limit_key_header: クライアントを識別するAPIキーのヘッダー名
+            （テナントに登録されたキーの場合のみ使用し、それ以外は
+            接続元のIPアドレスで識別）
+        scheduler_max_concurrency: 同時に実行するスクリーニング数の上限
+            （0 で優先度スケジューラーを無効化）
+        scheduler_interactive_weight: interactive レーンの重み
+        scheduler_bulk_weight: bulk レーンの重み
+        tenants_config_path: テナントごとの設定ファイル（JSON）のパス
+            （None ならテナントを使用しない）
+        tenant_cache_size: 遅延構築したテナントのサービスを保持する数
+        tenant_idle_timeout: 使われていないテナントのサービスを解放するまでの秒数
+        tenant_header: テナントIDを指定するヘッダー名
+        tenant_api_key_header: テナントを識別するAPIキーのヘッダー名
+        admin_token: 管理用エンドポイントの認証トークン
+            （None なら管理用エンドポイントを無効化）
+        tracing_exporter: スパンの書き出し先
+            （"none" でトレーシングを無効化、"console" は標準出力、
+            "file" は tracing_file_path の JSON Lines）
+        tracing_file_path: スパンを追記するファイルのパス
+        tracing_sample_ratio: 新しいトレースを標本化する割合（0.0〜1.0。
+            traceparent で受け取ったトレースは送信元の判定に従う）
+        tracing_service_name: スパンのリソースの service.name
+        tracing_max_queue_size: 書き出し待ちのスパンの上限（超えた分は捨てる）
+        tracing_schedule_delay: スパンをまとめて書き出す間隔（秒）
+
+    Examples:
+        >>> settings = Settings(workers=4)
+        >>> settings.workers
+        4
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="SCREENING_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    host: str = Field(default="0.0.0.0", description="バインドアドレス")
+    port: int = Field(default=8000, ge=0, le=65535, description="リッスンポート")
+    workers: int = Field(
+        default_factory=lambda: os.cpu_count() or 1,
+        ge=1,
+        description="ワーカープロセス数（デフォルト: CPUコア数）",
+    )
+    backlog: int = Field(default=2048, ge=1, description="接続待ちキュー長")
+    timeout_keep_alive: int = Field(
+        default=5, ge=0, description="Keep-Alive タイムアウト（秒）"
+    )
+    limit_concurrency: int | None = Field(
+        default=None, ge=1, description="ワーカーあたりの同時実行上限"
+    )
+    timeout_graceful_shutdown: int | None = Field(
+        default=30, ge=0, description="グレースフルシャットダウン待機上限（秒）"
+    )
+    cache_size: int = Field(
+        default=1024, ge=0, description="プロセス内結果キャッシュのエントリ数"
+    )
+    shared_cache_capacity: int = Field(
+        default=0, ge=0, description="ワーカー間共有結果キャッシュのエントリ数"
+    )
+    shared_cache_slot_size: int = Field(
+        default=4096, ge=64, description="共有結果キャッシュのスロットサイズ"
+    )
+    near_duplicate_capacity: int = Field(
+        default=0, ge=0, description="近似重複の索引の件数（0 で無効）"
+    )
+    near_duplicate_threshold: float = Field(
+        default=0.9, gt=0, le=1, description="近似重複の類似度の下限"
+    )
+    near_duplicate_window: float = Field(
+        default=600.0, gt=0, description="近似重複の索引の保持秒数"
+    )
+    batch_max_size: int = Field(
+        default=0, ge=0, description="マイクロバッチの最大件数（0 で無効）"
+    )
+    batch_max_wait_ms: float = Field(
+        default=2.0, ge=0, description="マイクロバッチの最大待ち時間（ミリ秒）"
+    )
+    screening_backend: ScreeningBackend = Field(
+        default="echo", description="スクリーニングの実装"
+    )
+    ngram_model_path: str | None = Field(
+        default=None, description="n-gram線形モデルのパス"
+    )
+    ngram_review_threshold: float | None = Field(
+        default=None, ge=0.0, le=1.0, description="n-gram の REVIEW しきい値"
+    )
+    ngram_block_threshold: float | None = Field(
+        default=None, ge=0.0, le=1.0, description="n-gram の BLOCK しきい値"
+    )
+    rules_artifact_path: str | None = Field(
+        default=None, description="ルールセット成果物のディレクトリ"
+    )
+    rules_source_path: str | None = Field(
+        default=None, description="ルールソース（JSON）のパス"
+    )
+    rules_reload_interval: float = Field(
+        default=0.0, ge=0, description="ルールセットの更新確認間隔（秒、0で無効）"
+    )
+    pipeline_detectors: list[ScreeningBackend] = Field(
+        default_factory=list, description="パイプラインの検出器の並び"
+    )
+    ensemble_backends: list[ScreeningBackend] = Field(
+        default_factory=list, description="アンサンブルで並行に呼び出す実装の並び"
+    )
+    ensemble_strategy: Literal["max", "vote"] = Field(
+        default="max", description="アンサンブルの判定の統合方法"
+    )
+    ensemble_timeout_ms: float = Field(
+        default=200.0, ge=0, description="アンサンブルの各実装の持ち時間（ミリ秒）"
+    )
+    remote_base_url: str = Field(
+        default="http://127.0.0.1:9000", description="スコアリングAPIのURL"
+    )
+    remote_timeout: float = Field(default=2.0, gt=0, description="タイムアウト（秒）")
+    remote_max_connections: int = Field(default=100, ge=1, description="最大接続数")
+    remote_max_keepalive_connections: int = Field(
+        default=20, ge=0, description="Keep-Alive で保持する最大接続数"
+    )
+    remote_keepalive_expiry: float = Field(
+        default=30.0, ge=0, description="アイドル接続の保持秒数"
+    )
+    remote_http2: bool = Field(default=True, description="HTTP/2 を使用するか")
+    breaker_enabled: bool = Field(
+        default=False, description="サーキットブレーカーを有効にするか"
+    )
+    breaker_failure_rate: float = Field(
+        default=0.5, gt=0, le=1, description="サーキットを開く失敗率"
+    )
+    breaker_slow_call_ms: float | None = Field(
+        default=None, gt=0, description="失敗とみなす呼び出し時間（ミリ秒）"
+    )
+    breaker_window: int = Field(default=20, ge=1, description="失敗率の評価窓")
+    breaker_min_calls: int = Field(
+        default=10, ge=1, description="失敗率を評価する最小呼び出し数"
+    )
+    breaker_reset_timeout: float = Field(
+        default=5.0, ge=0, description="試行を再開するまでの秒数"
+    )
+    breaker_fallback: Literal["none", "echo"] = Field(
+        default="none", description="遮断中に使うローカル実装"
+    )
+    hedge_enabled: bool = Field(
+        default=False, description="ヘッジリクエストを有効にするか"
+    )
+    hedge_quantile: float = Field(
+        default=0.95, gt=0, lt=1, description="ヘッジ遅延のパーセンタイル"
+    )
+    hedge_initial_delay_ms: float = Field(
+        default=50.0, ge=0, description="サンプルが揃うまでのヘッジ遅延（ミリ秒）"
+    )
+    stream_chunk_size: int = Field(
+        default=8192, ge=1, description="ストリーミングのチャンクの最大文字数"
+    )
+    stream_heartbeat_interval: float = Field(
+        default=15.0, ge=0, description="ストリーミングのハートビート間隔（秒）"
+    )
+    websocket_max_in_flight: int = Field(
+        default=32, ge=1, description="WebSocket の1接続あたりの同時処理数"
+    )
+    rate_limit_per_second: float = Field(
+        default=0.0, ge=0, description="クライアントごとのレート制限（毎秒、0で無効）"
+    )
+    rate_limit_burst: int = Field(
+        default=20, ge=1, description="クライアントごとのバースト許容数"
+    )
+    rate_limit_max_clients: int = Field(
+        default=100_000, ge=1, description="レート制限の状態を保持するクライアント数"
+    )
+    rate_limit_key_header: str = Field(
+        default="X-API-Key", description="クライアントを識別するAPIキーのヘッダー"
+    )
+    scheduler_max_concurrency: int = Field(
+        default=0, ge=0, description="同時に実行するスクリーニング数（0で無効）"
+    )
+    scheduler_interactive_weight: float = Field(
+        default=8.0, gt=0, description="interactive レーンの重み"
+    )
+    scheduler_bulk_weight: float = Field(
+        default=1.0, gt=0, description="bulk レーンの重み"
+    )
+    tenants_config_path: str | None = Field(
+        default=None, description="テナントごとの設定ファイルのパス"
+    )
+    tenant_cache_size: int = Field(
+        default=16, ge=1, description="保持するテナントのサービス数"
+    )
+    tenant_idle_timeout: float = Field(
+        default=600.0, gt=0, description="テナントのサービスを解放する待ち時間（秒）"
+    )
+    tenant_header: str = Field(
+        default="X-Tenant-ID", description="テナントIDを指定するヘッダー"
+    )
+    tenant_api_key_header: str = Field(
+        default="X-API-Key", description="テナントを識別するAPIキーのヘッダー"
+    )
+    admin_token: str | None = Field(
+        default=None, description="管理用エンドポイントの認証トークン"
+    )
+    tracing_exporter: Literal["none", "console", "file"] = Field(
+        default="none", description="スパンの書き出し先（none で無効）"
+    )
+    tracing_file_path: str = Field(
+        default="traces.jsonl", description="スパンを追記するファイルのパス"
+    )
+    tracing_sample_ratio: float = Field(
+        default=1.0, ge=0.0, le=1.0, description="新しいトレースを標本化する割合"
+    )
+    tracing_service_name: str = Field(
+        default="screening-api", description="スパンのリソースの service.name"
+    )
+    tracing_max_queue_size: int = Field(
+        default=2048, ge=1, description="書き出し待ちのスパンの上限"
+    )
+    tracing_schedule_delay: float = Field(
+        default=5.0, gt=0, description="スパンをまとめて書き出す間隔（秒）"
+    )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    プロセス内で共有する Settings インスタンスを返します
+
+    Returns:
+        Settings: 環境変数から読み込んだ設定
+
+    Note:
+        結果はキャッシュされます。テストで環境変数を変更した場合は
+        ``get_settings.cache_clear()`` を呼び出してください。
+    """
+    return Settings()
+
+
+__all__ = ["ScreeningBackend", "Settings", "get_settings"]
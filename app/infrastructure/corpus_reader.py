@@ -0,0 +1,156 @@
+"""
+mmap によるコーパスの読み込み
+
+このモジュールは、JSONL / CSV の入力ファイルを mmap で開き、レコードの
+終了位置の索引を作るリーダーを提供します。一括スクリーニングの親プロセスは
+索引からバイト範囲だけをワーカーに渡し、各ワーカーは同じファイルを mmap で
+開いて範囲を直接読みます。ファイルの内容はページキャッシュを共有し、
+プロセス間で文字列をシリアライズしません。
+
+- 索引は改行の位置の一括走査で作ります。NumPy があれば 64MiB ごとの
+  ブロックをベクトル化して比較し、なければ ``mmap.find`` で探します。
+- CSV は引用符の数の偶奇を累積し、引用符の外の改行だけを境界とします
+  （引用符内の改行を含むレコードを分割しません）。
+- ``view()`` はマッピングの memoryview を返します（コピーしません）。
+  テキストへの復号はレコードを解析するときに行います。
+
+NumPy は任意依存です（``uv sync --extra ngram``）。
+"""
+
+import mmap
+from array import array
+from pathlib import Path
+from typing import Literal
+
+CorpusFormat = Literal["jsonl", "csv"]
+
+# NumPy で一度に比較するバイト数（比較結果の配列の大きさを抑える）
+_SCAN_BLOCK = 64 * 1024 * 1024
+
+_NEWLINE = ord("\n")
+_QUOTE = ord('"')
+
+
+class CorpusReader:
+    """
+    mmap で開いた入力ファイルとレコードの索引
+
+    Examples:
+        >>> with CorpusReader("applicants.jsonl") as corpus:
+        ...     ends = corpus.record_ends  # 各レコードの終了位置（排他的）
+        ...     first = bytes(corpus.view(0, ends[0]))
+
+    Note:
+        レコードは末尾の改行を含みます。最後のレコードが改行で
+        終わらない場合も、ファイルの終端をそのレコードの終了位置とします。
+        索引は最初に record_ends を参照したときに作ります（ワーカーのように
+        範囲を読むだけの場合は作りません）。
+    """
+
+    def __init__(
+        self, path: str | Path, *, corpus_format: CorpusFormat = "jsonl"
+    ) -> None:
+        """
+        ファイルを mmap で開きます
+
+        Args:
+            path: 入力ファイルのパス
+            corpus_format: 入力の形式（レコードの境界の決め方）
+        """
+        self.path = Path(path)
+        self._format = corpus_format
+        self._ends: array | None = None
+        with self.path.open("rb") as f:
+            size = self.path.stat().st_size
+            # 空のファイルは mmap できないため、空のバッファとして扱う
+            self._mapping = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            )
+        self.size = size
+
+    def __enter__(self) -> "CorpusReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def record_ends(self) -> array:
+        """各レコードの終了位置（排他的、昇順の int64 配列）"""
+        if self._ends is None:
+            self._ends = self._scan()
+        return self._ends
+
+    def view(self, start: int, end: int) -> memoryview:
+        """
+        ファイルのバイト範囲をコピーせずに返します
+
+        Args:
+            start: 開始位置
+            end: 終了位置（排他的）
+
+        Returns:
+            memoryview: マッピングの範囲
+        """
+        if self._mapping is None:
+            return memoryview(b"")
+        return memoryview(self._mapping)[start:end]
+
+    def close(self) -> None:
+        """マッピングを解放します（view() で返した範囲は先に解放してください）"""
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+    def _scan(self) -> array:
+        if self._mapping is None:
+            return array("q")
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            return self._scan_python()
+        return self._scan_numpy()
+
+    def _scan_numpy(self) -> array:
+        """改行（CSV は引用符の外の改行）の位置をブロックごとにベクトル化して求める"""
+        import numpy as np
+
+        data = np.frombuffer(self._mapping, dtype=np.uint8)
+        ends: list[np.ndarray] = []
+        quoted = False
+        for start in range(0, data.size, _SCAN_BLOCK):
+            block = data[start : start + _SCAN_BLOCK]
+            newlines = np.flatnonzero(block == _NEWLINE)
+            if self._format == "csv":
+                # 各改行までの引用符の数の偶奇（ブロックの先頭の状態を引き継ぐ）。
+                # uint8 の累積和は 256 で桁あふれしても偶奇は変わらない
+                parity = np.cumsum(block == _QUOTE, dtype=np.uint8)
+                outside = (parity[newlines] + np.uint8(quoted)) % 2 == 0
+                quoted = bool((int(parity[-1]) + quoted) % 2)
+                newlines = newlines[outside]
+            ends.append(newlines + start + 1)
+        result = array("q", np.concatenate(ends).astype(np.int64).tobytes())
+        return self._terminate(result)
+
+    def _scan_python(self) -> array:
+        """NumPy がない場合に mmap.find で改行を探す"""
+        mapping = self._mapping
+        ends = array("q")
+        start = 0
+        quotes = 0
+        while (newline := mapping.find(b"\n", start)) != -1:
+            if self._format == "csv":
+                quotes += mapping[start:newline].count(b'"')
+            start = newline + 1
+            if quotes % 2 == 0:
+                ends.append(start)
+        return self._terminate(ends)
+
+    def _terminate(self, ends: array) -> array:
+        """改行で終わらない最後のレコードを加える"""
+        if not ends or ends[-1] != self.size:
+            ends.append(self.size)
+        return ends
+
+
+__all__ = ["CorpusFormat", "CorpusReader"]
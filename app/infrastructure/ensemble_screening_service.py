@@ -0,0 +1,408 @@
+"""
+アンサンブルによるスクリーニングサービス
+
+このモジュールは、複数の ScreeningService（ルール、n-gram モデル、
+リモートモデル等）を ``asyncio.TaskGroup`` で並行に呼び出し、判定と
+スコアを統合する実装を提供します。レイテンシは各実装の合計ではなく
+最も遅い実装（と持ち時間）で決まります。
+
+- 持ち時間: 実装ごとに ``asyncio.timeout`` で打ち切り、間に合わなかった
+  実装は棄権として扱います（失敗した実装も同様）。
+- 早期終了: 判定が確定した時点で残りの呼び出しをキャンセルします。
+  確定するのは、decisive な実装（高速なルール等）が decisive_verdict 以上を
+  返した場合と、残りの実装の結果によらず統合後の判定が変わらない場合です。
+"""
+
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.domain.screening_result import ScreeningResult, Verdict, apply_replacements
+from app.domain.screening_service import (
+    ScreeningService,
+    analyze_content,
+    analyze_many_contents,
+)
+from app.infrastructure.service_lifecycle import (
+    close_service,
+    reload_service,
+    start_service,
+    stop_service,
+)
+
+EnsembleStrategy = Literal["max", "vote"]
+
+
+@dataclass(frozen=True, slots=True)
+class EnsembleMember:
+    """
+    アンサンブルを構成する実装
+
+    Attributes:
+        name: 実装の名前（アンサンブル内で一意）
+        service: 呼び出す ScreeningService の実装
+        weight: vote で統合する場合の票の重み
+        timeout: この実装の持ち時間（秒。None ならアンサンブルの既定値）
+        decisive: decisive_verdict 以上の判定でアンサンブルの判定を確定させるか
+    """
+
+    name: str
+    service: ScreeningService
+    weight: float = 1.0
+    timeout: float | None = None
+    decisive: bool = False
+
+
+@dataclass
+class EnsembleStats:
+    """
+    アンサンブルの統計
+
+    Attributes:
+        calls: analyze() の呼び出し回数
+        early_exits: 判定が確定して残りの呼び出しをキャンセルした回数
+        timeouts: 持ち時間を超えて棄権した呼び出しの数
+        errors: 失敗して棄権した呼び出しの数
+    """
+
+    calls: int = 0
+    early_exits: int = 0
+    timeouts: int = 0
+    errors: int = 0
+
+
+class _Round:
+    """1回の analyze() で実装の呼び出し間を受け渡す状態"""
+
+    __slots__ = (
+        "errors",
+        "pending_decisive",
+        "pending_weight",
+        "responses",
+        "settled",
+        "tasks",
+    )
+
+    def __init__(self, members: Sequence[EnsembleMember]) -> None:
+        self.responses: list[tuple[EnsembleMember, ScreeningResult]] = []
+        self.errors: list[BaseException] = []
+        self.tasks: list[asyncio.Task[None]] = []
+        self.pending_weight = sum(member.weight for member in members)
+        self.pending_decisive = sum(member.decisive for member in members)
+        self.settled = False
+
+
+class EnsembleScreeningService:
+    """
+    複数の実装を並行に呼び出して判定を統合するスクリーニングサービス
+
+    ScreeningService / ScreeningAnalyzer / BatchScreeningAnalyzer Protocol に
+    構造的部分型付けにより準拠します。統合方法は次の2つです。
+
+    - ``max``: 最も重い判定と最大のスコア。BLOCK が返った時点で確定します。
+    - ``vote``: 重み付き多数決（同数なら重い判定）と重み付き平均のスコア。
+      残りの実装の票で逆転できなくなった時点で確定します。
+
+    いずれの場合も decisive な実装の decisive_verdict 以上の判定は、統合後の
+    判定の下限になります。検出箇所は応答した実装の和集合です。棄権した実装が
+    ある場合や、暫定の結果（degraded）を返した実装がある場合は、統合後の結果も
+    degraded になり、上位のキャッシュ等に保存されません（早期終了で
+    キャンセルした実装は棄権に含めません）。
+
+    Attributes:
+        stats: 早期終了と棄権の統計
+
+    Examples:
+        >>> service = EnsembleScreeningService(
+        ...     [
+        ...         EnsembleMember("rules", rules_service, decisive=True),
+        ...         EnsembleMember("ngram", ngram_service),
+        ...         EnsembleMember("remote", remote_service, timeout=0.1),
+        ...     ],
+        ...     timeout=0.2,
+        ... )
+        >>> result = await service.analyze("男性限定の募集")  # rules の BLOCK で確定
+        >>> service.stats.early_exits
+        1
+
+    Note:
+        早期終了した場合のスコアと検出箇所は、それまでに応答した実装のみから
+        計算します。analyze_many() は各実装の analyze_many() を並行に呼び出し、
+        早期終了はしません（バッチの途中で打ち切れないため）。
+    """
+
+    def __init__(
+        self,
+        members: Sequence[EnsembleMember],
+        *,
+        strategy: EnsembleStrategy = "max",
+        timeout: float | None = None,
+        decisive_verdict: Verdict = Verdict.BLOCK,
+    ) -> None:
+        """
+        EnsembleScreeningService を初期化します
+
+        Args:
+            members: アンサンブルを構成する実装
+            strategy: 判定の統合方法（"max" または "vote"）
+            timeout: 各実装の既定の持ち時間（秒。None なら無制限）
+            decisive_verdict: decisive な実装が判定を確定させる重さ
+
+        Raises:
+            ValueError: 実装がない、名前が重複している、重みが正でない、
+                または strategy が不正な場合
+        """
+        if not members:
+            raise ValueError("アンサンブルには実装が1つ以上必要です")
+        names = [member.name for member in members]
+        if len(names) != len(set(names)):
+            raise ValueError("アンサンブルの実装の名前が重複しています")
+        if any(member.weight <= 0 for member in members):
+            raise ValueError("weight は正の値である必要があります")
+        if strategy not in ("max", "vote"):
+            raise ValueError(f"未対応の統合方法です: {strategy}")
+        self._members = tuple(members)
+        self._strategy = strategy
+        self._timeout = timeout
+        self._decisive_verdict = decisive_verdict
+        self.stats = EnsembleStats()
+
+    @property
+    def version(self) -> str:
+        """バージョンを持つ実装のバージョンの組（持たない場合は空文字列）"""
+        versions = (
+            (member.name, getattr(member.service, "version", ""))
+            for member in self._members
+        )
+        return ";".join(f"{name}={version}" for name, version in versions if version)
+
+    async def screen(self, content: str) -> str:
+        """
+        アンサンブルでスクリーニングし、結果のテキストを返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            スクリーニング結果のテキスト
+        """
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        各実装を並行に呼び出し、判定が確定した時点で結果を統合します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: 統合したスクリーニング結果
+
+        Raises:
+            ScreeningUnavailableError: すべての実装が棄権した場合（原因は
+                最初に棄権した実装の例外。持ち時間を超えた場合は TimeoutError）
+        """
+        self.stats.calls += 1
+        round_ = _Round(self._members)
+        async with asyncio.TaskGroup() as group:
+            for member in self._members:
+                round_.tasks.append(
+                    group.create_task(self._call(member, content, round_))
+                )
+        if not round_.responses:
+            raise ScreeningUnavailableError(
+                "アンサンブルのすべての実装が棄権しました"
+            ) from round_.errors[0]
+        # 早期終了でキャンセルした実装は errors に含まれない（棄権ではない）
+        return self._combine(content, round_.responses, abstained=bool(round_.errors))
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        """
+        各実装の analyze_many() を並行に呼び出し、テキストごとに結果を統合します
+
+        Args:
+            contents: スクリーニング対象のテキストの列
+
+        Returns:
+            list[ScreeningResult]: contents と同じ順序の結果
+
+        Raises:
+            ScreeningUnavailableError: すべての実装が棄権した場合（原因は
+                最初に棄権した実装の例外）
+        """
+        if not contents:
+            return []
+        batches: list[tuple[EnsembleMember, list[ScreeningResult]]] = []
+        errors: list[BaseException] = []
+
+        async def call(member: EnsembleMember) -> None:
+            try:
+                async with asyncio.timeout(self._budget(member)):
+                    results = await analyze_many_contents(member.service, contents)
+            except TimeoutError as exc:
+                self.stats.timeouts += 1
+                errors.append(exc)
+            except Exception as exc:
+                self.stats.errors += 1
+                errors.append(exc)
+            else:
+                batches.append((member, results))
+
+        async with asyncio.TaskGroup() as group:
+            for member in self._members:
+                group.create_task(call(member))
+        if not batches:
+            raise ScreeningUnavailableError(
+                "アンサンブルのすべての実装が棄権しました"
+            ) from errors[0]
+        return [
+            self._combine(
+                content,
+                [(member, results[index]) for member, results in batches],
+                abstained=bool(errors),
+            )
+            for index, content in enumerate(contents)
+        ]
+
+    async def start(self) -> None:
+        """各実装の start() フックを転送します"""
+        for member in self._members:
+            await start_service(member.service)
+
+    async def aclose(self) -> None:
+        """各実装の aclose() フックを転送します"""
+        for member in self._members:
+            await stop_service(member.service)
+
+    def close(self) -> None:
+        """各実装の close() フックを転送します"""
+        for member in self._members:
+            close_service(member.service)
+
+    async def reload(self, *, force: bool = False) -> str | None:
+        """
+        各実装の reload() フックを転送します
+
+        Returns:
+            str | None: いずれかの実装を差し替えた場合はアンサンブルの新しい
+            バージョン（上位のキャッシュの名前空間に使われます）
+        """
+        reloaded = False
+        for member in self._members:
+            if await reload_service(member.service, force=force) is not None:
+                reloaded = True
+        return self.version if reloaded else None
+
+    def _budget(self, member: EnsembleMember) -> float | None:
+        return member.timeout if member.timeout is not None else self._timeout
+
+    async def _call(self, member: EnsembleMember, content: str, round_: _Round) -> None:
+        """1つの実装を持ち時間内で呼び出し、判定が確定したら残りをキャンセルする"""
+        try:
+            async with asyncio.timeout(self._budget(member)):
+                result = await analyze_content(member.service, content)
+        except TimeoutError as exc:
+            self.stats.timeouts += 1
+            round_.errors.append(exc)
+        except Exception as exc:
+            self.stats.errors += 1
+            round_.errors.append(exc)
+        else:
+            round_.responses.append((member, result))
+        round_.pending_weight -= member.weight
+        round_.pending_decisive -= member.decisive
+        if round_.settled or not self._is_settled(round_):
+            return
+        round_.settled = True
+        current = asyncio.current_task()
+        cancelled = False
+        for task in round_.tasks:
+            if task is not current and not task.done():
+                cancelled = task.cancel() or cancelled
+        if cancelled:
+            self.stats.early_exits += 1
+
+    def _is_settled(self, round_: _Round) -> bool:
+        """残りの実装の結果によらず統合後の判定が変わらないか"""
+        if not round_.responses:
+            return False
+        member, result = round_.responses[-1]
+        if self._is_decisive(member, result):
+            return True
+        if self._strategy == "max":
+            return result.verdict is Verdict.BLOCK
+        votes = self._votes(round_.responses)
+        leader = max(votes, key=lambda v: (votes[v], v.severity))
+        if (
+            round_.pending_decisive
+            and leader.severity < self._decisive_verdict.severity
+        ):
+            # 応答していない decisive な実装が判定を引き上げうる
+            return False
+        runner_up = max(
+            (weight for verdict, weight in votes.items() if verdict is not leader),
+            default=0.0,
+        )
+        return votes[leader] > runner_up + round_.pending_weight
+
+    def _is_decisive(self, member: EnsembleMember, result: ScreeningResult) -> bool:
+        return (
+            member.decisive
+            and result.verdict.severity >= self._decisive_verdict.severity
+        )
+
+    @staticmethod
+    def _votes(
+        responses: Sequence[tuple[EnsembleMember, ScreeningResult]],
+    ) -> dict[Verdict, float]:
+        votes: dict[Verdict, float] = {}
+        for member, result in responses:
+            votes[result.verdict] = votes.get(result.verdict, 0.0) + member.weight
+        return votes
+
+    def _combine(
+        self,
+        content: str,
+        responses: Sequence[tuple[EnsembleMember, ScreeningResult]],
+        *,
+        abstained: bool,
+    ) -> ScreeningResult:
+        """
+        応答した実装の結果を統合する
+
+        棄権した実装がある場合や、暫定の結果を返した実装がある場合は、
+        一部の実装だけによる結果として degraded にする。
+        """
+        if self._strategy == "max":
+            verdict = max(
+                (result.verdict for _, result in responses), key=lambda v: v.severity
+            )
+            score = max(result.score for _, result in responses)
+        else:
+            votes = self._votes(responses)
+            verdict = max(votes, key=lambda v: (votes[v], v.severity))
+            weight = sum(member.weight for member, _ in responses)
+            score = sum(member.weight * result.score for member, result in responses)
+            score /= weight
+        for member, result in responses:
+            if (
+                self._is_decisive(member, result)
+                and result.verdict.severity > verdict.severity
+            ):
+                verdict = result.verdict
+        findings = sorted(
+            {finding for _, result in responses for finding in result.findings},
+            key=lambda f: (f.start, f.end, f.kind),
+        )
+        return ScreeningResult(
+            content=apply_replacements(content, findings),
+            score=score,
+            verdict=verdict,
+            findings=tuple(findings),
+            degraded=abstained or any(result.degraded for _, result in responses),
+        )
+
+
+__all__ = ["EnsembleMember", "EnsembleScreeningService", "EnsembleStats"]
@@ -0,0 +1,235 @@
+"""
+ヘッジリクエスト付きスクリーニングサービス
+
+このモジュールは、任意の ScreeningService をラップし、呼び出しが直近の
+レイテンシ分布の指定パーセンタイル（既定は p95）を超えても完了しない場合に
+同じ呼び出しを重複して発行するデコレーター実装を提供します。先に成功した
+結果を採用し、残りの呼び出しはキャンセルします。
+
+遅い呼び出しの大半は一時的な要因（GC、キューイング、再送）によるため、
+重複発行は約5%の追加負荷でテールレイテンシを大きく削減します。
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from app.domain.screening_result import ScreeningResult
+from app.domain.screening_service import (
+    ScreeningService,
+    analyze_content,
+    analyze_many_contents,
+)
+from app.infrastructure.service_lifecycle import (
+    close_service,
+    reload_service,
+    start_service,
+    stop_service,
+)
+
+# ヘッジ遅延を再計算する間隔（記録したサンプル数）
+_RECOMPUTE_EVERY = 16
+
+
+@dataclass
+class HedgingStats:
+    """
+    ヘッジリクエストの統計
+
+    Attributes:
+        calls: analyze() の呼び出し回数
+        hedged: 重複呼び出しを発行した回数
+        hedge_wins: 重複呼び出しの結果を採用した回数
+    """
+
+    calls: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+
+
+class HedgedScreeningService:
+    """
+    ヘッジリクエスト付きスクリーニングサービス
+
+    ScreeningService / ScreeningAnalyzer / BatchScreeningAnalyzer Protocol に
+    構造的部分型付けにより準拠します。ヘッジ遅延は成功した呼び出しの
+    レイテンシから計算した quantile パーセンタイルで、サンプルが
+    min_samples に満たない間は initial_delay を使用します。
+
+    Attributes:
+        stats: ヘッジの発行と採用の統計
+
+    Examples:
+        >>> service = HedgedScreeningService(remote_service, quantile=0.95)
+        >>> result = await service.analyze("テキスト")
+        >>> service.hedge_delay
+        0.012
+
+    Note:
+        analyze_many() はヘッジせずに下位サービスへ渡します。
+        バッチ全体の重複発行は追加負荷が大きいためです。
+    """
+
+    def __init__(
+        self,
+        service: ScreeningService,
+        *,
+        quantile: float = 0.95,
+        initial_delay: float = 0.05,
+        min_delay: float = 0.001,
+        max_hedges: int = 1,
+        window: int = 512,
+        min_samples: int = 20,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        HedgedScreeningService を初期化します
+
+        Args:
+            service: ヘッジ対象の下位サービス
+            quantile: ヘッジ遅延に使うレイテンシのパーセンタイル（0.0〜1.0）
+            initial_delay: サンプルが少ない間のヘッジ遅延（秒）
+            min_delay: ヘッジ遅延の下限（秒）
+            max_hedges: 1回の呼び出しで追加発行する最大数
+            window: レイテンシを保持する直近のサンプル数
+            min_samples: パーセンタイルを使い始める最小サンプル数
+            clock: 時刻を返す関数（テスト用）
+
+        Raises:
+            ValueError: quantile が範囲外、または max_hedges が 1 未満の場合
+        """
+        if not 0.0 < quantile < 1.0:
+            raise ValueError("quantile は 0 より大きく 1 未満である必要があります")
+        if max_hedges < 1:
+            raise ValueError("max_hedges は 1 以上である必要があります")
+        self._service = service
+        self._quantile = quantile
+        self._min_delay = min_delay
+        self._max_hedges = max_hedges
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._min_samples = min_samples
+        self._clock = clock
+        self._delay = initial_delay
+        self._samples_since_recompute = 0
+        self.stats = HedgingStats()
+
+    @property
+    def hedge_delay(self) -> float:
+        """現在のヘッジ遅延（秒）"""
+        return self._delay
+
+    async def screen(self, content: str) -> str:
+        """
+        ヘッジ付きでスクリーニングし、結果のテキストを返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            スクリーニング結果のテキスト
+        """
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        ヘッジ付きでスクリーニングし、最初に成功した詳細な結果を返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: スクリーニング結果
+
+        Raises:
+            Exception: 発行したすべての呼び出しが失敗した場合、最後の例外
+        """
+        self.stats.calls += 1
+        attempts = [self._launch(content)]
+        pending = set(attempts)
+        errors: list[BaseException] = []
+        try:
+            while pending:
+                hedges_left = len(attempts) <= self._max_hedges
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self._delay if hedges_left else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not attempts[0]:
+                            self.stats.hedge_wins += 1
+                        return task.result()
+                    errors.append(task.exception())
+                if not done and hedges_left:
+                    hedge = self._launch(content)
+                    attempts.append(hedge)
+                    pending.add(hedge)
+                    self.stats.hedged += 1
+            raise errors[-1]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        """
+        ヘッジせずに下位サービスで複数コンテンツをスクリーニングします
+
+        Args:
+            contents: スクリーニング対象のテキストの列
+
+        Returns:
+            list[ScreeningResult]: contents と同じ順序の結果
+        """
+        return await analyze_many_contents(self._service, contents)
+
+    async def start(self) -> None:
+        """下位サービスの start() フックを転送します"""
+        await start_service(self._service)
+
+    async def aclose(self) -> None:
+        """下位サービスの aclose() フックを転送します"""
+        await stop_service(self._service)
+
+    def close(self) -> None:
+        """下位サービスの close() フックを転送します"""
+        close_service(self._service)
+
+    async def reload(self, *, force: bool = False) -> str | None:
+        """下位サービスの reload() フックを転送します"""
+        return await reload_service(self._service, force=force)
+
+    def _launch(self, content: str) -> asyncio.Task[ScreeningResult]:
+        task = asyncio.get_running_loop().create_task(self._attempt(content))
+        task.add_done_callback(_consume_exception)
+        return task
+
+    async def _attempt(self, content: str) -> ScreeningResult:
+        """1回の呼び出しを実行し、成功した場合のみレイテンシを記録する"""
+        started = self._clock()
+        result = await analyze_content(self._service, content)
+        self._record(self._clock() - started)
+        return result
+
+    def _record(self, latency: float) -> None:
+        self._latencies.append(latency)
+        self._samples_since_recompute += 1
+        if (
+            len(self._latencies) >= self._min_samples
+            and self._samples_since_recompute >= _RECOMPUTE_EVERY
+        ):
+            self._samples_since_recompute = 0
+            ordered = sorted(self._latencies)
+            index = min(len(ordered) - 1, int(self._quantile * len(ordered)))
+            self._delay = max(self._min_delay, ordered[index])
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    """採用されなかった呼び出しの例外が未取得として警告されないようにする"""
+    if not task.cancelled():
+        task.exception()
+
+
+__all__ = ["HedgedScreeningService", "HedgingStats"]
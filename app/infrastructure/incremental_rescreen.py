@@ -0,0 +1,154 @@
+"""
+ルールセットの変更に伴う差分の再スクリーニング
+
+このモジュールは、ScreeningResultStore に保存したドキュメントのうち、
+ルールセットの変更で結果が変わり得るものだけを再スクリーニングする
+ジョブを提供します。
+
+ドキュメントのルールによる結果は、ルールの語句の出現だけで決まります。
+そのため、追加・削除・変更されたルールの語句（変更前と変更後の両方）を
+1つも含まないドキュメントは、結果が変わりません。ジョブは変更された
+語句をストアの転置索引で検索し、含み得るドキュメントだけを
+再スクリーニングし、残りはバージョンだけを更新します。
+
+ジョブは途中で中断しても、再実行すれば続きから正しい状態に収束します
+（ストア全体のルールセットは、すべてのドキュメントを処理してから記録します）。
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from app.domain.rule import Rule
+from app.domain.screening_service import analyze_many_contents
+from app.infrastructure.result_store import ScreeningResultStore
+from app.infrastructure.rule_screening_service import RuleScreeningService
+
+
+@dataclass(frozen=True, slots=True)
+class RescreenReport:
+    """
+    再スクリーニングの結果
+
+    Attributes:
+        version: 新しいルールセットのバージョン
+        total: ストアのドキュメントの数
+        changed_terms: 変更されたルールの語句の数（全件の場合は None）
+        rescreened: 再スクリーニングしたドキュメントの数
+        skipped: 再スクリーニングを省いたドキュメントの数
+        changed: 再スクリーニングで結果が変わったドキュメントの数
+    """
+
+    version: str
+    total: int
+    changed_terms: int | None
+    rescreened: int
+    skipped: int
+    changed: int
+
+
+def changed_terms(old_rules: Sequence[Rule], new_rules: Sequence[Rule]) -> set[str]:
+    """
+    追加・削除・変更されたルールの語句を返します
+
+    id が同じで定義（語句、種類、判定、重み、置換文字列）が同じルールは
+    変更なしとみなします。変更されたルールは変更前と変更後の語句の両方を
+    含めます。
+
+    Args:
+        old_rules: 変更前のルール
+        new_rules: 変更後のルール
+
+    Returns:
+        set[str]: 語句の集合
+    """
+    old = {rule.id: rule for rule in old_rules}
+    new = {rule.id: rule for rule in new_rules}
+    terms: set[str] = set()
+    for rule_id in old.keys() | new.keys():
+        before, after = old.get(rule_id), new.get(rule_id)
+        if before == after:
+            continue
+        for rule in (before, after):
+            if rule is not None:
+                terms.update(rule.terms)
+    return terms
+
+
+async def rescreen_changed(
+    store: ScreeningResultStore,
+    service: RuleScreeningService,
+    *,
+    batch_size: int = 256,
+) -> RescreenReport:
+    """
+    ルールセットの変更で結果が変わり得るドキュメントだけを再スクリーニングします
+
+    ストアに記録したルールセットと service のルールセットの差分から
+    対象を決めます。ストアにルールセットの記録がない場合は全件を、
+    記録と異なるバージョンの結果を持つドキュメント（記録後に追加された
+    もの等）は常に再スクリーニングします。既に新しいバージョンの結果を
+    持つドキュメントは再スクリーニングしません。
+
+    Args:
+        store: ドキュメントと結果のストア
+        service: 新しいルールセットのサービス
+        batch_size: 1回の analyze_many() に渡すドキュメントの数
+
+    Returns:
+        RescreenReport: 再スクリーニングした数と省いた数
+
+    Raises:
+        ValueError: batch_size が 1 未満の場合
+
+    Note:
+        同じ語句を持つ複数のルールの優先順位（ルールの順序）だけを
+        変更した場合は検出しません。
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size は 1 以上である必要があります")
+    version = service.version
+    rules = service.rules
+    total = len(store)
+    # 新しいバージョンの結果を持つドキュメント（一括処理で追加したもの等）は省く
+    targets = store.stale(version)
+    recorded = store.ruleset()
+    terms = None
+    if recorded is not None:
+        recorded_version, recorded_rules = recorded
+        terms = (
+            changed_terms(recorded_rules, rules)
+            if recorded_version != version
+            else set()
+        )
+        targets &= store.stale(recorded_version) | store.candidates(terms)
+
+    changed = 0
+    ordered = sorted(targets)
+    for start in range(0, len(ordered), batch_size):
+        documents = list(store.load(ordered[start : start + batch_size]))
+        results = await analyze_many_contents(
+            service, [document.content for document in documents]
+        )
+        changed += sum(
+            result != document.result
+            for document, result in zip(documents, results, strict=True)
+        )
+        store.update_results(
+            (
+                (document.id, result)
+                for document, result in zip(documents, results, strict=True)
+            ),
+            version=version,
+        )
+    store.commit_ruleset(version, rules)
+    return RescreenReport(
+        version=version,
+        total=total,
+        changed_terms=None if terms is None else len(terms),
+        rescreened=len(targets),
+        skipped=total - len(targets),
+        changed=changed,
+    )
+
+
+__all__ = ["RescreenReport", "changed_terms", "rescreen_changed"]
@@ -0,0 +1,230 @@
+"""
+並行する screen() 呼び出しのマイクロバッチ化
+
+このモジュールは、個別に到着する多数のスクリーニング呼び出しを短時間だけ
+待ち合わせ、1回のバッチとして下位サービスの analyze_many() に渡す
+デコレーター実装を提供します。モデル推論やリモートAPIのように
+バッチ処理の方が1件あたりのコストが小さいバックエンドで効果があります。
+
+バッチは次のいずれかの条件で送出されます。
+
+- 待ち行列の件数が ``max_batch_size`` に達した
+- 最初の1件が到着してから ``max_wait_ms`` が経過した
+"""
+
+import asyncio
+import time
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.domain.screening_result import ScreeningResult
+from app.domain.screening_service import ScreeningService, analyze_many_contents
+from app.infrastructure.service_lifecycle import (
+    close_service,
+    reload_service,
+    start_service,
+    stop_service,
+)
+
+
+@dataclass
+class BatchingStats:
+    """
+    マイクロバッチの統計
+
+    Attributes:
+        batches: 送出したバッチ数
+        items: バッチで処理した件数
+        batch_sizes: バッチサイズごとの送出回数
+        total_queue_delay: 各呼び出しが待ち行列で待った時間の合計（秒）
+        max_queue_delay: 待ち行列での最大待ち時間（秒）
+    """
+
+    batches: int = 0
+    items: int = 0
+    batch_sizes: Counter[int] = field(default_factory=Counter)
+    total_queue_delay: float = 0.0
+    max_queue_delay: float = 0.0
+
+    @property
+    def mean_batch_size(self) -> float:
+        """平均バッチサイズ"""
+        return self.items / self.batches if self.batches else 0.0
+
+    @property
+    def mean_queue_delay_ms(self) -> float:
+        """バッチ化により追加された平均待ち時間（ミリ秒）"""
+        return self.total_queue_delay / self.items * 1000 if self.items else 0.0
+
+
+class MicroBatchingScreeningService:
+    """
+    並行呼び出しをバッチにまとめるスクリーニングサービス
+
+    ScreeningService / ScreeningAnalyzer / BatchScreeningAnalyzer Protocol に
+    構造的部分型付けにより準拠します。各呼び出しは Future を受け取り、
+    バッチ処理の完了後に自分の結果（または例外）で解決されます。
+
+    Attributes:
+        stats: バッチサイズと待ち時間の統計
+
+    Examples:
+        >>> service = MicroBatchingScreeningService(
+        ...     ngram_service, max_batch_size=64, max_wait_ms=2.0
+        ... )
+        >>> results = await asyncio.gather(*(service.screen(t) for t in texts))
+        >>> service.stats.mean_batch_size
+        64.0
+    """
+
+    def __init__(
+        self,
+        service: ScreeningService,
+        *,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+    ) -> None:
+        """
+        MicroBatchingScreeningService を初期化します
+
+        Args:
+            service: バッチを処理する下位サービス（analyze_many() を推奨）
+            max_batch_size: 1バッチの最大件数
+            max_wait_ms: 最初の1件を待たせる最大時間（ミリ秒）
+
+        Raises:
+            ValueError: max_batch_size が 1 未満、または max_wait_ms が負の場合
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size は 1 以上である必要があります")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms は 0 以上である必要があります")
+        self._service = service
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._pending: list[tuple[str, asyncio.Future[ScreeningResult], float]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self.stats = BatchingStats()
+
+    async def screen(self, content: str) -> str:
+        """
+        バッチに参加してスクリーニングし、結果のテキストを返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            スクリーニング結果のテキスト
+        """
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        バッチに参加してスクリーニングし、詳細な結果を返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: スクリーニング結果
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ScreeningResult] = loop.create_future()
+        self._pending.append((content, future, time.perf_counter()))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush)
+        return await future
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        """
+        既にまとまっている複数コンテンツは待ち合わせずに下位サービスへ渡します
+
+        Args:
+            contents: スクリーニング対象のテキストの列
+
+        Returns:
+            list[ScreeningResult]: contents と同じ順序の結果
+        """
+        return await analyze_many_contents(self._service, contents)
+
+    async def start(self) -> None:
+        """下位サービスの start() フックを転送します"""
+        await start_service(self._service)
+
+    async def aclose(self) -> None:
+        """待ち行列と処理中のバッチを完了させてから下位サービスを閉じます"""
+        self._flush()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        await stop_service(self._service)
+
+    def close(self) -> None:
+        """下位サービスの close() フックを転送します"""
+        close_service(self._service)
+
+    async def reload(self, *, force: bool = False) -> str | None:
+        """下位サービスの reload() フックを転送します"""
+        return await reload_service(self._service, force=force)
+
+    def _flush(self) -> None:
+        """待ち行列の内容を1つのバッチとして送出する"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(
+        self, batch: list[tuple[str, asyncio.Future[ScreeningResult], float]]
+    ) -> None:
+        """バッチを下位サービスで処理し、各呼び出し元の Future を解決する"""
+        dispatched_at = time.perf_counter()
+        self._record(batch, dispatched_at)
+        error: Exception | None = None
+        try:
+            results = await analyze_many_contents(
+                self._service, [content for content, _, _ in batch]
+            )
+            if len(results) != len(batch):
+                raise ScreeningUnavailableError(
+                    f"{len(batch)} 件のバッチに {len(results)} 件の結果が返されました"
+                )
+            for (_, future, _), result in zip(batch, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as exc:
+            error = exc
+        finally:
+            # 取り消された場合も、呼び出し元を解決されない Future で待たせない
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(
+                        error or ScreeningUnavailableError("バッチ処理が中断されました")
+                    )
+
+    def _record(
+        self,
+        batch: list[tuple[str, asyncio.Future[ScreeningResult], float]],
+        dispatched_at: float,
+    ) -> None:
+        stats = self.stats
+        stats.batches += 1
+        stats.items += len(batch)
+        stats.batch_sizes[len(batch)] += 1
+        for _, _, enqueued_at in batch:
+            delay = dispatched_at - enqueued_at
+            stats.total_queue_delay += delay
+            stats.max_queue_delay = max(stats.max_queue_delay, delay)
+
+
+__all__ = ["BatchingStats", "MicroBatchingScreeningService"]
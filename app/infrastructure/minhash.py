@@ -0,0 +1,288 @@
+"""
+MinHash 署名と LSH による近似重複の検索
+
+このモジュールは、テキストの文字シングル（k-gram）集合の Jaccard 類似度を
+推定する MinHash 署名と、署名を帯（band）に分けてハッシュ表に登録する
+LSH 索引を提供します。
+
+- シングルのハッシュは、コードポイント配列上の漸化式
+  ``h[k] = h[k-1] * P + cp[i+k-1]`` で全位置を一括計算します。
+- 置換は乗算・シフト方式の普遍ハッシュ ``(a * x + b) >> 32``（a は奇数）で、
+  ``num_perm`` 個の置換の最小値をシングルのブロックごとに NumPy の
+  ブロードキャストで求めます。シングルごとの Python ループはありません。
+- LSH は ``bands`` 個の帯のいずれかが一致した登録済みの署名だけを候補とし、
+  候補の類似度を署名から推定します。
+
+索引は件数の上限と時間窓を持ち、古いものから追い出します。
+
+NumPy は任意依存です（``uv sync --extra ngram``）。
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.infrastructure.ngram_model import normalize_text
+
+# 64bit ローリングハッシュの乗数（FNV-1a の素数）
+_PRIME = np.uint64(0x100000001B3)
+# 一度にブロードキャストするシングルの数（num_perm × この数の配列を作る）
+_BLOCK = 4096
+
+
+class MinHasher:
+    """
+    テキストの MinHash 署名を計算するクラス
+
+    テキストは正規化（NFKC・小文字化）してから shingle_size 文字の
+    シングルに分けます。shingle_size より短いテキストは全体を1つの
+    シングルとします。
+
+    Examples:
+        >>> hasher = MinHasher(num_perm=128)
+        >>> a = hasher.signature("山田太郎です。営業職を希望します。")
+        >>> b = hasher.signature("佐藤花子です。営業職を希望します。")
+        >>> MinHasher.similarity(a, b)
+        0.6
+    """
+
+    def __init__(
+        self, *, num_perm: int = 128, shingle_size: int = 5, seed: int = 1
+    ) -> None:
+        """
+        MinHasher を初期化します
+
+        Args:
+            num_perm: 置換の数（署名の長さ）
+            shingle_size: シングルの文字数
+            seed: 置換の係数を生成する乱数のシード
+
+        Raises:
+            ValueError: num_perm または shingle_size が 1 未満の場合
+        """
+        if num_perm < 1 or shingle_size < 1:
+            raise ValueError("num_perm と shingle_size は 1 以上である必要があります")
+        rng = np.random.default_rng(seed)
+        high = np.iinfo(np.uint64).max
+        self._a = (
+            rng.integers(0, high, size=num_perm, dtype=np.uint64, endpoint=True)
+            | np.uint64(1)
+        )[:, None]
+        self._b = rng.integers(0, high, size=num_perm, dtype=np.uint64, endpoint=True)[
+            :, None
+        ]
+        self._shingle_size = shingle_size
+        self.num_perm = num_perm
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        テキストの MinHash 署名を計算します
+
+        Args:
+            text: 入力テキスト
+
+        Returns:
+            np.ndarray: 長さ num_perm の uint32 配列（空のテキストは全要素が最大値）
+        """
+        shingles = self._shingles(normalize_text(text))
+        signature = np.full(self.num_perm, np.iinfo(np.uint32).max, dtype=np.uint32)
+        for start in range(0, shingles.size, _BLOCK):
+            block = shingles[start : start + _BLOCK]
+            hashed = ((self._a * block + self._b) >> np.uint64(32)).astype(np.uint32)
+            np.minimum(signature, hashed.min(axis=1), out=signature)
+        return signature
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        """
+        2つの署名から Jaccard 類似度を推定します
+
+        Args:
+            a: MinHash 署名
+            b: 同じ MinHasher で計算した MinHash 署名
+
+        Returns:
+            float: 推定した Jaccard 類似度（0.0〜1.0）
+        """
+        return float(np.count_nonzero(a == b)) / a.size
+
+    def _shingles(self, text: str) -> np.ndarray:
+        """重複を除いたシングルのハッシュ"""
+        encoded = text.encode("utf-32-le", errors="surrogatepass")
+        codepoints = np.frombuffer(encoded, dtype=np.uint32).astype(np.uint64)
+        size = min(self._shingle_size, codepoints.size)
+        if size == 0:
+            return codepoints
+        count = codepoints.size - size + 1
+        rolling = codepoints[:count].copy()
+        for offset in range(1, size):
+            rolling = rolling * _PRIME + codepoints[offset : offset + count]
+        return np.unique(rolling)
+
+
+@dataclass(slots=True)
+class _Entry[V]:
+    """索引に登録した署名と値"""
+
+    signature: np.ndarray
+    value: V
+    inserted_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class LshMatch[V]:
+    """
+    LSH 索引の検索結果
+
+    Attributes:
+        key: 登録時のキー
+        similarity: 署名から推定した Jaccard 類似度
+        value: 登録時の値
+    """
+
+    key: str
+    similarity: float
+    value: V
+
+
+class LshIndex[V]:
+    """
+    MinHash 署名の帯ごとのハッシュ表による近似重複の索引
+
+    帯の行数を r、帯の数を b とすると、類似度 s の署名が候補になる確率は
+    ``1 - (1 - s^r)^b`` です（既定の r=8、b=16 で s=0.9 なら 0.99 以上、
+    s=0.5 なら 0.06 程度）。
+
+    Examples:
+        >>> index = LshIndex(num_perm=128, bands=16, capacity=1024, window=600)
+        >>> index.add("doc-1", hasher.signature(text), result)
+        >>> index.query(hasher.signature(similar_text), threshold=0.9)
+        LshMatch(key='doc-1', similarity=0.93, value=...)
+
+    Note:
+        件数が capacity を超えた場合と、登録から window 秒を過ぎた場合に
+        古いものから追い出します。同じキーの登録は置き換えます。
+    """
+
+    def __init__(
+        self,
+        *,
+        num_perm: int = 128,
+        bands: int = 16,
+        capacity: int = 1024,
+        window: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        LshIndex を初期化します
+
+        Args:
+            num_perm: 署名の長さ
+            bands: 帯の数（num_perm を割り切る数）
+            capacity: 登録する最大件数
+            window: 登録を保持する秒数
+            clock: 時刻を返す関数（テスト用）
+
+        Raises:
+            ValueError: bands が num_perm を割り切らない、または capacity が
+                1 未満の場合
+        """
+        if bands < 1 or num_perm % bands:
+            raise ValueError("bands は num_perm を割り切る正の数である必要があります")
+        if capacity < 1:
+            raise ValueError("capacity は 1 以上である必要があります")
+        self._num_perm = num_perm
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._capacity = capacity
+        self._window = window
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry[V]] = OrderedDict()
+        self._buckets: dict[tuple[int, bytes], set[str]] = {}
+
+    def __len__(self) -> int:
+        """登録している件数"""
+        return len(self._entries)
+
+    def add(self, key: str, signature: np.ndarray, value: V) -> None:
+        """
+        署名と値を登録します
+
+        Args:
+            key: 登録のキー
+            signature: MinHash 署名
+            value: 検索結果として返す値
+
+        Raises:
+            ValueError: 署名の長さが num_perm と異なる場合
+        """
+        if signature.shape != (self._num_perm,):
+            raise ValueError("署名の長さが num_perm と一致しません")
+        self._discard(key)
+        self._entries[key] = _Entry(signature, value, self._clock())
+        for band in self._band_keys(signature):
+            self._buckets.setdefault(band, set()).add(key)
+        self._evict()
+
+    def query(self, signature: np.ndarray, *, threshold: float) -> LshMatch[V] | None:
+        """
+        類似度が threshold 以上で最も類似した登録を返します
+
+        Args:
+            signature: MinHash 署名
+            threshold: 類似度の下限
+
+        Returns:
+            LshMatch | None: 最も類似した登録（なければ None）
+        """
+        self._evict()
+        candidates: set[str] = set()
+        for band in self._band_keys(signature):
+            candidates |= self._buckets.get(band, set())
+        best: LshMatch[V] | None = None
+        for key in candidates:
+            entry = self._entries[key]
+            similarity = MinHasher.similarity(signature, entry.signature)
+            if similarity >= threshold and (
+                best is None or similarity > best.similarity
+            ):
+                best = LshMatch(key, similarity, entry.value)
+        return best
+
+    def clear(self) -> None:
+        """すべての登録を削除します"""
+        self._entries.clear()
+        self._buckets.clear()
+
+    def _band_keys(self, signature: np.ndarray) -> list[tuple[int, bytes]]:
+        rows = self._rows
+        return [
+            (band, signature[band * rows : (band + 1) * rows].tobytes())
+            for band in range(self._bands)
+        ]
+
+    def _evict(self) -> None:
+        """件数の上限と時間窓を超えた登録を古いものから削除する"""
+        deadline = self._clock() - self._window
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if len(self._entries) <= self._capacity and entry.inserted_at > deadline:
+                break
+            self._discard(key)
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for band in self._band_keys(entry.signature):
+            bucket = self._buckets.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band]
+
+
+__all__ = ["LshIndex", "LshMatch", "MinHasher"]
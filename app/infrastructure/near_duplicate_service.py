@@ -0,0 +1,305 @@
+"""
+近似重複の差分スクリーニング
+
+このモジュールは、任意の ScreeningService をラップし、直近に
+スクリーニングしたテキストの近似重複（氏名や日付だけを変えた一括応募等）
+では、変わった行だけを下位サービスでスクリーニングするデコレーター実装を
+提供します。完全一致の結果キャッシュでは拾えない重複を対象とします。
+
+1. テキストの MinHash 署名で LSH 索引を検索し、類似度が閾値以上の
+   過去のテキストと結果を得ます。
+2. 過去のテキストとの行単位の差分（difflib）を取り、変わらない行の
+   検出箇所は位置をずらして引き継ぎます。
+3. 追加・変更された行を前後1行の文脈とともに analyze_many() で
+   スクリーニングし、行の境目をまたぐものを含めて変更行にかかる
+   検出箇所を合わせます。判定とスコアは、過去の結果と変更行の結果の
+   うち重いもの（大きいもの）です。
+
+差分が大きい場合は全体をスクリーニングします。索引には全体を
+スクリーニングした結果だけを登録します（差分の結果を基準にすると
+近似が積み重なるため）。フォールバックによる暫定の結果は登録しません。
+"""
+
+import dataclasses
+import hashlib
+from collections.abc import Sequence
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+from app.domain.screening_result import ScreeningResult, apply_replacements
+from app.domain.screening_service import (
+    ScreeningService,
+    analyze_content,
+    analyze_many_contents,
+)
+from app.infrastructure.minhash import LshIndex, MinHasher
+from app.infrastructure.service_lifecycle import (
+    close_service,
+    reload_service,
+    start_service,
+    stop_service,
+)
+
+
+@dataclass
+class NearDuplicateStats:
+    """
+    近似重複の統計
+
+    Attributes:
+        calls: analyze() の呼び出し回数
+        near_hits: 近似重複の差分だけをスクリーニングした回数
+        fallbacks: 近似重複が見つかったが差分が大きく全体をスクリーニングした回数
+        total_chars: analyze() に渡されたテキストの文字数の合計
+        screened_chars: 下位サービスに渡した文字数の合計
+    """
+
+    calls: int = 0
+    near_hits: int = 0
+    fallbacks: int = 0
+    total_chars: int = 0
+    screened_chars: int = 0
+
+
+class NearDuplicateScreeningService:
+    """
+    近似重複の差分だけをスクリーニングするサービス
+
+    ScreeningService / ScreeningAnalyzer Protocol に構造的部分型付けにより
+    準拠します。
+
+    Attributes:
+        stats: 近似重複の統計
+
+    Examples:
+        >>> service = NearDuplicateScreeningService(rules_service, threshold=0.9)
+        >>> await service.analyze(resume)  # 全体をスクリーニングして索引に登録
+        >>> await service.analyze(resume.replace("山田太郎", "佐藤花子"))
+        >>> service.stats.near_hits
+        1
+
+    Note:
+        近似重複の判定は過去の結果より軽くなりません（削除された行に
+        あった違反の判定も引き継ぐ、安全側の近似です）。テキスト全体を
+        入力とするモデル（n-gram、リモート）では変更行だけのスコアは
+        近似値になります。reload() で下位サービスが差し替わった場合は
+        索引を空にします。
+    """
+
+    def __init__(
+        self,
+        service: ScreeningService,
+        *,
+        threshold: float = 0.9,
+        capacity: int = 1024,
+        window: float = 600.0,
+        max_changed_ratio: float = 0.5,
+        min_length: int = 256,
+        max_length: int = 20_000,
+        hasher: MinHasher | None = None,
+        index: LshIndex[tuple[str, ScreeningResult]] | None = None,
+    ) -> None:
+        """
+        NearDuplicateScreeningService を初期化します
+
+        Args:
+            service: 下位の ScreeningService 実装
+            threshold: 近似重複とみなす推定 Jaccard 類似度の下限
+            capacity: 索引に登録する最大件数
+            window: 索引に登録を保持する秒数
+            max_changed_ratio: 差分だけをスクリーニングする変更文字数の割合の上限
+            min_length: 近似重複を検索する最小の文字数（短いテキストは全体を
+                スクリーニングする方が安い）
+            max_length: 近似重複を検索する最大の文字数（署名の計算を抑える）
+            hasher: MinHash 署名の計算（None なら既定の設定）
+            index: LSH 索引（None なら capacity と window で作成）
+
+        Raises:
+            ValueError: threshold が範囲外の場合
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold は 0 より大きく 1 以下である必要があります")
+        self._service = service
+        self._threshold = threshold
+        self._max_changed_ratio = max_changed_ratio
+        self._min_length = min_length
+        self._max_length = max_length
+        self._hasher = hasher if hasher is not None else MinHasher()
+        self._index = (
+            index
+            if index is not None
+            else LshIndex(
+                num_perm=self._hasher.num_perm, capacity=capacity, window=window
+            )
+        )
+        self._generation = 0
+        self.stats = NearDuplicateStats()
+
+    async def screen(self, content: str) -> str:
+        """
+        スクリーニングし、結果のテキストを返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            スクリーニング結果のテキスト
+        """
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        近似重複があれば差分だけを、なければ全体をスクリーニングします
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: スクリーニング結果
+        """
+        self.stats.calls += 1
+        self.stats.total_chars += len(content)
+        if not self._min_length <= len(content) <= self._max_length:
+            return await self._screen(content)
+
+        signature = self._hasher.signature(content)
+        match = self._index.query(signature, threshold=self._threshold)
+        if match is not None:
+            prior_content, prior_result = match.value
+            result = await self._screen_changes(prior_content, prior_result, content)
+            if result is not None:
+                self.stats.near_hits += 1
+                return result
+            self.stats.fallbacks += 1
+
+        generation = self._generation
+        result = await self._screen(content)
+        if generation == self._generation and not result.degraded:
+            # 待っている間に下位サービスが差し替わった結果と、
+            # フォールバックによる暫定の結果は登録しない
+            key = hashlib.sha256(
+                content.encode("utf-8", errors="surrogatepass")
+            ).hexdigest()
+            self._index.add(key, signature, (content, result))
+        return result
+
+    async def start(self) -> None:
+        """下位サービスの start() フックを転送します"""
+        await start_service(self._service)
+
+    async def aclose(self) -> None:
+        """下位サービスの aclose() フックを転送します"""
+        await stop_service(self._service)
+
+    def close(self) -> None:
+        """下位サービスの close() フックを転送します"""
+        close_service(self._service)
+
+    async def reload(self, *, force: bool = False) -> str | None:
+        """
+        下位サービスの reload() フックを転送します
+
+        下位サービスが差し替わった場合は、古い結果を引き継がないよう
+        索引を空にします。
+        """
+        version = await reload_service(self._service, force=force)
+        if version is not None:
+            self._generation += 1
+            self._index.clear()
+        return version
+
+    async def _screen(self, content: str) -> ScreeningResult:
+        self.stats.screened_chars += len(content)
+        return await analyze_content(self._service, content)
+
+    async def _screen_changes(
+        self, prior_content: str, prior: ScreeningResult, content: str
+    ) -> ScreeningResult | None:
+        """
+        過去のテキストとの差分の行だけをスクリーニングして結果を組み立てる
+
+        Returns:
+            ScreeningResult | None: 組み立てた結果（差分が大きい場合は None）
+        """
+        old_lines = prior_content.splitlines(keepends=True)
+        new_lines = content.splitlines(keepends=True)
+        old_offsets = _line_offsets(old_lines)
+        new_offsets = _line_offsets(new_lines)
+        matcher = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+
+        findings = []
+        # 変更行の範囲と、前後1行の文脈を含めてスクリーニングする範囲
+        segments: list[tuple[int, int, int, int]] = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                old_start, old_end = old_offsets[i1], old_offsets[i2]
+                shift = new_offsets[j1] - old_start
+                findings.extend(
+                    dataclasses.replace(
+                        finding, start=finding.start + shift, end=finding.end + shift
+                    )
+                    for finding in prior.findings
+                    if old_start <= finding.start and finding.end <= old_end
+                )
+            elif j1 < j2 or 0 < j1 < len(new_lines):
+                # 削除でも前後の行が新たに隣り合うため、その境目を確かめる
+                segments.append(
+                    (
+                        new_offsets[max(j1 - 1, 0)],
+                        new_offsets[j1],
+                        new_offsets[j2],
+                        new_offsets[min(j2 + 1, len(new_lines))],
+                    )
+                )
+
+        changed = sum(end - start for _, start, end, _ in segments)
+        if changed > self._max_changed_ratio * len(content):
+            return None
+
+        self.stats.screened_chars += sum(end - start for start, _, _, end in segments)
+        results = (
+            await analyze_many_contents(
+                self._service, [content[start:end] for start, _, _, end in segments]
+            )
+            if segments
+            else []
+        )
+        verdict, score = prior.verdict, prior.score
+        degraded = False
+        for (offset, start, end, _), result in zip(segments, results, strict=True):
+            # 変更行にかからない検出（文脈の行だけにあるもの）は、
+            # 過去の結果から引き継いだ検出と重複するため除く。削除の場合は
+            # start == end で、新たに隣り合った行の境目をまたぐ検出だけが残る
+            for finding in result.findings:
+                finding = dataclasses.replace(
+                    finding, start=finding.start + offset, end=finding.end + offset
+                )
+                if finding.start < end and start < finding.end:
+                    findings.append(finding)
+            if result.verdict.severity > verdict.severity:
+                verdict = result.verdict
+            score = max(score, result.score)
+            degraded = degraded or result.degraded
+
+        # 隣り合う変更の文脈が重なると、同じ検出が二度得られる
+        findings = sorted(
+            dict.fromkeys(findings), key=lambda finding: (finding.start, finding.end)
+        )
+        return ScreeningResult(
+            content=apply_replacements(content, findings),
+            score=score,
+            verdict=verdict,
+            findings=tuple(findings),
+            degraded=degraded,
+        )
+
+
+def _line_offsets(lines: Sequence[str]) -> list[int]:
+    """各行の開始位置（末尾に全体の長さを加えた列）"""
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+    return offsets
+
+
+__all__ = ["NearDuplicateScreeningService", "NearDuplicateStats"]
@@ -0,0 +1,383 @@
+"""
+文字n-gramのハッシュ特徴量と線形モデル
+
+このモジュールは、正規化したテキストの文字n-gramを固定次元の
+疎な特徴ベクトルにハッシュする HashedNgramVectorizer と、その特徴量に
+対するロジスティック回帰モデル NgramLinearModel を提供します。
+
+特徴量化とスコアリングはバッチ全体を1本の配列として処理し、
+ドキュメントごとのPythonループを持ちません。
+
+- バッチの全テキストを連結したコードポイント配列上で、n-gramのハッシュを
+  ``h[n] = h[n-1] * P + cp[i+n-1]`` の漸化式で一括計算します。
+- ドキュメント境界をまたぐn-gramはドキュメントIDの比較で除外します。
+- 疎行列（COO形式）と重みベクトルの積は ``np.bincount`` の
+  重み付き集計で計算します。
+
+モデルは ``.npz`` ファイルのほか、全ワーカーで重みを共有できる
+mmap 形式の成果物（app.infrastructure.artifacts）としても保存できます。
+
+NumPy は任意依存です（``uv sync --extra ngram``）。
+"""
+
+import unicodedata
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from app.infrastructure.artifacts import (
+    ArtifactManifest,
+    open_artifact,
+    write_artifact,
+)
+
+# n-gramモデル成果物の種類
+NGRAM_ARTIFACT_KIND = "ngram_model"
+
+# 64bit ローリングハッシュの乗数（FNV-1a の素数）
+_PRIME = np.uint64(0x100000001B3)
+# n ごとにハッシュ空間を分けるための定数（黄金比）
+_GOLDEN = 0x9E3779B97F4A7C15
+# 最終ミックス（MurmurHash3 fmix64）の乗数
+_MIX = np.uint64(0xFF51AFD7ED558CCD)
+_MASK64 = (1 << 64) - 1
+
+
+def normalize_text(text: str) -> str:
+    """
+    特徴量化の前にテキストを正規化します
+
+    全角英数字や半角カナの表記ゆれを NFKC で統一し、小文字化します。
+    既に NFKC 正規化済みのテキストは高速な判定のみで変換を省略します。
+
+    Args:
+        text: 入力テキスト
+
+    Returns:
+        str: 正規化したテキスト
+    """
+    if not unicodedata.is_normalized("NFKC", text):
+        text = unicodedata.normalize("NFKC", text)
+    return text.lower()
+
+
+@dataclass(frozen=True, slots=True)
+class HashedFeatures:
+    """
+    バッチの疎な特徴量（COO形式、各ドキュメントでL2正規化済み）
+
+    Attributes:
+        doc: 各非ゼロ要素のドキュメント番号
+        feature: 各非ゼロ要素の特徴量番号
+        value: 各非ゼロ要素の値
+        n_docs: バッチのドキュメント数
+    """
+
+    doc: np.ndarray
+    feature: np.ndarray
+    value: np.ndarray
+    n_docs: int
+
+
+@dataclass(frozen=True, slots=True)
+class HashedNgramVectorizer:
+    """
+    文字n-gramを固定次元の特徴量にハッシュするベクトライザー
+
+    各n-gramは 64bit ハッシュの下位ビットで特徴量番号を、最上位ビットで
+    符号（±1）を決めます。符号付きハッシュにより、衝突したn-gramの寄与が
+    期待値で打ち消し合います。
+
+    Attributes:
+        n_features: 特徴量の次元数（2のべき乗）
+        ngram_min: 最小のn-gram長
+        ngram_max: 最大のn-gram長
+
+    Examples:
+        >>> vectorizer = HashedNgramVectorizer(n_features=2**18)
+        >>> features = vectorizer.transform(["男性限定", "経験者歓迎"])
+        >>> features.n_docs
+        2
+    """
+
+    n_features: int = 2**18
+    ngram_min: int = 1
+    ngram_max: int = 3
+
+    def __post_init__(self) -> None:
+        if self.n_features < 1 or self.n_features & (self.n_features - 1):
+            raise ValueError("n_features は 2 のべき乗である必要があります")
+        if not 1 <= self.ngram_min <= self.ngram_max:
+            raise ValueError("1 <= ngram_min <= ngram_max である必要があります")
+
+    def transform(self, texts: Sequence[str]) -> HashedFeatures:
+        """
+        テキストのバッチを疎な特徴量に変換します
+
+        Args:
+            texts: 入力テキストの列
+
+        Returns:
+            HashedFeatures: バッチの特徴量
+        """
+        n_docs = len(texts)
+        normalized = list(map(normalize_text, texts))
+        lengths = np.fromiter(map(len, normalized), dtype=np.int64, count=n_docs)
+        # JSON の "\ud800" 等で入力に含まれうる孤立サロゲートもそのまま符号化する
+        codepoints = np.frombuffer(
+            "".join(normalized).encode("utf-32-le", errors="surrogatepass"),
+            dtype=np.uint32,
+        ).astype(np.uint64)
+        doc_ids = np.repeat(np.arange(n_docs, dtype=np.int64), lengths)
+
+        docs: list[np.ndarray] = []
+        hashes: list[np.ndarray] = []
+        rolling = np.zeros(codepoints.size, dtype=np.uint64)
+        for n in range(1, self.ngram_max + 1):
+            count = codepoints.size - n + 1
+            if count <= 0:
+                break
+            # 位置 i から始まる長さ n のn-gramのハッシュ
+            rolling = rolling[:count] * _PRIME + codepoints[n - 1 : n - 1 + count]
+            if n < self.ngram_min:
+                continue
+            within_doc = doc_ids[:count] == doc_ids[n - 1 : n - 1 + count]
+            docs.append(doc_ids[:count][within_doc])
+            hashes.append(_finalize(rolling[within_doc], n))
+
+        if not hashes:
+            empty = np.empty(0, dtype=np.int64)
+            return HashedFeatures(empty, empty, np.empty(0), n_docs)
+
+        doc = np.concatenate(docs)
+        hashed = np.concatenate(hashes)
+        feature = (hashed & np.uint64(self.n_features - 1)).astype(np.int64)
+        sign = 1.0 - 2.0 * (hashed >> np.uint64(63)).astype(np.float64)
+
+        # 同じ (ドキュメント, 特徴量) の出現を集計して COO 形式にする
+        keys, inverse = np.unique(doc * self.n_features + feature, return_inverse=True)
+        value = np.bincount(inverse, weights=sign, minlength=keys.size)
+        doc = keys // self.n_features
+        norm = np.sqrt(np.bincount(doc, weights=value**2, minlength=n_docs))
+        value /= np.where(norm > 0, norm, 1.0)[doc]
+        return HashedFeatures(doc, keys % self.n_features, value, n_docs)
+
+
+@dataclass(frozen=True)
+class NgramLinearModel:
+    """
+    ハッシュ特徴量に対するロジスティック回帰モデル
+
+    Attributes:
+        vectorizer: 特徴量化に使うベクトライザー
+        weights: 特徴量ごとの重み（長さ n_features）
+        bias: バイアス項
+        review_threshold: REVIEW と判定するスコアの下限
+        block_threshold: BLOCK と判定するスコアの下限
+
+    Examples:
+        >>> model = NgramLinearModel.fit(texts, labels)
+        >>> model.predict_proba(["男性限定の募集"])
+        array([0.93])
+        >>> model.save("model.npz")
+    """
+
+    vectorizer: HashedNgramVectorizer
+    weights: np.ndarray
+    bias: float = 0.0
+    review_threshold: float = 0.5
+    block_threshold: float = 0.9
+
+    def __post_init__(self) -> None:
+        if self.weights.shape != (self.vectorizer.n_features,):
+            raise ValueError("weights の長さが n_features と一致しません")
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        テキストのバッチのスコア（0.0〜1.0）を一括で計算します
+
+        Args:
+            texts: 入力テキストの列
+
+        Returns:
+            np.ndarray: 各テキストのスコア
+        """
+        return _sigmoid(self.decision_function(self.vectorizer.transform(texts)))
+
+    def decision_function(self, features: HashedFeatures) -> np.ndarray:
+        """
+        特徴量と重みの内積にバイアスを加えた値を返します
+
+        Args:
+            features: transform() で得た特徴量
+
+        Returns:
+            np.ndarray: 各ドキュメントのロジット
+        """
+        dot = np.bincount(
+            features.doc,
+            weights=features.value * self.weights[features.feature],
+            minlength=features.n_docs,
+        )
+        return dot + self.bias
+
+    @classmethod
+    def fit(
+        cls,
+        texts: Sequence[str],
+        labels: Sequence[int],
+        *,
+        vectorizer: HashedNgramVectorizer | None = None,
+        epochs: int = 300,
+        learning_rate: float = 1.0,
+        l2: float = 1e-4,
+    ) -> "NgramLinearModel":
+        """
+        全バッチ勾配降下法でロジスティック回帰を学習します
+
+        Args:
+            texts: 学習テキストの列
+            labels: 各テキストのラベル（1: 要確認, 0: 問題なし）
+            vectorizer: 使用するベクトライザー（None なら既定値）
+            epochs: 反復回数
+            learning_rate: 学習率
+            l2: L2正則化の係数
+
+        Returns:
+            NgramLinearModel: 学習済みモデル
+        """
+        vectorizer = vectorizer or HashedNgramVectorizer()
+        features = vectorizer.transform(texts)
+        target = np.asarray(labels, dtype=np.float64)
+        weights, bias = np.zeros(vectorizer.n_features), 0.0
+        n_docs = max(features.n_docs, 1)
+        for _ in range(epochs):
+            dot = np.bincount(
+                features.doc,
+                weights=features.value * weights[features.feature],
+                minlength=features.n_docs,
+            )
+            error = _sigmoid(dot + bias) - target
+            gradient = np.bincount(
+                features.feature,
+                weights=error[features.doc] * features.value,
+                minlength=vectorizer.n_features,
+            )
+            weights -= learning_rate * (gradient / n_docs + l2 * weights)
+            bias -= learning_rate * float(error.mean())
+        return cls(vectorizer, weights, bias)
+
+    def save(self, path: str | Path) -> None:
+        """
+        モデルを ``.npz`` ファイルに保存します
+
+        Args:
+            path: 保存先のパス
+        """
+        np.savez(
+            path,
+            weights=self.weights,
+            bias=self.bias,
+            ngram_range=(self.vectorizer.ngram_min, self.vectorizer.ngram_max),
+            thresholds=(self.review_threshold, self.block_threshold),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "NgramLinearModel":
+        """
+        save() で保存したモデルを読み込みます
+
+        Args:
+            path: ``.npz`` ファイルのパス
+
+        Returns:
+            NgramLinearModel: 読み込んだモデル
+        """
+        with np.load(path) as archive:
+            weights = archive["weights"]
+            ngram_min, ngram_max = archive["ngram_range"].tolist()
+            review_threshold, block_threshold = archive["thresholds"].tolist()
+            return cls(
+                HashedNgramVectorizer(weights.size, ngram_min, ngram_max),
+                weights,
+                float(archive["bias"]),
+                review_threshold,
+                block_threshold,
+            )
+
+    def save_artifact(self, directory: str | Path) -> ArtifactManifest:
+        """
+        モデルを mmap 形式の成果物として保存します
+
+        Args:
+            directory: 出力先ディレクトリ
+
+        Returns:
+            ArtifactManifest: 書き出した成果物のマニフェスト
+        """
+        return write_artifact(
+            directory,
+            NGRAM_ARTIFACT_KIND,
+            {"weights": np.ascontiguousarray(self.weights, dtype=np.float64)},
+            {
+                "n_features": self.vectorizer.n_features,
+                "ngram_min": self.vectorizer.ngram_min,
+                "ngram_max": self.vectorizer.ngram_max,
+                "bias": self.bias,
+                "review_threshold": self.review_threshold,
+                "block_threshold": self.block_threshold,
+            },
+        )
+
+    @classmethod
+    def load_artifact(
+        cls, directory: str | Path, *, verify: bool = False
+    ) -> "NgramLinearModel":
+        """
+        save_artifact() で保存したモデルを mmap で開きます
+
+        重みはコピーせずに読み取り専用の配列としてマッピングするため、
+        読み込みは重みのサイズによらず数ミリ秒で完了します。
+
+        Args:
+            directory: 成果物のディレクトリ
+            verify: 配列ファイルのハッシュを検証するか
+
+        Returns:
+            NgramLinearModel: 読み込んだモデル
+        """
+        artifact = open_artifact(directory, kind=NGRAM_ARTIFACT_KIND, verify=verify)
+        meta = artifact.metadata
+        return cls(
+            HashedNgramVectorizer(
+                meta["n_features"], meta["ngram_min"], meta["ngram_max"]
+            ),
+            np.frombuffer(artifact.array("weights"), dtype=np.float64),
+            meta["bias"],
+            meta["review_threshold"],
+            meta["block_threshold"],
+        )
+
+
+def _finalize(rolling: np.ndarray, n: int) -> np.ndarray:
+    """n-gram長ごとにハッシュ空間を分け、ビットを拡散させる（fmix64）"""
+    hashed = rolling ^ np.uint64((n * _GOLDEN) & _MASK64)
+    hashed ^= hashed >> np.uint64(33)
+    hashed *= _MIX
+    hashed ^= hashed >> np.uint64(33)
+    return hashed
+
+
+def _sigmoid(logits: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-logits))
+
+
+__all__ = [
+    "NGRAM_ARTIFACT_KIND",
+    "HashedFeatures",
+    "HashedNgramVectorizer",
+    "NgramLinearModel",
+    "normalize_text",
+]
@@ -0,0 +1,113 @@
+"""
+文字n-gram線形モデルによるスクリーニングサービス
+
+このモジュールは、NgramLinearModel でテキストをスコアリングするローカルの
+ScreeningService 実装を提供します。外部APIを呼び出さずに学習済みの
+スコアを得られ、analyze_many() はバッチ全体を1回のNumPy演算で処理します。
+"""
+
+from collections.abc import Sequence
+
+from app.domain.screening_result import ScreeningResult, Verdict
+from app.infrastructure.ngram_model import NgramLinearModel
+
+
+class NgramScreeningService:
+    """
+    文字n-gram線形モデルによるスクリーニングサービス
+
+    ScreeningService / ScreeningAnalyzer / BatchScreeningAnalyzer Protocol に
+    構造的部分型付けにより準拠します。スコアはモデルの出力確率で、
+    モデルのしきい値（指定した場合はそのしきい値）に従って判定します。テキストは書き換えず、
+    検出箇所（findings）も返しません。
+
+    Examples:
+        >>> service = NgramScreeningService(NgramLinearModel.load("model.npz"))
+        >>> results = await service.analyze_many(["男性限定", "経験者歓迎"])
+        >>> [result.verdict for result in results]
+        [<Verdict.REVIEW: 'review'>, <Verdict.PASS: 'pass'>]
+
+    Note:
+        スコアリングはイベントループ上で同期的に実行されます。
+        1件ずつの呼び出しでは配列演算の固定費が支配的になるため、
+        MicroBatchingScreeningService と組み合わせて利用してください。
+    """
+
+    def __init__(
+        self,
+        model: NgramLinearModel,
+        *,
+        review_threshold: float | None = None,
+        block_threshold: float | None = None,
+    ) -> None:
+        """
+        NgramScreeningService を初期化します
+
+        Args:
+            model: 学習済みの NgramLinearModel
+            review_threshold: REVIEW と判定するスコアの下限（None ならモデルの値）
+            block_threshold: BLOCK と判定するスコアの下限（None ならモデルの値）
+
+        Note:
+            同じモデルをしきい値だけ変えて複数のテナントで共有できます。
+        """
+        self._model = model
+        self._review_threshold = (
+            model.review_threshold if review_threshold is None else review_threshold
+        )
+        self._block_threshold = (
+            model.block_threshold if block_threshold is None else block_threshold
+        )
+
+    async def screen(self, content: str) -> str:
+        """
+        スクリーニングし、入力と同じテキストを返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            入力と同じテキスト
+        """
+        return content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        1件のテキストをスコアリングし、詳細な結果を返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: スコアと判定を含む結果
+        """
+        (result,) = await self.analyze_many([content])
+        return result
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        """
+        バッチ全体を1回の行列演算でスコアリングします
+
+        Args:
+            contents: スクリーニング対象のテキストの列
+
+        Returns:
+            list[ScreeningResult]: contents と同じ順序の結果
+        """
+        if not contents:
+            return []
+        scores = self._model.predict_proba(contents).tolist()
+        return [
+            ScreeningResult(content, score=score, verdict=self._verdict(score))
+            for content, score in zip(contents, scores, strict=True)
+        ]
+
+    def _verdict(self, score: float) -> Verdict:
+        if score >= self._block_threshold:
+            return Verdict.BLOCK
+        if score >= self._review_threshold:
+            return Verdict.REVIEW
+        return Verdict.PASS
+
+
+__all__ = ["NgramScreeningService"]
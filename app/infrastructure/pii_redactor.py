@@ -0,0 +1,216 @@
+"""
+個人情報の検出と置換
+
+このモジュールは、応募者のテキストに含まれる個人情報（メールアドレス、
+電話番号、郵便番号、住所、マイナンバー）を検出し、置換するエンジンを
+提供します。
+
+- すべての種類のパターンを名前付きグループの選択（``(?P<p0>...)|(?P<p1>...)``）
+  として1つの正規表現にコンパイルし、テキストを1回だけ走査します。
+  種類ごとに ``re.sub`` を繰り返す方法と異なり、テキストの長さに比例した
+  走査と文字列の再構築は1回ずつです。
+- 置換後のテキストは、一致箇所の間の部分と置換文字列を1回の join で
+  組み立てます。
+- すべてのパターンが先頭になりうる文字（``first``）を持つ場合は、合成した
+  正規表現の先頭にその文字クラスの先読みを置きます。大半の位置は
+  選択肢を1つずつ試す前にこの1回の判定で読み飛ばせます。
+- ``\\d`` は全角数字にも一致するため、全角で書かれた番号も検出します。
+"""
+
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from app.domain.screening_result import Finding
+
+# 番号の区切りとして扱うハイフン類（全角・長音記号を含む）
+_HYPHEN = "[-‐－−ー]"
+
+_PREFECTURES = (
+    "北海道 青森県 岩手県 宮城県 秋田県 山形県 福島県 茨城県 栃木県 群馬県 埼玉県"
+    " 千葉県 東京都 神奈川県 新潟県 富山県 石川県 福井県 山梨県 長野県 岐阜県"
+    " 静岡県 愛知県 三重県 滋賀県 京都府 大阪府 兵庫県 奈良県 和歌山県 鳥取県"
+    " 島根県 岡山県 広島県 山口県 徳島県 香川県 愛媛県 高知県 福岡県 佐賀県"
+    " 長崎県 熊本県 大分県 宮崎県 鹿児島県 沖縄県"
+).split()
+
+
+def is_valid_my_number(text: str) -> bool:
+    """
+    マイナンバー（個人番号）のチェックデジットを検証します
+
+    Args:
+        text: 12桁の数字（区切り文字を含んでもよい）
+
+    Returns:
+        bool: 12桁で、末尾のチェックデジットが正しい場合 True
+
+    Examples:
+        >>> is_valid_my_number("1234 5678 9018")
+        True
+    """
+    digits = [int(char) for char in text if char.isdigit()]
+    if len(digits) != 12:
+        return False
+    total = sum(
+        digit * (position + 1 if position <= 6 else position - 5)
+        for position, digit in enumerate(reversed(digits[:11]), start=1)
+    )
+    remainder = total % 11
+    return digits[11] == (0 if remainder <= 1 else 11 - remainder)
+
+
+@dataclass(frozen=True, slots=True)
+class PiiPattern:
+    """
+    個人情報の1つの種類のパターン
+
+    Attributes:
+        kind: 検出の種類（Finding.kind）
+        pattern: 正規表現（名前付きグループを含めないこと）
+        replacement: 置換後の文字列
+        first: 一致の先頭になりうる文字（文字クラスの中身。例: ``"\\d〒"``。
+            None なら先読みによる読み飛ばしを行わない）
+        validate: 一致した文字列を検証する関数（False なら検出しない）
+    """
+
+    kind: str
+    pattern: str
+    replacement: str
+    first: str | None = None
+    validate: Callable[[str], bool] | None = None
+
+
+DEFAULT_PII_PATTERNS: tuple[PiiPattern, ...] = (
+    PiiPattern(
+        "email",
+        r"[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+",
+        "[EMAIL]",
+        first=r"A-Za-z0-9._%+\-",
+    ),
+    PiiPattern(
+        "my_number",
+        rf"(?<!\d)\d{{4}}(?:[ 　]|{_HYPHEN})?\d{{4}}(?:[ 　]|{_HYPHEN})?\d{{4}}(?!\d)",
+        "[MY_NUMBER]",
+        first=r"\d",
+        validate=is_valid_my_number,
+    ),
+    PiiPattern(
+        "phone",
+        rf"(?<!\d)(?:(?:[+＋]81[ 　]?|[0０])\d{{1,4}}{_HYPHEN}\d{{1,4}}{_HYPHEN}"
+        r"\d{4}|[0０]\d{9,10})(?!\d)",
+        "[PHONE]",
+        first=r"\d+＋",
+    ),
+    PiiPattern(
+        "postal_code",
+        rf"(?:〒[ 　]?\d{{3}}{_HYPHEN}?\d{{4}}|(?<!\d)\d{{3}}{_HYPHEN}\d{{4}})(?!\d)",
+        "[POSTAL_CODE]",
+        first=r"\d〒",
+    ),
+    PiiPattern(
+        "address",
+        rf"(?:{'|'.join(_PREFECTURES)})[^\s、。,，]{{0,15}}?[市区町村郡]"
+        rf"[^\s、。,，]{{0,20}}?\d+(?:(?:{_HYPHEN}|丁目|番地|番|号|の)\d+){{0,3}}"
+        r"(?:番地|番|号)?",
+        "[ADDRESS]",
+        first="".join(dict.fromkeys(prefecture[0] for prefecture in _PREFECTURES)),
+    ),
+)
+
+
+class PiiRedactor:
+    """
+    個人情報を1回の走査で検出・置換するエンジン
+
+    パターンの選択は先頭から順に試すため、同じ位置で複数の種類に一致する
+    場合は patterns の先の種類を採用します（既定ではマイナンバーを
+    電話番号より先に試します）。検証関数が False を返した一致は検出せず、
+    その直後から走査を続けます。
+
+    Examples:
+        >>> redactor = PiiRedactor()
+        >>> redactor.redact("連絡先: taro@example.com / 090-1234-5678")
+        ('連絡先: [EMAIL] / [PHONE]', [Finding(kind='email', ...), ...])
+    """
+
+    def __init__(self, patterns: Sequence[PiiPattern] = DEFAULT_PII_PATTERNS) -> None:
+        """
+        PiiRedactor を初期化し、パターンを1つの正規表現にコンパイルします
+
+        Args:
+            patterns: 個人情報のパターン（先のものほど優先）
+
+        Raises:
+            ValueError: パターンがない、または正規表現が不正な場合
+        """
+        if not patterns:
+            raise ValueError("パターンが1つ以上必要です")
+        self._patterns = tuple(patterns)
+        alternation = "|".join(
+            f"(?P<p{index}>{pattern.pattern})"
+            for index, pattern in enumerate(self._patterns)
+        )
+        if all(pattern.first for pattern in self._patterns):
+            first = "".join(pattern.first for pattern in self._patterns)
+            alternation = f"(?=[{first}])(?:{alternation})"
+        try:
+            self._regex = re.compile(alternation)
+        except re.error as exc:
+            raise ValueError(f"個人情報のパターンが不正です: {exc}") from exc
+        self._by_group = {f"p{index}": p for index, p in enumerate(self._patterns)}
+
+    @property
+    def patterns(self) -> tuple[PiiPattern, ...]:
+        """コンパイルしたパターン（優先順）"""
+        return self._patterns
+
+    def find(self, text: str) -> list[Finding]:
+        """
+        個人情報を検出します
+
+        Args:
+            text: 検査するテキスト
+
+        Returns:
+            list[Finding]: 検出箇所（開始位置の昇順。互いに重ならない）
+        """
+        findings = []
+        for match in self._regex.finditer(text):
+            pattern = self._by_group[match.lastgroup]
+            if pattern.validate is not None and not pattern.validate(match.group()):
+                continue
+            findings.append(
+                Finding(pattern.kind, match.start(), match.end(), pattern.replacement)
+            )
+        return findings
+
+    def redact(self, text: str) -> tuple[str, list[Finding]]:
+        """
+        個人情報を検出し、置換したテキストを返します
+
+        Args:
+            text: 検査するテキスト
+
+        Returns:
+            tuple[str, list[Finding]]: 置換後のテキストと検出箇所
+        """
+        findings = self.find(text)
+        if not findings:
+            return text, findings
+        pieces = []
+        position = 0
+        for finding in findings:
+            pieces.append(text[position : finding.start])
+            pieces.append(finding.replacement)
+            position = finding.end
+        pieces.append(text[position:])
+        return "".join(pieces), findings
+
+
+__all__ = [
+    "DEFAULT_PII_PATTERNS",
+    "PiiPattern",
+    "PiiRedactor",
+    "is_valid_my_number",
+]
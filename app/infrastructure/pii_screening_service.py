@@ -0,0 +1,89 @@
+"""
+個人情報の置換を行うスクリーニングサービス
+
+このモジュールは、PiiRedactor で個人情報を検出し、置換したテキストを
+返す ScreeningService 実装を提供します。個人情報の有無は応募の可否とは
+無関係なため、判定は常に PASS、スコアは 0.0 です。保存や下流のモデル
+呼び出しの前段として、単独のバックエンド、アンサンブルの一員、または
+パイプラインの検出器として使用します。
+"""
+
+from collections.abc import Sequence
+
+from app.domain.screening_result import ScreeningResult
+from app.infrastructure.pii_redactor import PiiRedactor
+
+
+class PiiScreeningService:
+    """
+    個人情報を置換するスクリーニングサービス
+
+    ScreeningService / ScreeningAnalyzer / BatchScreeningAnalyzer Protocol に
+    構造的部分型付けにより準拠します。
+
+    Examples:
+        >>> service = PiiScreeningService()
+        >>> await service.screen("連絡先は taro@example.com です")
+        '連絡先は [EMAIL] です'
+    """
+
+    def __init__(self, redactor: PiiRedactor | None = None) -> None:
+        """
+        PiiScreeningService を初期化します
+
+        Args:
+            redactor: 個人情報の検出・置換エンジン（None なら既定のパターン）
+        """
+        self._redactor = redactor if redactor is not None else PiiRedactor()
+
+    async def screen(self, content: str) -> str:
+        """
+        個人情報を置換したテキストを返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            個人情報を置換したテキスト
+        """
+        return self._redactor.redact(content)[0]
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        個人情報を置換し、検出箇所を含む結果を返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: 置換後のテキストと検出箇所（判定は PASS）
+        """
+        return self.evaluate(content)
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        """
+        複数のテキストの個人情報を置換します
+
+        Args:
+            contents: スクリーニング対象のテキストの列
+
+        Returns:
+            list[ScreeningResult]: contents と同じ順序の結果
+        """
+        return [self.evaluate(content) for content in contents]
+
+    def evaluate(self, content: str) -> ScreeningResult:
+        """
+        個人情報を同期的に置換します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: スクリーニング結果
+        """
+        redacted, findings = self._redactor.redact(content)
+        return ScreeningResult(redacted, findings=tuple(findings))
+
+
+__all__ = ["PiiScreeningService"]
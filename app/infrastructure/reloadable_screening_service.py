@@ -0,0 +1,220 @@
+"""
+再読み込み可能なスクリーニングサービス
+
+このモジュールは、ルールセット等の入力ファイルが更新されたときに
+新しいバックエンドをスレッドで構築し、稼働中のサービスと原子的に
+差し替えるデコレーター実装を提供します。
+
+- 構築（成果物の読み込みやルールのコンパイル）は ``asyncio.to_thread`` で
+  実行するため、イベントループを止めずにリクエストの処理を続けます。
+- 差し替えは参照の代入1回で、差し替え前に始まった呼び出しは古い
+  バージョンのまま完了します。古いバックエンドは、その呼び出しが
+  すべて終わってから閉じます。
+- ``reload()`` は新しいバージョンを返します。上位の
+  CachedScreeningService はこれをキャッシュキーの名前空間に使うため、
+  古いバージョンの結果は参照されなくなります。
+"""
+
+import asyncio
+import os
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from app.domain.screening_result import ScreeningResult
+from app.domain.screening_service import (
+    ScreeningService,
+    analyze_content,
+    analyze_many_contents,
+)
+from app.infrastructure.artifacts import MANIFEST_NAME
+from app.infrastructure.service_lifecycle import (
+    close_service,
+    start_service,
+    stop_service,
+)
+
+
+def file_fingerprint(path: str | Path) -> tuple[int, int, int] | None:
+    """
+    ファイルの更新を検出するための指紋を返します
+
+    ディレクトリ（成果物）の場合はマニフェストの指紋を返します。
+    成果物はマニフェストの置き換えで更新されるためです。
+
+    Args:
+        path: ファイルまたは成果物のディレクトリ
+
+    Returns:
+        tuple[int, int, int] | None: (i-node, サイズ, 更新時刻)
+        （存在しない場合は None）
+    """
+    path = Path(path)
+    if path.is_dir():
+        path = path / MANIFEST_NAME
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class _Generation:
+    """1つのバージョンのバックエンドと実行中の呼び出し数"""
+
+    __slots__ = ("leases", "retired", "service")
+
+    def __init__(self, service: ScreeningService) -> None:
+        self.service = service
+        self.leases = 0
+        self.retired = False
+
+
+class ReloadableScreeningService:
+    """
+    バックエンドを無停止で差し替えられるスクリーニングサービス
+
+    ScreeningService / ScreeningAnalyzer / BatchScreeningAnalyzer Protocol に
+    構造的部分型付けにより準拠します。バックエンドが ``version`` 属性を
+    持つ場合（RuleScreeningService 等）は、同じバージョンへの差し替えを省きます。
+
+    Attributes:
+        reloads: バックエンドを差し替えた回数
+
+    Examples:
+        >>> service = ReloadableScreeningService(
+        ...     lambda: RuleScreeningService.open("artifacts/rules"),
+        ...     watch="artifacts/rules",
+        ... )
+        >>> await service.reload()  # 成果物が更新されていなければ None
+        >>> # scripts/build_artifacts.py で成果物を再ビルドした後
+        >>> await service.reload()
+        '9f2c...'
+
+    Note:
+        サービスのライフサイクルフック（start / aclose / close / reload）を
+        持ち、service_lifecycle の関数で呼び出します。
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], ScreeningService],
+        *,
+        watch: str | Path | None = None,
+    ) -> None:
+        """
+        ReloadableScreeningService を初期化し、最初のバックエンドを構築します
+
+        Args:
+            loader: バックエンドを構築する関数（スレッドから呼び出されます）
+            watch: 更新を検出するファイルまたは成果物のディレクトリ
+                （None の場合、reload() は force=True でのみ差し替えます）
+        """
+        self._loader = loader
+        self._watch = Path(watch) if watch is not None else None
+        self._fingerprint = self._current_fingerprint()
+        self._current = _Generation(loader())
+        self._lock = asyncio.Lock()
+        self._disposals: set[asyncio.Task[None]] = set()
+        self.reloads = 0
+
+    @property
+    def version(self) -> str:
+        """現在のバックエンドのバージョン（持たない場合は空文字列）"""
+        return getattr(self._current.service, "version", "")
+
+    async def screen(self, content: str) -> str:
+        """現在のバックエンドでスクリーニングを実行します"""
+        generation = self._acquire()
+        try:
+            return await generation.service.screen(content)
+        finally:
+            self._release(generation)
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """現在のバックエンドで詳細なスクリーニングを実行します"""
+        generation = self._acquire()
+        try:
+            return await analyze_content(generation.service, content)
+        finally:
+            self._release(generation)
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        """現在のバックエンドで複数のテキストをスクリーニングします"""
+        generation = self._acquire()
+        try:
+            return await analyze_many_contents(generation.service, contents)
+        finally:
+            self._release(generation)
+
+    async def reload(self, *, force: bool = False) -> str | None:
+        """
+        入力が更新されていれば新しいバックエンドを構築して差し替えます
+
+        同時に呼び出された場合は1つずつ実行します。構築に失敗した場合は
+        現在のバックエンドのまま例外を送出します（同じ入力で再試行は
+        しないため、入力を修正してから再度呼び出してください）。
+
+        Args:
+            force: 入力の更新を確認せずに構築するか
+
+        Returns:
+            str | None: 差し替えた場合は新しいバージョン、差し替えなかった場合は None
+        """
+        async with self._lock:
+            fingerprint = await asyncio.to_thread(self._current_fingerprint)
+            if not force and (self._watch is None or fingerprint == self._fingerprint):
+                return None
+            self._fingerprint = fingerprint
+            service = await asyncio.to_thread(self._loader)
+            version = getattr(service, "version", "")
+            if version and version == self.version:
+                close_service(service)
+                return None
+            await start_service(service)
+            previous, self._current = self._current, _Generation(service)
+            self.reloads += 1
+            previous.retired = True
+            if previous.leases == 0:
+                self._schedule_dispose(previous)
+            return version
+
+    async def start(self) -> None:
+        """現在のバックエンドの start() フックを転送します"""
+        await start_service(self._current.service)
+
+    async def aclose(self) -> None:
+        """古いバックエンドの解放を待ち、現在のバックエンドの aclose() を転送します"""
+        if self._disposals:
+            await asyncio.gather(*self._disposals, return_exceptions=True)
+        await stop_service(self._current.service)
+
+    def close(self) -> None:
+        """現在のバックエンドの close() フックを転送します"""
+        close_service(self._current.service)
+
+    def _current_fingerprint(self) -> tuple[int, int, int] | None:
+        return file_fingerprint(self._watch) if self._watch is not None else None
+
+    def _acquire(self) -> _Generation:
+        generation = self._current
+        generation.leases += 1
+        return generation
+
+    def _release(self, generation: _Generation) -> None:
+        generation.leases -= 1
+        if generation.retired and generation.leases == 0:
+            self._schedule_dispose(generation)
+
+    def _schedule_dispose(self, generation: _Generation) -> None:
+        task = asyncio.ensure_future(_dispose(generation.service))
+        self._disposals.add(task)
+        task.add_done_callback(self._disposals.discard)
+
+
+async def _dispose(service: ScreeningService) -> None:
+    """差し替えたバックエンドのフックを呼び出す"""
+    await stop_service(service)
+    close_service(service)
+
+
+__all__ = ["ReloadableScreeningService", "file_fingerprint"]
@@ -0,0 +1,250 @@
+"""
+外部スコアリングAPIを利用するスクリーニングサービス
+
+このモジュールは、リモートのスコアリングHTTP APIにスクリーニングを委譲する
+ScreeningService 実装を提供します。ワーカーごとに1つの長寿命な
+``httpx.AsyncClient`` をコネクションプールとして共有し、Keep-Alive と
+（``h2`` がインストールされていれば）HTTP/2 で接続を再利用します。
+
+リモートAPIの契約:
+    POST {base_url}/v1/score
+        リクエスト: ``{"content": "..."}``
+        レスポンス: ``{"content": "...", "score": 0.0, "verdict": "pass",
+        "findings": [{"kind": "...", "start": 0, "end": 0, "replacement": null}]}``
+    POST {base_url}/v1/score:batch
+        リクエスト: ``{"contents": ["...", ...]}``
+        レスポンス: ``{"results": [...]}``（各要素は /v1/score のレスポンスと同じ形式）
+"""
+
+import importlib.util
+import json
+from collections.abc import Sequence
+from typing import Any
+
+import httpx
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.domain.screening_result import Finding, ScreeningResult, Verdict
+from app.infrastructure.tracing import TRACEPARENT_HEADER, current_traceparent
+
+# スコアリングAPIのパス
+SCORE_PATH = "/v1/score"
+# 一括スコアリングAPIのパス
+BATCH_SCORE_PATH = "/v1/score:batch"
+
+
+class RemoteScreeningServiceError(ScreeningUnavailableError):
+    """リモートスコアリングAPIの呼び出しに失敗した場合の例外"""
+
+
+class RemoteScreeningService:
+    """
+    リモートスコアリングAPIを呼び出すスクリーニングサービス
+
+    ScreeningService / ScreeningAnalyzer / BatchScreeningAnalyzer Protocol に
+    構造的部分型付けにより準拠します。
+    HTTPクライアントは start() で作成し aclose() で閉じるため、
+    アプリケーションの lifespan と同じ寿命を持ちます。
+
+    Examples:
+        >>> service = RemoteScreeningService("http://scoring.internal:9000")
+        >>> await service.start()
+        >>> result = await service.analyze("応募者のテキスト")
+        >>> result.score
+        0.12
+        >>> await service.aclose()
+
+    Note:
+        start() を呼ばずに利用した場合は、初回呼び出し時にクライアントを
+        遅延作成します。
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        timeout: float = 2.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """
+        RemoteScreeningService を初期化します
+
+        Args:
+            base_url: スコアリングAPIのベースURL
+            timeout: 1リクエストあたりのタイムアウト（秒）
+            max_connections: コネクションプールの最大接続数
+            max_keepalive_connections: Keep-Alive で保持する最大アイドル接続数
+            keepalive_expiry: アイドル接続を保持する秒数
+            http2: HTTP/2 を使用するか（``h2`` が未インストールなら無視）
+            transport: テスト用のトランスポート（通常は None）
+        """
+        self._base_url = base_url
+        self._timeout = httpx.Timeout(timeout)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+    async def start(self) -> None:
+        """コネクションプールを持つHTTPクライアントを作成します"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=self._timeout,
+                limits=self._limits,
+                http2=self._http2,
+                transport=self._transport,
+            )
+
+    async def aclose(self) -> None:
+        """HTTPクライアントを閉じてプール内の接続を解放します"""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def screen(self, content: str) -> str:
+        """
+        リモートAPIでスクリーニングし、結果のテキストを返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            スクリーニング結果のテキスト
+
+        Raises:
+            RemoteScreeningServiceError: 通信エラーまたは不正な応答の場合
+        """
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        リモートAPIでスクリーニングし、詳細な結果を返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: スコア、判定、検出箇所を含む結果
+
+        Raises:
+            RemoteScreeningServiceError: 通信エラーまたは不正な応答の場合
+        """
+        payload = await self._post(SCORE_PATH, {"content": content})
+        return parse_result(payload)
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        """
+        一括スコアリングAPIで複数コンテンツを1回のリクエストでスクリーニングします
+
+        Args:
+            contents: スクリーニング対象のテキストの列
+
+        Returns:
+            list[ScreeningResult]: contents と同じ順序の結果
+
+        Raises:
+            RemoteScreeningServiceError: 通信エラー、不正な応答、または
+                結果の件数が一致しない場合
+        """
+        if not contents:
+            return []
+        payload = await self._post(BATCH_SCORE_PATH, {"contents": list(contents)})
+        try:
+            results = payload["results"]
+        except (KeyError, TypeError) as exc:
+            raise RemoteScreeningServiceError(
+                f"スコアリングAPIの応答が不正です: {exc}"
+            ) from exc
+        if not isinstance(results, list):
+            raise RemoteScreeningServiceError(
+                "スコアリングAPIの応答の results が配列ではありません"
+            )
+        if len(results) != len(contents):
+            raise RemoteScreeningServiceError(
+                "スコアリングAPIの応答件数がリクエストと一致しません"
+            )
+        return [parse_result(item) for item in results]
+
+    async def _post(self, path: str, body: dict[str, Any]) -> Any:
+        if self._client is None:
+            await self.start()
+        # 本文の符号化は入力の問題であり、リモートAPIの障害として扱わない
+        content = _encode_body(body)
+        headers = {"Content-Type": "application/json"}
+        # トレース中であれば W3C Trace Context をリモートAPIに伝搬する
+        traceparent = current_traceparent()
+        if traceparent is not None:
+            headers[TRACEPARENT_HEADER] = traceparent
+        try:
+            response = await self._client.post(path, content=content, headers=headers)
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise RemoteScreeningServiceError(
+                f"スコアリングAPIの呼び出しに失敗しました: {exc}"
+            ) from exc
+        try:
+            return response.json()
+        except ValueError as exc:
+            raise RemoteScreeningServiceError(
+                f"スコアリングAPIの応答が不正です: {exc}"
+            ) from exc
+
+
+def _encode_body(body: dict[str, Any]) -> bytes:
+    """本文をJSONに符号化する（孤立サロゲートは ASCII のエスケープで出力する）"""
+    try:
+        return json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode()
+    except UnicodeEncodeError:
+        return json.dumps(body, separators=(",", ":")).encode()
+
+
+def parse_result(payload: dict[str, Any]) -> ScreeningResult:
+    """
+    スコアリングAPIのレスポンスを ScreeningResult に変換します
+
+    Args:
+        payload: レスポンスJSON
+
+    Returns:
+        ScreeningResult: 変換した結果
+
+    Raises:
+        RemoteScreeningServiceError: 必須フィールドが欠けている場合
+    """
+    try:
+        return ScreeningResult(
+            content=payload["content"],
+            score=float(payload.get("score", 0.0)),
+            verdict=Verdict(payload.get("verdict", Verdict.PASS)),
+            findings=tuple(
+                Finding(
+                    kind=item["kind"],
+                    start=item["start"],
+                    end=item["end"],
+                    replacement=item.get("replacement"),
+                )
+                for item in payload.get("findings", ())
+            ),
+        )
+    except (KeyError, TypeError, ValueError) as exc:
+        raise RemoteScreeningServiceError(
+            f"スコアリングAPIの応答が不正です: {exc}"
+        ) from exc
+
+
+__all__ = [
+    "BATCH_SCORE_PATH",
+    "RemoteScreeningService",
+    "RemoteScreeningServiceError",
+    "SCORE_PATH",
+    "parse_result",
+]
@@ -0,0 +1,369 @@
+"""
+スクリーニング結果のストアと語句の転置索引
+
+このモジュールは、スクリーニングしたドキュメントの本文と結果、結果を得た
+ルールセットのバージョンを SQLite に保存するストアを提供します。
+
+ストアは本文の文字バイグラム（ルールの照合と同じ正規化をした2文字）から
+ドキュメントへの転置索引を持ちます。ある語句を含み得るドキュメントは、
+語句のすべてのバイグラムを含むドキュメントとして索引だけで求められるため、
+ルールセットの変更で影響を受け得るドキュメントを本文を読まずに絞り込めます。
+
+- 1文字の語句は、その文字で始まるバイグラムで検索します（本文の末尾に
+  番兵を加えるため、末尾の文字もいずれかのバイグラムの先頭になります）。
+- 索引による絞り込みは偽陽性を含み得ますが（バイグラムが離れて現れる場合）、
+  偽陰性はありません。
+- 本文とバイグラムは孤立サロゲートを含み得るため、``surrogatepass`` で
+  UTF-8 に符号化した BLOB として保存します（UTF-8 のバイト順は文字の
+  コードポイント順と一致するため、バイグラムの範囲検索もそのまま使えます）。
+
+ストアはファイル（または ``":memory:"``）に対応し、ルールセットの
+再スクリーニング（incremental_rescreen）で使用します。ストアには
+オフラインの一括処理（``scripts/screen_bulk.py --store``）で結果を保存します。
+"""
+
+import functools
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.domain.rule import Rule
+from app.domain.screening_result import ScreeningResult
+from app.infrastructure.cached_screening_service import decode_result, encode_result
+from app.infrastructure.rule_automaton import dump_rules, fold_char, parse_rules
+
+# 本文の末尾に加える番兵（末尾の文字もバイグラムの先頭になるようにする）
+_SENTINEL = "\x00"
+
+# 1回の SQL で扱うパラメーターの数の上限（SQLite の既定の上限より小さく）
+_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    content BLOB NOT NULL,
+    result TEXT NOT NULL,
+    version TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS grams (
+    gram BLOB NOT NULL,
+    doc INTEGER NOT NULL,
+    PRIMARY KEY (gram, doc)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS grams_doc ON grams (doc);
+CREATE TABLE IF NOT EXISTS ruleset (
+    singleton INTEGER PRIMARY KEY CHECK (singleton = 0),
+    version TEXT NOT NULL,
+    rules TEXT NOT NULL
+);
+"""
+
+# 照合と同じ1文字の正規化（unicodedata の呼び出しを文字ごとに1回にする）
+_fold = functools.cache(fold_char)
+
+
+def fold_text(text: str) -> str:
+    """
+    ルールの照合と同じ正規化（文字ごとの NFKC・小文字化）をします
+
+    Args:
+        text: 入力テキスト
+
+    Returns:
+        str: 正規化したテキスト（文字数は入力と同じ）
+    """
+    return "".join(map(_fold, text))
+
+
+def _encode(text: str) -> bytes:
+    """本文やバイグラムを UTF-8 に符号化する（孤立サロゲートもそのまま）"""
+    return text.encode("utf-8", "surrogatepass")
+
+
+def _bigrams(text: str) -> set[bytes]:
+    """正規化した本文のバイグラム（末尾に番兵を加える）"""
+    folded = fold_text(text) + _SENTINEL
+    return {_encode(folded[i : i + 2]) for i in range(len(folded) - 1)}
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResult:
+    """
+    ストアに保存したドキュメント
+
+    Attributes:
+        id: ドキュメントの識別子
+        content: スクリーニング対象の本文
+        result: スクリーニング結果
+        version: 結果を得たルールセットのバージョン
+    """
+
+    id: str
+    content: str
+    result: ScreeningResult
+    version: str
+
+
+class ScreeningResultStore:
+    """
+    SQLite によるスクリーニング結果のストア
+
+    Examples:
+        >>> store = ScreeningResultStore("corpus.db")
+        >>> store.put("doc-1", "男性限定の募集", result, version=service.version)
+        >>> store.candidates(["男性のみ"])  # 語句を含み得るドキュメント
+        set()
+        >>> store.close()
+
+    Note:
+        書き込みはメソッドごとに1つのトランザクションで行います。
+        同じファイルを複数のプロセスから同時に書き込まないでください。
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        """
+        ストアを開きます（なければ作成します）
+
+        Args:
+            path: データベースファイルのパス（``":memory:"`` でメモリ上）
+        """
+        self._connection = sqlite3.connect(str(path))
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ScreeningResultStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """保存しているドキュメントの数"""
+        return self._connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def put(
+        self, doc_id: str, content: str, result: ScreeningResult, *, version: str
+    ) -> None:
+        """
+        ドキュメントと結果を保存します
+
+        Args:
+            doc_id: ドキュメントの識別子（既存の場合は置き換えます）
+            content: スクリーニング対象の本文
+            result: スクリーニング結果
+            version: 結果を得たルールセットのバージョン
+        """
+        self.put_many([(doc_id, content, result)], version=version)
+
+    def put_many(
+        self,
+        items: Iterable[tuple[str, str, ScreeningResult]],
+        *,
+        version: str,
+    ) -> int:
+        """
+        複数のドキュメントと結果を1つのトランザクションで保存します
+
+        Args:
+            items: (識別子, 本文, 結果) の列
+            version: 結果を得たルールセットのバージョン
+
+        Returns:
+            int: 保存したドキュメントの数
+        """
+        count = 0
+        with self._connection:
+            for doc_id, content, result in items:
+                self._delete(doc_id)
+                rowid = self._connection.execute(
+                    "INSERT INTO documents (id, content, result, version)"
+                    " VALUES (?, ?, ?, ?)",
+                    (
+                        doc_id,
+                        _encode(content),
+                        encode_result(result).decode(),
+                        version,
+                    ),
+                ).lastrowid
+                self._connection.executemany(
+                    "INSERT INTO grams (gram, doc) VALUES (?, ?)",
+                    ((gram, rowid) for gram in _bigrams(content)),
+                )
+                count += 1
+        return count
+
+    def get(self, doc_id: str) -> StoredResult | None:
+        """
+        ドキュメントを取得します
+
+        Args:
+            doc_id: ドキュメントの識別子
+
+        Returns:
+            StoredResult | None: 保存したドキュメント（なければ None）
+        """
+        return next(self.load([doc_id]), None)
+
+    def load(self, doc_ids: Iterable[str]) -> Iterator[StoredResult]:
+        """
+        複数のドキュメントを取得します（存在しない識別子は無視します）
+
+        Args:
+            doc_ids: ドキュメントの識別子の列
+
+        Yields:
+            StoredResult: 保存したドキュメント（順序は不定）
+        """
+        for chunk in _chunks(list(doc_ids)):
+            rows = self._connection.execute(
+                "SELECT id, content, result, version FROM documents"
+                f" WHERE id IN ({_placeholders(chunk)})",
+                chunk,
+            )
+            for doc_id, content, result, version in rows:
+                yield StoredResult(
+                    doc_id,
+                    content.decode("utf-8", "surrogatepass"),
+                    decode_result(result),
+                    version,
+                )
+
+    def update_results(
+        self, items: Iterable[tuple[str, ScreeningResult]], *, version: str
+    ) -> None:
+        """
+        本文を変えずに結果とバージョンを更新します
+
+        Args:
+            items: (識別子, 結果) の列
+            version: 結果を得たルールセットのバージョン
+        """
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE documents SET result = ?, version = ? WHERE id = ?",
+                (
+                    (encode_result(result).decode(), version, doc_id)
+                    for doc_id, result in items
+                ),
+            )
+
+    def candidates(self, terms: Iterable[str]) -> set[str]:
+        """
+        いずれかの語句を含み得るドキュメントの識別子を返します
+
+        語句はルールの照合と同じ正規化をしてから検索します。
+
+        Args:
+            terms: 語句の列
+
+        Returns:
+            set[str]: 語句のすべてのバイグラムを含むドキュメントの識別子
+        """
+        found: set[str] = set()
+        for term in terms:
+            folded = fold_text(term)
+            if not folded:
+                continue
+            if len(folded) == 1:
+                # その文字で始まるバイグラム（UTF-8 に 0xFF のバイトは現れない）
+                prefix = _encode(folded)
+                rows = self._connection.execute(
+                    "SELECT DISTINCT d.id FROM grams g JOIN documents d"
+                    " ON d.rowid = g.doc WHERE g.gram >= ? AND g.gram < ?",
+                    (prefix, prefix + b"\xff"),
+                )
+            else:
+                grams = sorted(
+                    {_encode(folded[i : i + 2]) for i in range(len(folded) - 1)}
+                )
+                rows = self._connection.execute(
+                    "SELECT d.id FROM grams g JOIN documents d ON d.rowid = g.doc"
+                    f" WHERE g.gram IN ({_placeholders(grams)})"
+                    " GROUP BY g.doc HAVING COUNT(*) = ?",
+                    (*grams, len(grams)),
+                )
+            found.update(doc_id for (doc_id,) in rows)
+        return found
+
+    def stale(self, version: str) -> set[str]:
+        """
+        指定したバージョン以外の結果を持つドキュメントの識別子を返します
+
+        Args:
+            version: ルールセットのバージョン
+
+        Returns:
+            set[str]: ドキュメントの識別子
+        """
+        rows = self._connection.execute(
+            "SELECT id FROM documents WHERE version != ?", (version,)
+        )
+        return {doc_id for (doc_id,) in rows}
+
+    def ruleset(self) -> tuple[str, tuple[Rule, ...]] | None:
+        """
+        ストア全体の結果が対応するルールセットを返します
+
+        Returns:
+            tuple[str, tuple[Rule, ...]] | None: (バージョン, ルール)
+            （記録していなければ None）
+        """
+        row = self._connection.execute(
+            "SELECT version, rules FROM ruleset WHERE singleton = 0"
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], parse_rules(json.loads(row[1]))
+
+    def commit_ruleset(self, version: str, rules: Sequence[Rule]) -> int:
+        """
+        すべてのドキュメントの結果が指定したルールセットに対応すると記録します
+
+        再スクリーニングが不要と判断したドキュメントのバージョンも
+        まとめて更新します。
+
+        Args:
+            version: ルールセットのバージョン
+            rules: ルールセットのルール
+
+        Returns:
+            int: バージョンを更新したドキュメントの数
+        """
+        source = json.dumps(dump_rules(rules), ensure_ascii=False)
+        with self._connection:
+            updated = self._connection.execute(
+                "UPDATE documents SET version = ? WHERE version != ?",
+                (version, version),
+            ).rowcount
+            self._connection.execute(
+                "INSERT OR REPLACE INTO ruleset (singleton, version, rules)"
+                " VALUES (0, ?, ?)",
+                (version, source),
+            )
+        return updated
+
+    def close(self) -> None:
+        """データベースを閉じます"""
+        self._connection.close()
+
+    def _delete(self, doc_id: str) -> None:
+        row = self._connection.execute(
+            "SELECT rowid FROM documents WHERE id = ?", (doc_id,)
+        ).fetchone()
+        if row is not None:
+            self._connection.execute("DELETE FROM grams WHERE doc = ?", row)
+            self._connection.execute("DELETE FROM documents WHERE rowid = ?", row)
+
+
+def _chunks(items: Sequence[str]) -> Iterator[Sequence[str]]:
+    for start in range(0, len(items), _CHUNK):
+        yield items[start : start + _CHUNK]
+
+
+def _placeholders(items: Sequence[object]) -> str:
+    return ", ".join("?" * len(items))
+
+
+__all__ = ["ScreeningResultStore", "StoredResult", "fold_text"]
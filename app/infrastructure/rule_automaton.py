@@ -0,0 +1,537 @@
+"""
+ルールセットのコンパイルと照合オートマトン
+
+このモジュールは、Rule の語句を Aho-Corasick 法の決定性オートマトン（DFA）に
+コンパイルし、成果物（artifacts）として保存・mmap で読み込む機能を提供します。
+
+オートマトンは次の平坦な配列で表現されます。
+
+- ``char_class`` (uint16): コードポイント → 文字クラス。全角・半角や
+  大文字・小文字の違いはクラスの割り当てで吸収するため、入力テキストを
+  書き換えずに照合でき、検出位置は入力のオフセットのまま報告されます。
+- ``root`` (int32): クラス → 初期状態からの次の状態（全クラス分の密な行）
+- ``base`` / ``check`` / ``next`` (int32): 初期状態以外の遷移を行の重ね合わせ
+  （ダブル配列）で詰めた疎な遷移表。状態 ``s`` のクラス ``c`` の遷移は
+  ``check[base[s] + c] == s`` のとき ``next[base[s] + c]`` です。
+- ``fail`` (int32): 状態 → 遷移がない場合にたどる失敗遷移の先
+
+  遷移表の大きさはクラス数ではなくトライ木の辺の数に比例します（失敗遷移を
+  展開した完全なDFAは ``状態数 × クラス数`` の表になり、ルールの文字の
+  種類が多いと数十MBに膨らむため）。失敗遷移をたどる回数は入力の文字数で
+  抑えられるため、照合は入力の長さに線形な時間で終わります。
+- ``output_offsets`` / ``output_terms`` (int32): 各状態で一致する語句（CSR形式）
+- ``term_rule`` / ``term_length`` (int32): 語句 → ルール番号・文字数
+
+ルールのメタデータ（id、種類、判定、置換文字列等）はマニフェストに保存します。
+
+ルールソース（JSON）の形式::
+
+    {
+      "rules": [
+        {"id": "gender-male-only", "kind": "discriminatory_term",
+         "terms": ["男性限定", "男性のみ"], "verdict": "block",
+         "weight": 0.9, "replacement": null}
+      ]
+    }
+"""
+
+import json
+import unicodedata
+from array import array
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from app.domain.rule import Rule
+from app.domain.screening_result import Verdict
+from app.infrastructure.artifacts import (
+    Artifact,
+    ArtifactError,
+    ArtifactManifest,
+    open_artifact,
+    write_artifact,
+)
+
+# ルールセット成果物の種類
+RULESET_ARTIFACT_KIND = "ruleset"
+
+# 文字クラス表が最低限カバーするコードポイントの範囲（基本多言語面）
+_BMP_SIZE = 0x10000
+
+# ルールセット成果物の配列名（compile_rules() の戻り値のキー）
+_ARRAY_NAMES = (
+    "char_class",
+    "root",
+    "base",
+    "check",
+    "next",
+    "fail",
+    "output_offsets",
+    "output_terms",
+    "term_rule",
+    "term_length",
+)
+
+
+class RuleMatch(NamedTuple):
+    """
+    ルールの一致箇所
+
+    Attributes:
+        start: 入力テキスト内の開始位置（文字オフセット）
+        end: 入力テキスト内の終了位置（文字オフセット、排他的）
+        rule: 一致したルールの番号（RuleAutomaton.rules のインデックス）
+    """
+
+    start: int
+    end: int
+    rule: int
+
+
+def fold_char(char: str) -> str:
+    """
+    照合のために1文字を正規化します
+
+    NFKC 正規化と小文字化の結果が1文字になる場合はその文字を、
+    それ以外（合字の分解等で文字数が変わる場合）は元の文字を返します。
+    文字数を変えないため、照合結果のオフセットは入力テキストと一致します。
+
+    Args:
+        char: 1文字の文字列
+
+    Returns:
+        str: 正規化した1文字
+    """
+    folded = unicodedata.normalize("NFKC", char).lower()
+    return folded if len(folded) == 1 else char
+
+
+def parse_rules(source: Mapping[str, Any]) -> tuple[Rule, ...]:
+    """
+    ルールソース（JSONから読み込んだ辞書）を Rule の列に変換します
+
+    Args:
+        source: ``{"rules": [...]}`` 形式の辞書
+
+    Returns:
+        tuple[Rule, ...]: ソースの順序どおりのルール
+
+    Raises:
+        ValueError: 必須フィールドの欠落、不正な値、id の重複がある場合
+    """
+    rules = []
+    for item in source.get("rules", ()):
+        try:
+            rules.append(
+                Rule(
+                    id=item["id"],
+                    kind=item["kind"],
+                    terms=tuple(item["terms"]),
+                    verdict=Verdict(item.get("verdict", Verdict.REVIEW)),
+                    weight=float(item.get("weight", 0.5)),
+                    replacement=item.get("replacement"),
+                )
+            )
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"ルールの定義が不正です: {item!r}") from exc
+    ids = [rule.id for rule in rules]
+    if len(ids) != len(set(ids)):
+        raise ValueError("ルールの id が重複しています")
+    return tuple(rules)
+
+
+def load_rule_source(path: str | Path) -> tuple[Rule, ...]:
+    """
+    JSON形式のルールソースファイルを読み込みます
+
+    Args:
+        path: ルールソースファイルのパス
+
+    Returns:
+        tuple[Rule, ...]: 読み込んだルール
+    """
+    return parse_rules(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+class RuleAutomaton:
+    """
+    ルールの語句を一括照合する Aho-Corasick オートマトン
+
+    遷移表は平坦な配列（``memoryview``）として保持するため、成果物から
+    mmap で開いた場合は全ワーカーで同じページを共有します。照合はテキストを
+    1回走査するだけで、ルール数に依存しません。
+
+    Attributes:
+        rules: ルールの列（RuleMatch.rule の参照先）
+        version: ルールセットの内容のハッシュ
+
+    Examples:
+        >>> automaton = RuleAutomaton.compile(rules)
+        >>> automaton.find("ＡＢＣ株式会社 男性限定")
+        [RuleMatch(start=9, end=13, rule=0)]
+    """
+
+    def __init__(
+        self,
+        arrays: Mapping[str, Sequence[int]],
+        rules: Sequence[Rule],
+        *,
+        version: str = "",
+        artifact: Artifact | None = None,
+    ) -> None:
+        """
+        RuleAutomaton を初期化します（通常は compile() か open() を使用してください）
+
+        Args:
+            arrays: コンパイル済みの配列
+            rules: ルールの列
+            version: ルールセットの内容のハッシュ
+            artifact: 配列の元になった成果物（close() で解放する）
+        """
+        self.rules = tuple(rules)
+        self.version = version
+        self._char_class = arrays["char_class"]
+        self._root = arrays["root"]
+        self._base = arrays["base"]
+        self._check = arrays["check"]
+        self._next = arrays["next"]
+        self._fail = arrays["fail"]
+        self._output_offsets = arrays["output_offsets"]
+        self._output_terms = arrays["output_terms"]
+        self._term_rule = arrays["term_rule"]
+        self._term_length = arrays["term_length"]
+        self._artifact = artifact
+
+    @classmethod
+    def compile(cls, rules: Sequence[Rule], *, version: str = "") -> "RuleAutomaton":
+        """
+        ルールをメモリ上でコンパイルします
+
+        Args:
+            rules: コンパイルするルール
+            version: ルールセットの内容のハッシュ
+
+        Returns:
+            RuleAutomaton: コンパイル済みのオートマトン
+        """
+        return cls(compile_rules(rules), rules, version=version)
+
+    @classmethod
+    def open(cls, directory: str | Path, *, verify: bool = False) -> "RuleAutomaton":
+        """
+        ルールセット成果物を mmap で開きます
+
+        Args:
+            directory: build_rule_artifact() で作成した成果物のディレクトリ
+            verify: 配列ファイルのハッシュを検証するか
+
+        Returns:
+            RuleAutomaton: 成果物を参照するオートマトン
+
+        Raises:
+            ArtifactError: 成果物が見つからない、または必要な配列がない場合
+                （遷移表の形式が異なる古いビルドの成果物等）
+        """
+        artifact = open_artifact(directory, kind=RULESET_ARTIFACT_KIND, verify=verify)
+        try:
+            arrays = {name: artifact.array(name) for name in _ARRAY_NAMES}
+        except ArtifactError:
+            artifact.close()
+            raise
+        rules = parse_rules(artifact.metadata)
+        return cls(arrays, rules, version=artifact.version, artifact=artifact)
+
+    def find(self, text: str) -> list[RuleMatch]:
+        """
+        テキスト中のルールの一致箇所を返します
+
+        重なり合う一致は、開始位置が最も左で、その中で最も長いものを優先して
+        重ならないように選びます。
+
+        Args:
+            text: 照合対象のテキスト
+
+        Returns:
+            list[RuleMatch]: 開始位置の昇順の一致箇所
+        """
+        char_class = self._char_class
+        table_size = len(char_class)
+        root = self._root
+        base = self._base
+        check = self._check
+        nxt = self._next
+        fail = self._fail
+        offsets = self._output_offsets
+
+        # 走査中は出力のある (終了位置, 状態) だけを記録する
+        hits: list[tuple[int, int]] = []
+        state = 0
+        for end, code in enumerate(map(ord, text), 1):
+            class_id = char_class[code] if code < table_size else 0
+            if class_id == 0:
+                # ルールに現れない文字からはどの語句も続かない
+                state = 0
+                continue
+            while state:
+                slot = base[state] + class_id
+                if check[slot] == state:
+                    state = nxt[slot]
+                    break
+                state = fail[state]
+            else:
+                state = root[class_id]
+            if offsets[state] != offsets[state + 1]:
+                hits.append((end, state))
+        if not hits:
+            return []
+
+        terms = self._output_terms
+        term_rule = self._term_rule
+        term_length = self._term_length
+        candidates = [
+            RuleMatch(end - term_length[term], end, term_rule[term])
+            for end, state in hits
+            for term in terms[offsets[state] : offsets[state + 1]]
+        ]
+        return _leftmost_longest(candidates)
+
+    def close(self) -> None:
+        """成果物から開いた場合はマッピングを解放します"""
+        if self._artifact is not None:
+            self._artifact.close()
+            self._artifact = None
+
+
+def compile_rules(rules: Sequence[Rule]) -> dict[str, array]:
+    """
+    ルールを Aho-Corasick DFA の平坦な配列にコンパイルします
+
+    Args:
+        rules: コンパイルするルール
+
+    Returns:
+        dict[str, array]: 配列名から ``array.array`` への対応
+
+    Raises:
+        ValueError: 文字の種類が多すぎて uint16 のクラス番号に収まらない場合
+    """
+    terms = [
+        (rule_index, "".join(map(fold_char, term)))
+        for rule_index, rule in enumerate(rules)
+        for term in rule.terms
+    ]
+
+    # 文字クラス: 0 はルールに現れない文字
+    alphabet: dict[str, int] = {}
+    for _, term in terms:
+        for char in term:
+            alphabet.setdefault(char, len(alphabet) + 1)
+    n_classes = len(alphabet) + 1
+    if n_classes > 0xFFFF:
+        raise ValueError("ルールに含まれる文字の種類が多すぎます")
+
+    char_class = _build_char_class(alphabet)
+    goto, outputs, term_rule, term_length = _build_trie(terms, alphabet)
+    fail = _failure_links(goto, outputs)
+    root = array("i", bytes(4 * n_classes))
+    for class_id, child in goto[0].items():
+        root[class_id] = child
+    base, check, nxt = _pack_rows(goto, n_classes)
+
+    output_offsets = array("i", [0])
+    output_terms = array("i")
+    for matched in outputs:
+        output_terms.extend(matched)
+        output_offsets.append(len(output_terms))
+
+    return {
+        "char_class": char_class,
+        "root": root,
+        "base": base,
+        "check": check,
+        "next": nxt,
+        "fail": fail,
+        "output_offsets": output_offsets,
+        "output_terms": output_terms,
+        "term_rule": term_rule,
+        "term_length": term_length,
+    }
+
+
+def _build_char_class(alphabet: Mapping[str, int]) -> array:
+    """コードポイントから文字クラスへの表を作る（0 はルールに現れない文字）"""
+    table_size = max([_BMP_SIZE, *(ord(char) + 1 for char in alphabet)])
+    char_class = array("H", bytes(2 * table_size))
+    for code in range(table_size):
+        if 0xD800 <= code <= 0xDFFF:
+            continue
+        class_id = alphabet.get(fold_char(chr(code)))
+        if class_id is not None:
+            char_class[code] = class_id
+    return char_class
+
+
+def _build_trie(
+    terms: Sequence[tuple[int, str]], alphabet: Mapping[str, int]
+) -> tuple[list[dict[int, int]], list[list[int]], array, array]:
+    """語句のトライ木と、各状態で終わる語句・語句ごとのルール番号と長さを作る"""
+    goto: list[dict[int, int]] = [{}]
+    outputs: list[list[int]] = [[]]
+    term_rule = array("i")
+    term_length = array("i")
+    for rule_index, term in terms:
+        state = 0
+        for char in term:
+            class_id = alphabet[char]
+            next_state = goto[state].get(class_id)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][class_id] = next_state
+                goto.append({})
+                outputs.append([])
+            state = next_state
+        outputs[state].append(len(term_rule))
+        term_rule.append(rule_index)
+        term_length.append(len(term))
+    return goto, outputs, term_rule, term_length
+
+
+def _failure_links(goto: list[dict[int, int]], outputs: list[list[int]]) -> array:
+    """幅優先で失敗遷移を求める（outputs も失敗先の分を統合する）"""
+    fail = array("i", bytes(4 * len(goto)))
+    queue: deque[int] = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        # 失敗先は浅い状態なので、その出力は既に統合済み
+        outputs[state] = outputs[state] + outputs[fail[state]]
+        for class_id, child in goto[state].items():
+            target = fail[state]
+            while class_id not in goto[target] and target:
+                target = fail[target]
+            fail[child] = goto[target].get(class_id, 0)
+            queue.append(child)
+    return fail
+
+
+def _pack_rows(
+    goto: list[dict[int, int]], n_classes: int
+) -> tuple[array, array, array]:
+    """
+    初期状態以外の遷移を、空きに収まる位置へ行をずらして1本の配列に詰める
+
+    各状態の行は、遷移のあるクラスの位置がすべて空いている最小の
+    オフセット（base）に置く。check には位置を使う状態を記録し、空きは -1 とする。
+    末尾は、どの base にどのクラスを足しても範囲に収まるよう n_classes 分あける。
+    """
+    base = array("i", bytes(4 * len(goto)))
+    check = array("i")
+    nxt = array("i")
+    first_free = 0
+    for state in range(1, len(goto)):
+        children = sorted(goto[state].items())
+        if not children:
+            continue
+        first_class = children[0][0]
+        # 先頭のクラスを空きの位置に合わせ、残りのクラスも空いていれば置く
+        position = max(first_free, first_class)
+        while True:
+            position = _next_free(check, position)
+            offset = position - first_class
+            if all(
+                offset + class_id >= len(check) or check[offset + class_id] == -1
+                for class_id, _ in children[1:]
+            ):
+                break
+            position += 1
+        size = offset + children[-1][0] + 1
+        if size > len(check):
+            check.extend([-1] * (size - len(check)))
+            nxt.extend([0] * (size - len(nxt)))
+        for class_id, child in children:
+            check[offset + class_id] = state
+            nxt[offset + class_id] = child
+        base[state] = offset
+        first_free = _next_free(check, first_free)
+    check.extend([-1] * n_classes)
+    nxt.extend([0] * n_classes)
+    return base, check, nxt
+
+
+def _next_free(check: array, start: int) -> int:
+    """start 以降で最初の空きの位置（末尾を超えた場合はその位置）"""
+    try:
+        return check.index(-1, start)
+    except ValueError:
+        return max(start, len(check))
+
+
+def build_rule_artifact(
+    rules: Sequence[Rule], directory: str | Path
+) -> ArtifactManifest:
+    """
+    ルールをコンパイルして成果物として書き出します
+
+    Args:
+        rules: コンパイルするルール
+        directory: 出力先ディレクトリ
+
+    Returns:
+        ArtifactManifest: 書き出した成果物のマニフェスト
+    """
+    return write_artifact(
+        directory,
+        RULESET_ARTIFACT_KIND,
+        compile_rules(rules),
+        dump_rules(rules),
+    )
+
+
+def dump_rules(rules: Sequence[Rule]) -> dict[str, Any]:
+    """
+    Rule の列をルールソース（JSONに変換できる辞書）に変換します
+
+    parse_rules() の逆変換です。
+
+    Args:
+        rules: 変換するルール
+
+    Returns:
+        dict[str, Any]: ``{"rules": [...]}`` 形式の辞書
+    """
+    return {"rules": [_rule_to_dict(rule) for rule in rules]}
+
+
+def _rule_to_dict(rule: Rule) -> dict[str, Any]:
+    return {
+        "id": rule.id,
+        "kind": rule.kind,
+        "terms": list(rule.terms),
+        "verdict": rule.verdict.value,
+        "weight": rule.weight,
+        "replacement": rule.replacement,
+    }
+
+
+def _leftmost_longest(candidates: Iterable[RuleMatch]) -> list[RuleMatch]:
+    """重なり合う一致から、左端優先・最長優先で重ならない一致を選ぶ"""
+    selected: list[RuleMatch] = []
+    covered_until = 0
+    for match in sorted(candidates, key=lambda m: (m.start, -m.end, m.rule)):
+        if match.start >= covered_until:
+            selected.append(match)
+            covered_until = match.end
+    return selected
+
+
+__all__ = [
+    "RULESET_ARTIFACT_KIND",
+    "RuleAutomaton",
+    "RuleMatch",
+    "build_rule_artifact",
+    "compile_rules",
+    "dump_rules",
+    "fold_char",
+    "load_rule_source",
+    "parse_rules",
+]
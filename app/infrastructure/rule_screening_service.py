@@ -0,0 +1,179 @@
+"""
+ルールベースのスクリーニングサービス
+
+このモジュールは、RuleAutomaton でルールの語句を照合し、検出箇所・判定・
+スコアと、置換ルールを適用したテキストを返す ScreeningService 実装を
+提供します。オートマトンは成果物から mmap で開くため、本番ランチャーの
+マスタープロセスで読み込めば全ワーカーが同じページを共有します。
+"""
+
+import hashlib
+import json
+from collections.abc import Sequence
+from pathlib import Path
+
+from app.domain.rule import Rule
+from app.domain.screening_result import (
+    Finding,
+    ScreeningResult,
+    Verdict,
+    apply_replacements,
+)
+from app.infrastructure.rule_automaton import RuleAutomaton, parse_rules
+
+
+class RuleScreeningService:
+    """
+    ルールベースのスクリーニングサービス
+
+    ScreeningService / ScreeningAnalyzer / BatchScreeningAnalyzer Protocol に
+    構造的部分型付けにより準拠します。
+
+    - 判定: 一致したルールのうち最も重い判定（一致がなければ PASS）
+    - スコア: 一致したルールの weight の noisy-OR（``1 - Π(1 - weight)``）
+    - テキスト: replacement を持つルールの一致箇所を置換したもの
+
+    Examples:
+        >>> service = RuleScreeningService.open("artifacts/rules")
+        >>> result = await service.analyze("男性限定の募集です")
+        >>> result.verdict
+        <Verdict.BLOCK: 'block'>
+        >>> result.findings
+        (Finding(kind='discriminatory_term', start=0, end=4, replacement=None),)
+    """
+
+    def __init__(self, automaton: RuleAutomaton) -> None:
+        """
+        RuleScreeningService を初期化します
+
+        Args:
+            automaton: コンパイル済みのルールオートマトン
+        """
+        self._automaton = automaton
+
+    @classmethod
+    def open(cls, directory: str | Path) -> "RuleScreeningService":
+        """
+        ルールセット成果物を mmap で開いてサービスを作成します
+
+        Args:
+            directory: ルールセット成果物のディレクトリ
+
+        Returns:
+            RuleScreeningService: 作成したサービス
+        """
+        return cls(RuleAutomaton.open(directory))
+
+    @classmethod
+    def compile_source(cls, path: str | Path) -> "RuleScreeningService":
+        """
+        ルールソース（JSON）をメモリ上でコンパイルしてサービスを作成します
+
+        成果物をビルドせずにルールを編集・再読み込みする場合に使用します。
+        コンパイルはルール数に比例した時間がかかるため、イベントループ上では
+        呼び出さないでください。
+
+        Args:
+            path: ルールソースファイルのパス
+
+        Returns:
+            RuleScreeningService: 作成したサービス（version はソースの SHA-256）
+        """
+        raw = Path(path).read_bytes()
+        rules = parse_rules(json.loads(raw))
+        return cls(
+            RuleAutomaton.compile(rules, version=hashlib.sha256(raw).hexdigest())
+        )
+
+    @property
+    def version(self) -> str:
+        """ルールセットの内容のハッシュ"""
+        return self._automaton.version
+
+    @property
+    def rules(self) -> tuple[Rule, ...]:
+        """ルールセットのルール（ソースの順序）"""
+        return self._automaton.rules
+
+    async def screen(self, content: str) -> str:
+        """
+        ルールを適用し、置換後のテキストを返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            置換ルールを適用したテキスト
+        """
+        return self.evaluate(content).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        ルールを適用し、詳細な結果を返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: 判定、スコア、検出箇所、置換後のテキスト
+        """
+        return self.evaluate(content)
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        """
+        複数のテキストにルールを適用します
+
+        Args:
+            contents: スクリーニング対象のテキストの列
+
+        Returns:
+            list[ScreeningResult]: contents と同じ順序の結果
+        """
+        return [self.evaluate(content) for content in contents]
+
+    def evaluate(self, content: str) -> ScreeningResult:
+        """
+        ルールを同期的に適用します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: スクリーニング結果
+        """
+        matches = self._automaton.find(content)
+        if not matches:
+            return ScreeningResult(content)
+
+        rules = self._automaton.rules
+        findings = tuple(
+            Finding(
+                rules[match.rule].kind,
+                match.start,
+                match.end,
+                rules[match.rule].replacement,
+            )
+            for match in matches
+        )
+        matched = [rules[index] for index in sorted({match.rule for match in matches})]
+        verdict = max(
+            (rule.verdict for rule in matched),
+            key=lambda verdict: verdict.severity,
+            default=Verdict.PASS,
+        )
+        unmatched_probability = 1.0
+        for rule in matched:
+            unmatched_probability *= 1.0 - rule.weight
+        return ScreeningResult(
+            content=apply_replacements(content, findings),
+            score=1.0 - unmatched_probability,
+            verdict=verdict,
+            findings=findings,
+        )
+
+    def close(self) -> None:
+        """ルールセット成果物のマッピングを解放します"""
+        self._automaton.close()
+
+
+__all__ = ["RuleScreeningService"]
@@ -5,6 +5,8 @@
 現在の実装は暫定的なエコー実装で、入力値をそのまま返します。
 """
 
+from app.domain.screening_result import ScreeningResult
+
 
 class EchoScreeningService:
     """
@@ -42,5 +44,19 @@ class EchoScreeningService:
         """
         return content
 
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        スクリーニング処理を実行し、詳細な結果を返します
+
+        エコー実装のため、入力をそのまま含む検出なしの結果を返します。
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: スコア 0.0、判定 PASS、検出なしの結果
+        """
+        return ScreeningResult(content=content)
+
 
 __all__ = ["EchoScreeningService"]
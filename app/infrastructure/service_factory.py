@@ -0,0 +1,272 @@
+"""
+スクリーニングサービスの組み立て
+
+このモジュールは、Settings に基づいて ScreeningService の実装と
+それを包むデコレーター（マイクロバッチ、耐障害性、キャッシュ等）を組み立てるファクトリを提供します。
+Presentation層の依存性注入はこのファクトリを遅延インポートして使用します。
+"""
+
+from pathlib import Path
+
+from app.domain.screening_service import ScreeningService
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.screening_service_impl import EchoScreeningService
+
+
+def create_screening_service(settings: Settings) -> ScreeningService:
+    """
+    設定に従って ScreeningService を組み立てます
+
+    Args:
+        settings: アプリケーション設定
+
+    Returns:
+        ScreeningService: 組み立て済みのサービス
+
+    Note:
+        デコレーターは外側から キャッシュ → 近似重複 → サーキットブレーカー →
+        ヘッジ → マイクロバッチ → バックエンド の順に重ねます。キャッシュヒットは
+        バッチの待ち時間を払わず、ヘッジの重複呼び出しはブレーカーの
+        1回の呼び出しとして数えられます。近似重複の変更行だけの呼び出しも
+        ブレーカーとマイクロバッチを通ります。
+
+        共有メモリキャッシュ（L2）はこの関数を呼び出したプロセスで作成されます。
+        本番ランチャーではフォーク前のマスタープロセスで呼び出されるため、
+        全ワーカーが同じキャッシュを共有します。
+
+        rules バックエンドは ReloadableScreeningService で包み、reload()
+        フックでルールセットを無停止で差し替えられるようにします。結果
+        キャッシュの名前空間にはルールセットのバージョンを使用します。
+
+        ensemble_backends を指定した場合は、それらを並行に呼び出す
+        EnsembleScreeningService をバックエンドとし、screening_backend は
+        使用しません。
+
+        トレーシングが有効な場合（get_tracer()）は、組み立てたサービス全体と
+        バックエンドをそれぞれ TracedScreeningService で包みます。トレーサーは
+        プロセスで共有するため、settings の tracing_* ではなく環境変数の
+        設定に従います。
+    """
+    backend = (
+        _create_ensemble(settings)
+        if settings.ensemble_backends
+        else _create_backend(settings)
+    )
+    namespace = getattr(backend, "version", "")
+    service = _with_tracing(
+        backend,
+        name="screening.backend",
+        backend="ensemble"
+        if settings.ensemble_backends
+        else settings.screening_backend,
+    )
+    service = _with_batching(service, settings)
+    service = _with_resilience(service, settings)
+    service = _with_near_duplicates(service, settings)
+    service = _with_cache(service, settings, namespace=namespace)
+    return _with_tracing(service, name="screening.service")
+
+
+def _create_backend(settings: Settings) -> ScreeningService:
+    """設定された screening_backend に対応する実装を作成する"""
+    if settings.screening_backend == "ngram":
+        if settings.ngram_model_path is None:
+            raise ValueError(
+                "ngram バックエンドには SCREENING_NGRAM_MODEL_PATH の指定が必要です"
+            )
+        from app.infrastructure.ngram_model import NgramLinearModel
+        from app.infrastructure.ngram_screening_service import NgramScreeningService
+
+        path = Path(settings.ngram_model_path)
+        model = (
+            NgramLinearModel.load_artifact(path)
+            if path.is_dir()
+            else NgramLinearModel.load(path)
+        )
+        return NgramScreeningService(
+            model,
+            review_threshold=settings.ngram_review_threshold,
+            block_threshold=settings.ngram_block_threshold,
+        )
+    if settings.screening_backend == "rules":
+        return _create_rules_backend(settings)
+    if settings.screening_backend == "pii":
+        from app.infrastructure.pii_screening_service import PiiScreeningService
+
+        return PiiScreeningService()
+    if settings.screening_backend == "remote":
+        from app.infrastructure.remote_screening_service import (
+            RemoteScreeningService,
+        )
+
+        return RemoteScreeningService(
+            settings.remote_base_url,
+            timeout=settings.remote_timeout,
+            max_connections=settings.remote_max_connections,
+            max_keepalive_connections=settings.remote_max_keepalive_connections,
+            keepalive_expiry=settings.remote_keepalive_expiry,
+            http2=settings.remote_http2,
+        )
+    return EchoScreeningService()
+
+
+def _create_ensemble(settings: Settings) -> ScreeningService:
+    """ensemble_backends の実装を並行に呼び出すアンサンブルを作成する"""
+    from app.infrastructure.ensemble_screening_service import (
+        EnsembleMember,
+        EnsembleScreeningService,
+    )
+
+    if len(set(settings.ensemble_backends)) != len(settings.ensemble_backends):
+        raise ValueError("SCREENING_ENSEMBLE_BACKENDS に同じ実装が重複しています")
+    members = [
+        EnsembleMember(
+            name,
+            _create_backend(settings.model_copy(update={"screening_backend": name})),
+            # ルールの BLOCK は確定的なため、残りのモデルの呼び出しを打ち切る
+            decisive=name == "rules",
+        )
+        for name in settings.ensemble_backends
+    ]
+    timeout_ms = settings.ensemble_timeout_ms
+    return EnsembleScreeningService(
+        members,
+        strategy=settings.ensemble_strategy,
+        timeout=timeout_ms / 1000 if timeout_ms else None,
+    )
+
+
+def _create_rules_backend(settings: Settings) -> ScreeningService:
+    """ルールセットの更新で再読み込みできる rules バックエンドを作成する"""
+    from app.infrastructure.reloadable_screening_service import (
+        ReloadableScreeningService,
+    )
+    from app.infrastructure.rule_screening_service import RuleScreeningService
+
+    if settings.rules_source_path is not None:
+        source = settings.rules_source_path
+        return ReloadableScreeningService(
+            lambda: RuleScreeningService.compile_source(source), watch=source
+        )
+    if settings.rules_artifact_path is not None:
+        directory = settings.rules_artifact_path
+        return ReloadableScreeningService(
+            lambda: RuleScreeningService.open(directory), watch=directory
+        )
+    raise ValueError(
+        "rules バックエンドには SCREENING_RULES_ARTIFACT_PATH または"
+        " SCREENING_RULES_SOURCE_PATH の指定が必要です"
+    )
+
+
+def _with_batching(service: ScreeningService, settings: Settings) -> ScreeningService:
+    """マイクロバッチが有効な場合に MicroBatchingScreeningService で包む"""
+    if settings.batch_max_size <= 0:
+        return service
+
+    from app.infrastructure.micro_batching_service import (
+        MicroBatchingScreeningService,
+    )
+
+    return MicroBatchingScreeningService(
+        service,
+        max_batch_size=settings.batch_max_size,
+        max_wait_ms=settings.batch_max_wait_ms,
+    )
+
+
+def _with_resilience(service: ScreeningService, settings: Settings) -> ScreeningService:
+    """ヘッジリクエストとサーキットブレーカーが有効な場合に包む"""
+    if settings.hedge_enabled:
+        from app.infrastructure.hedged_screening_service import (
+            HedgedScreeningService,
+        )
+
+        service = HedgedScreeningService(
+            service,
+            quantile=settings.hedge_quantile,
+            initial_delay=settings.hedge_initial_delay_ms / 1000,
+        )
+
+    if settings.breaker_enabled:
+        from app.infrastructure.circuit_breaker_service import (
+            CircuitBreakerScreeningService,
+        )
+
+        slow_call_ms = settings.breaker_slow_call_ms
+        service = CircuitBreakerScreeningService(
+            service,
+            fallback=(
+                EchoScreeningService() if settings.breaker_fallback == "echo" else None
+            ),
+            failure_rate_threshold=settings.breaker_failure_rate,
+            slow_call_threshold=slow_call_ms / 1000 if slow_call_ms else None,
+            window=settings.breaker_window,
+            min_calls=min(settings.breaker_min_calls, settings.breaker_window),
+            reset_timeout=settings.breaker_reset_timeout,
+        )
+    return service
+
+
+def _with_near_duplicates(
+    service: ScreeningService, settings: Settings
+) -> ScreeningService:
+    """近似重複の検出が有効な場合に NearDuplicateScreeningService で包む"""
+    if settings.near_duplicate_capacity <= 0:
+        return service
+
+    from app.infrastructure.near_duplicate_service import (
+        NearDuplicateScreeningService,
+    )
+
+    return NearDuplicateScreeningService(
+        service,
+        threshold=settings.near_duplicate_threshold,
+        capacity=settings.near_duplicate_capacity,
+        window=settings.near_duplicate_window,
+    )
+
+
+def _with_tracing(
+    service: ScreeningService, *, name: str, backend: str | None = None
+) -> ScreeningService:
+    """トレーシングが有効な場合に TracedScreeningService で包む"""
+    from app.infrastructure.tracing import SpanKind, get_tracer
+
+    tracer = get_tracer()
+    if tracer is None:
+        return service
+
+    from app.infrastructure.traced_screening_service import TracedScreeningService
+
+    return TracedScreeningService(
+        service,
+        tracer,
+        name=name,
+        # 外部スコアリングAPIの呼び出しは CLIENT スパンとして記録する
+        kind=SpanKind.CLIENT if backend == "remote" else SpanKind.INTERNAL,
+        backend=backend,
+    )
+
+
+def _with_cache(
+    service: ScreeningService, settings: Settings, *, namespace: str
+) -> ScreeningService:
+    """結果キャッシュが有効な場合に CachedScreeningService で包む"""
+    if settings.cache_size <= 0 and settings.shared_cache_capacity <= 0:
+        return service
+
+    from app.infrastructure.cached_screening_service import CachedScreeningService
+    from app.infrastructure.shared_memory_cache import SharedMemoryResultCache
+
+    l2 = None
+    if settings.shared_cache_capacity > 0:
+        l2 = SharedMemoryResultCache(
+            settings.shared_cache_capacity, slot_size=settings.shared_cache_slot_size
+        )
+    return CachedScreeningService(
+        service, l1_size=settings.cache_size, l2=l2, namespace=namespace
+    )
+
+
+__all__ = ["create_screening_service"]
@@ -0,0 +1,76 @@
+"""
+スクリーニングサービスのライフサイクル管理
+
+このモジュールは、ScreeningService 実装が任意に持つライフサイクルフックを
+呼び出すヘルパー関数を提供します。フックは次の3種類です。
+
+- ``async def start()``: ワーカーのイベントループ上でのリソース確保
+  （HTTPコネクションプール等）。lifespan の起動時に呼ばれます。
+- ``async def aclose()``: start() で確保したリソースの解放。
+  lifespan の終了時に呼ばれます。
+- ``def close()``: プロセスが所有するリソース（共有メモリ等）の解放。
+- ``async def reload(*, force=False)``: ルールセット等の再読み込み。
+  差し替えた場合は新しいバージョンを、そうでなければ None を返します。
+
+他のサービスを包むデコレーター実装は、これらの関数で下位サービスへ
+フックを転送します。フックを持たないサービスに対しては何もしません。
+"""
+
+from typing import Any
+
+
+async def start_service(service: Any) -> None:
+    """
+    サービスの start() フックを呼び出します
+
+    Args:
+        service: ScreeningService 実装
+    """
+    start = getattr(service, "start", None)
+    if start is not None:
+        await start()
+
+
+async def stop_service(service: Any) -> None:
+    """
+    サービスの aclose() フックを呼び出します
+
+    Args:
+        service: ScreeningService 実装
+    """
+    aclose = getattr(service, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+def close_service(service: Any) -> None:
+    """
+    サービスの close() フックを呼び出します
+
+    Args:
+        service: ScreeningService 実装
+    """
+    close = getattr(service, "close", None)
+    if close is not None:
+        close()
+
+
+async def reload_service(service: Any, *, force: bool = False) -> str | None:
+    """
+    サービスの reload() フックを呼び出します
+
+    Args:
+        service: ScreeningService 実装
+        force: 入力の更新を確認せずに再読み込みするか
+
+    Returns:
+        str | None: 差し替えた場合は新しいバージョン
+        （差し替えなかった場合やフックを持たない場合は None）
+    """
+    reload = getattr(service, "reload", None)
+    if reload is None:
+        return None
+    return await reload(force=force)
+
+
+__all__ = ["close_service", "reload_service", "start_service", "stop_service"]
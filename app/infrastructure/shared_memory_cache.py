@@ -0,0 +1,214 @@
+"""
+ワーカープロセス間で共有するスクリーニング結果キャッシュ
+
+このモジュールは、``multiprocessing.shared_memory`` 上に配置した固定サイズの
+オープンアドレス法ハッシュテーブルを提供します。本番ランチャー（``main.py``）が
+フォーク前にマスタープロセスで作成し、全ワーカーが同じテーブルを参照することで、
+ワーカー数に比例してキャッシュヒット率が下がる問題を解消します。
+
+テーブル構造:
+    キー（コンテンツハッシュ）から決まるセットに ``ways`` 個のスロットが並び、
+    セット内を線形探索します。空きスロットがなければセット内で最も長く
+    参照されていないスロットを追い出します（探索範囲に限定したLRU）。
+
+並行制御:
+    書き込みはセット単位のロックストライピング（``multiprocessing.Lock``）で
+    直列化し、読み込みはスロットごとのシーケンスロック（seqlock）により
+    ロックを取らずに行います。読み込み中に書き込みが重なった場合は再試行し、
+    それでも一貫した値が得られなければミスとして扱います。
+"""
+
+import os
+import struct
+import time
+from multiprocessing import Lock
+from multiprocessing.shared_memory import SharedMemory
+
+# テーブル全体のヘッダー: マジック, セット数, ウェイ数, スロットサイズ
+_TABLE_HEADER = struct.Struct("<4sIII")
+_MAGIC = b"SCRC"
+
+# スロットヘッダー: シーケンス番号, キー(16バイト), 最終アクセス時刻, 値の長さ
+_SLOT_HEADER = struct.Struct("<I16sdI")
+_SEQ = struct.Struct("<I")
+_ACCESS = struct.Struct("<d")
+_ACCESS_OFFSET = _SEQ.size + 16
+
+# キー長（blake2b の digest_size=16）
+KEY_SIZE = 16
+
+# 一貫した読み込みが得られるまでの再試行回数
+_MAX_READ_RETRIES = 8
+
+_EMPTY_KEY = bytes(KEY_SIZE)
+
+
+class SharedMemoryResultCache:
+    """
+    共有メモリ上の固定サイズ・オープンアドレス法ハッシュテーブル
+
+    キーは 16 バイトのコンテンツハッシュ、値は任意のバイト列です。
+    スロットに収まらない大きさの値はキャッシュせずに無視します。
+
+    Attributes:
+        capacity: 格納できる最大エントリ数（セット数 × ウェイ数）
+        max_value_size: 1エントリに格納できる値の最大バイト数
+
+    Examples:
+        >>> cache = SharedMemoryResultCache(capacity=1024)
+        >>> cache.put(b"k" * 16, b"value")
+        True
+        >>> cache.get(b"k" * 16)
+        b'value'
+        >>> cache.close()
+
+    Note:
+        ロックはフォークで継承されるため、ワーカーをフォークする前に
+        マスタープロセスでインスタンスを作成してください。作成した
+        プロセスで ``close()`` を呼ぶと共有メモリも解放（unlink）されます。
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        slot_size: int = 4096,
+        ways: int = 8,
+        stripes: int = 64,
+    ) -> None:
+        """
+        共有メモリを確保してテーブルを初期化します
+
+        Args:
+            capacity: 格納する最大エントリ数（ways の倍数に切り上げ）
+            slot_size: スロット1つのバイト数（ヘッダーを含む）
+            ways: 1セットあたりのスロット数（線形探索の範囲）
+            stripes: 書き込みロックの数
+
+        Raises:
+            ValueError: 容量やスロットサイズが不正な場合
+        """
+        if capacity <= 0 or ways <= 0 or stripes <= 0:
+            raise ValueError("capacity, ways, stripes は正の値である必要があります")
+        if slot_size <= _SLOT_HEADER.size:
+            raise ValueError(f"slot_size は {_SLOT_HEADER.size} より大きくしてください")
+
+        self._sets = -(-capacity // ways)
+        self._ways = ways
+        self._slot_size = slot_size
+        self.capacity = self._sets * ways
+        self.max_value_size = slot_size - _SLOT_HEADER.size
+
+        size = _TABLE_HEADER.size + self.capacity * slot_size
+        self._shm = SharedMemory(create=True, size=size)
+        self._buf = self._shm.buf
+        _TABLE_HEADER.pack_into(self._buf, 0, _MAGIC, self._sets, ways, slot_size)
+        self._locks = [Lock() for _ in range(min(stripes, self._sets))]
+        self._owner_pid = os.getpid()
+        self._closed = False
+
+    @property
+    def name(self) -> str:
+        """共有メモリブロックの名前"""
+        return self._shm.name
+
+    def get(self, key: bytes) -> bytes | None:
+        """
+        キーに対応する値をロックを取らずに取得します
+
+        Args:
+            key: 16 バイトのコンテンツハッシュ
+
+        Returns:
+            bytes | None: キャッシュされた値（存在しない場合は None）
+        """
+        buf = self._buf
+        for offset in self._set_offsets(self._set_index(key)):
+            for _ in range(_MAX_READ_RETRIES):
+                seq, slot_key, _, length = _SLOT_HEADER.unpack_from(buf, offset)
+                if seq & 1:
+                    continue
+                if slot_key != key:
+                    value = None
+                else:
+                    start = offset + _SLOT_HEADER.size
+                    value = bytes(buf[start : start + length])
+                if _SEQ.unpack_from(buf, offset)[0] == seq:
+                    break
+            else:
+                # 書き込みと競合し続けた場合はミスとして扱う
+                continue
+            if value is not None:
+                _ACCESS.pack_into(buf, offset + _ACCESS_OFFSET, time.monotonic())
+                return value
+        return None
+
+    def put(self, key: bytes, value: bytes) -> bool:
+        """
+        値を格納します
+
+        同じキーのスロットがあれば上書きし、なければ空きスロット、
+        それもなければセット内で最も古いスロットを追い出して格納します。
+
+        Args:
+            key: 16 バイトのコンテンツハッシュ
+            value: 格納する値
+
+        Returns:
+            bool: 格納した場合は True（値が大きすぎる場合は False）
+        """
+        if len(value) > self.max_value_size:
+            return False
+
+        set_index = self._set_index(key)
+        with self._locks[set_index % len(self._locks)]:
+            offset = self._choose_slot(set_index, key)
+            buf = self._buf
+            seq = _SEQ.unpack_from(buf, offset)[0]
+            # 奇数のシーケンス番号は書き込み中であることを読み込み側に示す
+            _SEQ.pack_into(buf, offset, seq + 1)
+            start = offset + _SLOT_HEADER.size
+            buf[start : start + len(value)] = value
+            _SLOT_HEADER.pack_into(
+                buf, offset, seq + 1, key, time.monotonic(), len(value)
+            )
+            _SEQ.pack_into(buf, offset, (seq + 2) & 0xFFFFFFFF)
+        return True
+
+    def close(self) -> None:
+        """
+        共有メモリへの参照を閉じます
+
+        作成したプロセスで呼び出した場合は共有メモリブロックも解放します。
+        フォークしたワーカーから呼び出しても他プロセスには影響しません。
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._buf = None
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            self._shm.unlink()
+
+    def _set_index(self, key: bytes) -> int:
+        return int.from_bytes(key[:8], "little") % self._sets
+
+    def _set_offsets(self, set_index: int) -> range:
+        first = _TABLE_HEADER.size + set_index * self._ways * self._slot_size
+        return range(first, first + self._ways * self._slot_size, self._slot_size)
+
+    def _choose_slot(self, set_index: int, key: bytes) -> int:
+        offsets = self._set_offsets(set_index)
+        victim, oldest = offsets[0], float("inf")
+        for offset in offsets:
+            _, slot_key, accessed, _ = _SLOT_HEADER.unpack_from(self._buf, offset)
+            if slot_key == key:
+                return offset
+            if slot_key == _EMPTY_KEY:
+                accessed = float("-inf")
+            if accessed < oldest:
+                victim, oldest = offset, accessed
+        return victim
+
+
+__all__ = ["KEY_SIZE", "SharedMemoryResultCache"]
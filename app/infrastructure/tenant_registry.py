@@ -0,0 +1,480 @@
+"""
+テナントごとのスクリーニングサービスのレジストリ
+
+このモジュールは、顧客企業（テナント）ごとに異なるルールセットや
+しきい値でスクリーニングするため、テナントの設定から ScreeningService を
+構築して保持するレジストリを提供します。
+
+テナントの設定は JSON ファイルで、テナントごとに識別用のAPIキーと
+Settings の上書き値を指定します::
+
+    {
+      "tenants": {
+        "acme": {
+          "api_keys": ["acme-key-1"],
+          "preload": true,
+          "settings": {
+            "screening_backend": "rules",
+            "rules_artifact_path": "artifacts/acme-rules"
+          }
+        },
+        "globex": {
+          "settings": {
+            "screening_backend": "ngram",
+            "ngram_model_path": "artifacts/ngram",
+            "ngram_block_threshold": 0.8
+          }
+        }
+      }
+    }
+
+- ``preload`` のテナントは起動時（本番ランチャーではフォーク前）に構築し、
+  解放しません。利用の多いテナントはリクエストの経路で構築されません。
+- それ以外のテナントは最初のリクエストで構築し、最近使われた順に
+  max_instances 件まで保持します。idle_timeout 秒使われなかったテナントも
+  解放するため、利用の少ないテナントがメモリを占有し続けることはありません。
+- 同じテナントの構築が同時に要求された場合は、1回だけ構築して結果を共有します
+  （single-flight）。構築（成果物やモデルの読み込み）はスレッドで実行するため、
+  イベントループを止めません。
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from app.domain.screening_result import ScreeningResult
+from app.domain.screening_service import ScreeningService, analyze_content
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.service_factory import create_screening_service
+from app.infrastructure.service_lifecycle import (
+    close_service,
+    reload_service,
+    start_service,
+    stop_service,
+)
+
+
+class UnknownTenantError(LookupError):
+    """設定にないテナントIDが指定された場合の例外"""
+
+
+@dataclass(frozen=True, slots=True)
+class TenantConfig:
+    """
+    1つのテナントの設定
+
+    Attributes:
+        tenant_id: テナントID
+        api_keys: テナントを識別するAPIキー
+        settings: Settings の上書き値（フィールド名 -> 値）
+        preload: 起動時に構築して解放しないか
+    """
+
+    tenant_id: str
+    api_keys: tuple[str, ...] = ()
+    settings: Mapping[str, Any] = field(default_factory=dict)
+    preload: bool = False
+
+
+def load_tenant_configs(path: str | Path) -> tuple[TenantConfig, ...]:
+    """
+    JSON形式のテナント設定ファイルを読み込みます
+
+    Args:
+        path: テナント設定ファイルのパス
+
+    Returns:
+        tuple[TenantConfig, ...]: テナントの設定
+
+    Raises:
+        ValueError: ファイルの形式が不正な場合
+    """
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    tenants = raw.get("tenants") if isinstance(raw, dict) else None
+    if not isinstance(tenants, dict):
+        raise ValueError("テナント設定には tenants オブジェクトが必要です")
+    configs = []
+    for tenant_id, entry in tenants.items():
+        if not isinstance(entry, dict):
+            raise ValueError(f"テナント {tenant_id} の設定はオブジェクトが必要です")
+        api_keys = entry.get("api_keys", [])
+        overrides = entry.get("settings", {})
+        if not isinstance(api_keys, list) or not all(
+            isinstance(key, str) and key for key in api_keys
+        ):
+            raise ValueError(f"テナント {tenant_id} の api_keys は文字列の配列です")
+        if not isinstance(overrides, dict):
+            raise ValueError(f"テナント {tenant_id} の settings はオブジェクトです")
+        configs.append(
+            TenantConfig(
+                tenant_id,
+                api_keys=tuple(api_keys),
+                settings=overrides,
+                preload=bool(entry.get("preload", False)),
+            )
+        )
+    return tuple(configs)
+
+
+def tenant_settings(base: Settings, overrides: Mapping[str, Any]) -> Settings:
+    """
+    共通の設定にテナントの上書き値を適用した Settings を作成します
+
+    Args:
+        base: アプリケーション共通の設定
+        overrides: テナントの上書き値
+
+    Returns:
+        Settings: テナントの設定
+
+    Raises:
+        ValueError: 未知のフィールドや不正な値を含む場合
+
+    Note:
+        共有メモリキャッシュ（L2）はフォーク前に作成した場合にだけ
+        ワーカー間で共有されるため、テナントでは常に無効にします。
+    """
+    unknown = set(overrides) - set(Settings.model_fields)
+    if unknown:
+        raise ValueError(f"未知の設定項目です: {', '.join(sorted(unknown))}")
+    return Settings.model_validate(
+        {**base.model_dump(), **overrides, "shared_cache_capacity": 0}
+    )
+
+
+class _Entry:
+    """構築済みのテナントのサービスと利用状況"""
+
+    __slots__ = ("evicted", "last_used", "leases", "service")
+
+    def __init__(self, service: ScreeningService, now: float) -> None:
+        self.service = service
+        self.last_used = now
+        self.leases = 0
+        self.evicted = False
+
+
+class TenantRegistry:
+    """
+    テナントごとの ScreeningService を解決・保持するレジストリ
+
+    Examples:
+        >>> registry = TenantRegistry(settings, load_tenant_configs("tenants.json"))
+        >>> tenant = registry.resolve({"X-API-Key": "acme-key-1"})
+        >>> tenant
+        'acme'
+        >>> await registry.service(tenant).analyze("男性限定の募集です")
+        ScreeningResult(...)
+
+    Note:
+        サービスのライフサイクルフック（start / aclose / close / reload）を持ち、
+        アプリケーションの lifespan から service_lifecycle の関数で呼び出します。
+        解放したサービスは、実行中の呼び出しが終わってから閉じます。
+    """
+
+    def __init__(
+        self,
+        base: Settings,
+        tenants: Sequence[TenantConfig],
+        *,
+        max_instances: int = 16,
+        idle_timeout: float = 600.0,
+        tenant_header: str = "X-Tenant-ID",
+        api_key_header: str = "X-API-Key",
+        factory: Callable[[Settings], ScreeningService] = create_screening_service,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        TenantRegistry を初期化します
+
+        テナントの設定はここで検証しますが、サービスは構築しません。
+
+        Args:
+            base: アプリケーション共通の設定
+            tenants: テナントの設定
+            max_instances: 遅延構築したサービスを保持する数の上限
+            idle_timeout: 使われていないサービスを解放するまでの秒数
+            tenant_header: テナントIDを指定するヘッダー名
+            api_key_header: テナントを識別するAPIキーのヘッダー名
+            factory: Settings から ScreeningService を構築する関数
+            clock: 現在時刻（秒）を返す関数
+
+        Raises:
+            ValueError: テナントの設定が不正、またはAPIキーが重複している場合
+        """
+        if max_instances < 1:
+            raise ValueError("max_instances は1以上である必要があります")
+        self._settings: dict[str, Settings] = {}
+        self._api_keys: dict[str, str] = {}
+        self._preload = frozenset(t.tenant_id for t in tenants if t.preload)
+        for tenant in tenants:
+            try:
+                self._settings[tenant.tenant_id] = tenant_settings(
+                    base, tenant.settings
+                )
+            except ValueError as exc:
+                raise ValueError(f"テナント {tenant.tenant_id}: {exc}") from exc
+            for key in tenant.api_keys:
+                if self._api_keys.setdefault(key, tenant.tenant_id) != tenant.tenant_id:
+                    raise ValueError("APIキーが複数のテナントに指定されています")
+        self._max_instances = max_instances
+        self._idle_timeout = idle_timeout
+        self._tenant_header = tenant_header.lower()
+        self._api_key_header = api_key_header.lower()
+        self._factory = factory
+        self._clock = clock
+        self._pinned: dict[str, _Entry] = {}
+        # 遅延構築したサービス（最後の利用順）
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._building: dict[str, asyncio.Future[_Entry]] = {}
+        self._disposals: set[asyncio.Task[None]] = set()
+        self._proxies = {
+            tenant_id: TenantScreeningService(self, tenant_id)
+            for tenant_id in self._settings
+        }
+
+    @property
+    def tenants(self) -> frozenset[str]:
+        """設定されているテナントID"""
+        return frozenset(self._settings)
+
+    @property
+    def cached(self) -> tuple[str, ...]:
+        """構築済みのテナントID（起動時に構築したもの、最近使われた順の遅延構築分）"""
+        return (*self._pinned, *reversed(self._entries))
+
+    def is_api_key(self, api_key: str) -> bool:
+        """
+        テナントに登録されたAPIキーかを返します
+
+        Args:
+            api_key: リクエストのAPIキー
+
+        Returns:
+            bool: いずれかのテナントの api_keys に含まれる場合は True
+        """
+        return api_key in self._api_keys
+
+    def resolve(self, headers: Mapping[str, str]) -> str | None:
+        """
+        リクエストヘッダーからテナントを解決します
+
+        APIキーがテナントに登録されていればそのテナント、なければ
+        テナントIDのヘッダーで指定したテナントを返します。
+
+        Args:
+            headers: リクエストヘッダー（キーの大文字小文字を区別しないマッピング）
+
+        Returns:
+            str | None: テナントID（どちらもない場合は None）
+
+        Raises:
+            UnknownTenantError: 設定にないテナントIDが指定された場合
+        """
+        api_key = headers.get(self._api_key_header)
+        if api_key and api_key in self._api_keys:
+            return self._api_keys[api_key]
+        tenant_id = headers.get(self._tenant_header)
+        if not tenant_id:
+            return None
+        if tenant_id not in self._settings:
+            raise UnknownTenantError(tenant_id)
+        return tenant_id
+
+    def service(self, tenant_id: str) -> "TenantScreeningService":
+        """
+        テナントのスクリーニングサービスを返します
+
+        返すサービスは呼び出しごとにテナントの実装を取得するため、
+        実装が未構築・解放済みでも使用できます。
+
+        Args:
+            tenant_id: テナントID
+
+        Returns:
+            TenantScreeningService: テナントのサービス
+
+        Raises:
+            UnknownTenantError: 設定にないテナントIDの場合
+        """
+        try:
+            return self._proxies[tenant_id]
+        except KeyError:
+            raise UnknownTenantError(tenant_id) from None
+
+    def preload(self) -> None:
+        """
+        preload のテナントのサービスを構築します
+
+        本番ランチャーではフォーク前のマスタープロセスで呼び出し、
+        構築済みのオブジェクトを全ワーカーで共有します。
+        """
+        for tenant_id in sorted(self._preload - set(self._pinned)):
+            service = self._factory(self._settings[tenant_id])
+            self._pinned[tenant_id] = _Entry(service, self._clock())
+
+    async def start(self) -> None:
+        """preload のテナントを構築し、start() フックを呼び出します"""
+        self.preload()
+        for entry in self._pinned.values():
+            await start_service(entry.service)
+
+    async def aclose(self) -> None:
+        """すべてのサービスの aclose() フックを呼び出して解放します"""
+        while self._entries:
+            _, entry = self._entries.popitem(last=False)
+            entry.evicted = True
+            if entry.leases == 0:
+                await self._dispose(entry)
+        if self._disposals:
+            await asyncio.gather(*self._disposals, return_exceptions=True)
+        for entry in self._pinned.values():
+            await stop_service(entry.service)
+
+    def close(self) -> None:
+        """preload のテナントのサービスの close() フックを呼び出します"""
+        for entry in self._pinned.values():
+            close_service(entry.service)
+        self._pinned.clear()
+
+    async def reload(self, *, force: bool = False) -> str | None:
+        """
+        構築済みのテナントのサービスに reload() フックを転送します
+
+        未構築のテナントは次に構築するときに最新の入力を読み込みます。
+
+        Args:
+            force: 入力の更新を確認せずに再読み込みするか
+
+        Returns:
+            None: テナントごとにバージョンが異なるため常に None
+        """
+        entries = [*self._pinned.values(), *self._entries.values()]
+        for entry in entries:
+            if not entry.evicted:
+                await reload_service(entry.service, force=force)
+        return None
+
+    @asynccontextmanager
+    async def lease(self, tenant_id: str) -> AsyncIterator[ScreeningService]:
+        """
+        テナントの実装を取得し、ブロックの間は解放されないようにします
+
+        Args:
+            tenant_id: テナントID
+
+        Yields:
+            ScreeningService: テナントの実装
+        """
+        entry = self._pinned.get(tenant_id)
+        if entry is None:
+            entry = await self._get(tenant_id)
+        entry.leases += 1
+        try:
+            yield entry.service
+        finally:
+            entry.leases -= 1
+            if entry.evicted and entry.leases == 0:
+                self._schedule_dispose(entry)
+
+    async def _get(self, tenant_id: str) -> _Entry:
+        """遅延構築分のサービスを取得する（なければ1回だけ構築する）"""
+        now = self._clock()
+        self._evict_idle(now)
+        entry = self._entries.get(tenant_id)
+        if entry is not None:
+            entry.last_used = now
+            self._entries.move_to_end(tenant_id)
+            return entry
+
+        building = self._building.get(tenant_id)
+        if building is None:
+            if tenant_id not in self._settings:
+                raise UnknownTenantError(tenant_id)
+            building = asyncio.ensure_future(self._build(tenant_id))
+            self._building[tenant_id] = building
+            building.add_done_callback(lambda _: self._building.pop(tenant_id, None))
+        # 1つの呼び出しが取り消されても、他の呼び出しのための構築は続ける
+        return await asyncio.shield(building)
+
+    async def _build(self, tenant_id: str) -> _Entry:
+        """サービスをスレッドで構築し、start() フックを呼び出して登録する"""
+        service = await asyncio.to_thread(self._factory, self._settings[tenant_id])
+        await start_service(service)
+        entry = _Entry(service, self._clock())
+        self._entries[tenant_id] = entry
+        while len(self._entries) > self._max_instances:
+            self._evict(next(iter(self._entries)))
+        return entry
+
+    def _evict_idle(self, now: float) -> None:
+        """最後の利用が古い順に、idle_timeout を過ぎたサービスを解放する"""
+        while self._entries:
+            tenant_id, entry = next(iter(self._entries.items()))
+            if now - entry.last_used < self._idle_timeout:
+                return
+            self._evict(tenant_id)
+
+    def _evict(self, tenant_id: str) -> None:
+        entry = self._entries.pop(tenant_id)
+        entry.evicted = True
+        if entry.leases == 0:
+            self._schedule_dispose(entry)
+
+    def _schedule_dispose(self, entry: _Entry) -> None:
+        task = asyncio.ensure_future(self._dispose(entry))
+        self._disposals.add(task)
+        task.add_done_callback(self._disposals.discard)
+
+    @staticmethod
+    async def _dispose(entry: _Entry) -> None:
+        """解放したサービスのフックを呼び出す"""
+        await stop_service(entry.service)
+        close_service(entry.service)
+
+
+class TenantScreeningService:
+    """
+    呼び出しごとにテナントの実装を取得して委譲するサービス
+
+    ScreeningService / ScreeningAnalyzer Protocol に構造的部分型付けにより
+    準拠し、ScreeningUsecase からは通常のサービスと同様に利用できます。
+    TenantRegistry.service() で取得してください。
+    """
+
+    def __init__(self, registry: TenantRegistry, tenant_id: str) -> None:
+        """
+        TenantScreeningService を初期化します
+
+        Args:
+            registry: テナントのレジストリ
+            tenant_id: テナントID
+        """
+        self._registry = registry
+        self.tenant_id = tenant_id
+
+    async def screen(self, content: str) -> str:
+        """テナントの実装でスクリーニングを実行します"""
+        async with self._registry.lease(self.tenant_id) as service:
+            return await service.screen(content)
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """テナントの実装で詳細なスクリーニングを実行します"""
+        async with self._registry.lease(self.tenant_id) as service:
+            return await analyze_content(service, content)
+
+
+__all__ = [
+    "TenantConfig",
+    "TenantRegistry",
+    "TenantScreeningService",
+    "UnknownTenantError",
+    "load_tenant_configs",
+    "tenant_settings",
+]
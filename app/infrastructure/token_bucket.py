@@ -0,0 +1,166 @@
+"""
+クライアントごとのトークンバケット
+
+このモジュールは、クライアントごとのレート制限を判定する
+トークンバケットを提供します。
+
+トークン数は GCRA（Generic Cell Rate Algorithm）の形で保持します。
+クライアントごとに「バケットが満杯に戻る時刻」を1つの float として記録し、
+判定のたびにその時刻と現在時刻の差から残りのトークン数を計算するため、
+補充用のタイマーやタスクは不要で、1回の判定は O(1) です。
+
+満杯に戻る時刻を過ぎたクライアントのバケットは、未登録のクライアントと
+区別できないため、情報を失わずに削除できます。エントリは最後の利用順に
+並べ、判定のたびに先頭から満杯のエントリを最大2件削除します。エントリ数が
+max_clients を超えた場合は、最も長く利用されていないエントリを削除します
+（そのクライアントはバケットが満杯の状態から再開します）。
+"""
+
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple
+
+
+class RateLimitDecision(NamedTuple):
+    """
+    レート制限の判定結果（リクエストごとに生成するため軽量なタプル）
+
+    Attributes:
+        allowed: リクエストを許可したか
+        limit: バケットの容量（連続して許可できるリクエスト数）
+        remaining: 判定後に残っているトークン数
+        reset_after: バケットが満杯に戻るまでの秒数
+        retry_after: 拒否した場合に、再試行で許可されるまでの秒数（許可時は 0）
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float
+    retry_after: float = 0.0
+
+
+class TokenBucketLimiter:
+    """
+    クライアントごとのトークンバケットによるレート制限
+
+    各クライアントは容量 burst のバケットを持ち、トークンは毎秒 rate 個の
+    割合で補充されます。リクエストは1トークンを消費し、トークンが
+    足りない場合は拒否します。
+
+    Examples:
+        >>> limiter = TokenBucketLimiter(rate=10, burst=20)
+        >>> decision = limiter.acquire("key:abc")
+        >>> decision.allowed, decision.remaining
+        (True, 19)
+
+    Note:
+        イベントループ上から同期的に呼び出す前提のため、ロックは使用しません。
+        状態はプロセスごとに保持されるため、複数ワーカーで運用する場合の
+        実効的な上限はワーカー数倍になります。
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        *,
+        max_clients: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        TokenBucketLimiter を初期化します
+
+        Args:
+            rate: 1秒あたりに補充するトークン数
+            burst: バケットの容量
+            max_clients: 保持するクライアント数の上限
+            clock: 現在時刻（秒）を返す関数
+
+        Raises:
+            ValueError: rate が0以下、burst または max_clients が1未満の場合
+        """
+        if rate <= 0:
+            raise ValueError("rate は0より大きい必要があります")
+        if burst < 1:
+            raise ValueError("burst は1以上である必要があります")
+        if max_clients < 1:
+            raise ValueError("max_clients は1以上である必要があります")
+        self._interval = 1.0 / rate
+        self._burst = burst
+        self._capacity = burst * self._interval
+        self._max_clients = max_clients
+        self._clock = clock
+        # クライアント -> バケットが満杯に戻る時刻（最後の利用順）
+        self._full_at: OrderedDict[str, float] = OrderedDict()
+
+    @property
+    def limit(self) -> int:
+        """バケットの容量"""
+        return self._burst
+
+    @property
+    def window(self) -> float:
+        """空のバケットが満杯に戻るまでの秒数"""
+        return self._capacity
+
+    def __len__(self) -> int:
+        """保持しているクライアント数"""
+        return len(self._full_at)
+
+    def acquire(self, key: str) -> RateLimitDecision:
+        """
+        クライアントのトークンを1つ消費できるか判定します
+
+        Args:
+            key: クライアントを識別するキー
+
+        Returns:
+            RateLimitDecision: 判定結果（許可した場合はトークンを消費済み）
+        """
+        now = self._clock()
+        self._evict_full(now)
+        full_at = max(self._full_at.get(key, now), now) + self._interval
+        debt = full_at - now
+        if debt > self._capacity:
+            # 拒否した場合は状態を変えない
+            current = debt - self._interval
+            return RateLimitDecision(
+                allowed=False,
+                limit=self._burst,
+                remaining=0,
+                reset_after=current,
+                retry_after=debt - self._capacity,
+            )
+
+        self._full_at[key] = full_at
+        self._full_at.move_to_end(key)
+        if len(self._full_at) > self._max_clients:
+            self._full_at.popitem(last=False)
+        return RateLimitDecision(
+            allowed=True,
+            limit=self._burst,
+            remaining=math.floor((self._capacity - debt) / self._interval + 1e-9),
+            reset_after=debt,
+        )
+
+    def _evict_full(self, now: float) -> None:
+        """最後の利用が古い順に、満杯に戻ったバケットを最大2件削除する"""
+        # 1回の判定で増えるエントリは高々1件のため、2件ずつ削除すれば
+        # 判定ごとの処理量を一定に保ったまま満杯のエントリを回収できる
+        full_at = self._full_at
+        for _ in range(2):
+            if not full_at:
+                return
+            key = next(iter(full_at))
+            if full_at[key] > now:
+                return
+            del full_at[key]
+
+
+__all__ = [
+    "RateLimitDecision",
+    "TokenBucketLimiter",
+]
@@ -0,0 +1,149 @@
+"""
+トレーシング付きスクリーニングサービス
+
+このモジュールは、任意の ScreeningService をラップし、呼び出しごとに
+スパンを記録するデコレーター実装を提供します。サービスの組み立てでは
+デコレーターを重ねたサービス全体（キャッシュを含む）と、バックエンド
+（ルールエンジン、モデル、外部スコアリングAPI等）の境界を包み、
+キャッシュヒットやマイクロバッチの待ち時間とバックエンドの処理時間を
+分けて確認できるようにします。
+"""
+
+from collections.abc import Sequence
+
+from app.domain.screening_result import ScreeningResult
+from app.domain.screening_service import (
+    ScreeningService,
+    analyze_content,
+    analyze_many_contents,
+)
+from app.infrastructure.service_lifecycle import (
+    close_service,
+    reload_service,
+    start_service,
+    stop_service,
+)
+from app.infrastructure.tracing import Span, SpanKind, Tracer
+
+
+class TracedScreeningService:
+    """
+    呼び出しごとにスパンを記録するスクリーニングサービス
+
+    ScreeningService / ScreeningAnalyzer / BatchScreeningAnalyzer Protocol に
+    構造的部分型付けにより準拠します。スパンには入力の文字数（一括の場合は
+    件数）と、結果の判定・スコア・検出数を属性として記録します。
+
+    Examples:
+        >>> service = TracedScreeningService(
+        ...     RemoteScreeningService("http://scoring.internal:9000"),
+        ...     tracer,
+        ...     name="screening.backend",
+        ...     kind=SpanKind.CLIENT,
+        ... )
+        >>> await service.analyze("応募者のテキスト")
+
+    Note:
+        マイクロバッチの内側のバックエンドのスパンは、バッチを開始した
+        リクエストのスパンの子として記録されます（同じバッチの他の
+        リクエストとは件数の属性で対応付けます）。
+    """
+
+    def __init__(
+        self,
+        service: ScreeningService,
+        tracer: Tracer,
+        *,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        backend: str | None = None,
+    ) -> None:
+        """
+        TracedScreeningService を初期化します
+
+        Args:
+            service: スパンを記録する下位サービス
+            tracer: スパンを開始するトレーサー
+            name: スパンの名前の接頭辞（``<name>.analyze`` 等）
+            kind: スパンの種類（外部への呼び出しは CLIENT）
+            backend: ``screening.backend`` 属性に記録する実装の名前
+        """
+        self._service = service
+        self._tracer = tracer
+        self._kind = kind
+        self._names = {
+            method: f"{name}.{method}" for method in ("analyze", "analyze_many")
+        }
+        self._attributes = {} if backend is None else {"screening.backend": backend}
+
+    async def screen(self, content: str) -> str:
+        """
+        スパンを記録しながらスクリーニングし、結果のテキストを返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            スクリーニング結果のテキスト
+        """
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        スパンを記録しながら詳細な結果を取得します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: 下位サービスの結果
+        """
+        with self._start("analyze", "screening.content_length", len(content)) as span:
+            result = await analyze_content(self._service, content)
+            _record_result(span, result)
+            return result
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        """
+        バッチ全体を1つのスパンとして記録しながら詳細な結果を取得します
+
+        Args:
+            contents: スクリーニング対象のテキストの列
+
+        Returns:
+            list[ScreeningResult]: contents と同じ順序の結果
+        """
+        with self._start("analyze_many", "screening.batch_size", len(contents)):
+            return await analyze_many_contents(self._service, contents)
+
+    async def start(self) -> None:
+        """下位サービスの start() フックを転送します"""
+        await start_service(self._service)
+
+    async def aclose(self) -> None:
+        """下位サービスの aclose() フックを転送します"""
+        await stop_service(self._service)
+
+    def close(self) -> None:
+        """下位サービスの close() フックを転送します"""
+        close_service(self._service)
+
+    async def reload(self, *, force: bool = False) -> str | None:
+        """下位サービスの reload() フックを転送します"""
+        return await reload_service(self._service, force=force)
+
+    def _start(self, method: str, key: str, value: int) -> Span:
+        return self._tracer.start_span(
+            self._names[method], {**self._attributes, key: value}, kind=self._kind
+        )
+
+
+def _record_result(span: Span, result: ScreeningResult) -> None:
+    """スクリーニング結果の要約をスパンの属性に記録する"""
+    if span.recording:
+        span.set_attribute("screening.verdict", str(result.verdict))
+        span.set_attribute("screening.score", result.score)
+        span.set_attribute("screening.findings", len(result.findings))
+
+
+__all__ = ["TracedScreeningService"]
@@ -0,0 +1,635 @@
+"""
+OpenTelemetry 互換の軽量トレーサー
+
+このモジュールは、W3C Trace Context（``traceparent`` ヘッダー）で伝搬する
+トレーサーと、スパンをまとめて書き出すエクスポーターを提供します。
+OpenTelemetry SDK には依存せず、標準ライブラリだけで動作します。
+
+- スパンは ``contextvars`` で現在のスパンを追跡し、``with`` のブロック内で
+  開始したスパン（別タスクに引き継がれたものを含む）を子にします。
+- 標本化は親のスパンに従います（ParentBased）。親がない場合はトレースIDの
+  下位64ビットと sample_ratio で決めます（TraceIdRatioBased と同じ判定のため、
+  他のサービスとも同じトレースを標本化します）。標本化しないスパンも
+  トレースIDを伝搬しますが、時刻や属性は記録しません。
+- 終了したスパンはキューに積むだけで、JSON への変換と書き出しは
+  バックグラウンドのスレッドがまとめて行います（BatchSpanProcessor）。
+  キューが一杯の場合はスパンを捨て、リクエストの処理を待たせません。
+- エクスポーターは SpanExporter Protocol で差し替えられます。標準では
+  標準出力（ConsoleSpanExporter）と JSON Lines のファイル
+  （FileSpanExporter）を提供し、コレクターなしで確認できます。
+  出力は OTLP/JSON のフィールド名（``traceId``、``spanId`` 等）を使います。
+"""
+
+import atexit
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, TextIO
+
+from app.domain.tracing import AttributeValue
+
+if TYPE_CHECKING:
+    from app.infrastructure.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# W3C Trace Context のヘッダー名
+TRACEPARENT_HEADER = "traceparent"
+
+_TRACE_ID_MASK = (1 << 64) - 1
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+_current_span: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+
+
+class SpanKind(StrEnum):
+    """
+    スパンの種類（OTLP の SpanKind）
+
+    Attributes:
+        INTERNAL: プロセス内の処理
+        SERVER: 受信したリクエストの処理
+        CLIENT: 外部への呼び出し
+    """
+
+    INTERNAL = "SPAN_KIND_INTERNAL"
+    SERVER = "SPAN_KIND_SERVER"
+    CLIENT = "SPAN_KIND_CLIENT"
+
+
+@dataclass(frozen=True, slots=True)
+class SpanContext:
+    """
+    プロセスをまたいで伝搬するスパンの識別子
+
+    Attributes:
+        trace_id: 128ビットのトレースID
+        span_id: 64ビットのスパンID
+        sampled: 標本化されているか（traceparent の sampled フラグ）
+    """
+
+    trace_id: int
+    span_id: int
+    sampled: bool
+
+    @property
+    def traceparent(self) -> str:
+        """W3C Trace Context の traceparent ヘッダーの値"""
+        flags = "01" if self.sampled else "00"
+        return f"00-{self.trace_id:032x}-{self.span_id:016x}-{flags}"
+
+
+def parse_traceparent(value: str) -> SpanContext | None:
+    """
+    traceparent ヘッダーの値を解析します
+
+    Args:
+        value: ``00-<trace-id>-<parent-id>-<flags>`` 形式の値
+
+    Returns:
+        SpanContext | None: 解析した識別子（形式が不正な場合は None）
+
+    Examples:
+        >>> parse_traceparent("00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01")
+        SpanContext(trace_id=..., span_id=..., sampled=True)
+    """
+    parts = value.strip().split("-")
+    if len(parts) < 4:
+        return None
+    version, trace_id, span_id, flags = parts[:4]
+    # 未知の将来のバージョンは先頭の4フィールドだけを解釈する
+    if version == "ff" or (version == "00" and len(parts) != 4):
+        return None
+    lengths = (len(version), len(trace_id), len(span_id), len(flags))
+    if lengths != (2, 32, 16, 2):
+        return None
+    if not _HEX_DIGITS.issuperset(version + trace_id + span_id + flags):
+        return None
+    context = SpanContext(int(trace_id, 16), int(span_id, 16), bool(int(flags, 16) & 1))
+    if not context.trace_id or not context.span_id:
+        return None
+    return context
+
+
+def current_span() -> "Span | None":
+    """現在のコンテキストで実行中のスパン（なければ None）を返します"""
+    return _current_span.get()
+
+
+def current_traceparent() -> str | None:
+    """
+    外部への呼び出しに付与する traceparent ヘッダーの値を返します
+
+    Returns:
+        str | None: 現在のスパンの traceparent（スパンがなければ None）
+    """
+    span = _current_span.get()
+    return None if span is None else span.context.traceparent
+
+
+class SpanExporter(Protocol):
+    """
+    終了したスパンを書き出すエクスポーターのインターフェース
+
+    export() はバックグラウンドのスレッドから呼ばれます。
+    """
+
+    def export(self, spans: Sequence[dict[str, Any]]) -> None:
+        """
+        スパンの列を書き出します
+
+        Args:
+            spans: OTLP/JSON のフィールド名を持つスパンの辞書の列
+        """
+        ...
+
+    def shutdown(self) -> None:
+        """書き出し先を閉じます"""
+        ...
+
+
+class ConsoleSpanExporter:
+    """
+    スパンを1行1件の JSON として標準出力に書き出すエクスポーター
+
+    SpanExporter Protocol に構造的部分型付けにより準拠します。
+    """
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        """
+        ConsoleSpanExporter を初期化します
+
+        Args:
+            stream: 書き出し先（None なら書き出すときの sys.stdout）
+        """
+        self._stream = stream
+
+    def export(self, spans: Sequence[dict[str, Any]]) -> None:
+        stream = self._stream or sys.stdout
+        stream.write("".join(_dump(span) for span in spans))
+        stream.flush()
+
+    def shutdown(self) -> None:
+        pass
+
+
+class FileSpanExporter:
+    """
+    スパンを JSON Lines のファイルに追記するエクスポーター
+
+    SpanExporter Protocol に構造的部分型付けにより準拠します。
+    ファイルは最初の書き出しで開くため、マスタープロセスで作成して
+    フォークしたワーカーでも、各ワーカーが自分のファイル記述子で追記します。
+    1回の書き出しは1回の write() で行い、複数のワーカーの行が混ざりません。
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        FileSpanExporter を初期化します
+
+        Args:
+            path: 追記する JSON Lines のファイルのパス
+        """
+        self.path = Path(path)
+        self._file: TextIO | None = None
+        self._pid = 0
+
+    def export(self, spans: Sequence[dict[str, Any]]) -> None:
+        if self._file is None or self._pid != os.getpid():
+            self._file = self.path.open("a", encoding="utf-8")
+            self._pid = os.getpid()
+        self._file.write("".join(_dump(span) for span in spans))
+        self._file.flush()
+
+    def shutdown(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class Span:
+    """
+    1つの処理の区間
+
+    ``with`` のブロックの間は現在のスパンとなり、ブロックを抜けると
+    終了します。標本化されていないスパンは識別子の伝搬だけを行い、
+    属性や時刻は記録しません。
+
+    Attributes:
+        name: スパンの名前
+        context: スパンの識別子
+        parent_id: 親のスパンID（ルートの場合は None）
+        kind: スパンの種類
+        attributes: スパンの属性
+        error: 例外で終了した場合のメッセージ（正常なら None）
+    """
+
+    __slots__ = (
+        "_end",
+        "_processor",
+        "_start",
+        "_token",
+        "attributes",
+        "context",
+        "error",
+        "kind",
+        "name",
+        "parent_id",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        context: SpanContext,
+        *,
+        parent_id: int | None,
+        kind: SpanKind,
+        attributes: Mapping[str, AttributeValue] | None,
+        processor: "BatchSpanProcessor",
+    ) -> None:
+        self.name = name
+        self.context = context
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes: dict[str, AttributeValue] = (
+            dict(attributes) if attributes and context.sampled else {}
+        )
+        self.error: str | None = None
+        self._processor = processor
+        self._start = time.time_ns() if context.sampled else 0
+        self._end = 0
+        self._token = None
+
+    @property
+    def recording(self) -> bool:
+        """属性や時刻を記録するか（標本化されているか）"""
+        return self.context.sampled
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """
+        スパンに属性を設定します（標本化されていない場合は何もしません）
+
+        Args:
+            key: 属性名（例: ``"http.response.status_code"``）
+            value: 属性値
+        """
+        if self.context.sampled:
+            self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        """
+        スパンをエラーとして記録します
+
+        Args:
+            exc: 処理を中断した例外
+        """
+        if self.context.sampled:
+            self.error = str(exc) or type(exc).__name__
+            self.attributes["exception.type"] = type(exc).__qualname__
+
+    def end(self) -> None:
+        """スパンを終了し、標本化されていればエクスポートのキューに積みます"""
+        if self._end or not self.context.sampled:
+            return
+        self._end = time.time_ns()
+        self._processor.on_end(self)
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type: object, exc: BaseException | None, tb: object) -> None:
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.record_exception(exc)
+        self.end()
+
+    def to_dict(self) -> dict[str, Any]:
+        """OTLP/JSON のフィールド名でスパンを辞書にします"""
+        status = (
+            {"code": "STATUS_CODE_UNSET"}
+            if self.error is None
+            else {"code": "STATUS_CODE_ERROR", "message": self.error}
+        )
+        return {
+            "traceId": f"{self.context.trace_id:032x}",
+            "spanId": f"{self.context.span_id:016x}",
+            "parentSpanId": "" if self.parent_id is None else f"{self.parent_id:016x}",
+            "name": self.name,
+            "kind": self.kind.value,
+            "startTimeUnixNano": self._start,
+            "endTimeUnixNano": self._end,
+            "attributes": self.attributes,
+            "status": status,
+        }
+
+
+class BatchSpanProcessor:
+    """
+    終了したスパンをキューに積み、バックグラウンドでまとめて書き出すプロセッサー
+
+    スパンの終了時の処理はキューへの追加だけです。キューに max_batch_size 件
+    たまるか schedule_delay 秒ごとに、バックグラウンドのスレッドが
+    スパンを辞書に変換してエクスポーターに渡します。
+
+    Attributes:
+        dropped: キューが一杯で捨てたスパンの数
+
+    Note:
+        スレッドは最初のスパンが終了したときに開始します。フォークした
+        子プロセスでは親のキューを引き継がずに新しいスレッドを開始します。
+        プロセスの終了時（atexit）に残りのスパンを書き出します。
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        *,
+        resource: Mapping[str, AttributeValue] | None = None,
+        max_queue_size: int = 2048,
+        max_batch_size: int = 512,
+        schedule_delay: float = 5.0,
+    ) -> None:
+        """
+        BatchSpanProcessor を初期化します
+
+        Args:
+            exporter: スパンの書き出し先
+            resource: すべてのスパンに付与するリソースの属性
+                （``service.name`` 等）
+            max_queue_size: 書き出し待ちのスパンの上限
+            max_batch_size: 1回の export() に渡すスパンの上限
+            schedule_delay: 書き出しの間隔（秒）
+
+        Raises:
+            ValueError: 件数や間隔が範囲外の場合
+        """
+        if max_queue_size < 1 or not 1 <= max_batch_size <= max_queue_size:
+            raise ValueError(
+                "max_batch_size は 1 以上 max_queue_size 以下である必要があります"
+            )
+        if schedule_delay <= 0:
+            raise ValueError("schedule_delay は 0 より大きい必要があります")
+        self._exporter = exporter
+        self._resource = dict(resource or {})
+        self._max_queue_size = max_queue_size
+        self._max_batch_size = max_batch_size
+        self._schedule_delay = schedule_delay
+        self._queue: deque[Span] = deque()
+        self._pid = 0
+        self._shutdown = False
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self.dropped = 0
+
+    def on_end(self, span: Span) -> None:
+        """
+        終了したスパンをキューに積みます
+
+        Args:
+            span: 終了したスパン
+        """
+        if self._pid != os.getpid():
+            self._start_worker()
+        if self._shutdown or len(self._queue) >= self._max_queue_size:
+            self.dropped += 1
+            return
+        self._queue.append(span)
+        if len(self._queue) >= self._max_batch_size:
+            self._wakeup.set()
+
+    def force_flush(self) -> None:
+        """キューのスパンを呼び出したスレッドで書き出します"""
+        with self._lock:
+            while self._queue:
+                self._export_batch()
+
+    def shutdown(self) -> None:
+        """スレッドを止め、残りのスパンを書き出してエクスポーターを閉じます"""
+        if self._shutdown:
+            return
+        self._shutdown = True
+        self._wakeup.set()
+        thread = self._thread
+        if (
+            thread is not None
+            and self._pid == os.getpid()
+            and thread is not threading.current_thread()
+        ):
+            thread.join(timeout=self._schedule_delay)
+        self.force_flush()
+        self._exporter.shutdown()
+
+    def _start_worker(self) -> None:
+        """このプロセスの書き出しスレッドを開始する（フォーク後は状態を作り直す）"""
+        if self._pid:
+            # 親プロセスのキューは親が書き出す
+            self._queue = deque()
+            self._lock = threading.Lock()
+            self._wakeup = threading.Event()
+        else:
+            atexit.register(self.shutdown)
+        self._pid = os.getpid()
+        self._thread = threading.Thread(
+            target=self._run, name="span-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._shutdown:
+            self._wakeup.wait(self._schedule_delay)
+            self._wakeup.clear()
+            if not self._shutdown:
+                self.force_flush()
+
+    def _export_batch(self) -> None:
+        queue = self._queue
+        batch = [queue.popleft() for _ in range(min(len(queue), self._max_batch_size))]
+        spans = []
+        for span in batch:
+            data = span.to_dict()
+            data["resource"] = self._resource
+            spans.append(data)
+        try:
+            self._exporter.export(spans)
+        except Exception:
+            logger.exception("%d 件のスパンの書き出しに失敗しました", len(spans))
+
+
+class Tracer:
+    """
+    スパンを開始するトレーサー
+
+    Tracer Protocol（app.domain.tracing）に構造的部分型付けにより準拠します。
+
+    Examples:
+        >>> tracer = Tracer(FileSpanExporter("traces.jsonl"), sample_ratio=0.1)
+        >>> with tracer.start_span("screening.service") as span:
+        ...     span.set_attribute("screening.verdict", "pass")
+
+    Note:
+        受信したリクエストの traceparent は start_span() の parent に渡します。
+        parent を省略した場合は現在のスパンを親とし、現在のスパンもなければ
+        新しいトレースを開始します。
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        *,
+        sample_ratio: float = 1.0,
+        service_name: str = "screening-api",
+        max_queue_size: int = 2048,
+        max_batch_size: int = 512,
+        schedule_delay: float = 5.0,
+    ) -> None:
+        """
+        Tracer を初期化します
+
+        Args:
+            exporter: スパンの書き出し先
+            sample_ratio: 新しいトレースを標本化する割合（0.0〜1.0）
+            service_name: リソースの ``service.name`` 属性
+            max_queue_size: 書き出し待ちのスパンの上限
+            max_batch_size: 1回の書き出しのスパンの上限
+            schedule_delay: 書き出しの間隔（秒）
+
+        Raises:
+            ValueError: sample_ratio が範囲外の場合
+        """
+        if not 0.0 <= sample_ratio <= 1.0:
+            raise ValueError("sample_ratio は 0 以上 1 以下である必要があります")
+        self._bound = round(sample_ratio * (1 << 64))
+        self.processor = BatchSpanProcessor(
+            exporter,
+            resource={"service.name": service_name},
+            max_queue_size=max_queue_size,
+            max_batch_size=min(max_batch_size, max_queue_size),
+            schedule_delay=schedule_delay,
+        )
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Mapping[str, AttributeValue] | None = None,
+        *,
+        kind: SpanKind = SpanKind.INTERNAL,
+        parent: SpanContext | None = None,
+    ) -> Span:
+        """
+        スパンを作成します（``with`` で開始し、ブロックを抜けると終了します）
+
+        Args:
+            name: スパンの名前
+            attributes: スパンの属性
+            kind: スパンの種類
+            parent: 親のスパンの識別子（None なら現在のスパン）
+
+        Returns:
+            Span: 作成したスパン
+        """
+        if parent is None:
+            current = _current_span.get()
+            parent = None if current is None else current.context
+        span_id = random.getrandbits(64) or 1
+        if parent is None:
+            trace_id = random.getrandbits(128) or 1
+            context = SpanContext(
+                trace_id, span_id, (trace_id & _TRACE_ID_MASK) < self._bound
+            )
+        else:
+            context = SpanContext(parent.trace_id, span_id, parent.sampled)
+        return Span(
+            name,
+            context,
+            parent_id=None if parent is None else parent.span_id,
+            kind=kind,
+            attributes=attributes,
+            processor=self.processor,
+        )
+
+    def force_flush(self) -> None:
+        """書き出し待ちのスパンをすぐに書き出します"""
+        self.processor.force_flush()
+
+    def shutdown(self) -> None:
+        """残りのスパンを書き出してエクスポーターを閉じます"""
+        self.processor.shutdown()
+
+
+def tracer_from_settings(settings: "Settings") -> Tracer | None:
+    """
+    設定に従ってトレーサーを構築します
+
+    Args:
+        settings: アプリケーション設定
+
+    Returns:
+        Tracer | None: トレーサー（tracing_exporter が "none" なら None）
+    """
+    if settings.tracing_exporter == "none":
+        return None
+    exporter: SpanExporter = (
+        FileSpanExporter(settings.tracing_file_path)
+        if settings.tracing_exporter == "file"
+        else ConsoleSpanExporter()
+    )
+    return Tracer(
+        exporter,
+        sample_ratio=settings.tracing_sample_ratio,
+        service_name=settings.tracing_service_name,
+        max_queue_size=settings.tracing_max_queue_size,
+        schedule_delay=settings.tracing_schedule_delay,
+    )
+
+
+@lru_cache
+def get_tracer() -> Tracer | None:
+    """
+    プロセス内で共有するトレーサーを返します
+
+    Returns:
+        Tracer | None: Settings から構築したトレーサー（無効なら None）
+
+    Note:
+        結果はキャッシュされます。テストで環境変数を変更した場合は
+        ``get_settings.cache_clear()`` と ``get_tracer.cache_clear()`` を
+        呼び出してください。
+    """
+    from app.infrastructure.config.settings import get_settings
+
+    return tracer_from_settings(get_settings())
+
+
+def _dump(span: dict[str, Any]) -> str:
+    return json.dumps(span, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+__all__ = [
+    "BatchSpanProcessor",
+    "ConsoleSpanExporter",
+    "FileSpanExporter",
+    "Span",
+    "SpanContext",
+    "SpanExporter",
+    "SpanKind",
+    "TRACEPARENT_HEADER",
+    "Tracer",
+    "current_span",
+    "current_traceparent",
+    "get_tracer",
+    "parse_traceparent",
+    "tracer_from_settings",
+]
@@ -5,21 +5,165 @@ FastAPI 依存性注入設定
 アプリケーション層とインフラストラクチャ層のインスタンスを提供します。
 """
 
-from fastapi import Depends
+import hmac
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
+from fastapi import Depends, Header, HTTPException
+from fastapi.requests import HTTPConnection
+
+from app.domain.screening_result import Verdict
 from app.domain.screening_service import ScreeningService
-from app.infrastructure.screening_service_impl import EchoScreeningService
+from app.usecase.priority_scheduler import (
+    PrioritizedScreeningService,
+    Priority,
+    PriorityScheduler,
+)
+from app.usecase.screening_pipeline import (
+    DetectorStage,
+    NormalizeStage,
+    PipelineStage,
+    PrefilterStage,
+    RedactionStage,
+    ScoringStage,
+    ScreeningPipeline,
+)
 from app.usecase.screening_usecase import ScreeningUsecase
 
+if TYPE_CHECKING:
+    from app.infrastructure.tenant_registry import TenantRegistry
+
+# 要求の優先度クラスを指定するヘッダー
+PRIORITY_HEADER = "X-Screening-Priority"
+
+# 管理用エンドポイントの認証トークンを指定するヘッダー
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
 
-def get_screening_service() -> ScreeningService:
+@dataclass(frozen=True, slots=True)
+class StreamOptions:
+    """
+    ストリーミングエンドポイントの設定
+
+    Attributes:
+        chunk_size: 1回にスクリーニングする最大文字数
+        heartbeat_interval: ハートビートの間隔（秒、0 で無効）
+    """
+
+    chunk_size: int
+    heartbeat_interval: float
+
+
+def get_stream_options() -> StreamOptions:
+    """
+    ストリーミングの設定を提供する依存性注入ファクトリ
+
+    設定モジュールは関数内で遅延インポートします。テストでは
+    ``app.dependency_overrides[get_stream_options]`` で差し替えられます。
+
+    Returns:
+        StreamOptions: Settings から読み込んだストリーミングの設定
+    """
+    from app.infrastructure.config.settings import get_settings
+
+    settings = get_settings()
+    return StreamOptions(
+        chunk_size=settings.stream_chunk_size,
+        heartbeat_interval=settings.stream_heartbeat_interval,
+    )
+
+
+def build_screening_service() -> ScreeningService:
+    """
+    アプリケーションで共有する ScreeningService の実装を構築します
+
+    Infrastructure層のモジュールは関数内で遅延インポートします。
+    これにより ``app.presentation.main`` のインポート時に実装側の
+    重い依存（ルールエンジン、モデル、DBドライバ等）が読み込まれず、
+    コールドスタート時間を抑えられます。
+
+    Returns:
+        ScreeningService: 設定に従って組み立てた ScreeningService の実装
+    """
+    from app.infrastructure.config.settings import get_settings
+    from app.infrastructure.service_factory import create_screening_service
+
+    settings = get_settings()
+    if settings.pipeline_detectors:
+        return build_screening_pipeline(settings.pipeline_detectors)
+    return create_screening_service(settings)
+
+
+def build_screening_pipeline(detectors: Sequence[str]) -> ScreeningPipeline:
+    """
+    検出器の並びから ScreeningPipeline を組み立てます
+
+    正規化 → 前処理フィルタ（空白だけのテキストを打ち切る）→ 個人情報の
+    検出器 → 先頭の検出器（BLOCK で以降を打ち切る）→ 残りの検出器（並行に
+    実行）→ 置換 → スコアの統合 の順に並べます。先頭には最も軽い検出器
+    （通常は rules）を指定してください。
+
+    pii は並びの位置によらず他の検出器より先に実行し、検出した個人情報を
+    以降の検出器（リモートのモデル等）に渡しません。
+
+    Args:
+        detectors: 検出器に使う screening_backend の並び
+
+    Returns:
+        ScreeningPipeline: 組み立てたパイプライン
+
+    Note:
+        各検出器は Settings の他の項目（マイクロバッチ、耐障害性、L1キャッシュ）に
+        従って組み立てます。共有メモリキャッシュ（L2）は検出器ごとに
+        確保されるのを避けるため使用しません。
+    """
+    from app.infrastructure.config.settings import get_settings
+    from app.infrastructure.service_factory import create_screening_service
+
+    settings = get_settings()
+    built = [
+        (
+            backend,
+            create_screening_service(
+                settings.model_copy(
+                    update={"screening_backend": backend, "shared_cache_capacity": 0}
+                )
+            ),
+        )
+        for backend in detectors
+    ]
+    stages: list[PipelineStage | Sequence[PipelineStage]] = [
+        NormalizeStage(),
+        PrefilterStage(),
+    ]
+    stages += [
+        DetectorStage(name, service, mask_char="*")
+        for name, service in built
+        if name == "pii"
+    ]
+    detector_services = [(name, service) for name, service in built if name != "pii"]
+    if detector_services:
+        (first, first_service), *rest = detector_services
+        stages.append(DetectorStage(first, first_service, halt_at=Verdict.BLOCK))
+        if rest:
+            stages.append([DetectorStage(name, service) for name, service in rest])
+    stages += [RedactionStage(), ScoringStage()]
+    return ScreeningPipeline(stages)
+
+
+def get_screening_service(connection: HTTPConnection) -> ScreeningService:
     """
     ScreeningService の実装を提供する依存性注入ファクトリ
 
-    FastAPI の Depends で使用され、EchoScreeningService の
-    インスタンスを返します。Protocol 型を返すことで、
+    FastAPI の Depends で使用され、lifespan で構築済みの
+    共有インスタンスを返します。Protocol 型を返すことで、
     具体的な実装に依存しないインターフェースを提供します。
 
+    Args:
+        connection: 現在のリクエストまたは WebSocket 接続
+            （app.state へのアクセスに使用）
+
     Returns:
         ScreeningService: ScreeningService Protocol に準拠する実装
 
@@ -29,25 +173,193 @@ def get_screening_service() -> ScreeningService:
         ...     result = service.screen("test")
         ...     return {"result": result}
 
+    Raises:
+        HTTPException: 設定にないテナントIDが指定された場合（404）
+
     Note:
-        現在の実装では EchoScreeningService を返しますが、
-        将来的には設定ファイルや環境変数に基づいて
-        異なる実装を返すように拡張できます。
+        lifespan が実行されていない場合（TestClient を with 文なしで
+        使用した場合など）は、初回呼び出し時に遅延構築して
+        app.state にキャッシュします。テナントの設定がある場合は、
+        リクエストのAPIキーまたはテナントIDのヘッダーで解決した
+        テナントのサービスを返します。
+    """
+    state = connection.app.state
+    if not hasattr(state, "tenant_registry"):
+        state.tenant_registry = build_tenant_registry()
+    registry = state.tenant_registry
+    if registry is not None:
+        from app.infrastructure.tenant_registry import UnknownTenantError
+
+        try:
+            tenant_id = registry.resolve(connection.headers)
+        except UnknownTenantError as exc:
+            raise HTTPException(status_code=404, detail="Unknown tenant") from exc
+        if tenant_id is not None:
+            return registry.service(tenant_id)
+    service = getattr(state, "screening_service", None)
+    if service is None:
+        service = build_screening_service()
+        state.screening_service = service
+    return service
+
+
+def build_tenant_registry() -> "TenantRegistry | None":
     """
-    return EchoScreeningService()
+    Settings に従ってテナントのレジストリを構築します
+
+    テナントのサービスはここでは構築しません（preload のテナントは
+    TenantRegistry.preload() で構築します）。
+
+    Returns:
+        TenantRegistry | None: レジストリ
+        （``SCREENING_TENANTS_CONFIG_PATH`` が未設定の場合は None）
+    """
+    from app.infrastructure.config.settings import get_settings
+
+    settings = get_settings()
+    if settings.tenants_config_path is None:
+        return None
+    from app.infrastructure.tenant_registry import (
+        TenantRegistry,
+        load_tenant_configs,
+    )
+
+    return TenantRegistry(
+        settings,
+        load_tenant_configs(settings.tenants_config_path),
+        max_instances=settings.tenant_cache_size,
+        idle_timeout=settings.tenant_idle_timeout,
+        tenant_header=settings.tenant_header,
+        api_key_header=settings.tenant_api_key_header,
+    )
+
+
+def build_priority_scheduler() -> PriorityScheduler | None:
+    """
+    Settings に従って優先度スケジューラーを構築します
+
+    Returns:
+        PriorityScheduler | None: スケジューラー
+        （``SCREENING_SCHEDULER_MAX_CONCURRENCY`` が 0 の場合は None）
+    """
+    from app.infrastructure.config.settings import get_settings
+
+    settings = get_settings()
+    if settings.scheduler_max_concurrency <= 0:
+        return None
+    return PriorityScheduler(
+        settings.scheduler_max_concurrency,
+        weights={
+            Priority.INTERACTIVE: settings.scheduler_interactive_weight,
+            Priority.BULK: settings.scheduler_bulk_weight,
+        },
+    )
+
+
+def get_priority_scheduler(connection: HTTPConnection) -> PriorityScheduler | None:
+    """
+    優先度スケジューラーを提供する依存性注入ファクトリ
+
+    lifespan で構築済みの共有インスタンスを返します。lifespan が
+    実行されていない場合は初回呼び出し時に遅延構築して app.state に
+    キャッシュします。
+
+    Args:
+        connection: 現在のリクエストまたは WebSocket 接続
+
+    Returns:
+        PriorityScheduler | None: スケジューラー（無効の場合は None）
+    """
+    state = connection.app.state
+    if not hasattr(state, "priority_scheduler"):
+        state.priority_scheduler = build_priority_scheduler()
+    return state.priority_scheduler
+
+
+@dataclass(frozen=True, slots=True)
+class WebSocketOptions:
+    """
+    WebSocket エンドポイントの設定
+
+    Attributes:
+        max_in_flight: 1接続で同時に処理するメッセージ数の上限
+    """
+
+    max_in_flight: int
+
+
+def get_websocket_options() -> WebSocketOptions:
+    """
+    WebSocket の設定を提供する依存性注入ファクトリ
+
+    Returns:
+        WebSocketOptions: Settings から読み込んだ WebSocket の設定
+    """
+    from app.infrastructure.config.settings import get_settings
+
+    return WebSocketOptions(max_in_flight=get_settings().websocket_max_in_flight)
+
+
+def get_admin_token() -> str | None:
+    """
+    管理用エンドポイントの認証トークンを提供する依存性注入ファクトリ
+
+    テストでは ``app.dependency_overrides[get_admin_token]`` で差し替えられます。
+
+    Returns:
+        str | None: 認証トークン（未設定の場合は None）
+    """
+    from app.infrastructure.config.settings import get_settings
+
+    return get_settings().admin_token
+
+
+def require_admin_token(
+    token: str | None = Header(
+        None, alias=ADMIN_TOKEN_HEADER, description="管理用の認証トークン"
+    ),
+    expected: str | None = Depends(get_admin_token),
+) -> None:
+    """
+    管理用エンドポイントの認証トークンを検証する依存性
+
+    Args:
+        token: X-Admin-Token ヘッダーの値
+        expected: 設定された認証トークン
+
+    Raises:
+        HTTPException: 管理用エンドポイントが無効な場合（404）、
+            トークンが一致しない場合（403）
+    """
+    if expected is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if token is None or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(status_code=403, detail="Forbidden")
 
 
 def get_screening_usecase(
     service: ScreeningService = Depends(get_screening_service),
+    scheduler: PriorityScheduler | None = Depends(get_priority_scheduler),
+    priority: Priority = Header(
+        Priority.INTERACTIVE,
+        alias=PRIORITY_HEADER,
+        description="要求の優先度クラス（一括処理は bulk）",
+    ),
 ) -> ScreeningUsecase:
     """
     ScreeningUsecase のインスタンスを提供する依存性注入ファクトリ
 
     FastAPI の Depends で使用され、ScreeningService を注入した
-    ScreeningUsecase のインスタンスを返します。
+    ScreeningUsecase のインスタンスを返します。優先度スケジューラーが
+    有効な場合は、サービスの呼び出しごとに要求の優先度クラスの
+    実行枠を取得するようにサービスを包みます。
+    トレーシングが有効な場合は、プロセスで共有するトレーサーを渡して
+    ユースケースの各操作のスパンを記録します。
 
     Args:
         service: ScreeningService の実装（Depends で自動注入）
+        scheduler: 優先度スケジューラー（無効の場合は None）
+        priority: X-Screening-Priority ヘッダーで指定した優先度クラス
 
     Returns:
         ScreeningUsecase: ScreeningUsecase のインスタンス
@@ -63,7 +375,27 @@ def get_screening_usecase(
         FastAPI が自動的に依存関係を解決してサービスを注入します。
         これにより、層間の疎結合が実現されます。
     """
-    return ScreeningUsecase(service)
+    from app.infrastructure.tracing import get_tracer
+
+    if scheduler is not None:
+        service = PrioritizedScreeningService(service, scheduler, priority)
+    return ScreeningUsecase(service, tracer=get_tracer())
 
 
-__all__ = ["get_screening_service", "get_screening_usecase"]
+__all__ = [
+    "ADMIN_TOKEN_HEADER",
+    "PRIORITY_HEADER",
+    "StreamOptions",
+    "WebSocketOptions",
+    "build_priority_scheduler",
+    "build_screening_pipeline",
+    "build_screening_service",
+    "build_tenant_registry",
+    "get_admin_token",
+    "get_priority_scheduler",
+    "get_screening_service",
+    "get_screening_usecase",
+    "get_stream_options",
+    "get_websocket_options",
+    "require_admin_token",
+]
@@ -0,0 +1,147 @@
+"""
+ルールセットのホットリロード
+
+このモジュールは、app.state のスクリーニングサービス（テナントのサービスを
+含む）に reload() フックを転送する関数と、それを次の契機で呼び出す
+HotReloader を提供します。
+
+- ファイルの監視: ``SCREENING_RULES_RELOAD_INTERVAL`` 秒ごとに入力の更新を確認
+- シグナル: SIGHUP を受け取ると入力の更新を確認せずに再読み込み
+  （本番ランチャーのマスタープロセスは自身を再読み込みしてから
+  SIGHUP を全ワーカーに転送します）
+- 管理用エンドポイント: ``POST /admin/reload``（routes/admin.py）
+
+再読み込みはワーカーごとに行います。各ワーカーはファイルの監視で
+更新を検出するため、管理用エンドポイントを呼び出したワーカー以外も
+監視間隔以内に新しいバージョンに切り替わります。
+"""
+
+import asyncio
+import logging
+import signal
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+async def reload_services(state: Any, *, force: bool = False) -> str | None:
+    """
+    app.state のスクリーニングサービスとテナントのサービスを再読み込みします
+
+    Args:
+        state: FastAPI アプリケーションの app.state
+        force: 入力の更新を確認せずに再読み込みするか
+
+    Returns:
+        str | None: 共通のサービスを差し替えた場合は新しいバージョン
+
+    Raises:
+        Exception: 新しいバックエンドの構築に失敗した場合（現在の
+            バックエンドのまま、構築時の例外を送出します）
+    """
+    from app.infrastructure.service_lifecycle import reload_service
+
+    version = None
+    service = getattr(state, "screening_service", None)
+    if service is not None:
+        version = await reload_service(service, force=force)
+    registry = getattr(state, "tenant_registry", None)
+    if registry is not None:
+        await reload_service(registry, force=force)
+    return version
+
+
+class HotReloader:
+    """
+    ファイルの監視とシグナルで reload_services() を呼び出すタスク
+
+    Examples:
+        >>> reloader = HotReloader(app.state, interval=5.0)
+        >>> await reloader.start()
+        >>> ...
+        >>> await reloader.aclose()
+
+    Note:
+        lifespan から start() / aclose() を呼び出します。シグナルハンドラーは
+        メインスレッドのイベントループでのみ登録できるため、TestClient 等で
+        別スレッドから起動した場合は登録しません。
+    """
+
+    def __init__(self, state: Any, *, interval: float) -> None:
+        """
+        HotReloader を初期化します
+
+        Args:
+            state: FastAPI アプリケーションの app.state
+            interval: 入力の更新を確認する間隔（秒、0 でファイルの監視を無効化）
+        """
+        self._state = state
+        self._interval = interval
+        self._watcher: asyncio.Task[None] | None = None
+        self._pending: set[asyncio.Task[None]] = set()
+        self._signal_installed = False
+
+    async def start(self) -> None:
+        """ファイルの監視を開始し、SIGHUP のハンドラーを登録します"""
+        if self._interval > 0:
+            self._watcher = asyncio.create_task(self._watch())
+        sighup = getattr(signal, "SIGHUP", None)
+        if sighup is None:
+            return
+        try:
+            asyncio.get_running_loop().add_signal_handler(sighup, self._on_signal)
+        except (NotImplementedError, RuntimeError, ValueError):
+            return
+        self._signal_installed = True
+
+    async def aclose(self) -> None:
+        """ファイルの監視と実行中の再読み込みを止めます"""
+        if self._signal_installed:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+            self._signal_installed = False
+        tasks = [*self._pending]
+        if self._watcher is not None:
+            tasks.append(self._watcher)
+            self._watcher = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            await self._reload(force=False)
+
+    def _on_signal(self) -> None:
+        task = asyncio.create_task(self._reload(force=True))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _reload(self, *, force: bool) -> None:
+        try:
+            version = await reload_services(self._state, force=force)
+        except Exception:
+            logger.exception("ルールセットの再読み込みに失敗しました")
+            return
+        if version is not None:
+            logger.info("ルールセットを %s に切り替えました", version)
+
+
+def hot_reloader_from_settings(state: Any) -> HotReloader:
+    """
+    Settings に従って HotReloader を作成します
+
+    設定モジュールは関数内で遅延インポートします。
+
+    Args:
+        state: FastAPI アプリケーションの app.state
+
+    Returns:
+        HotReloader: 起動前の HotReloader
+    """
+    from app.infrastructure.config.settings import get_settings
+
+    return HotReloader(state, interval=get_settings().rules_reload_interval)
+
+
+__all__ = ["HotReloader", "hot_reloader_from_settings", "reload_services"]
@@ -0,0 +1,258 @@
+"""
+MessagePack のコンテントネゴシエーション
+
+このモジュールは、``application/msgpack`` のリクエストボディを受け付け、
+``Accept`` ヘッダーに応じて MessagePack のレスポンスを返すための
+ルートクラス・レスポンスクラス・依存性を提供します。
+
+リクエストボディは NegotiatedRoute が MessagePack から復号して FastAPI に
+JSONボディとして渡すため、バリデーションは JSON の場合と同じ Pydantic
+スキーマを通り、エラー時も同じ 422 レスポンスになります。
+
+文字列が長さ付きで格納されるため、大きな日本語テキストでは JSON の
+エスケープ処理と文字列の走査を省略でき、エンコード・デコードの CPU 時間を
+削減できます（``scripts/benchmark_msgpack.py``）。バイト数は非 ASCII を
+エスケープしない JSON とほぼ同じで、非 ASCII をエスケープする JSON の
+約半分です。
+
+msgpack は任意依存です（``uv sync --extra msgpack``）。インストールされて
+いない場合、MessagePack のリクエストは 415 となり、``Accept`` による
+ネゴシエーションは JSON を選びます。
+"""
+
+import importlib.util
+from collections.abc import Callable, Coroutine
+from functools import cache
+from typing import Any
+
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+
+# MessagePack のメディアタイプ
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+# MessagePack として受け付けるメディアタイプ（旧来の別名を含む）
+MSGPACK_MEDIA_TYPES = frozenset(
+    {MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"}
+)
+# JSON として扱う Accept のメディアレンジ
+_JSON_MEDIA_RANGES = frozenset({"application/json", "application/*", "*/*"})
+
+
+@cache
+def msgpack_available() -> bool:
+    """msgpack パッケージがインストールされているかを返します"""
+    return importlib.util.find_spec("msgpack") is not None
+
+
+def is_msgpack(content_type: str | None) -> bool:
+    """
+    Content-Type が MessagePack かどうかを返します
+
+    Args:
+        content_type: Content-Type ヘッダーの値
+
+    Returns:
+        bool: MessagePack のメディアタイプなら True
+    """
+    if not content_type:
+        return False
+    return content_type.split(";", 1)[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+
+def prefers_msgpack(accept: str | None) -> bool:
+    """
+    Accept ヘッダーが JSON より MessagePack を優先しているかを返します
+
+    MessagePack のメディアタイプが明示され、その品質値が JSON
+    （``application/json``、``application/*``、``*/*``）以上の場合に
+    MessagePack を選びます。msgpack がインストールされていない場合は
+    常に False です。
+
+    Args:
+        accept: Accept ヘッダーの値
+
+    Returns:
+        bool: MessagePack で応答すべきなら True
+
+    Examples:
+        >>> prefers_msgpack("application/msgpack")
+        True
+        >>> prefers_msgpack("*/*, application/msgpack;q=0.5")
+        False
+    """
+    if not accept or not msgpack_available():
+        return False
+    msgpack_q = 0.0
+    json_q = 0.0
+    for media_range in accept.split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        media_type = media_type.lower()
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_q = max(msgpack_q, quality)
+        elif media_type in _JSON_MEDIA_RANGES:
+            json_q = max(json_q, quality)
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+def packb(content: Any) -> bytes:
+    """
+    オブジェクトを MessagePack にエンコードします
+
+    Args:
+        content: エンコードするオブジェクト（dict / list / str / 数値等）
+
+    Returns:
+        bytes: MessagePack のバイト列
+    """
+    import msgpack
+
+    return msgpack.packb(content, use_bin_type=True)
+
+
+def unpackb(data: bytes) -> Any:
+    """
+    MessagePack をデコードします
+
+    Args:
+        data: MessagePack のバイト列（1つのオブジェクト）
+
+    Returns:
+        Any: デコードしたオブジェクト
+
+    Raises:
+        ValueError: 不正な MessagePack の場合
+    """
+    import msgpack
+
+    try:
+        return msgpack.unpackb(data, raw=False)
+    except (msgpack.UnpackException, ValueError, TypeError) as exc:
+        raise ValueError(str(exc)) from exc
+
+
+def pack_event(event: str, data: Any, *, event_id: str | None = None) -> bytes:
+    """
+    ストリーミングのイベントを MessagePack の map にエンコードします
+
+    MessagePack のオブジェクトは自己区切りのため、イベントを連結して
+    送信すれば、クライアントは ``msgpack.Unpacker`` で順に取り出せます。
+
+    Args:
+        event: イベント名
+        data: イベントのデータ
+        event_id: イベントID（None なら含めない）
+
+    Returns:
+        bytes: ``{"event": ..., "id": ..., "data": ...}`` の MessagePack
+    """
+    message: dict[str, Any] = {"event": event}
+    if event_id is not None:
+        message["id"] = event_id
+    message["data"] = data
+    return packb(message)
+
+
+class MsgPackResponse(Response):
+    """
+    MessagePack のレスポンス
+
+    Examples:
+        >>> MsgPackResponse({"content": "abc"}).body
+        b'\\x81\\xa7content\\xa3abc'
+    """
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return packb(content)
+
+
+def wants_msgpack(request: Request) -> bool:
+    """
+    レスポンスを MessagePack で返すべきかを判定する依存性注入ファクトリ
+
+    Args:
+        request: 現在のリクエスト
+
+    Returns:
+        bool: Accept ヘッダーが MessagePack を優先している場合は True
+    """
+    return prefers_msgpack(request.headers.get("accept"))
+
+
+class NegotiatedRoute(APIRoute):
+    """
+    MessagePack のリクエストボディを受け付けるルートクラス
+
+    ``APIRouter(route_class=NegotiatedRoute)`` で使用します。Content-Type が
+    MessagePack のリクエストは、ボディを復号したうえで JSON リクエストとして
+    元のハンドラーに渡します。
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def negotiated_handler(request: Request) -> Response:
+            if is_msgpack(request.headers.get("content-type")):
+                request = await _as_json_request(request)
+            return await handler(request)
+
+        return negotiated_handler
+
+
+async def _as_json_request(request: Request) -> Request:
+    """MessagePack のボディを復号し、JSONボディとして読めるリクエストを作る"""
+    if not msgpack_available():
+        raise HTTPException(
+            status_code=415, detail="MessagePack はこのサーバーで利用できません"
+        )
+    body = await request.body()
+    try:
+        decoded = unpackb(body) if body else None
+    except ValueError as exc:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "msgpack_invalid",
+                    "loc": ("body",),
+                    "msg": "MessagePack decode error",
+                    "input": {},
+                    "ctx": {"error": str(exc)},
+                }
+            ]
+        ) from exc
+
+    scope = dict(request.scope)
+    scope["headers"] = [
+        (name, b"application/json" if name == b"content-type" else value)
+        for name, value in request.scope["headers"]
+    ]
+    json_request = Request(scope, request.receive)
+    # 復号済みのボディを JSON として読ませる（request.json() はこの値を返す）
+    json_request._body = body
+    json_request._json = decoded
+    return json_request
+
+
+__all__ = [
+    "MSGPACK_MEDIA_TYPE",
+    "MSGPACK_MEDIA_TYPES",
+    "MsgPackResponse",
+    "NegotiatedRoute",
+    "is_msgpack",
+    "msgpack_available",
+    "pack_event",
+    "packb",
+    "prefers_msgpack",
+    "unpackb",
+    "wants_msgpack",
+]
@@ -0,0 +1,137 @@
+"""
+事前生成済みOpenAPIドキュメントの配信
+
+このモジュールは、ビルド時に ``scripts/export_openapi.py`` で生成した
+``openapi.json`` を読み込み、シリアライズ済みのバイト列とETagとして保持します。
+FastAPI が初回の ``/openapi.json`` や ``/docs`` アクセス時に行うスキーマ生成を
+本番トラフィックの途中で発生させないことが目的です。
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from fastapi import FastAPI
+
+# プロジェクトルート（openapi.yaml と同じ場所に openapi.json を配置する）
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# 事前生成済みOpenAPIドキュメントのデフォルトパス
+DEFAULT_OPENAPI_PATH = PROJECT_ROOT / "openapi.json"
+
+logger = logging.getLogger(__name__)
+
+
+class OpenAPIDocument:
+    """
+    シリアライズ済みのOpenAPIドキュメント
+
+    レスポンスボディとして送信するバイト列と、その内容から算出した
+    強いETagを保持します。リクエストごとのシリアライズは行いません。
+
+    Attributes:
+        body: レスポンスボディとして送信するJSONバイト列
+        etag: ボディのSHA-256ダイジェストから算出した強いETag
+        precomputed: ビルド時アーティファクトから読み込んだ場合は True
+
+    Examples:
+        >>> document = OpenAPIDocument(b'{"openapi": "3.1.0"}')
+        >>> document.etag.startswith('"')
+        True
+        >>> document.matches(document.etag)
+        True
+    """
+
+    def __init__(self, body: bytes, *, precomputed: bool = True) -> None:
+        """
+        OpenAPIDocument を初期化します
+
+        Args:
+            body: シリアライズ済みのOpenAPI JSONバイト列
+            precomputed: ビルド時アーティファクト由来かどうか
+        """
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        self.precomputed = precomputed
+
+    @classmethod
+    def from_schema(cls, schema: dict[str, Any]) -> "OpenAPIDocument":
+        """
+        OpenAPIスキーマ辞書からドキュメントを生成します
+
+        Args:
+            schema: ``FastAPI.openapi()`` が返すスキーマ辞書
+
+        Returns:
+            OpenAPIDocument: 実行時生成のドキュメント
+        """
+        return cls(serialize_openapi(schema), precomputed=False)
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """
+        If-None-Match ヘッダーがこのドキュメントのETagに一致するか判定します
+
+        Args:
+            if_none_match: リクエストの If-None-Match ヘッダー値
+
+        Returns:
+            bool: 一致する場合（304 Not Modified を返せる場合）は True
+        """
+        if not if_none_match:
+            return False
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        return "*" in candidates or self.etag in candidates
+
+
+def serialize_openapi(schema: dict[str, Any]) -> bytes:
+    """
+    OpenAPIスキーマを成果物と同一の形式でシリアライズします
+
+    ``scripts/export_openapi.py`` と同じ関数を使うことで、
+    成果物の鮮度チェックをバイト単位で比較できます。
+
+    Args:
+        schema: OpenAPIスキーマ辞書
+
+    Returns:
+        bytes: UTF-8でエンコードされたJSON（末尾改行付き）
+    """
+    text = json.dumps(schema, ensure_ascii=False, indent=2)
+    return (text + "\n").encode("utf-8")
+
+
+def load_openapi_document(
+    app: FastAPI, path: Path = DEFAULT_OPENAPI_PATH
+) -> OpenAPIDocument:
+    """
+    事前生成済みOpenAPIドキュメントを読み込みます
+
+    成果物が存在しない場合は、警告を出したうえで実行時に一度だけ
+    スキーマを生成してフォールバックします。
+
+    Args:
+        app: フォールバック時にスキーマを生成する FastAPI アプリケーション
+        path: 事前生成済み ``openapi.json`` のパス
+
+    Returns:
+        OpenAPIDocument: 配信用のドキュメント
+    """
+    try:
+        return OpenAPIDocument(path.read_bytes())
+    except FileNotFoundError:
+        logger.warning(
+            "事前生成済みOpenAPIが見つかりません（%s）。実行時に生成します。", path
+        )
+        return OpenAPIDocument.from_schema(app.openapi())
+
+
+__all__ = [
+    "DEFAULT_OPENAPI_PATH",
+    "OpenAPIDocument",
+    "load_openapi_document",
+    "serialize_openapi",
+]
@@ -0,0 +1,181 @@
+"""
+レート制限ミドルウェア
+
+このモジュールは、クライアント（APIキーまたはIPアドレス）ごとに
+トークンバケットでリクエストを制限する ASGI ミドルウェアを提供します。
+
+制限を超えたリクエストはアプリケーションに渡さずに 429 を返します。
+対象のレスポンスには IETF の RateLimit ヘッダー
+（``RateLimit-Limit`` / ``RateLimit-Remaining`` / ``RateLimit-Reset`` /
+``RateLimit-Policy``）を付与します。
+"""
+
+import math
+from collections.abc import Callable, Sequence
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.token_bucket import RateLimitDecision, TokenBucketLimiter
+
+# 制限を超えたリクエストへのエラーメッセージ
+RATE_LIMITED_DETAIL = "リクエストが多すぎます。しばらくしてから再試行してください"
+
+
+class RateLimitMiddleware:
+    """
+    クライアントごとのレート制限を行う ASGI ミドルウェア
+
+    クライアントは ``key_header`` のヘッダー（APIキー）が key_validator で
+    登録済みと確認できればその値で、それ以外は接続元のIPアドレスで識別します。
+    未登録のAPIキーで識別すると、リクエストごとにキーを変えるだけで制限を
+    回避でき、他のクライアントの状態も追い出せるためです。レート制限の対象は
+    ``path_prefixes`` のいずれかで始まるパスへの HTTP リクエストのみで、
+    ヘルスチェックや WebSocket の接続は対象外です。
+
+    Examples:
+        >>> app.add_middleware(
+        ...     RateLimitMiddleware,
+        ...     limiter=TokenBucketLimiter(rate=10, burst=20),
+        ... )
+
+    Note:
+        Settings から構成する場合は rate_limit_from_settings() を
+        ``app.add_middleware()`` に渡します。
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        limiter: TokenBucketLimiter,
+        key_header: str = "X-API-Key",
+        key_validator: Callable[[Scope, str], bool] | None = None,
+        path_prefixes: Sequence[str] = ("/v1/",),
+    ) -> None:
+        """
+        RateLimitMiddleware を初期化します
+
+        Args:
+            app: 下位の ASGI アプリケーション
+            limiter: クライアントごとのトークンバケット
+            key_header: クライアントを識別するAPIキーのヘッダー名
+            key_validator: リクエストのスコープとAPIキーから登録済みのキーかを
+                判定する関数（None ならAPIキーでは識別せず、常にIPアドレス）
+            path_prefixes: レート制限の対象とするパスの接頭辞
+        """
+        self._app = app
+        self._limiter = limiter
+        self._key_header = key_header.lower().encode("latin-1")
+        self._key_validator = key_validator
+        self._path_prefixes = tuple(path_prefixes)
+        # リクエストごとに変わらないヘッダーは事前にエンコードしておく
+        self._limit_header = (b"ratelimit-limit", str(limiter.limit).encode())
+        self._policy_header = (
+            b"ratelimit-policy",
+            f"{limiter.limit};w={math.ceil(limiter.window)}".encode(),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self._path_prefixes):
+            await self._app(scope, receive, send)
+            return
+
+        decision = self._limiter.acquire(self._client_key(scope))
+        headers = self._headers(decision)
+        if not decision.allowed:
+            response = JSONResponse(
+                status_code=429, content={"detail": RATE_LIMITED_DETAIL}
+            )
+            retry_after = max(1, math.ceil(decision.retry_after))
+            response.raw_headers += [*headers, (b"retry-after", b"%d" % retry_after)]
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *headers]
+            await send(message)
+
+        await self._app(scope, receive, send_with_headers)
+
+    def _headers(self, decision: RateLimitDecision) -> list[tuple[bytes, bytes]]:
+        """判定結果から RateLimit ヘッダーを作る"""
+        return [
+            self._limit_header,
+            (b"ratelimit-remaining", b"%d" % decision.remaining),
+            (b"ratelimit-reset", b"%d" % math.ceil(decision.reset_after)),
+            self._policy_header,
+        ]
+
+    def _client_key(self, scope: Scope) -> str:
+        """登録済みのAPIキーまたは接続元のIPアドレスからクライアントのキーを作る"""
+        if self._key_validator is not None:
+            for name, value in scope["headers"]:
+                if name == self._key_header and value:
+                    key = value.decode("latin-1")
+                    if self._key_validator(scope, key):
+                        return "key:" + key
+                    break
+        client = scope.get("client")
+        return "ip:" + client[0] if client else "ip:unknown"
+
+
+def registered_api_key(scope: Scope, api_key: str) -> bool:
+    """
+    テナントレジストリに登録されたAPIキーかを判定します
+
+    rate_limit_from_settings() で構築したミドルウェアの key_validator です。
+    レジストリはアプリケーションの ``app.state.tenant_registry`` を参照します。
+
+    Args:
+        scope: リクエストの ASGI スコープ
+        api_key: リクエストのAPIキー
+
+    Returns:
+        bool: 登録済みのキーなら True（テナントを使用しない場合は常に False）
+    """
+    app = scope.get("app")
+    registry = getattr(getattr(app, "state", None), "tenant_registry", None)
+    return registry is not None and registry.is_api_key(api_key)
+
+
+def rate_limit_from_settings(app: ASGIApp) -> ASGIApp:
+    """
+    Settings に従って RateLimitMiddleware を構築するミドルウェアファクトリ
+
+    ``app.add_middleware(rate_limit_from_settings)`` で登録すると、
+    Starlette が最初のリクエストでミドルウェアを構築する際に呼び出されます。
+    設定モジュールは関数内で遅延インポートするため、アプリケーションの
+    インポート時には読み込まれません。
+
+    Args:
+        app: 下位の ASGI アプリケーション
+
+    Returns:
+        ASGIApp: RateLimitMiddleware（``SCREENING_RATE_LIMIT_PER_SECOND`` が
+        0 の場合は app をそのまま返し、オーバーヘッドなし）
+    """
+    from app.infrastructure.config.settings import get_settings
+
+    settings = get_settings()
+    if settings.rate_limit_per_second <= 0:
+        return app
+    return RateLimitMiddleware(
+        app,
+        limiter=TokenBucketLimiter(
+            settings.rate_limit_per_second,
+            settings.rate_limit_burst,
+            max_clients=settings.rate_limit_max_clients,
+        ),
+        key_header=settings.rate_limit_key_header,
+        key_validator=registered_api_key,
+    )
+
+
+__all__ = [
+    "RATE_LIMITED_DETAIL",
+    "RateLimitMiddleware",
+    "rate_limit_from_settings",
+    "registered_api_key",
+]
@@ -0,0 +1,69 @@
+"""
+管理用APIルーター
+
+このモジュールは、運用者がルールセットを無停止で再読み込みするための
+管理用エンドポイントを提供します。``SCREENING_ADMIN_TOKEN`` を設定した
+場合のみ有効で、X-Admin-Token ヘッダーで認証します。
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from app.presentation.api.dependencies import require_admin_token
+from app.presentation.api.hot_reload import reload_services
+from app.presentation.api.schemas.screening import ReloadResponse
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+@router.post(
+    "/reload",
+    response_model=ReloadResponse,
+    summary="ルールセットの再読み込み",
+    description=(
+        "ルールセットを読み込み直し、稼働中のサービスと差し替えます。"
+        "読み込みはバックグラウンドのスレッドで行い、処理中のリクエストは"
+        "古いルールセットのまま完了します。"
+    ),
+    responses={
+        403: {"description": "認証トークンが一致しない"},
+        404: {"description": "管理用エンドポイントが無効"},
+        422: {
+            "description": "ルールセットの読み込みに失敗（現在のルールセットを継続）"
+        },
+    },
+)
+async def reload_rules(request: Request) -> ReloadResponse:
+    """
+    ルールセットの再読み込みエンドポイント
+
+    入力の更新を確認せずに読み込み直します。内容が同じ（バージョンが
+    変わらない）場合は差し替えません。
+
+    Args:
+        request: 現在のリクエスト（app.state へのアクセスに使用）
+
+    Returns:
+        ReloadResponse: 差し替えたかどうかと新しいバージョン
+
+    Raises:
+        HTTPException: ルールセットの読み込みに失敗した場合（422）
+
+    Note:
+        再読み込みはリクエストを受け付けたワーカーで行います。他のワーカーは
+        ファイルの監視（SCREENING_RULES_RELOAD_INTERVAL）で切り替わります。
+        全ワーカーを即時に切り替える場合はマスタープロセスに SIGHUP を送ってください。
+    """
+    try:
+        version = await reload_services(request.app.state, force=True)
+    except (OSError, ValueError) as exc:
+        raise HTTPException(
+            status_code=422, detail=f"Failed to reload rules: {exc}"
+        ) from exc
+    return ReloadResponse(reloaded=version is not None, version=version)
+
+
+__all__ = ["router"]
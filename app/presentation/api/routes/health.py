@@ -2,12 +2,27 @@
 ヘルスチェックAPIルーター
 
 このモジュールは、サービスのヘルスステータスを確認するための
-シンプルなヘルスチェックエンドポイントを提供します。
+シンプルなヘルスチェックエンドポイントと、優先度スケジューラーの
+レーンごとの待ち状況、スクリーニングパイプラインのステージごとの
+統計を確認するエンドポイントを提供します。
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from app.presentation.api.schemas.screening import HealthResponse
+from app.domain.screening_service import ScreeningService
+from app.presentation.api.dependencies import (
+    get_priority_scheduler,
+    get_screening_service,
+)
+from app.presentation.api.schemas.screening import (
+    HealthResponse,
+    LaneStatsSchema,
+    PipelineStatsResponse,
+    SchedulerStatsResponse,
+    StageStatsSchema,
+)
+from app.usecase.priority_scheduler import PriorityScheduler
+from app.usecase.screening_pipeline import ScreeningPipeline
 
 router = APIRouter(
     tags=["health"],
@@ -48,4 +63,69 @@ def get_health() -> HealthResponse:
     return HealthResponse()
 
 
+@router.get(
+    "/health/scheduler",
+    response_model=SchedulerStatsResponse,
+    summary="優先度スケジューラーの統計",
+    description=(
+        "優先度クラス（interactive / bulk）ごとの待ち行列の長さ、実行中の数、"
+        "待ち時間の統計を返します。"
+    ),
+)
+def get_scheduler_stats(
+    scheduler: PriorityScheduler | None = Depends(get_priority_scheduler),
+) -> SchedulerStatsResponse:
+    """
+    優先度スケジューラーの統計エンドポイント
+
+    Args:
+        scheduler: 優先度スケジューラー（無効の場合は None）
+
+    Returns:
+        SchedulerStatsResponse: レーンごとの統計（無効の場合は enabled=False）
+    """
+    if scheduler is None:
+        return SchedulerStatsResponse(enabled=False)
+    return SchedulerStatsResponse(
+        enabled=True,
+        lanes={
+            priority: LaneStatsSchema.from_stats(stats)
+            for priority, stats in scheduler.stats().items()
+        },
+    )
+
+
+@router.get(
+    "/health/pipeline",
+    response_model=PipelineStatsResponse,
+    summary="スクリーニングパイプラインの統計",
+    description=(
+        "パイプラインのステージごとの実行回数、打ち切りによるスキップ数、"
+        "ヒット数、処理時間を返します。"
+    ),
+)
+def get_pipeline_stats(
+    service: ScreeningService = Depends(get_screening_service),
+) -> PipelineStatsResponse:
+    """
+    スクリーニングパイプラインの統計エンドポイント
+
+    Args:
+        service: リクエストに対応するスクリーニングサービス
+
+    Returns:
+        PipelineStatsResponse: ステージごとの統計
+        （パイプラインを使用していない場合は enabled=False）
+    """
+    if not isinstance(service, ScreeningPipeline):
+        return PipelineStatsResponse(enabled=False)
+    return PipelineStatsResponse(
+        enabled=True,
+        stages={
+            name: StageStatsSchema.from_stats(stats)
+            for name, stats in service.stats().items()
+        },
+    )
+
+
 __all__ = ["router"]
@@ -0,0 +1,77 @@
+"""
+OpenAPIドキュメントAPIルーター
+
+このモジュールは、事前生成済みのOpenAPIドキュメントと、
+それを参照する Swagger UI / ReDoc ページを提供します。
+FastAPI 標準の実行時スキーマ生成の代わりに使用します。
+"""
+
+from fastapi import APIRouter, Request, Response
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import HTMLResponse
+
+from app.presentation.api.openapi_document import (
+    OpenAPIDocument,
+    load_openapi_document,
+)
+
+OPENAPI_URL = "/openapi.json"
+
+router = APIRouter(include_in_schema=False)
+
+
+def get_openapi_document(request: Request) -> OpenAPIDocument:
+    """
+    アプリケーションに保持された OpenAPIDocument を返します
+
+    lifespan で読み込み済みであればそれを返し、未読み込みであれば
+    初回呼び出し時に読み込んで app.state にキャッシュします。
+
+    Args:
+        request: 現在のリクエスト
+
+    Returns:
+        OpenAPIDocument: 配信用のドキュメント
+    """
+    document = getattr(request.app.state, "openapi_document", None)
+    if document is None:
+        document = load_openapi_document(request.app)
+        request.app.state.openapi_document = document
+    return document
+
+
+@router.get(OPENAPI_URL)
+def get_openapi(request: Request) -> Response:
+    """
+    事前生成済みOpenAPIドキュメントを返すエンドポイント
+
+    シリアライズ済みのバイト列をそのまま返し、If-None-Match が
+    ETag に一致する場合は 304 Not Modified を返します。
+
+    Returns:
+        Response: OpenAPI JSON（または 304 レスポンス）
+    """
+    document = get_openapi_document(request)
+    headers = {"ETag": document.etag, "Cache-Control": "no-cache"}
+    if document.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=document.body, media_type="application/json", headers=headers
+    )
+
+
+@router.get("/docs")
+def get_swagger_ui(request: Request) -> HTMLResponse:
+    """Swagger UI ページを返すエンドポイント"""
+    return get_swagger_ui_html(
+        openapi_url=OPENAPI_URL, title=f"{request.app.title} - Swagger UI"
+    )
+
+
+@router.get("/redoc")
+def get_redoc(request: Request) -> HTMLResponse:
+    """ReDoc ページを返すエンドポイント"""
+    return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{request.app.title} - ReDoc")
+
+
+__all__ = ["router", "get_openapi_document"]
@@ -3,33 +3,134 @@
 
 このモジュールは、スクリーニング操作のためのREST APIエンドポイントを提供します。
 POST /v1/screenings エンドポイントでスクリーニングリクエストを受け付けます。
+
+レスポンスの形式はクエリパラメータ ``mode`` または ``X-Response-Mode``
+ヘッダーで選択でき、判定だけが必要なクライアントは入力テキストの
+折り返し（大きな文書ではその分の転送量とシリアライズ）を省略できます。
+
+POST /v1/screenings/stream は長い文書をチャンクごとにスクリーニングし、
+検出箇所を Server-Sent Events で順次送信します。
+
+WebSocket /v1/screenings/ws は1つの接続上で多数の小さなスクリーニングを
+パイプライン処理します。
+
+いずれのエンドポイントも JSON に加えて MessagePack（``application/msgpack``）の
+リクエストボディを受け付け、``Accept`` ヘッダーに応じて MessagePack で応答します
+（WebSocket ではバイナリフレーム）。
 """
 
-from fastapi import APIRouter, Depends
+from collections.abc import AsyncIterator, Callable
 
-from app.presentation.api.dependencies import get_screening_usecase
+from fastapi import APIRouter, Depends, Header, Query, Response, WebSocket
+from fastapi.responses import StreamingResponse
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.domain.screening_result import Verdict
+from app.presentation.api.dependencies import (
+    StreamOptions,
+    WebSocketOptions,
+    get_screening_usecase,
+    get_stream_options,
+    get_websocket_options,
+)
+from app.presentation.api.msgpack_codec import (
+    MSGPACK_MEDIA_TYPE,
+    MsgPackResponse,
+    NegotiatedRoute,
+    pack_event,
+    wants_msgpack,
+)
 from app.presentation.api.schemas.screening import (
+    ResponseMode,
+    ScreeningChunkEvent,
     ScreeningRequest,
-    ScreeningResponse,
+    ScreeningSummaryEvent,
 )
+from app.presentation.api.screening_responses import (
+    ScreeningResponseBody,
+    build_screening_response,
+)
+from app.presentation.api.sse import (
+    HEARTBEAT_EVENT,
+    SSE_HEADERS,
+    SSE_MEDIA_TYPE,
+    format_event,
+    with_heartbeat,
+)
+from app.presentation.api.websocket_session import ScreeningSession
 from app.usecase.screening_usecase import ScreeningUsecase
 
 router = APIRouter(
     prefix="/v1/screenings",
     tags=["screenings"],
+    route_class=NegotiatedRoute,
 )
 
 
+# レスポンス形式を選択するヘッダー
+RESPONSE_MODE_HEADER = "X-Response-Mode"
+
+# MessagePack のリクエストボディ（スキーマは JSON と共通）
+MSGPACK_REQUEST_BODY = {
+    "requestBody": {
+        "content": {
+            MSGPACK_MEDIA_TYPE: {
+                "schema": {"$ref": "#/components/schemas/ScreeningRequest"}
+            }
+        }
+    }
+}
+
+
 @router.post(
     "",
-    response_model=ScreeningResponse,
+    response_model=ScreeningResponseBody,
     summary="スクリーニング実行",
-    description="提供されたコンテンツに対してスクリーニング処理を非同期で実行します。",
+    description=(
+        "提供されたコンテンツに対してスクリーニング処理を非同期で実行します。\n\n"
+        "レスポンスの形式はクエリパラメータ `mode` または `X-Response-Mode` "
+        "ヘッダーで選択します（両方ある場合はクエリパラメータを優先）。\n\n"
+        "- `full`（デフォルト）: スクリーニング後のテキスト全体 "
+        "（`ScreeningResponse`）\n"
+        "- `verdict`: スコア・判定・検出箇所のみ（`ScreeningVerdictResponse`）\n"
+        "- `patch`: 書き換え箇所の編集の一覧（`ScreeningPatchResponse`）\n\n"
+        "リクエストボディは `application/msgpack` でも送信でき、"
+        "`Accept: application/msgpack` を指定すると MessagePack で応答します。"
+    ),
+    responses={
+        200: {
+            "content": {
+                MSGPACK_MEDIA_TYPE: {
+                    "schema": {
+                        "anyOf": [
+                            {"$ref": f"#/components/schemas/{name}"}
+                            for name in (
+                                "ScreeningResponse",
+                                "ScreeningVerdictResponse",
+                                "ScreeningPatchResponse",
+                            )
+                        ]
+                    }
+                }
+            }
+        }
+    },
+    openapi_extra=MSGPACK_REQUEST_BODY,
 )
 async def create_screening(
     request: ScreeningRequest,
+    response: Response,
+    mode: ResponseMode | None = Query(
+        default=None, description="レスポンスの形式（デフォルト: full）"
+    ),
+    header_mode: ResponseMode | None = Header(
+        default=None,
+        alias=RESPONSE_MODE_HEADER,
+        description="レスポンスの形式（クエリパラメータ mode が優先）",
+    ),
     usecase: ScreeningUsecase = Depends(get_screening_usecase),
-) -> ScreeningResponse:
+    msgpack: bool = Depends(wants_msgpack),
+) -> ScreeningResponseBody | Response:
     """
     スクリーニング処理を非同期で実行するエンドポイント
 
@@ -38,13 +139,19 @@ async def create_screening(
 
     Args:
         request: スクリーニングリクエスト（content フィールドを含む）
+        response: レスポンス（Vary ヘッダーの設定に使用）
+        mode: クエリパラメータで指定したレスポンスの形式
+        header_mode: X-Response-Mode ヘッダーで指定したレスポンスの形式
         usecase: ScreeningUsecase インスタンス（依存性注入）
+        msgpack: MessagePack で応答するか（Accept ヘッダーから判定）
 
     Returns:
-        ScreeningResponse: スクリーニング結果（content フィールドを含む）
+        レスポンスの形式に応じた ScreeningResponse、ScreeningVerdictResponse
+        または ScreeningPatchResponse（MessagePack の場合は MsgPackResponse）
 
     Raises:
-        422: リクエストボディのバリデーションエラー（FastAPI自動処理）
+        422: リクエストボディまたはレスポンス形式のバリデーションエラー
+            （FastAPI自動処理）
         415: 不正な Content-Type（FastAPI自動処理）
 
     Examples:
@@ -62,16 +169,169 @@ async def create_screening(
         }
         ```
 
+        ``?mode=verdict`` のレスポンス:
+        ```json
+        {
+            "score": 0.0,
+            "verdict": "pass",
+            "findings": []
+        }
+        ```
+
     Note:
         非同期実行により、外部APIやデータベースアクセスを含む
         スクリーニングロジックでも効率的に処理できます。
         現在の実装では、入力コンテンツをそのまま返す暫定的な動作です。
     """
+    # ヘッダーで形式を切り替えるため、キャッシュがヘッダーごとに区別するよう伝える
+    vary = f"{RESPONSE_MODE_HEADER}, Accept"
+    response_mode = mode or header_mode or ResponseMode.FULL
+
     # ユースケースを非同期で実行してスクリーニング処理を行う
-    result_content = await usecase.execute(request.content)
+    body = await build_screening_response(usecase, request.content, response_mode)
+    if msgpack:
+        return MsgPackResponse(body.model_dump(mode="json"), headers={"Vary": vary})
+    response.headers["Vary"] = vary
+    return body
+
 
-    # レスポンスを作成して返す
-    return ScreeningResponse(content=result_content)
+@router.post(
+    "/stream",
+    response_class=StreamingResponse,
+    summary="スクリーニング実行（ストリーミング）",
+    description=(
+        "長い文書をチャンクに分けてスクリーニングし、結果を Server-Sent Events "
+        "で順次送信します。\n\n"
+        "- `findings`: チャンクのスクリーニングが完了するたびに送信"
+        "（`ScreeningChunkEvent`、位置は文書全体のコードポイント単位）\n"
+        "- `heartbeat`: 次のイベントまでの間隔が空いた場合に送信\n"
+        "- `summary`: 最後に1回だけ送信（`ScreeningSummaryEvent`）\n"
+        "- `error`: 途中でスクリーニングを継続できなくなった場合に送信して終了"
+    ),
+    responses={
+        200: {
+            "description": (
+                "スクリーニングのイベントストリーム。`Accept: application/msgpack` "
+                "の場合は `{event, id, data}` の MessagePack の map を連結して送信"
+            ),
+            "content": {
+                SSE_MEDIA_TYPE: {"schema": {"type": "string"}},
+                MSGPACK_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+            },
+        }
+    },
+    openapi_extra=MSGPACK_REQUEST_BODY,
+)
+async def stream_screening(
+    request: ScreeningRequest,
+    usecase: ScreeningUsecase = Depends(get_screening_usecase),
+    options: StreamOptions = Depends(get_stream_options),
+    msgpack: bool = Depends(wants_msgpack),
+) -> StreamingResponse:
+    """
+    スクリーニングの結果を Server-Sent Events で順次返すエンドポイント
+
+    Args:
+        request: スクリーニングリクエスト（content フィールドを含む）
+        usecase: ScreeningUsecase インスタンス（依存性注入）
+        options: チャンクの大きさとハートビートの間隔（依存性注入）
+        msgpack: MessagePack で応答するか（Accept ヘッダーから判定）
+
+    Returns:
+        StreamingResponse: ``text/event-stream``（MessagePack の場合は
+        ``application/msgpack``）のレスポンス
+
+    Examples:
+        レスポンス:
+        ```text
+        event: findings
+        id: 0
+        data: {"start":0,"end":8192,"score":0.9,"verdict":"block",...}
+
+        event: summary
+        data: {"score":0.9,"verdict":"block","finding_count":1,...}
+        ```
+
+    Note:
+        チャンクは送信側が次のイベントを要求した時点で処理されるため、
+        送信が遅いクライアントに対しては処理も待たされ、文書全体の結果を
+        メモリ上に組み立てることはありません。
+    """
+    encode = pack_event if msgpack else format_event
+    events = _screening_events(usecase, request.content, options.chunk_size, encode)
+    return StreamingResponse(
+        with_heartbeat(
+            events, options.heartbeat_interval, heartbeat=encode(HEARTBEAT_EVENT, {})
+        ),
+        media_type=MSGPACK_MEDIA_TYPE if msgpack else SSE_MEDIA_TYPE,
+        headers={**SSE_HEADERS, "Vary": "Accept"},
+    )
+
+
+async def _screening_events(
+    usecase: ScreeningUsecase,
+    content: str,
+    chunk_size: int,
+    encode: Callable[..., bytes],
+) -> AsyncIterator[bytes]:
+    """チャンクごとの findings イベントと最後の summary イベントを生成する"""
+    score = 0.0
+    verdict = Verdict.PASS
+    finding_count = 0
+    chunk_count = 0
+    stream = usecase.stream(content, chunk_size=chunk_size)
+    try:
+        async for chunk in stream:
+            event = ScreeningChunkEvent.from_chunk(chunk.start, chunk.end, chunk.result)
+            yield encode(
+                "findings", event.model_dump(mode="json"), event_id=str(chunk_count)
+            )
+            score = max(score, chunk.result.score)
+            if chunk.result.verdict.severity > verdict.severity:
+                verdict = chunk.result.verdict
+            finding_count += len(chunk.result.findings)
+            chunk_count += 1
+    except ScreeningUnavailableError:
+        # ヘッダー送信後は 503 を返せないため、error イベントで終了を伝える
+        yield encode(
+            "error", {"detail": "スクリーニングサービスが一時的に利用できません"}
+        )
+        return
+    finally:
+        await stream.aclose()
+
+    summary = ScreeningSummaryEvent(
+        score=score,
+        verdict=verdict,
+        finding_count=finding_count,
+        chunk_count=chunk_count,
+        length=len(content),
+    )
+    yield encode("summary", summary.model_dump(mode="json"))
+
+
+@router.websocket("/ws")
+async def screening_session(
+    websocket: WebSocket,
+    usecase: ScreeningUsecase = Depends(get_screening_usecase),
+    options: WebSocketOptions = Depends(get_websocket_options),
+) -> None:
+    """
+    1つの接続上で多数のスクリーニングを処理する WebSocket エンドポイント
+
+    クライアントは ``{"id": ..., "content": ..., "mode": ...}`` を応答を
+    待たずに送り続けられ、応答 ``{"id": ..., "result": ...}``
+    （失敗時は ``{"id": ..., "error": {"code": ..., "detail": ...}}``）は
+    処理が完了した順に返されます。``result`` の形式は POST /v1/screenings の
+    各レスポンス形式と同じです。
+
+    Args:
+        websocket: WebSocket 接続
+        usecase: ScreeningUsecase インスタンス（依存性注入）
+        options: 接続あたりの同時処理数の上限（依存性注入）
+    """
+    session = ScreeningSession(websocket, usecase, max_in_flight=options.max_in_flight)
+    await session.run()
 
 
 __all__ = ["router"]
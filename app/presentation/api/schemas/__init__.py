@@ -5,9 +5,39 @@ APIスキーマパッケージ
 """
 
 from app.presentation.api.schemas.screening import (
+    FindingSchema,
     HealthResponse,
+    LaneStatsSchema,
+    PipelineStatsResponse,
+    ReloadResponse,
+    ResponseMode,
+    SchedulerStatsResponse,
+    ScreeningChunkEvent,
+    ScreeningEdit,
+    ScreeningMessage,
+    ScreeningPatchResponse,
     ScreeningRequest,
     ScreeningResponse,
+    ScreeningSummaryEvent,
+    ScreeningVerdictResponse,
+    StageStatsSchema,
 )
 
-__all__ = ["ScreeningRequest", "ScreeningResponse", "HealthResponse"]
+__all__ = [
+    "FindingSchema",
+    "HealthResponse",
+    "LaneStatsSchema",
+    "PipelineStatsResponse",
+    "ReloadResponse",
+    "ResponseMode",
+    "SchedulerStatsResponse",
+    "ScreeningChunkEvent",
+    "ScreeningEdit",
+    "ScreeningMessage",
+    "ScreeningPatchResponse",
+    "ScreeningRequest",
+    "ScreeningResponse",
+    "ScreeningSummaryEvent",
+    "ScreeningVerdictResponse",
+    "StageStatsSchema",
+]
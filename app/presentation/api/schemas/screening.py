@@ -5,8 +5,35 @@
 Pydantic BaseModelを使用して、データバリデーションとOpenAPIドキュメント生成を行います。
 """
 
+from enum import StrEnum
+
 from pydantic import BaseModel, Field
 
+from app.domain.screening_result import (
+    ScreeningResult,
+    Verdict,
+    applied_replacements,
+)
+from app.usecase.priority_scheduler import LaneStats, Priority
+from app.usecase.screening_pipeline import StageStats
+
+
+class ResponseMode(StrEnum):
+    """
+    スクリーニングレスポンスの形式
+
+    クエリパラメータ ``mode`` または ``X-Response-Mode`` ヘッダーで指定します。
+
+    Attributes:
+        FULL: スクリーニング後のテキスト全体を返す（デフォルト）
+        VERDICT: スコア・判定・検出箇所のみを返し、テキストを返さない
+        PATCH: テキストの代わりに、書き換え箇所の編集（位置・長さ・置換文字列）を返す
+    """
+
+    FULL = "full"
+    VERDICT = "verdict"
+    PATCH = "patch"
+
 
 class ScreeningRequest(BaseModel):
     """
@@ -68,6 +95,255 @@ class ScreeningResponse(BaseModel):
     }
 
 
+class FindingSchema(BaseModel):
+    """
+    検出箇所スキーマ
+
+    Attributes:
+        kind: 検出の種類
+        start: 入力テキスト内の開始位置（コードポイント単位）
+        end: 入力テキスト内の終了位置（コードポイント単位、排他的）
+    """
+
+    kind: str = Field(..., description="検出の種類", examples=["email"])
+    start: int = Field(..., ge=0, description="開始位置（コードポイント単位）")
+    end: int = Field(..., ge=0, description="終了位置（コードポイント単位、排他的）")
+
+
+class ScreeningVerdictResponse(BaseModel):
+    """
+    判定のみのスクリーニングレスポンススキーマ（``mode=verdict``）
+
+    入力テキストを返さないため、大きな文書でもレスポンスは検出箇所の数に
+    比例した大きさになります。
+
+    Attributes:
+        score: リスクスコア（0.0〜1.0）
+        verdict: スクリーニングの判定
+        findings: 検出箇所の一覧
+
+    Examples:
+        >>> ScreeningVerdictResponse.from_result(ScreeningResult("text")).verdict
+        <Verdict.PASS: 'pass'>
+    """
+
+    score: float = Field(..., ge=0.0, le=1.0, description="リスクスコア")
+    verdict: Verdict = Field(..., description="スクリーニングの判定")
+    findings: list[FindingSchema] = Field(
+        default_factory=list, description="検出箇所の一覧（開始位置の昇順）"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "score": 0.9,
+                    "verdict": "block",
+                    "findings": [{"kind": "discriminatory_term", "start": 0, "end": 4}],
+                }
+            ]
+        }
+    }
+
+    @classmethod
+    def from_result(cls, result: ScreeningResult) -> "ScreeningVerdictResponse":
+        """
+        ScreeningResult からレスポンスを作成します
+
+        Args:
+            result: スクリーニング結果
+
+        Returns:
+            ScreeningVerdictResponse: 作成したレスポンス
+        """
+        return cls(
+            score=result.score,
+            verdict=result.verdict,
+            findings=[
+                FindingSchema(kind=finding.kind, start=finding.start, end=finding.end)
+                for finding in result.findings
+            ],
+        )
+
+
+class ScreeningEdit(BaseModel):
+    """
+    テキストの書き換え1件を表すスキーマ
+
+    入力テキストの ``offset`` から ``length`` 文字を ``replacement`` に
+    置き換えることを表します。位置は入力テキスト上のコードポイント単位です。
+
+    Attributes:
+        offset: 書き換え箇所の開始位置
+        length: 置き換える文字数
+        replacement: 置換後の文字列
+    """
+
+    offset: int = Field(..., ge=0, description="開始位置（コードポイント単位）")
+    length: int = Field(..., ge=0, description="置き換える文字数")
+    replacement: str = Field(..., description="置換後の文字列", examples=["[EMAIL]"])
+
+
+class ScreeningPatchResponse(BaseModel):
+    """
+    差分形式のスクリーニングレスポンススキーマ（``mode=patch``）
+
+    書き換え後のテキストの代わりに編集の一覧を返します。編集は重ならず、
+    開始位置の昇順に並ぶため、入力テキストに先頭から順に適用できます。
+
+    Attributes:
+        score: リスクスコア（0.0〜1.0）
+        verdict: スクリーニングの判定
+        edits: 入力テキストへの編集の一覧
+
+    Examples:
+        >>> ScreeningPatchResponse.from_result(ScreeningResult("text")).edits
+        []
+    """
+
+    score: float = Field(..., ge=0.0, le=1.0, description="リスクスコア")
+    verdict: Verdict = Field(..., description="スクリーニングの判定")
+    edits: list[ScreeningEdit] = Field(
+        default_factory=list, description="入力テキストへの編集（開始位置の昇順）"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "score": 0.2,
+                    "verdict": "review",
+                    "edits": [{"offset": 4, "length": 16, "replacement": "[EMAIL]"}],
+                }
+            ]
+        }
+    }
+
+    @classmethod
+    def from_result(cls, result: ScreeningResult) -> "ScreeningPatchResponse":
+        """
+        ScreeningResult からレスポンスを作成します
+
+        置換文字列を持たない検出箇所はテキストを書き換えないため含めません。
+        重なり合う検出箇所は full 形式の content と同じく開始位置が左のものだけを
+        含めるため（applied_replacements()）、編集を適用すると content と一致します。
+
+        Args:
+            result: スクリーニング結果
+
+        Returns:
+            ScreeningPatchResponse: 作成したレスポンス
+        """
+        return cls(
+            score=result.score,
+            verdict=result.verdict,
+            edits=[
+                ScreeningEdit(
+                    offset=finding.start,
+                    length=finding.end - finding.start,
+                    replacement=finding.replacement,
+                )
+                for finding in applied_replacements(result.findings)
+            ],
+        )
+
+
+class ScreeningChunkEvent(BaseModel):
+    """
+    ストリーミングの ``findings`` イベントのデータ
+
+    POST /v1/screenings/stream で、文書の一部分のスクリーニングが完了する
+    たびに送信されます。位置はすべて文書全体のコードポイント単位です。
+
+    Attributes:
+        start: チャンクの開始位置
+        end: チャンクの終了位置（排他的）
+        score: チャンクのリスクスコア（0.0〜1.0）
+        verdict: チャンクの判定
+        findings: チャンク内の検出箇所
+        edits: チャンク内の書き換え
+    """
+
+    start: int = Field(..., ge=0, description="チャンクの開始位置")
+    end: int = Field(..., ge=0, description="チャンクの終了位置（排他的）")
+    score: float = Field(..., ge=0.0, le=1.0, description="チャンクのリスクスコア")
+    verdict: Verdict = Field(..., description="チャンクの判定")
+    findings: list[FindingSchema] = Field(
+        default_factory=list, description="チャンク内の検出箇所"
+    )
+    edits: list[ScreeningEdit] = Field(
+        default_factory=list, description="チャンク内の書き換え"
+    )
+
+    @classmethod
+    def from_chunk(
+        cls, start: int, end: int, result: ScreeningResult
+    ) -> "ScreeningChunkEvent":
+        """
+        チャンクのスクリーニング結果からイベントのデータを作成します
+
+        Args:
+            start: チャンクの開始位置
+            end: チャンクの終了位置
+            result: 検出位置を文書全体のオフセットにしたスクリーニング結果
+
+        Returns:
+            ScreeningChunkEvent: 作成したイベントのデータ
+        """
+        patch = ScreeningPatchResponse.from_result(result)
+        return cls(
+            start=start,
+            end=end,
+            score=result.score,
+            verdict=result.verdict,
+            findings=ScreeningVerdictResponse.from_result(result).findings,
+            edits=patch.edits,
+        )
+
+
+class ScreeningSummaryEvent(BaseModel):
+    """
+    ストリーミングの ``summary`` イベントのデータ
+
+    すべてのチャンクの送信後に1回だけ送信されます。
+
+    Attributes:
+        score: 文書全体のリスクスコア（チャンクのスコアの最大値）
+        verdict: 文書全体の判定（チャンクの判定のうち最も重いもの）
+        finding_count: 検出箇所の総数
+        chunk_count: チャンクの数
+        length: 文書の文字数
+    """
+
+    score: float = Field(..., ge=0.0, le=1.0, description="文書全体のリスクスコア")
+    verdict: Verdict = Field(..., description="文書全体の判定")
+    finding_count: int = Field(..., ge=0, description="検出箇所の総数")
+    chunk_count: int = Field(..., ge=0, description="チャンクの数")
+    length: int = Field(..., ge=0, description="文書の文字数")
+
+
+class ScreeningMessage(BaseModel):
+    """
+    WebSocket のスクリーニング要求メッセージスキーマ
+
+    /v1/screenings/ws に JSON テキストとして送信します。応答は ``id`` を
+    付けて、処理が完了した順に返されます。
+
+    Attributes:
+        id: 応答との対応付けに使う相関ID（クライアントが採番）
+        content: スクリーニング対象のテキストコンテンツ
+        mode: 応答の形式（デフォルト: full）
+
+    Examples:
+        >>> ScreeningMessage.model_validate_json('{"id": "1", "content": "abc"}').mode
+        <ResponseMode.FULL: 'full'>
+    """
+
+    id: str = Field(..., min_length=1, max_length=128, description="相関ID")
+    content: str = Field(..., description="スクリーニング対象のテキストコンテンツ")
+    mode: ResponseMode = Field(default=ResponseMode.FULL, description="応答の形式")
+
+
 class HealthResponse(BaseModel):
     """
     ヘルスチェックレスポンススキーマ
@@ -95,4 +371,154 @@ class HealthResponse(BaseModel):
     model_config = {"json_schema_extra": {"examples": [{"status": "ok"}]}}
 
 
-__all__ = ["ScreeningRequest", "ScreeningResponse", "HealthResponse"]
+class LaneStatsSchema(BaseModel):
+    """
+    優先度レーンの統計スキーマ
+
+    Attributes:
+        weight: レーンの重み
+        queued: 実行枠を待っている要求数
+        running: 実行中の要求数
+        admitted: 実行枠を取得した要求数の累計
+        mean_wait_ms: 直近の要求の平均待ち時間（ミリ秒）
+        p95_wait_ms: 直近の要求の待ち時間の95パーセンタイル（ミリ秒）
+        max_wait_ms: 待ち時間の最大値（ミリ秒）
+    """
+
+    weight: float = Field(..., gt=0, description="レーンの重み")
+    queued: int = Field(..., ge=0, description="実行枠を待っている要求数")
+    running: int = Field(..., ge=0, description="実行中の要求数")
+    admitted: int = Field(..., ge=0, description="実行枠を取得した要求数の累計")
+    mean_wait_ms: float = Field(..., ge=0, description="平均待ち時間（ミリ秒）")
+    p95_wait_ms: float = Field(..., ge=0, description="待ち時間の p95（ミリ秒）")
+    max_wait_ms: float = Field(..., ge=0, description="待ち時間の最大値（ミリ秒）")
+
+    @classmethod
+    def from_stats(cls, stats: LaneStats) -> "LaneStatsSchema":
+        """
+        スケジューラーの統計からスキーマを作成します
+
+        Args:
+            stats: レーンの統計のスナップショット
+
+        Returns:
+            LaneStatsSchema: 作成したスキーマ
+        """
+        return cls(
+            weight=stats.weight,
+            queued=stats.queued,
+            running=stats.running,
+            admitted=stats.admitted,
+            mean_wait_ms=stats.mean_wait_ms,
+            p95_wait_ms=stats.p95_wait_ms,
+            max_wait_ms=stats.max_wait_ms,
+        )
+
+
+class SchedulerStatsResponse(BaseModel):
+    """
+    優先度スケジューラーの統計レスポンススキーマ
+
+    GET /health/scheduler エンドポイントからのレスポンスボディを表します。
+
+    Attributes:
+        enabled: スケジューラーが有効か
+        lanes: 優先度クラスごとの統計（無効の場合は空）
+    """
+
+    enabled: bool = Field(..., description="スケジューラーが有効か")
+    lanes: dict[Priority, LaneStatsSchema] = Field(
+        default_factory=dict, description="優先度クラスごとの統計"
+    )
+
+
+class StageStatsSchema(BaseModel):
+    """
+    パイプラインのステージの統計スキーマ
+
+    Attributes:
+        calls: 実行した回数
+        skipped: 打ち切りにより実行しなかった回数
+        hits: ヒット数の累計
+        mean_ms: 平均処理時間（ミリ秒）
+        max_ms: 最大処理時間（ミリ秒）
+    """
+
+    calls: int = Field(..., ge=0, description="実行した回数")
+    skipped: int = Field(..., ge=0, description="打ち切りにより実行しなかった回数")
+    hits: int = Field(..., ge=0, description="ヒット数の累計")
+    mean_ms: float = Field(..., ge=0, description="平均処理時間（ミリ秒）")
+    max_ms: float = Field(..., ge=0, description="最大処理時間（ミリ秒）")
+
+    @classmethod
+    def from_stats(cls, stats: StageStats) -> "StageStatsSchema":
+        """
+        パイプラインの統計からスキーマを作成します
+
+        Args:
+            stats: ステージの統計のスナップショット
+
+        Returns:
+            StageStatsSchema: 作成したスキーマ
+        """
+        return cls(
+            calls=stats.calls,
+            skipped=stats.skipped,
+            hits=stats.hits,
+            mean_ms=stats.mean_ms,
+            max_ms=stats.max_ms,
+        )
+
+
+class PipelineStatsResponse(BaseModel):
+    """
+    スクリーニングパイプラインの統計レスポンススキーマ
+
+    GET /health/pipeline エンドポイントからのレスポンスボディを表します。
+
+    Attributes:
+        enabled: パイプラインが有効か
+        stages: ステージごとの統計（パイプラインの順。無効の場合は空）
+    """
+
+    enabled: bool = Field(..., description="パイプラインが有効か")
+    stages: dict[str, StageStatsSchema] = Field(
+        default_factory=dict, description="ステージごとの統計"
+    )
+
+
+class ReloadResponse(BaseModel):
+    """
+    ルールセットの再読み込みのレスポンススキーマ
+
+    POST /admin/reload エンドポイントからのレスポンスボディを表します。
+
+    Attributes:
+        reloaded: 共通のサービスのルールセットを差し替えたか
+        version: 差し替えた場合は新しいルールセットのバージョン
+    """
+
+    reloaded: bool = Field(..., description="ルールセットを差し替えたか")
+    version: str | None = Field(
+        default=None, description="新しいルールセットのバージョン"
+    )
+
+
+__all__ = [
+    "FindingSchema",
+    "HealthResponse",
+    "LaneStatsSchema",
+    "PipelineStatsResponse",
+    "ReloadResponse",
+    "ResponseMode",
+    "ScreeningChunkEvent",
+    "ScreeningEdit",
+    "ScreeningMessage",
+    "ScreeningPatchResponse",
+    "ScreeningRequest",
+    "ScreeningResponse",
+    "ScreeningSummaryEvent",
+    "ScreeningVerdictResponse",
+    "SchedulerStatsResponse",
+    "StageStatsSchema",
+]
@@ -0,0 +1,48 @@
+"""
+レスポンス形式に応じたスクリーニング結果の作成
+
+このモジュールは、HTTP と WebSocket の両方のエンドポイントで共有する、
+ResponseMode に応じてユースケースを呼び分けてレスポンスを作成する関数を提供します。
+"""
+
+from app.presentation.api.schemas.screening import (
+    ResponseMode,
+    ScreeningPatchResponse,
+    ScreeningResponse,
+    ScreeningVerdictResponse,
+)
+from app.usecase.screening_usecase import ScreeningUsecase
+
+# いずれかの形式のスクリーニングレスポンス
+ScreeningResponseBody = (
+    ScreeningResponse | ScreeningVerdictResponse | ScreeningPatchResponse
+)
+
+
+async def build_screening_response(
+    usecase: ScreeningUsecase, content: str, mode: ResponseMode
+) -> ScreeningResponseBody:
+    """
+    レスポンス形式に応じてスクリーニングを実行し、レスポンスを作成します
+
+    full 形式では従来どおり usecase.execute() を、それ以外の形式では
+    判定と検出箇所を含む usecase.analyze() を呼び出します。
+
+    Args:
+        usecase: ScreeningUsecase インスタンス
+        content: スクリーニング対象のテキスト
+        mode: レスポンスの形式
+
+    Returns:
+        ScreeningResponseBody: 形式に応じたレスポンス
+    """
+    if mode is ResponseMode.FULL:
+        return ScreeningResponse(content=await usecase.execute(content))
+
+    result = await usecase.analyze(content)
+    if mode is ResponseMode.VERDICT:
+        return ScreeningVerdictResponse.from_result(result)
+    return ScreeningPatchResponse.from_result(result)
+
+
+__all__ = ["ScreeningResponseBody", "build_screening_response"]
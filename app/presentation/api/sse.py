@@ -0,0 +1,130 @@
+"""
+Server-Sent Events（SSE）のエンコードとハートビート
+
+このモジュールは、SSE のイベントをバイト列に整形する関数と、イベントの
+間隔が空いたときにハートビートを挟む非同期イテレーターを提供します。
+
+イベントはレスポンスの送信側（StreamingResponse）が1件ずつ要求して
+送信するため、次のイベントの生成はその前のイベントの送信が終わるまで
+始まりません。送信が遅いクライアントに対してはサーバー側の処理も待たされ、
+未送信のイベントがメモリに溜まることはありません。
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+# SSE のメディアタイプ
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# プロキシやクライアントのバッファリングを防ぐレスポンスヘッダー
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+# ハートビートのイベント名
+HEARTBEAT_EVENT = "heartbeat"
+
+
+def format_event(event: str, data: Any, *, event_id: str | None = None) -> bytes:
+    """
+    SSE のイベントを1件分のバイト列に整形します
+
+    Args:
+        event: イベント名
+        data: イベントのデータ（JSONに変換する。文字列はそのまま送る）
+        event_id: イベントID（None なら送らない）
+
+    Returns:
+        bytes: 空行で終わる UTF-8 のイベント
+
+    Examples:
+        >>> format_event("summary", {"verdict": "pass"})
+        b'event: summary\\ndata: {"verdict":"pass"}\\n\\n'
+    """
+    payload = (
+        data
+        if isinstance(data, str)
+        else json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    )
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    # data に改行が含まれる場合は行ごとに data フィールドを分ける
+    lines.extend(f"data: {line}" for line in payload.split("\n"))
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+async def with_heartbeat(
+    events: AsyncIterable[bytes], interval: float, *, heartbeat: bytes | None = None
+) -> AsyncIterator[bytes]:
+    """
+    イベントの間隔が interval 秒を超えるたびにハートビートを挟みます
+
+    長い文書の処理中にイベントが途切れても、プロキシのアイドルタイムアウトで
+    接続が切られず、クライアントも処理中であることを判別できます。
+
+    Args:
+        events: 元のイベントの非同期イテレーター
+        interval: ハートビートの間隔（秒、0 以下ならハートビートを挟まない）
+        heartbeat: ハートビートとして送るバイト列（None なら SSE の
+            heartbeat イベント）
+
+    Yields:
+        bytes: 元のイベント、またはハートビートのイベント
+
+    Note:
+        クライアントの切断等で途中で閉じられた場合は、処理中のイベントの
+        生成を取り消してから元のイテレーターを閉じます。
+    """
+    iterator = aiter(events)
+    if interval <= 0:
+        async for event in iterator:
+            yield event
+        return
+
+    if heartbeat is None:
+        heartbeat = format_event(HEARTBEAT_EVENT, {})
+    pending: asyncio.Future[bytes] | None = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(iterator))
+            done, _ = await asyncio.wait({pending}, timeout=interval)
+            if not done:
+                yield heartbeat
+                continue
+            finished, pending = pending, None
+            try:
+                event = finished.result()
+            except StopAsyncIteration:
+                return
+            yield event
+    finally:
+        await _close(iterator, pending)
+
+
+async def _close(
+    iterator: AsyncIterator[bytes], pending: asyncio.Future[bytes] | None
+) -> None:
+    """実行中のイベントの生成を取り消してから元のイテレーターを閉じる"""
+    if pending is not None:
+        pending.cancel()
+        # 元のイテレーターを閉じる前に、実行中の生成の終了を待つ
+        await asyncio.wait({pending})
+        if not pending.cancelled():
+            pending.exception()
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+__all__ = [
+    "HEARTBEAT_EVENT",
+    "SSE_HEADERS",
+    "SSE_MEDIA_TYPE",
+    "format_event",
+    "with_heartbeat",
+]
@@ -0,0 +1,112 @@
+"""
+トレーシングミドルウェア
+
+このモジュールは、HTTP リクエストごとにサーバースパンを記録する
+ASGI ミドルウェアを提供します。リクエストの ``traceparent`` ヘッダー
+（W3C Trace Context）を親とし、ルーティング後の経路テンプレートを
+スパンの名前にします（``POST /v1/screenings`` 等）。ユースケース、
+スクリーニングサービス、外部スコアリングAPIの呼び出しのスパンは
+このスパンの子として記録されます。
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.tracing import (
+    TRACEPARENT_HEADER,
+    SpanKind,
+    Tracer,
+    parse_traceparent,
+)
+
+_TRACEPARENT_KEY = TRACEPARENT_HEADER.encode("latin-1")
+
+
+class TracingMiddleware:
+    """
+    HTTP リクエストのサーバースパンを記録する ASGI ミドルウェア
+
+    スパンにはメソッド、パス、経路テンプレート、ステータスコードを
+    OpenTelemetry の HTTP の属性名で記録し、5xx のレスポンスや例外は
+    エラーとして記録します。WebSocket の接続は対象外です。
+
+    Examples:
+        >>> app.add_middleware(TracingMiddleware, tracer=Tracer(ConsoleSpanExporter()))
+
+    Note:
+        Settings から構成する場合は tracing_from_settings() を
+        ``app.add_middleware()`` に渡します。
+    """
+
+    def __init__(self, app: ASGIApp, *, tracer: Tracer) -> None:
+        """
+        TracingMiddleware を初期化します
+
+        Args:
+            app: 下位の ASGI アプリケーション
+            tracer: スパンを開始するトレーサー
+        """
+        self._app = app
+        self._tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        parent = None
+        for name, value in scope["headers"]:
+            if name == _TRACEPARENT_KEY:
+                parent = parse_traceparent(value.decode("latin-1"))
+                break
+        method = scope["method"]
+        span = self._tracer.start_span(
+            method,
+            {"http.request.method": method, "url.path": scope["path"]},
+            kind=SpanKind.SERVER,
+            parent=parent,
+        )
+
+        async def send_with_status(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                span.set_attribute("http.response.status_code", status)
+                if status >= 500 and span.recording:
+                    span.error = f"HTTP {status}"
+            await send(message)
+
+        with span:
+            try:
+                await self._app(scope, receive, send_with_status)
+            finally:
+                # ルーターが scope に設定した経路テンプレートでスパンに名前を付ける
+                route = getattr(scope.get("route"), "path", None)
+                if route is not None:
+                    span.name = f"{method} {route}"
+                    span.set_attribute("http.route", route)
+
+
+def tracing_from_settings(app: ASGIApp) -> ASGIApp:
+    """
+    Settings に従って TracingMiddleware を構築するミドルウェアファクトリ
+
+    ``app.add_middleware(tracing_from_settings)`` で登録すると、
+    Starlette が最初のリクエストでミドルウェアを構築する際に呼び出されます。
+    トレーサーはスクリーニングサービスやユースケースと同じ、プロセスで
+    共有するインスタンス（get_tracer()）を使用します。
+
+    Args:
+        app: 下位の ASGI アプリケーション
+
+    Returns:
+        ASGIApp: TracingMiddleware（``SCREENING_TRACING_EXPORTER`` が
+        "none" の場合は app をそのまま返し、オーバーヘッドなし）
+    """
+    from app.infrastructure.tracing import get_tracer
+
+    tracer = get_tracer()
+    if tracer is None:
+        return app
+    return TracingMiddleware(app, tracer=tracer)
+
+
+__all__ = ["TracingMiddleware", "tracing_from_settings"]
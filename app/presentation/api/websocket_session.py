@@ -0,0 +1,237 @@
+"""
+WebSocket のスクリーニングセッション
+
+このモジュールは、1つの WebSocket 接続上でスクリーニング要求を
+パイプライン処理するセッションを提供します。
+
+- クライアントは相関ID（``id``）付きのメッセージを応答を待たずに送り続けられます。
+- メッセージは接続ごとの上限まで並行に処理され、完了した順に応答します。
+- 上限に達している間は次のメッセージを読み込まないため、未処理の要求が
+  サーバーのメモリに溜まらず、クライアントは TCP のフロー制御で待たされます。
+
+リクエストごとのHTTPヘッダーの解析、ルーティング、依存性の解決は
+接続時に1回だけ行われます。
+
+テキストフレームは JSON、バイナリフレームは MessagePack として扱い、
+応答は受け取ったフレームと同じ形式で返します（msgpack がインストール
+されていない場合、バイナリフレームは受け付けません）。
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any
+
+from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.presentation.api.msgpack_codec import msgpack_available, packb, unpackb
+from app.presentation.api.schemas.screening import ScreeningMessage
+from app.presentation.api.screening_responses import build_screening_response
+from app.usecase.screening_usecase import ScreeningUsecase
+
+# 応答のエラーコード
+INVALID_MESSAGE = "invalid_message"
+UNAVAILABLE = "unavailable"
+INTERNAL_ERROR = "internal_error"
+
+logger = logging.getLogger(__name__)
+
+
+class ScreeningSession:
+    """
+    1つの WebSocket 接続のスクリーニングセッション
+
+    Examples:
+        >>> @router.websocket("/ws")
+        ... async def screening_session(websocket: WebSocket) -> None:
+        ...     await ScreeningSession(websocket, usecase, max_in_flight=32).run()
+
+        クライアントとのやり取り::
+
+            → {"id": "a1", "content": "男性限定の募集です", "mode": "verdict"}
+            → {"id": "a2", "content": "経験者歓迎"}
+            ← {"id": "a2", "result": {"content": "経験者歓迎"}}
+            ← {"id": "a1", "result": {"score": 0.9, "verdict": "block", ...}}
+            ← {"id": null, "error": {"code": "invalid_message", "detail": "..."}}
+
+        バイナリフレームでは同じ構造の map を MessagePack で送受信します。
+    """
+
+    def __init__(
+        self, websocket: WebSocket, usecase: ScreeningUsecase, *, max_in_flight: int
+    ) -> None:
+        """
+        ScreeningSession を初期化します
+
+        Args:
+            websocket: 受け付ける前の WebSocket 接続
+            usecase: ScreeningUsecase インスタンス
+            max_in_flight: 同時に処理するメッセージ数の上限
+
+        Raises:
+            ValueError: max_in_flight が1未満の場合
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight は1以上である必要があります")
+        self._websocket = websocket
+        self._usecase = usecase
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._send_lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def run(self) -> None:
+        """
+        接続を受け付け、切断されるまでメッセージを処理します
+
+        Note:
+            切断時に処理中のメッセージは取り消されます。
+        """
+        await self._websocket.accept()
+        try:
+            while True:
+                # 上限に達している間は次のメッセージを読まない
+                await self._slots.acquire()
+                message = await self._websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    self._slots.release()
+                    break
+                text = message.get("text")
+                if text is not None:
+                    task = self._spawn(self._handle(text))
+                elif msgpack_available():
+                    task = self._spawn(self._handle_binary(message.get("bytes") or b""))
+                else:
+                    task = self._spawn(
+                        self._reject(None, "テキストフレームのみ受け付けます")
+                    )
+                task.add_done_callback(lambda _: self._slots.release())
+        except WebSocketDisconnect:
+            pass
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _spawn(self, coroutine: Any) -> asyncio.Task[None]:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _handle(self, text: str) -> None:
+        """JSON のメッセージを1件スクリーニングして応答する"""
+        try:
+            message = ScreeningMessage.model_validate_json(text)
+        except ValidationError as exc:
+            await self._reject(_extract_id(text), _describe(exc))
+            return
+        await self._screen(message)
+
+    async def _handle_binary(self, data: bytes) -> None:
+        """MessagePack のメッセージを1件スクリーニングして応答する"""
+        try:
+            raw = unpackb(data)
+        except ValueError:
+            await self._reject(None, "MessagePack として解釈できません", binary=True)
+            return
+        try:
+            message = ScreeningMessage.model_validate(raw)
+        except ValidationError as exc:
+            await self._reject(_id_of(raw), _describe(exc), binary=True)
+            return
+        await self._screen(message, binary=True)
+
+    async def _screen(self, message: ScreeningMessage, *, binary: bool = False) -> None:
+        """検証済みのメッセージをスクリーニングして応答する"""
+        try:
+            response = await build_screening_response(
+                self._usecase, message.content, message.mode
+            )
+        except ScreeningUnavailableError:
+            await self._send_error(
+                message.id,
+                UNAVAILABLE,
+                "スクリーニングサービスが一時的に利用できません",
+                binary=binary,
+            )
+        except Exception:
+            logger.exception("WebSocket メッセージ %s の処理に失敗しました", message.id)
+            await self._send_error(
+                message.id,
+                INTERNAL_ERROR,
+                "スクリーニングに失敗しました",
+                binary=binary,
+            )
+        else:
+            await self._send(
+                {"id": message.id, "result": response.model_dump(mode="json")},
+                binary=binary,
+            )
+
+    async def _reject(
+        self, message_id: str | None, detail: str, *, binary: bool = False
+    ) -> None:
+        await self._send_error(message_id, INVALID_MESSAGE, detail, binary=binary)
+
+    async def _send_error(
+        self, message_id: str | None, code: str, detail: str, *, binary: bool = False
+    ) -> None:
+        await self._send(
+            {"id": message_id, "error": {"code": code, "detail": detail}},
+            binary=binary,
+        )
+
+    async def _send(self, reply: dict[str, Any], *, binary: bool = False) -> None:
+        """
+        応答を1件送信する（複数のタスクからの送信を直列化する）
+
+        binary が True なら MessagePack のバイナリフレーム、False なら
+        JSON のテキストフレームで送信する。
+        """
+        body: bytes | str = (
+            packb(reply)
+            if binary
+            else json.dumps(reply, ensure_ascii=False, separators=(",", ":"))
+        )
+        async with self._send_lock:
+            try:
+                if isinstance(body, bytes):
+                    await self._websocket.send_bytes(body)
+                else:
+                    await self._websocket.send_text(body)
+            except (WebSocketDisconnect, RuntimeError):
+                # 送信前に切断された応答は捨てる
+                pass
+
+
+def _describe(exc: ValidationError) -> str:
+    """バリデーションエラーを1行の説明にまとめる"""
+    return "; ".join(
+        f"{'.'.join(map(str, error['loc'])) or 'message'}: {error['msg']}"
+        for error in exc.errors(include_url=False)
+    )
+
+
+def _extract_id(text: str) -> str | None:
+    """不正なメッセージからも、可能なら相関IDを取り出す"""
+    try:
+        raw = json.loads(text)
+    except ValueError:
+        return None
+    return _id_of(raw)
+
+
+def _id_of(raw: Any) -> str | None:
+    """復号したメッセージから、可能なら相関IDを取り出す"""
+    message_id = raw.get("id") if isinstance(raw, dict) else None
+    return message_id if isinstance(message_id, str) else None
+
+
+__all__ = [
+    "INTERNAL_ERROR",
+    "INVALID_MESSAGE",
+    "UNAVAILABLE",
+    "ScreeningSession",
+]
@@ -0,0 +1,408 @@
+"""
+オフラインの一括スクリーニング
+
+このモジュールは、JSONL または CSV のファイルを HTTP を経由せずに
+ScreeningUsecase でスクリーニングし、結果を JSONL に書き出す処理を
+提供します（CLI は ``scripts/screen_bulk.py``）。
+
+- 親プロセスは入力を mmap で開き（CorpusReader）、レコードの終了位置の
+  索引を改行の一括走査で作ります（JSONL は行、CSV は引用符の外の改行）。
+  ワーカーにはバッチの開始位置と各レコードの終了位置だけを渡し、
+  各ワーカーは同じファイルを mmap で開いて範囲を直接読み、レコードを
+  解析するときに初めて復号します。解析・スクリーニング・結果の
+  シリアライズはワーカーで行うため、親プロセスがボトルネックになりにくく、
+  スループットはワーカー数にほぼ比例します。
+- 実行中のバッチ数は ``max_in_flight`` で制限します。親プロセスのメモリは
+  索引（1レコード8バイト）と実行中のバッチの結果だけです。
+- 結果は入力の順に書き出し、各行にレコードの識別子を含めます。
+- バッチを書き出すたびに、書き出し済みの入力と出力のオフセットを
+  チェックポイントに記録します。``resume=True`` で再実行すると、出力を
+  チェックポイントの位置まで切り詰め、続きの入力から再開します。
+- ``store_path`` を指定すると、本文と結果を結果ストア（SQLite）にも
+  保存します。ルールセットの変更時にはストアの文書を
+  ``scripts/rescreen_corpus.py`` で差分だけ再スクリーニングできます。
+  ストアへの書き込みは親プロセスでバッチごとに行い、チェックポイントより
+  先に済ませます（再開時に同じ識別子で保存し直しても置き換わるだけです）。
+"""
+
+import asyncio
+import bisect
+import csv
+import json
+import multiprocessing
+import multiprocessing.util
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from app.domain.screening_result import ScreeningResult
+from app.infrastructure.corpus_reader import CorpusFormat, CorpusReader
+from app.infrastructure.result_store import ScreeningResultStore
+
+InputFormat = CorpusFormat
+
+# チェックポイントのファイル名の接尾辞（出力ファイルの隣に作成する）
+CHECKPOINT_SUFFIX = ".checkpoint"
+
+
+@dataclass(frozen=True, slots=True)
+class BulkReport:
+    """
+    一括スクリーニングの結果
+
+    Attributes:
+        records: この実行でスクリーニングしたレコードの数
+        errors: 解析できなかったレコードの数（出力には error を書き出す）
+        resumed_from: 再開した入力のオフセット（最初から実行した場合は 0）
+        elapsed: 経過時間（秒）
+        degraded: フォールバックによる暫定の結果だったレコードの数
+            （出力には ``"degraded": true`` を書き出す。再スクリーニングの対象）
+    """
+
+    records: int
+    errors: int
+    resumed_from: int
+    elapsed: float
+    degraded: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """1秒あたりのレコード数"""
+        return self.records / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass(slots=True)
+class _BatchOutcome:
+    """
+    ワーカーが1バッチを処理した結果
+
+    Attributes:
+        lines: 出力の行
+        screened: スクリーニングしたレコードの数
+        failed: 解析できなかったレコードの数
+        degraded: フォールバックによる暫定の結果の数
+        stored: 結果ストアに保存する (識別子, 本文, 結果) の列
+            （ストアを使用しない場合と暫定の結果は含めない）
+        version: 結果を得たスクリーニングサービスのバージョン
+    """
+
+    lines: str
+    screened: int
+    failed: int
+    degraded: int = 0
+    stored: list[tuple[str, str, ScreeningResult]] = field(default_factory=list)
+    version: str = ""
+
+
+def run_bulk_screening(
+    input_path: str | Path,
+    output_path: str | Path,
+    *,
+    input_format: InputFormat | None = None,
+    id_field: str = "id",
+    content_field: str = "content",
+    workers: int | None = None,
+    batch_size: int = 64,
+    max_in_flight: int | None = None,
+    resume: bool = False,
+    store_path: str | Path | None = None,
+) -> BulkReport:
+    """
+    入力ファイルのレコードをプロセスプールでスクリーニングします
+
+    各ワーカーは起動時に Settings（環境変数 ``SCREENING_*``）に従って
+    スクリーニングサービスを組み立て、ScreeningUsecase.analyze() で
+    レコードを処理します。
+
+    出力の各行は ``{"id", "content", "score", "verdict", "findings"}``、
+    解析できなかったレコードは ``{"id", "error"}`` です。フォールバックによる
+    暫定の結果（サーキットブレーカーの遮断中等）には ``"degraded": true`` を
+    加え、結果ストアには保存しません。識別子の列が
+    ないレコードは入力ファイル内のバイトオフセットを識別子とします。
+
+    Args:
+        input_path: 入力ファイル（JSONL または ヘッダー付きの CSV）
+        output_path: 出力ファイル（JSONL）
+        input_format: 入力の形式（None なら拡張子で判定、.csv 以外は JSONL）
+        id_field: 識別子のフィールド名
+        content_field: スクリーニング対象のテキストのフィールド名
+        workers: ワーカープロセスの数（None なら CPU コア数）
+        batch_size: 1回にワーカーへ渡すレコードの数
+        max_in_flight: 同時に実行するバッチの上限（None ならワーカー数の2倍）
+        resume: チェックポイントがあれば続きから再開するか
+            （なければ最初から実行します）
+        store_path: 本文と結果を保存する結果ストア（SQLite）のパス
+            （None なら保存しません。識別子は文字列にして保存します）
+
+    Returns:
+        BulkReport: 処理したレコードの数と経過時間
+
+    Raises:
+        ValueError: batch_size、workers または max_in_flight が 1 未満の場合
+    """
+    workers = workers if workers is not None else os.cpu_count() or 1
+    max_in_flight = max_in_flight if max_in_flight is not None else workers * 2
+    if batch_size < 1 or workers < 1 or max_in_flight < 1:
+        raise ValueError(
+            "batch_size、workers、max_in_flight は 1 以上である必要があります"
+        )
+    input_path, output_path = Path(input_path), Path(output_path)
+    if input_format is None:
+        input_format = "csv" if input_path.suffix.lower() == ".csv" else "jsonl"
+    checkpoint_path = output_path.with_name(output_path.name + CHECKPOINT_SUFFIX)
+    checkpoint = _read_checkpoint(checkpoint_path) if resume else None
+
+    started = time.perf_counter()
+    records = errors = degraded = 0
+    with CorpusReader(input_path, corpus_format=input_format) as corpus:
+        ends = corpus.record_ends
+        first = 0
+        fieldnames = None
+        if input_format == "csv" and ends:
+            with corpus.view(0, ends[0]) as header:
+                fieldnames = next(csv.reader([str(header, "utf-8-sig")]), [])
+            first = 1
+        resumed_from = 0
+        if checkpoint is not None:
+            resumed_from = checkpoint["input_offset"]
+            first = max(first, bisect.bisect_right(ends, resumed_from))
+        with (
+            _open_output(output_path, checkpoint) as output,
+            (
+                ScreeningResultStore(store_path)
+                if store_path is not None
+                else nullcontext()
+            ) as store,
+            ProcessPoolExecutor(
+                workers,
+                # 親プロセスのスレッドを引き継がないよう spawn で起動する
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(
+                    str(input_path),
+                    input_format,
+                    fieldnames,
+                    id_field,
+                    content_field,
+                    store is not None,
+                ),
+            ) as pool,
+        ):
+            pending: deque[tuple[Future[_BatchOutcome], int]] = deque()
+
+            def drain() -> None:
+                nonlocal records, errors, degraded
+                future, end_offset = pending.popleft()
+                outcome = future.result()
+                output.write(outcome.lines.encode("utf-8"))
+                output.flush()
+                if store is not None:
+                    store.put_many(outcome.stored, version=outcome.version)
+                records += outcome.screened
+                errors += outcome.failed
+                degraded += outcome.degraded
+                _write_checkpoint(checkpoint_path, end_offset, output.tell())
+
+            # ワーカーにはバッチの開始位置と各レコードの終了位置だけを渡す
+            for index in range(first, len(ends), batch_size):
+                start = ends[index - 1] if index else 0
+                batch_ends = ends[index : index + batch_size].tolist()
+                future = pool.submit(_screen_batch, start, batch_ends)
+                pending.append((future, batch_ends[-1]))
+                if len(pending) >= max_in_flight:
+                    drain()
+            while pending:
+                drain()
+    checkpoint_path.unlink(missing_ok=True)
+    return BulkReport(
+        records, errors, resumed_from, time.perf_counter() - started, degraded
+    )
+
+
+def _open_output(path: Path, checkpoint: dict[str, int] | None) -> BinaryIO:
+    """出力を開く（再開する場合はチェックポイントの位置まで切り詰める）"""
+    if checkpoint is None:
+        return path.open("wb")
+    output = path.open("r+b")
+    output.truncate(checkpoint["output_offset"])
+    output.seek(checkpoint["output_offset"])
+    return output
+
+
+def _read_checkpoint(path: Path) -> dict[str, int] | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+def _write_checkpoint(path: Path, input_offset: int, output_offset: int) -> None:
+    """チェックポイントを原子的に置き換える"""
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(
+        json.dumps({"input_offset": input_offset, "output_offset": output_offset}),
+        encoding="utf-8",
+    )
+    os.replace(temporary, path)
+
+
+# ワーカープロセスの状態（_init_worker() で設定する）
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(
+    path: str,
+    input_format: InputFormat,
+    fieldnames: list[str] | None,
+    id_field: str,
+    content_field: str,
+    store: bool = False,
+) -> None:
+    """
+    ワーカープロセスで入力の mmap とスクリーニングサービスを用意する
+
+    store が真なら、バッチの結果に結果ストアに保存する文書を含める。
+
+    共有メモリキャッシュ（L2）は使用しない（spawn で起動したワーカーでは
+    ワーカーごとに別の領域を確保するだけで共有されないため）。サービスは
+    ワーカーの終了時に _close_worker() で閉じる。
+    """
+    from app.infrastructure.config.settings import get_settings
+    from app.infrastructure.service_factory import create_screening_service
+    from app.infrastructure.service_lifecycle import start_service
+    from app.presentation.api.dependencies import build_screening_pipeline
+    from app.usecase.screening_usecase import ScreeningUsecase
+
+    settings = get_settings()
+    if settings.pipeline_detectors:
+        service = build_screening_pipeline(settings.pipeline_detectors)
+    else:
+        service = create_screening_service(
+            settings.model_copy(update={"shared_cache_capacity": 0})
+        )
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(start_service(service))
+    _worker.update(
+        corpus=CorpusReader(path, corpus_format=input_format),
+        loop=loop,
+        service=service,
+        usecase=ScreeningUsecase(service),
+        input_format=input_format,
+        fieldnames=fieldnames,
+        id_field=id_field,
+        content_field=content_field,
+        store=store,
+    )
+    # プールのワーカーは atexit を実行せずに終了するため、multiprocessing の
+    # 終了処理に登録する
+    multiprocessing.util.Finalize(None, _close_worker, exitpriority=10)
+
+
+def _close_worker() -> None:
+    """ワーカープロセスのスクリーニングサービスと入力の mmap を閉じる"""
+    from app.infrastructure.service_lifecycle import close_service, stop_service
+
+    if not _worker:
+        return
+    loop, service = _worker["loop"], _worker["service"]
+    try:
+        loop.run_until_complete(stop_service(service))
+        close_service(service)
+    finally:
+        loop.close()
+        _worker["corpus"].close()
+        _worker.clear()
+
+
+def _screen_batch(start: int, ends: list[int]) -> _BatchOutcome:
+    """バッチを mmap から読んでスクリーニングする"""
+    corpus: CorpusReader = _worker["corpus"]
+    parsed: list[tuple[Any, str | None, str | None]] = []
+    for end in ends:
+        with corpus.view(start, end) as raw:
+            record = _parse_record(start, raw)
+        if record is not None:
+            parsed.append(record)
+        start = end
+    contents = [content for _, content, _ in parsed if content is not None]
+    results = iter(_worker["loop"].run_until_complete(_analyze_all(contents)))
+
+    lines = []
+    stored: list[tuple[str, str, ScreeningResult]] = []
+    failed = degraded = 0
+    for record_id, content, error in parsed:
+        if content is None:
+            failed += 1
+            payload: dict[str, Any] = {"id": record_id, "error": error}
+        else:
+            result = next(results)
+            payload = {"id": record_id, **_result_payload(result)}
+            if result.degraded:
+                degraded += 1
+            elif _worker["store"]:
+                stored.append((str(record_id), content, result))
+        lines.append(json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+    return _BatchOutcome(
+        "".join(line + "\n" for line in lines),
+        len(parsed) - failed,
+        failed,
+        degraded,
+        stored,
+        getattr(_worker["service"], "version", ""),
+    )
+
+
+async def _analyze_all(contents: list[str]) -> list[ScreeningResult]:
+    usecase = _worker["usecase"]
+    return list(await asyncio.gather(*(usecase.analyze(c) for c in contents)))
+
+
+def _parse_record(
+    offset: int, raw: memoryview
+) -> tuple[Any, str | None, str | None] | None:
+    """
+    (識別子, テキスト, エラー) を返す
+
+    空行は None、解析できなければテキストは None とする。
+    """
+    try:
+        text = str(raw, "utf-8")
+        if not text.strip():
+            return None
+        if _worker["input_format"] == "csv":
+            row = next(csv.reader([text]), [])
+            record = dict(zip(_worker["fieldnames"], row, strict=False))
+        else:
+            record = json.loads(text)
+    except (UnicodeDecodeError, ValueError, csv.Error) as exc:
+        return offset, None, f"invalid record: {exc}"
+    if not isinstance(record, dict):
+        return offset, None, "invalid record: not an object"
+    record_id = record.get(_worker["id_field"], offset)
+    content = record.get(_worker["content_field"])
+    if not isinstance(content, str):
+        return record_id, None, f"missing field: {_worker['content_field']}"
+    return record_id, content, None
+
+
+def _result_payload(result: ScreeningResult) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "content": result.content,
+        "score": result.score,
+        "verdict": result.verdict.value,
+        "findings": [
+            {"kind": finding.kind, "start": finding.start, "end": finding.end}
+            for finding in result.findings
+        ],
+    }
+    if result.degraded:
+        payload["degraded"] = True
+    return payload
+
+
+__all__ = ["CHECKPOINT_SUFFIX", "BulkReport", "InputFormat", "run_bulk_screening"]
@@ -5,10 +5,129 @@ Screening API - FastAPIアプリケーションエントリーポイント
 オニオンアーキテクチャに基づき、スクリーニング機能とヘルスチェックを提供します。
 """
 
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.infrastructure.service_lifecycle import (
+    close_service,
+    start_service,
+    stop_service,
+)
+from app.presentation.api.dependencies import (
+    build_priority_scheduler,
+    build_screening_service,
+    build_tenant_registry,
+)
+from app.presentation.api.hot_reload import hot_reloader_from_settings
+from app.presentation.api.openapi_document import load_openapi_document
+from app.presentation.api.rate_limit import rate_limit_from_settings
+from app.presentation.api.routes import (
+    admin_router,
+    health_router,
+    openapi_router,
+    screenings_router,
+)
+from app.presentation.api.tracing import tracing_from_settings
+
+
+def preload_resources(app: FastAPI) -> None:
+    """
+    リクエスト処理に必要な共有リソースを構築して app.state に保持します
+
+    スクリーニングサービス（ルールセットやモデルを含む）、preload の
+    テナントのサービス、優先度スケジューラー、事前生成済みのOpenAPIドキュメントを読み込みます。既に読み込み済みのリソースは
+    再構築しないため、何度呼び出しても安全です。
+
+    本番ランチャー（``main.py``）はワーカーをフォークする前に
+    マスタープロセスでこの関数を呼び出し、構築済みのオブジェクトを
+    コピーオンライトで全ワーカーに共有します。
+
+    Args:
+        app: FastAPI アプリケーションインスタンス
+    """
+    if getattr(app.state, "screening_service", None) is None:
+        app.state.screening_service = build_screening_service()
+    if not hasattr(app.state, "priority_scheduler"):
+        app.state.priority_scheduler = build_priority_scheduler()
+    if not hasattr(app.state, "tenant_registry"):
+        app.state.tenant_registry = build_tenant_registry()
+    if app.state.tenant_registry is not None:
+        app.state.tenant_registry.preload()
+    if getattr(app.state, "openapi_document", None) is None:
+        app.state.openapi_document = load_openapi_document(app)
+
+
+def release_resources(app: FastAPI) -> None:
+    """
+    preload_resources() で構築した共有リソースを解放します
+
+    スクリーニングサービスが ``close()`` を持つ場合（共有メモリキャッシュ等）は
+    呼び出してから app.state から取り除きます。
+
+    Args:
+        app: FastAPI アプリケーションインスタンス
+    """
+    service = getattr(app.state, "screening_service", None)
+    if service is not None:
+        close_service(service)
+    app.state.screening_service = None
+    if hasattr(app.state, "priority_scheduler"):
+        del app.state.priority_scheduler
+    if hasattr(app.state, "tenant_registry"):
+        if app.state.tenant_registry is not None:
+            close_service(app.state.tenant_registry)
+        del app.state.tenant_registry
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    アプリケーションのライフサイクルを管理します
+
+    起動時にスクリーニングサービスを構築して app.state に保持し、
+    リクエストごとの生成コストを排除します。重いインフラストラクチャ
+    モジュール（ルールエンジン、モデル、DBドライバ等）はここで初めて
+    インポートされるため、モジュールのインポート時間には影響しません。
+
+    サービスの start()/aclose() フック（HTTPコネクションプール等）は
+    ワーカーのイベントループ上で実行する必要があるため、マスタープロセスでの
+    事前読み込みとは分けてここで呼び出します。ルールセットのホットリロード
+    （ファイルの監視と SIGHUP）もワーカーごとにここで開始します。
+
+    Args:
+        app: FastAPI アプリケーションインスタンス
+
+    Note:
+        TestClient をコンテキストマネージャとして使わない場合など、
+        lifespan が実行されない経路では依存性注入ファクトリが
+        初回リクエスト時に遅延構築します。
+
+        事前生成済みのOpenAPIドキュメントもここで読み込み、初回の
+        ``/openapi.json`` や ``/docs`` アクセス時にスキーマ生成が
+        走らないようにします。
+    """
+    preload_resources(app)
+    service = app.state.screening_service
+    tenants = app.state.tenant_registry
+    await start_service(service)
+    if tenants is not None:
+        await start_service(tenants)
+    reloader = hot_reloader_from_settings(app.state)
+    await reloader.start()
+    try:
+        yield
+    finally:
+        await reloader.aclose()
+        if tenants is not None:
+            await stop_service(tenants)
+        await stop_service(service)
+        release_resources(app)
 
-from app.presentation.api.routes import health_router, screenings_router
 
 # FastAPIアプリケーションインスタンスを作成
 app = FastAPI(
@@ -39,8 +158,17 @@ RESTful APIバックエンドサービスです。
     license_info={
         "name": "Internal Use",
     },
+    lifespan=lifespan,
+    # OpenAPI/ドキュメントは事前生成済みの成果物を openapi_router から配信する
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
 )
 
+# クライアントごとのレート制限（SCREENING_RATE_LIMIT_PER_SECOND で有効化）
+# CORS より内側に置き、429 のレスポンスにも CORS ヘッダーを付与する
+app.add_middleware(rate_limit_from_settings)
+
 # CORS設定
 # フロントエンドからのアクセスを許可するためのCORS設定
 app.add_middleware(
@@ -57,32 +185,35 @@ app.add_middleware(
     allow_headers=["*"],  # すべてのHTTPヘッダーを許可
 )
 
+# リクエストごとのサーバースパン（SCREENING_TRACING_EXPORTER で有効化）
+# 最も外側に置き、レート制限で拒否したリクエストの時間も含めて記録する
+app.add_middleware(tracing_from_settings)
+
 # スクリーニングルーターを登録
 app.include_router(screenings_router)
 
 # ヘルスチェックルーターを登録
 app.include_router(health_router)
 
+# OpenAPIドキュメントルーターを登録
+app.include_router(openapi_router)
 
-# アプリケーション起動時のイベントハンドラー（オプション）
-@app.on_event("startup")
-async def startup_event():
-    """
-    アプリケーション起動時に実行されるイベントハンドラー
-
-    将来的には、データベース接続の初期化や
-    外部サービスの接続確認などを行うことができます。
-    """
-    pass
+# 管理用ルーターを登録（SCREENING_ADMIN_TOKEN を設定した場合のみ有効）
+app.include_router(admin_router)
 
 
-# アプリケーション終了時のイベントハンドラー（オプション）
-@app.on_event("shutdown")
-async def shutdown_event():
+@app.exception_handler(ScreeningUnavailableError)
+async def screening_unavailable_handler(
+    request: Request, exc: ScreeningUnavailableError
+) -> JSONResponse:
     """
-    アプリケーション終了時に実行されるイベントハンドラー
+    スクリーニングを一時的に実行できない場合に 503 を返す例外ハンドラー
 
-    将来的には、データベース接続のクローズや
-    リソースのクリーンアップを行うことができます。
+    外部スコアリングAPIの障害などをクライアントがリトライ可能な
+    エラーとして通知します。
     """
-    pass
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "スクリーニングサービスが一時的に利用できません"},
+        headers={"Retry-After": "1"},
+    )
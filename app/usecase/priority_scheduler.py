@@ -0,0 +1,298 @@
+"""
+優先度レーンによるスクリーニングのスケジューリング
+
+このモジュールは、同時に実行するスクリーニングの数を制限し、待ち行列を
+優先度クラス（レーン）ごとに分けて重み付き公平キューイング（WFQ）で
+実行順を決めるスケジューラーを提供します。
+
+- interactive: 採用担当者の画面操作に伴う要求（応答時間を優先）
+- bulk: 一括の再スクリーニング等（空いている処理能力を使う）
+
+レーンは重みに比例した割合で実行枠を受け取ります。すべての要求が同じ
+コストとみなせるため、WFQ は各レーンの仮想時刻（パス）を 1/重み ずつ
+進め、待ちのあるレーンのうち仮想時刻が最小のレーンから取り出す
+ストライドスケジューリングとして実装します。待ちのないレーンは仮想時刻を
+現在の仮想時刻まで進めてから再開するため、空いていた間の分をまとめて
+取り返すことはありません。
+
+ストリーミングでは文書のチャンクごとに実行枠を取得するため、長い bulk の
+文書が実行枠を占有し続けることもありません。
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+
+from app.domain.screening_result import ScreeningResult
+from app.domain.screening_service import ScreeningService, analyze_content
+
+
+class Priority(StrEnum):
+    """
+    スクリーニング要求の優先度クラス
+
+    Attributes:
+        INTERACTIVE: 対話的な要求（デフォルト）
+        BULK: 一括処理の要求
+    """
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+# レーンごとの重みのデフォルト（interactive は bulk の8倍の実行枠を受け取る）
+DEFAULT_WEIGHTS: Mapping[Priority, float] = {
+    Priority.INTERACTIVE: 8.0,
+    Priority.BULK: 1.0,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class LaneStats:
+    """
+    レーンの統計のスナップショット
+
+    Attributes:
+        weight: レーンの重み
+        queued: 実行枠を待っている要求数
+        running: 実行中の要求数
+        admitted: 実行枠を取得した要求数の累計
+        mean_wait_ms: 直近の要求の平均待ち時間（ミリ秒）
+        p95_wait_ms: 直近の要求の待ち時間の95パーセンタイル（ミリ秒）
+        max_wait_ms: 待ち時間の最大値（ミリ秒）
+    """
+
+    weight: float
+    queued: int
+    running: int
+    admitted: int
+    mean_wait_ms: float
+    p95_wait_ms: float
+    max_wait_ms: float
+
+
+class _Lane:
+    """1つの優先度クラスの待ち行列と統計"""
+
+    __slots__ = (
+        "admitted",
+        "max_wait",
+        "pass_",
+        "recent_waits",
+        "running",
+        "stride",
+        "waiters",
+    )
+
+    def __init__(self, weight: float, window: int) -> None:
+        self.stride = 1.0 / weight
+        self.pass_ = 0.0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.running = 0
+        self.admitted = 0
+        self.max_wait = 0.0
+        self.recent_waits: deque[float] = deque(maxlen=window)
+
+
+class PriorityScheduler:
+    """
+    優先度レーン付きのスクリーニングの実行枠
+
+    同時に実行できる要求は max_concurrency 件までで、それを超える要求は
+    レーンごとの待ち行列で待ちます。実行枠が空くと、重み付き公平キューイング
+    により次に実行するレーンを選びます。
+
+    Examples:
+        >>> scheduler = PriorityScheduler(max_concurrency=16)
+        >>> async with scheduler.slot(Priority.BULK):
+        ...     result = await service.analyze(content)
+        >>> scheduler.stats()[Priority.BULK].admitted
+        1
+
+    Note:
+        イベントループ上から使用する前提のため、ロックは使用しません。
+        実行枠はワーカープロセスごとです。
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        *,
+        weights: Mapping[Priority, float] = DEFAULT_WEIGHTS,
+        window: int = 1024,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        PriorityScheduler を初期化します
+
+        Args:
+            max_concurrency: 同時に実行する要求数の上限
+            weights: レーンごとの重み（すべての Priority を含む）
+            window: 待ち時間の統計に使う直近の要求数
+            clock: 現在時刻（秒）を返す関数
+
+        Raises:
+            ValueError: max_concurrency が1未満、または重みが不足・0以下の場合
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency は1以上である必要があります")
+        if set(weights) != set(Priority) or min(weights.values()) <= 0:
+            raise ValueError("weights はすべての優先度に正の重みを指定してください")
+        self._max_concurrency = max_concurrency
+        self._lanes = {
+            priority: _Lane(weights[priority], window) for priority in Priority
+        }
+        self._clock = clock
+        self._active = 0
+        self._virtual_time = 0.0
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority) -> AsyncIterator[None]:
+        """
+        実行枠を取得し、ブロックを抜けると解放します
+
+        Args:
+            priority: 要求の優先度クラス
+
+        Yields:
+            None: 実行枠を保持している間
+
+        Note:
+            待っている間に取り消された場合は、待ち行列から取り除きます。
+        """
+        lane = self._lanes[priority]
+        await self._acquire(lane)
+        try:
+            yield
+        finally:
+            lane.running -= 1
+            self._release()
+
+    def stats(self) -> dict[Priority, LaneStats]:
+        """
+        レーンごとの統計のスナップショットを返します
+
+        Returns:
+            dict[Priority, LaneStats]: 優先度クラスごとの統計
+        """
+        snapshot = {}
+        for priority, lane in self._lanes.items():
+            waits = sorted(lane.recent_waits)
+            snapshot[priority] = LaneStats(
+                weight=1.0 / lane.stride,
+                queued=len(lane.waiters),
+                running=lane.running,
+                admitted=lane.admitted,
+                mean_wait_ms=sum(waits) / len(waits) * 1000 if waits else 0.0,
+                p95_wait_ms=(
+                    waits[min(len(waits) - 1, math.ceil(0.95 * len(waits)) - 1)] * 1000
+                    if waits
+                    else 0.0
+                ),
+                max_wait_ms=lane.max_wait * 1000,
+            )
+        return snapshot
+
+    async def _acquire(self, lane: _Lane) -> None:
+        """実行枠を取得する（空きがなければレーンの待ち行列で待つ）"""
+        if self._active < self._max_concurrency and not self._has_waiters():
+            self._active += 1
+            self._admit(lane, 0.0)
+            return
+
+        if not lane.waiters:
+            # 待ちのなかったレーンは空いていた間の分を取り返さない
+            lane.pass_ = max(lane.pass_, self._virtual_time)
+        waiter = asyncio.get_running_loop().create_future()
+        lane.waiters.append(waiter)
+        enqueued_at = self._clock()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 実行枠を受け取った直後に取り消された場合は次の要求に渡す
+                self._release()
+            else:
+                lane.waiters.remove(waiter)
+            raise
+        self._admit(lane, self._clock() - enqueued_at)
+
+    def _release(self) -> None:
+        """実行枠を次の要求に渡す（待ちがなければ空きに戻す）"""
+        lane = min(
+            (lane for lane in self._lanes.values() if lane.waiters),
+            key=lambda lane: lane.pass_,
+            default=None,
+        )
+        if lane is None:
+            self._active -= 1
+            return
+        self._virtual_time = lane.pass_
+        lane.pass_ += lane.stride
+        lane.waiters.popleft().set_result(None)
+
+    def _has_waiters(self) -> bool:
+        return any(lane.waiters for lane in self._lanes.values())
+
+    @staticmethod
+    def _admit(lane: _Lane, wait: float) -> None:
+        lane.running += 1
+        lane.admitted += 1
+        lane.recent_waits.append(wait)
+        lane.max_wait = max(lane.max_wait, wait)
+
+
+class PrioritizedScreeningService:
+    """
+    スクリーニングの呼び出しごとにスケジューラーの実行枠を取得するサービス
+
+    ScreeningService / ScreeningAnalyzer Protocol に構造的部分型付けにより
+    準拠し、ScreeningUsecase からは通常のサービスと同様に利用できます。
+
+    Examples:
+        >>> service = PrioritizedScreeningService(inner, scheduler, Priority.BULK)
+        >>> await service.screen("テキスト")
+        'テキスト'
+    """
+
+    def __init__(
+        self,
+        service: ScreeningService,
+        scheduler: PriorityScheduler,
+        priority: Priority,
+    ) -> None:
+        """
+        PrioritizedScreeningService を初期化します
+
+        Args:
+            service: 実際にスクリーニングを行うサービス
+            scheduler: 実行枠を管理するスケジューラー
+            priority: このサービス経由の要求の優先度クラス
+        """
+        self._service = service
+        self._scheduler = scheduler
+        self._priority = priority
+
+    async def screen(self, content: str) -> str:
+        """実行枠を取得してからスクリーニングを実行します"""
+        async with self._scheduler.slot(self._priority):
+            return await self._service.screen(content)
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """実行枠を取得してから詳細なスクリーニングを実行します"""
+        async with self._scheduler.slot(self._priority):
+            return await analyze_content(self._service, content)
+
+
+__all__ = [
+    "DEFAULT_WEIGHTS",
+    "LaneStats",
+    "PrioritizedScreeningService",
+    "Priority",
+    "PriorityScheduler",
+]
@@ -0,0 +1,635 @@
+"""
+段階的なスクリーニングパイプライン
+
+このモジュールは、スクリーニングを次のような段階（ステージ）の並びとして
+宣言的に組み立てるパイプラインを提供します::
+
+    pipeline = ScreeningPipeline([
+        NormalizeStage(),
+        PrefilterStage(has_text),
+        DetectorStage("rules", rules_service, halt_at=Verdict.BLOCK),
+        [DetectorStage("ngram", ngram_service), DetectorStage("remote", remote)],
+        RedactionStage(),
+        ScoringStage(),
+    ])
+
+- 並びの要素はステージ、またはステージの列です。列の中のステージは
+  互いに独立した検出器として並行に実行します。
+- 軽いステージ（前処理フィルタや高速なルール）は ``PipelineContext.halt()`` で
+  以降の重いステージを打ち切れます。打ち切ったステージは「スキップ」として
+  記録されます。``runs_after_halt`` が真のステージ（置換・スコアの統合）は
+  打ち切り後も実行します。
+- ステージごとに呼び出し数・スキップ数・ヒット数・処理時間を記録し、
+  ``ScreeningPipeline.stats()`` で参照できます。
+
+正規化は文字数を変えないため、検出箇所の位置は入力テキストの位置のまま
+扱えます。
+"""
+
+import asyncio
+import dataclasses
+import time
+import unicodedata
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from app.domain.screening_result import (
+    Finding,
+    ScreeningResult,
+    Verdict,
+    applied_replacements,
+    apply_replacements,
+)
+from app.domain.screening_service import ScreeningService, analyze_content
+
+
+def _finding_order(finding: Finding) -> tuple[int, int]:
+    """検出箇所の順序（開始位置の昇順。同じ開始位置なら長いものが先）"""
+    return finding.start, -finding.end
+
+
+@dataclass(slots=True)
+class PipelineContext:
+    """
+    1回のスクリーニングでステージ間を受け渡す状態
+
+    Attributes:
+        content: 入力テキスト
+        text: 検出器が照合するテキスト（正規化後。文字数は content と同じ）
+        findings: 検出箇所（検出器の追加順）
+        scores: 検出器ごとのスコア
+        verdict: これまでの判定のうち最も重いもの
+        score: 最終的なスコア（None なら検出器のスコアの最大値）
+        redacted: 置換を適用したテキスト（None なら content のまま）
+        halted: 以降のステージを打ち切ったか
+        degraded: いずれかの検出器の結果がフォールバックによる暫定の結果か
+    """
+
+    content: str
+    text: str = ""
+    findings: list[Finding] = field(default_factory=list)
+    scores: dict[str, float] = field(default_factory=dict)
+    verdict: Verdict = Verdict.PASS
+    score: float | None = None
+    redacted: str | None = None
+    halted: bool = False
+    degraded: bool = False
+
+    def __post_init__(self) -> None:
+        if not self.text:
+            self.text = self.content
+
+    def add_result(self, name: str, result: ScreeningResult) -> None:
+        """
+        検出器の結果を取り込みます
+
+        Args:
+            name: 検出器の名前
+            result: 検出器のスクリーニング結果
+        """
+        self.findings.extend(result.findings)
+        self.scores[name] = result.score
+        self.degraded = self.degraded or result.degraded
+        self.escalate(result.verdict)
+
+    def escalate(self, verdict: Verdict) -> None:
+        """判定を verdict 以上の重さに引き上げます"""
+        if verdict.severity > self.verdict.severity:
+            self.verdict = verdict
+
+    def halt(self, verdict: Verdict | None = None) -> None:
+        """
+        以降のステージを打ち切ります
+
+        Args:
+            verdict: 引き上げる判定（None なら判定は変えない）
+        """
+        self.halted = True
+        if verdict is not None:
+            self.escalate(verdict)
+
+    def result(self) -> ScreeningResult:
+        """
+        パイプラインの結果を組み立てます
+
+        Returns:
+            ScreeningResult: 検出箇所は開始位置の昇順（同じ開始位置なら
+            長いものが先。暫定の結果を取り込んだ場合は degraded）
+        """
+        score = self.score
+        if score is None:
+            score = max(self.scores.values(), default=0.0)
+        return ScreeningResult(
+            content=self.content if self.redacted is None else self.redacted,
+            score=score,
+            verdict=self.verdict,
+            findings=tuple(sorted(self.findings, key=_finding_order)),
+            degraded=self.degraded,
+        )
+
+
+class PipelineStage(Protocol):
+    """
+    パイプラインのステージのインターフェース
+
+    Attributes:
+        name: ステージの名前（パイプライン内で一意。統計のキーになる）
+
+    Note:
+        クラス属性 ``runs_after_halt = True`` を持つステージは、
+        PipelineContext.halt() による打ち切りの後も実行されます。
+    """
+
+    name: str
+
+    async def run(self, context: PipelineContext) -> int:
+        """
+        ステージを実行します
+
+        Args:
+            context: スクリーニングの状態（ステージが更新する）
+
+        Returns:
+            int: ステージのヒット数（検出数、置換数等）
+        """
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class StageStats:
+    """
+    ステージの統計のスナップショット
+
+    Attributes:
+        calls: 実行した回数
+        skipped: 打ち切りにより実行しなかった回数
+        hits: ヒット数の累計
+        mean_ms: 平均処理時間（ミリ秒）
+        max_ms: 最大処理時間（ミリ秒）
+    """
+
+    calls: int
+    skipped: int
+    hits: int
+    mean_ms: float
+    max_ms: float
+
+
+class _StageMetrics:
+    """ステージの統計の累計"""
+
+    __slots__ = ("calls", "hits", "max_seconds", "skipped", "total_seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.skipped = 0
+        self.hits = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def snapshot(self) -> StageStats:
+        mean = self.total_seconds / self.calls if self.calls else 0.0
+        return StageStats(
+            calls=self.calls,
+            skipped=self.skipped,
+            hits=self.hits,
+            mean_ms=mean * 1000,
+            max_ms=self.max_seconds * 1000,
+        )
+
+
+class _FoldTable(dict[int, str]):
+    """
+    str.translate 用の文字の正規化表（初めて現れた文字だけ計算する）
+
+    NFKC と小文字化で1文字になる文字だけを置き換え、文字数を保ちます。
+    """
+
+    # 敵対的な入力で表が際限なく大きくならないようにする上限
+    MAX_SIZE = 65536
+
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        folded = unicodedata.normalize("NFKC", char).lower()
+        value = folded if len(folded) == 1 else char
+        if len(self) < self.MAX_SIZE:
+            self[code] = value
+        return value
+
+
+_FOLD_TABLE = _FoldTable()
+
+
+def fold_text(text: str) -> str:
+    """
+    全角・半角や大文字・小文字の違いを吸収した、同じ文字数のテキストを返します
+
+    Args:
+        text: 正規化するテキスト
+
+    Returns:
+        str: 正規化したテキスト
+
+    Examples:
+        >>> fold_text("ＡＢＣ株式会社")
+        'abc株式会社'
+    """
+    return text.translate(_FOLD_TABLE)
+
+
+def has_text(text: str) -> bool:
+    """空白以外の文字を含むか（PrefilterStage の既定の条件）"""
+    return bool(text) and not text.isspace()
+
+
+class NormalizeStage:
+    """
+    検出器が照合するテキストを正規化するステージ
+
+    入力テキスト（出力の content）は書き換えず、context.text だけを
+    置き換えます。ヒット数は書き換わった場合に 1 です。
+    """
+
+    def __init__(
+        self, normalize: Callable[[str], str] = fold_text, *, name: str = "normalize"
+    ) -> None:
+        """
+        NormalizeStage を初期化します
+
+        Args:
+            normalize: 文字数を変えない正規化関数
+            name: ステージの名前
+        """
+        self.name = name
+        self._normalize = normalize
+
+    async def run(self, context: PipelineContext) -> int:
+        """context.text を正規化します"""
+        normalized = self._normalize(context.text)
+        if len(normalized) != len(context.text):
+            raise ValueError("正規化でテキストの文字数が変わりました")
+        changed = normalized != context.text
+        context.text = normalized
+        return int(changed)
+
+
+class PrefilterStage:
+    """
+    条件を満たさないテキストで以降のステージを打ち切るステージ
+
+    検出器を呼ぶまでもないテキスト（空白だけ等）を PASS として
+    打ち切ります。ヒット数は打ち切った場合に 1 です。
+    """
+
+    def __init__(
+        self, predicate: Callable[[str], bool] = has_text, *, name: str = "prefilter"
+    ) -> None:
+        """
+        PrefilterStage を初期化します
+
+        Args:
+            predicate: 以降のステージを実行すべきテキストで True を返す関数
+            name: ステージの名前
+        """
+        self.name = name
+        self._predicate = predicate
+
+    async def run(self, context: PipelineContext) -> int:
+        """条件を満たさなければ打ち切ります"""
+        if self._predicate(context.text):
+            return 0
+        context.halt()
+        return 1
+
+
+class DetectorStage:
+    """
+    ScreeningService を検出器として呼び出すステージ
+
+    サービスの結果から検出箇所・スコア・判定を取り込みます（サービスが
+    書き換えたテキストは使わず、置換は RedactionStage が検出箇所から
+    行います）。ヒット数は検出箇所の数です。
+
+    mask_char を指定すると、検出箇所を context.text 上で同じ文字数の
+    mask_char で塗りつぶし、以降のステージ（下流のモデル等）に渡しません。
+    個人情報の検出器で使用します。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        service: ScreeningService,
+        *,
+        halt_at: Verdict | None = None,
+        mask_char: str | None = None,
+    ) -> None:
+        """
+        DetectorStage を初期化します
+
+        Args:
+            name: ステージ（検出器）の名前
+            service: 検出器として使う ScreeningService の実装
+            halt_at: この重さ以上の判定で以降のステージを打ち切る
+                （None なら打ち切らない）
+            mask_char: 検出箇所を以降のステージから隠す1文字
+                （None なら隠さない。並行に実行する列の中では使わないこと）
+
+        Raises:
+            ValueError: mask_char が1文字でない場合
+        """
+        if mask_char is not None and len(mask_char) != 1:
+            raise ValueError("mask_char は1文字である必要があります")
+        self.name = name
+        self.service = service
+        self._halt_at = halt_at
+        self._mask_char = mask_char
+
+    async def run(self, context: PipelineContext) -> int:
+        """サービスで context.text をスクリーニングします"""
+        result = await analyze_content(self.service, context.text)
+        context.add_result(self.name, result)
+        if self._mask_char is not None and result.findings:
+            context.text = _mask(context.text, result.findings, self._mask_char)
+        if (
+            self._halt_at is not None
+            and result.verdict.severity >= self._halt_at.severity
+        ):
+            context.halt()
+        return len(result.findings)
+
+
+def _mask(text: str, findings: Sequence[Finding], mask_char: str) -> str:
+    """検出箇所を同じ文字数の mask_char で塗りつぶす（1回の join）"""
+    pieces = []
+    position = 0
+    for finding in sorted(findings, key=lambda f: f.start):
+        start = max(finding.start, position)
+        if finding.end <= start:
+            continue
+        pieces.append(text[position:start])
+        pieces.append(mask_char * (finding.end - start))
+        position = finding.end
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+
+class RedactionStage:
+    """
+    検出箇所の置換を入力テキストに適用するステージ
+
+    重なり合う検出箇所は、開始位置が最も左のもの（同じ開始位置なら長いもの）を
+    優先します。結果の検出箇所と同じ順序で applied_replacements() により
+    選ぶため、patch の編集を適用したテキストは content と一致します。
+    ヒット数は置換した箇所の数です。打ち切り後も実行します
+    （BLOCK で打ち切った文書の検出箇所も置換するため）。
+    """
+
+    runs_after_halt = True
+
+    def __init__(self, *, mask: str | None = None, name: str = "redaction") -> None:
+        """
+        RedactionStage を初期化します
+
+        Args:
+            mask: replacement を持たない検出箇所を置き換える文字列
+                （None ならそれらは置換しない）
+            name: ステージの名前
+        """
+        self.name = name
+        self._mask = mask
+
+    async def run(self, context: PipelineContext) -> int:
+        """置換を1回の join で適用します"""
+        findings = sorted(context.findings, key=_finding_order)
+        if self._mask is not None:
+            # 結果の検出箇所にもマスクを残し、patch の編集と content を一致させる
+            findings = [
+                finding
+                if finding.replacement is not None
+                else dataclasses.replace(finding, replacement=self._mask)
+                for finding in findings
+            ]
+            context.findings = findings
+        applied = applied_replacements(findings)
+        if not applied:
+            return 0
+        source = context.content if context.redacted is None else context.redacted
+        context.redacted = apply_replacements(source, applied)
+        return len(applied)
+
+
+class ScoringStage:
+    """
+    検出器のスコアを統合して最終的なスコアと判定を決めるステージ
+
+    スコアは検出器のスコアの noisy-OR（``1 - Π(1 - score)``）で、
+    しきい値を超えた場合は判定を引き上げます。ヒット数は判定が
+    PASS でない場合に 1 です。打ち切り後も実行します。
+    """
+
+    runs_after_halt = True
+
+    def __init__(
+        self,
+        *,
+        review_threshold: float | None = None,
+        block_threshold: float | None = None,
+        name: str = "scoring",
+    ) -> None:
+        """
+        ScoringStage を初期化します
+
+        Args:
+            review_threshold: これ以上のスコアを REVIEW とする（None なら使わない）
+            block_threshold: これ以上のスコアを BLOCK とする（None なら使わない）
+            name: ステージの名前
+        """
+        self.name = name
+        self._review_threshold = review_threshold
+        self._block_threshold = block_threshold
+
+    async def run(self, context: PipelineContext) -> int:
+        """スコアを統合し、しきい値で判定を引き上げます"""
+        unmatched_probability = 1.0
+        for score in context.scores.values():
+            unmatched_probability *= 1.0 - score
+        score = 1.0 - unmatched_probability
+        context.score = score
+        if self._block_threshold is not None and score >= self._block_threshold:
+            context.escalate(Verdict.BLOCK)
+        elif self._review_threshold is not None and score >= self._review_threshold:
+            context.escalate(Verdict.REVIEW)
+        return int(context.verdict is not Verdict.PASS)
+
+
+class ScreeningPipeline:
+    """
+    ステージの並びでスクリーニングするパイプライン
+
+    ScreeningService / ScreeningAnalyzer Protocol に構造的部分型付けにより
+    準拠し、ScreeningUsecase からは通常のサービスと同様に利用できます。
+
+    Examples:
+        >>> pipeline = ScreeningPipeline([
+        ...     NormalizeStage(),
+        ...     PrefilterStage(),
+        ...     DetectorStage("rules", rules_service, halt_at=Verdict.BLOCK),
+        ...     RedactionStage(),
+        ...     ScoringStage(),
+        ... ])
+        >>> result = await pipeline.analyze("ＭＡＬＥ ONLY")
+        >>> pipeline.stats()["rules"].calls
+        1
+
+    Note:
+        検出器のサービスのライフサイクルフック（start / aclose / close /
+        reload）を転送します。
+    """
+
+    def __init__(
+        self, stages: Sequence[PipelineStage | Sequence[PipelineStage]]
+    ) -> None:
+        """
+        ScreeningPipeline を初期化します
+
+        Args:
+            stages: ステージの並び（ステージの列は並行に実行する）
+
+        Raises:
+            ValueError: ステージがない、列が空、または名前が重複している場合
+        """
+        steps: list[tuple[PipelineStage, ...]] = []
+        for step in stages:
+            group = tuple(step) if isinstance(step, Sequence) else (step,)
+            if not group:
+                raise ValueError("並行に実行するステージの列が空です")
+            steps.append(group)
+        if not steps:
+            raise ValueError("ステージが1つ以上必要です")
+        names = [stage.name for group in steps for stage in group]
+        if len(names) != len(set(names)):
+            raise ValueError("ステージの名前が重複しています")
+        self._steps = tuple(steps)
+        self._metrics = {name: _StageMetrics() for name in names}
+
+    @property
+    def version(self) -> str:
+        """バージョンを持つ検出器のバージョンの組（持たない場合は空文字列）"""
+        versions = (
+            (stage.name, getattr(stage.service, "version", ""))
+            for stage in self._detectors()
+        )
+        return ";".join(f"{name}={version}" for name, version in versions if version)
+
+    async def screen(self, content: str) -> str:
+        """パイプラインでスクリーニングし、置換後のテキストを返します"""
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        パイプラインでスクリーニングし、詳細な結果を返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: 判定、スコア、検出箇所、置換後のテキスト
+        """
+        context = PipelineContext(content)
+        for group in self._steps:
+            if context.halted:
+                runnable = []
+                for stage in group:
+                    if getattr(stage, "runs_after_halt", False):
+                        runnable.append(stage)
+                    else:
+                        self._metrics[stage.name].skipped += 1
+                group = tuple(runnable)
+            if len(group) == 1:
+                await self._run(group[0], context)
+            elif group:
+                await asyncio.gather(*(self._run(stage, context) for stage in group))
+        return context.result()
+
+    def stats(self) -> dict[str, StageStats]:
+        """
+        ステージごとの統計のスナップショットを返します
+
+        Returns:
+            dict[str, StageStats]: ステージ名 -> 統計（パイプラインの順）
+        """
+        return {name: metrics.snapshot() for name, metrics in self._metrics.items()}
+
+    async def start(self) -> None:
+        """検出器のサービスの start() フックを転送します"""
+        for service in self._services():
+            start = getattr(service, "start", None)
+            if start is not None:
+                await start()
+
+    async def aclose(self) -> None:
+        """検出器のサービスの aclose() フックを転送します"""
+        for service in self._services():
+            aclose = getattr(service, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def close(self) -> None:
+        """検出器のサービスの close() フックを転送します"""
+        for service in self._services():
+            close = getattr(service, "close", None)
+            if close is not None:
+                close()
+
+    async def reload(self, *, force: bool = False) -> str | None:
+        """
+        検出器のサービスの reload() フックを転送します
+
+        Returns:
+            str | None: いずれかの検出器を差し替えた場合はパイプラインの
+            新しいバージョン（すべての検出器のバージョンの組）
+        """
+        reloaded = False
+        for service in self._services():
+            reload = getattr(service, "reload", None)
+            if reload is not None and await reload(force=force) is not None:
+                reloaded = True
+        return self.version if reloaded else None
+
+    async def _run(self, stage: PipelineStage, context: PipelineContext) -> None:
+        metrics = self._metrics[stage.name]
+        started = time.perf_counter()
+        hits = await stage.run(context)
+        elapsed = time.perf_counter() - started
+        metrics.calls += 1
+        metrics.hits += hits
+        metrics.total_seconds += elapsed
+        if elapsed > metrics.max_seconds:
+            metrics.max_seconds = elapsed
+
+    def _detectors(self) -> list[DetectorStage]:
+        return [
+            stage
+            for group in self._steps
+            for stage in group
+            if isinstance(stage, DetectorStage)
+        ]
+
+    def _services(self) -> list[ScreeningService]:
+        return [stage.service for stage in self._detectors()]
+
+
+__all__ = [
+    "DetectorStage",
+    "NormalizeStage",
+    "PipelineContext",
+    "PipelineStage",
+    "PrefilterStage",
+    "RedactionStage",
+    "ScoringStage",
+    "ScreeningPipeline",
+    "StageStats",
+    "fold_text",
+    "has_text",
+]
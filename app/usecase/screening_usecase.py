@@ -5,7 +5,35 @@
 依存性注入を使用してDomain層のインターフェースに依存し、外側の層への依存を排除します。
 """
 
-from app.domain.screening_service import ScreeningService
+import dataclasses
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from typing import Any
+
+from app.domain.screening_result import ScreeningResult
+from app.domain.screening_service import ScreeningService, analyze_content
+from app.domain.tracing import Tracer
+
+# ストリーミングで1回にスクリーニングする最大文字数のデフォルト
+DEFAULT_STREAM_CHUNK_SIZE = 8192
+
+
+@dataclass(frozen=True, slots=True)
+class ScreeningChunk:
+    """
+    ストリーミングでスクリーニングした文書の一部分
+
+    Attributes:
+        start: 文書内のチャンクの開始位置（文字オフセット）
+        end: 文書内のチャンクの終了位置（文字オフセット、排他的）
+        result: チャンクのスクリーニング結果。content はチャンクの
+            スクリーニング後のテキスト、findings の位置は文書全体のオフセット
+    """
+
+    start: int
+    end: int
+    result: ScreeningResult
 
 
 class ScreeningUsecase:
@@ -17,6 +45,7 @@ class ScreeningUsecase:
 
     Attributes:
         _service: スクリーニングサービスのインスタンス（Protocol型）
+        _tracer: 各操作のスパンを記録するトレーサー（None なら記録しない）
 
     Examples:
         >>> from app.infrastructure.screening_service_impl import EchoScreeningService
@@ -32,18 +61,23 @@ class ScreeningUsecase:
         依存は持ちません。
     """
 
-    def __init__(self, service: ScreeningService) -> None:
+    def __init__(
+        self, service: ScreeningService, *, tracer: Tracer | None = None
+    ) -> None:
         """
         ScreeningUsecaseを初期化します
 
         Args:
             service: ScreeningService Protocol に準拠するサービスインスタンス
+            tracer: Tracer Protocol に準拠するトレーサー（None ならスパンを
+                記録しない）
 
         Note:
             依存性注入を使用して、ScreeningServiceの実装を外部から注入します。
             これにより、テスト時にモックを使用でき、実装の交換も容易になります。
         """
         self._service = service
+        self._tracer = tracer
 
     async def execute(self, content: str) -> str:
         """
@@ -63,11 +97,114 @@ class ScreeningUsecase:
         Note:
             このメソッドは、ScreeningServiceのscreen()メソッドを
             非同期で呼び出してスクリーニング処理を実行します。
-            現在の実装では追加のビジネスロジックはありませんが、
-            将来的にロギング、バリデーション、前処理・後処理などを
-            追加する拡張ポイントとなります。
+            正規化・前処理フィルタ・検出器・置換・スコアの統合などの
+            段階的な処理は、ScreeningPipeline（screening_pipeline.py）を
+            サービスとして注入して組み立てます。
         """
-        return await self._service.screen(content)
+        with self._span("ScreeningUsecase.execute", content):
+            return await self._service.screen(content)
 
+    async def analyze(self, content: str) -> ScreeningResult:
+        """
+        スクリーニング処理を非同期で実行し、判定と検出箇所を含む結果を返します
+
+        Args:
+            content: スクリーニング対象のテキスト
+
+        Returns:
+            ScreeningResult: スコア、判定、検出箇所、スクリーニング後のテキスト
+
+        Note:
+            サービスが analyze() を実装していない場合は screen() の結果を
+            検出箇所なしの PASS として包みます。
+        """
+        with self._span("ScreeningUsecase.analyze", content):
+            return await analyze_content(self._service, content)
 
-__all__ = ["ScreeningUsecase"]
+    async def stream(
+        self, content: str, *, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[ScreeningChunk]:
+        """
+        長い文書をチャンクに分けてスクリーニングし、完了した順に結果を返します
+
+        チャンクは呼び出し元が次の結果を要求した時点で初めて処理されるため、
+        文書全体の結果をメモリ上に組み立てることはなく、送信が遅いクライアントに
+        対しては処理も自然に待たされます。
+
+        Args:
+            content: スクリーニング対象のテキスト
+            chunk_size: 1チャンクの最大文字数
+
+        Yields:
+            ScreeningChunk: 文書の先頭から順のチャンクの結果
+
+        Note:
+            チャンクはできるだけ改行の直後で区切ります。改行をまたぐ語句が
+            少ない採用文書ではチャンク境界で検出を取りこぼしにくくなりますが、
+            1行が chunk_size を超える場合は文字数で区切ります。
+        """
+        for start, end in split_chunks(content, chunk_size):
+            with self._span("ScreeningUsecase.stream", content[start:end]):
+                result = await analyze_content(self._service, content[start:end])
+            if start and result.findings:
+                result = dataclasses.replace(
+                    result,
+                    findings=tuple(
+                        dataclasses.replace(
+                            finding,
+                            start=finding.start + start,
+                            end=finding.end + start,
+                        )
+                        for finding in result.findings
+                    ),
+                )
+            yield ScreeningChunk(start, end, result)
+
+    def _span(self, name: str, content: str) -> AbstractContextManager[Any]:
+        """トレーサーがあれば操作のスパンを開始する（なければ何もしない）"""
+        if self._tracer is None:
+            return nullcontext()
+        return self._tracer.start_span(name, {"screening.content_length": len(content)})
+
+
+def split_chunks(content: str, chunk_size: int) -> Iterator[tuple[int, int]]:
+    """
+    テキストを最大 chunk_size 文字の区間に分けます
+
+    区間はできるだけ改行の直後で区切り、区間内に改行がない場合は
+    chunk_size 文字で区切ります。
+
+    Args:
+        content: 分割するテキスト
+        chunk_size: 1区間の最大文字数
+
+    Yields:
+        tuple[int, int]: 区間の開始位置と終了位置（排他的）
+
+    Raises:
+        ValueError: chunk_size が1未満の場合
+
+    Examples:
+        >>> list(split_chunks("ab\ncd\nef", 4))
+        [(0, 3), (3, 6), (6, 8)]
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size は1以上である必要があります")
+    start = 0
+    length = len(content)
+    while start < length:
+        end = min(start + chunk_size, length)
+        if end < length:
+            newline = content.rfind("\n", start, end)
+            if newline >= start:
+                end = newline + 1
+        yield start, end
+        start = end
+
+
+__all__ = [
+    "DEFAULT_STREAM_CHUNK_SIZE",
+    "ScreeningChunk",
+    "ScreeningUsecase",
+    "split_chunks",
+]
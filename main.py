@@ -1,6 +1,412 @@
-def main():
-    print("Hello from screening-api-core!")
+"""
+本番用マルチプロセスサーバーランチャー
+
+マスタープロセスで ``app.presentation.main:app`` とスクリーニングに必要な
+共有リソース（ルールセット、モデル重み、OpenAPIドキュメント）を事前に読み込み、
+``gc.freeze()`` で構築済みオブジェクトをGC対象外にしたうえで N 個の
+ワーカーをフォークします。ワーカーはマスターがバインドした listen ソケットを
+共有し、それぞれ uvicorn サーバーとしてリクエストを処理します。
+
+フォーク後のワーカーはマスターのメモリページをコピーオンライトで共有します。
+GC が参照カウント以外のヘッダー（世代リンク）を書き換えるとページが
+複製されてしまうため、フォーク前に ``gc.freeze()`` を呼び出して
+事前読み込み済みのオブジェクトを永続世代に移します。
+
+使用例::
+
+    python main.py --workers 4 --port 8000 --backlog 2048
+
+設定は ``SCREENING_`` 接頭辞付きの環境変数でも指定できます
+（``app/infrastructure/config/settings.py`` を参照）。
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+
+from app.infrastructure.config.settings import Settings, get_settings
+
+logger = logging.getLogger("screening.launcher")
+
+# 再起動待ちのワーカーがある間に子プロセスの終了を確認する間隔（秒）
+_POLL_INTERVAL = 0.05
+
+
+def _positive_int(value: str) -> int:
+    """1 以上の整数を受け付ける argparse の型変換"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 以上を指定してください: {value}")
+    return number
+
+
+def parse_args(argv: list[str] | None = None, settings: Settings | None = None):
+    """
+    コマンドライン引数を解析します
+
+    各オプションのデフォルト値は Settings（環境変数）から取得し、
+    コマンドライン引数で上書きできます。
+
+    Args:
+        argv: 解析する引数リスト（None の場合は sys.argv）
+        settings: デフォルト値の取得元（None の場合は get_settings()）
+
+    Returns:
+        argparse.Namespace: 解析済みの引数
+    """
+    settings = settings or get_settings()
+    parser = argparse.ArgumentParser(description="Screening API 本番サーバー")
+    parser.add_argument("--host", default=settings.host)
+    parser.add_argument("--port", type=int, default=settings.port)
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=settings.workers,
+        help="フォークするワーカー数（1 でフォークせず単一プロセス）",
+    )
+    parser.add_argument(
+        "--backlog",
+        type=int,
+        default=settings.backlog,
+        help="listen ソケットの接続待ちキュー長",
+    )
+    parser.add_argument(
+        "--timeout-keep-alive",
+        type=int,
+        default=settings.timeout_keep_alive,
+        help="Keep-Alive 接続のアイドルタイムアウト（秒）",
+    )
+    parser.add_argument(
+        "--limit-concurrency",
+        type=int,
+        default=settings.limit_concurrency,
+        help="ワーカーあたりの同時実行上限（超過時は 503）",
+    )
+    parser.add_argument(
+        "--timeout-graceful-shutdown",
+        type=int,
+        default=settings.timeout_graceful_shutdown,
+    )
+    return parser.parse_args(argv)
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    """
+    ワーカー間で共有する listen ソケットを作成します
+
+    Args:
+        host: バインドアドレス
+        port: リッスンポート（0 の場合は空きポート）
+        backlog: 接続待ちキュー長
+
+    Returns:
+        socket.socket: listen 状態のソケット
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def preload_application():
+    """
+    マスタープロセスでアプリケーションと共有リソースを読み込みます
+
+    読み込み中は自動GCを停止し、完了後に一度だけ回収してから
+    ``gc.freeze()`` で全オブジェクトを永続世代に移します。
+
+    Returns:
+        FastAPI: リソース読み込み済みのアプリケーション
+    """
+    gc.disable()
+    from app.presentation.main import app, preload_resources
+
+    preload_resources(app)
+    gc.collect()
+    gc.freeze()
+    return app
+
+
+def build_server(app, args, sock: socket.socket):
+    """
+    ワーカーで実行する uvicorn サーバーを構築します
+
+    Args:
+        app: 事前読み込み済みのASGIアプリケーション
+        args: parse_args() の戻り値
+        sock: マスターから継承した listen ソケット
+
+    Returns:
+        uvicorn.Server: 起動前のサーバー
+    """
+    import uvicorn
+
+    config = uvicorn.Config(
+        app,
+        lifespan="on",
+        backlog=args.backlog,
+        timeout_keep_alive=args.timeout_keep_alive,
+        limit_concurrency=args.limit_concurrency,
+        timeout_graceful_shutdown=args.timeout_graceful_shutdown,
+        access_log=False,
+    )
+    config.host, config.port = sock.getsockname()[:2]
+    return uvicorn.Server(config)
+
+
+class PreforkSupervisor:
+    """
+    ワーカープロセスのフォークと監視を行うスーパーバイザー
+
+    SIGTERM/SIGINT を受け取るとワーカーに SIGTERM を転送し、
+    全ワーカーの終了を待ってから戻ります。SIGHUP を受け取るとマスターの
+    ルールセットを再読み込みしてから全ワーカーに転送し、各ワーカーも
+    再読み込みします。停止要求前にワーカーが終了した場合は新しいワーカーを
+    フォークして補充します（マスターを先に再読み込みするため、補充した
+    ワーカーも新しいバージョンで起動します）。
+
+    補充は ``restart_delay`` から倍々に ``max_restart_delay`` まで待ってから
+    行い、起動直後に落ち続けるワーカーでフォークを繰り返さないようにします。
+    ``stable_after`` 秒以上動いたワーカーの終了は連続の失敗に数えません。
+    同じワーカーが ``max_restarts`` 回を超えて連続で失敗した場合は
+    全ワーカーを停止し、非 0 の終了コードで戻ります。
+
+    Args:
+        app: 事前読み込み済みのASGIアプリケーション
+        args: parse_args() の戻り値
+        sock: ワーカーで共有する listen ソケット
+        restart_delay: 最初の再起動までの待ち時間（秒）
+        max_restart_delay: 再起動までの待ち時間の上限（秒）
+        max_restarts: 諦めるまでに許す連続の再起動回数
+        stable_after: 正常に動いたとみなして失敗回数を戻す稼働時間（秒）
+    """
+
+    def __init__(
+        self,
+        app,
+        args,
+        sock: socket.socket,
+        *,
+        restart_delay: float = 0.5,
+        max_restart_delay: float = 30.0,
+        max_restarts: int = 5,
+        stable_after: float = 30.0,
+    ) -> None:
+        self._app = app
+        self._args = args
+        self._sock = sock
+        self._restart_delay = restart_delay
+        self._max_restart_delay = max_restart_delay
+        self._max_restarts = max_restarts
+        self._stable_after = stable_after
+        self._workers: dict[int, int] = {}
+        self._started: dict[int, float] = {}
+        self._failures: dict[int, int] = {}
+        self._pending: dict[int, float] = {}
+        self._stopping = False
+        self._reloading = False
+        self._exit_code = 0
+
+    def run(self) -> int:
+        """
+        ワーカーを起動して全ワーカーが終了するまで監視します
+
+        Returns:
+            int: 終了コード（停止要求による正常停止時は 0、
+            ワーカーが失敗し続けて諦めた場合は 1）
+        """
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGHUP, self._handle_reload)
+        for index in range(self._args.workers):
+            self._spawn(index)
+
+        while self._workers or self._pending:
+            if self._stopping:
+                self._pending.clear()
+            self._spawn_due()
+            try:
+                pid, status = self._wait()
+            except ChildProcessError:
+                break
+            index = self._workers.pop(pid, None)
+            if index is None or self._stopping:
+                continue
+            self._schedule_restart(index, pid, status)
+        return self._exit_code
+
+    def _wait(self) -> tuple[int, int]:
+        """ワーカーの終了を待ちます（再起動待ちがある間は短い間隔で確認）"""
+        if not self._pending:
+            return os.wait()
+        if self._workers:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid:
+                return pid, status
+        due = min(self._pending.values())
+        time.sleep(min(max(due - time.monotonic(), 0.0), _POLL_INTERVAL))
+        return 0, 0
+
+    def _spawn_due(self) -> None:
+        now = time.monotonic()
+        for index, due in list(self._pending.items()):
+            if due <= now:
+                del self._pending[index]
+                self._spawn(index)
+
+    def _schedule_restart(self, index: int, pid: int, status: int) -> None:
+        if time.monotonic() - self._started[index] >= self._stable_after:
+            self._failures[index] = 0
+        failures = self._failures.get(index, 0) + 1
+        self._failures[index] = failures
+        exit_code = os.waitstatus_to_exitcode(status)
+        if failures > self._max_restarts:
+            logger.error(
+                "ワーカー %d (pid=%d) が %d 回連続で終了しました（exit=%d）。"
+                "サーバーを停止します。",
+                index,
+                pid,
+                failures,
+                exit_code,
+            )
+            self._exit_code = 1
+            self._handle_stop(signal.SIGTERM, None)
+            return
+        delay = min(self._restart_delay * 2 ** (failures - 1), self._max_restart_delay)
+        logger.warning(
+            "ワーカー %d (pid=%d) が終了しました（exit=%d）。%.1f 秒後に再起動します。",
+            index,
+            pid,
+            exit_code,
+            delay,
+        )
+        self._pending[index] = time.monotonic() + delay
+
+    def _spawn(self, index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            # ワーカープロセス: シグナル処理は uvicorn に任せる
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            # lifespan でハンドラーを登録するまでの SIGHUP でワーカーを止めない
+            signal.signal(signal.SIGHUP, signal.SIG_IGN)
+            gc.enable()
+            exit_code = 0
+            try:
+                build_server(self._app, self._args, self._sock).run(
+                    sockets=[self._sock]
+                )
+            except BaseException:
+                logger.exception("ワーカー %d が異常終了しました", index)
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        self._workers[pid] = index
+        self._started[index] = time.monotonic()
+
+    def _handle_reload(self, signum: int, frame) -> None:
+        self._reload_master()
+        for pid in list(self._workers):
+            try:
+                os.kill(pid, signal.SIGHUP)
+            except ProcessLookupError:
+                pass
+
+    def _reload_master(self) -> None:
+        """フォーク元のマスターのルールセットを再読み込みする"""
+        if self._reloading:
+            # 再読み込み中に届いた SIGHUP は、実行中の再読み込みに任せる
+            return
+        self._reloading = True
+        try:
+            version = asyncio.run(_reload_in_master(self._app.state))
+        except Exception:
+            logger.exception("マスタープロセスの再読み込みに失敗しました")
+            return
+        finally:
+            self._reloading = False
+        if version is not None:
+            # 新しく構築したオブジェクトも、以後フォークするワーカーと共有する
+            gc.collect()
+            gc.freeze()
+            logger.info("マスタープロセスのルールセットを %s に切り替えました", version)
+
+    def _handle_stop(self, signum: int, frame) -> None:
+        self._stopping = True
+        for pid in list(self._workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+
+async def _reload_in_master(state) -> str | None:
+    """
+    マスタープロセスの共有リソースを再読み込みします
+
+    マスターにはイベントループがないため、asyncio.run() から呼び出します。
+    差し替えた古いバックエンドの解放はバックグラウンドのタスクで行われるため、
+    ループを閉じる前に完了を待ちます。
+
+    Args:
+        state: 事前読み込み済みのアプリケーションの app.state
+
+    Returns:
+        str | None: 共通のサービスを差し替えた場合は新しいバージョン
+    """
+    from app.presentation.api.hot_reload import reload_services
+
+    version = await reload_services(state, force=True)
+    disposals = asyncio.all_tasks() - {asyncio.current_task()}
+    await asyncio.gather(*disposals, return_exceptions=True)
+    return version
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    本番サーバーを起動します
+
+    ワーカー数が 1 の場合はフォークせず、マスタープロセスで
+    直接 uvicorn サーバーを実行します。
+
+    Args:
+        argv: コマンドライン引数（None の場合は sys.argv）
+
+    Returns:
+        int: 終了コード
+    """
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args(argv)
+    sock = bind_socket(args.host, args.port, args.backlog)
+    app = preload_application()
+    logger.info(
+        "listening on %s:%d (workers=%d, backlog=%d)",
+        *sock.getsockname()[:2],
+        args.workers,
+        args.backlog,
+    )
+
+    if args.workers == 1:
+        gc.enable()
+        build_server(app, args, sock).run(sockets=[sock])
+        return 0
+    try:
+        return PreforkSupervisor(app, args, sock).run()
+    finally:
+        # 共有メモリキャッシュ等、マスターが所有するリソースを解放する
+        from app.presentation.main import release_resources
+
+        release_resources(app)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+一括スクリーニング: ワーカー数とスループット
+
+約 1KB の応募者のテキストを含む JSONL を生成し、ワーカー数ごとの
+一括スクリーニングのスループット（件/秒）と、1ワーカーに対する
+速度向上を計測します。スクリーニングの実装は環境変数
+（``SCREENING_*``）で指定します（既定は echo）。
+
+使用例::
+
+    SCREENING_SCREENING_BACKEND=pii python scripts/benchmark_bulk.py --records 200000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.presentation.bulk_screening import run_bulk_screening  # noqa: E402
+
+SENTENCE = (
+    "前職では営業を担当しました。連絡先は taro.yamada@example.co.jp または"
+    " 090-1234-5678 です。土日の面接を希望します。"
+)
+
+
+def _write_input(path: Path, records: int) -> None:
+    content = SENTENCE * 8
+    with path.open("w", encoding="utf-8") as f:
+        for i in range(records):
+            f.write(json.dumps({"id": i, "content": content}, ensure_ascii=False))
+            f.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, cores} & set(range(1, cores + 1)))
+    with tempfile.TemporaryDirectory() as directory:
+        source = Path(directory) / "input.jsonl"
+        _write_input(source, args.records)
+        print("workers | records/s | speedup")
+        baseline = None
+        for workers in counts:
+            report = run_bulk_screening(
+                source,
+                Path(directory) / "output.jsonl",
+                workers=workers,
+                batch_size=args.batch_size,
+            )
+            baseline = baseline or report.throughput
+            print(
+                f"{workers:>7} | {report.throughput:9.0f} |"
+                f" {report.throughput / baseline:6.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+コーパスの読み込み: ファイルオブジェクトの行の反復と mmap の索引の比較
+
+約 1KB のレコードを含む JSONL を生成し、レコードの境界を求めて
+バッチに分けるまでの時間を計測します。
+
+- readline: ファイルオブジェクトを1行ずつ反復し、行のバイト列を作る
+  （ワーカーにはこのバイト列を pickle して渡す）
+- mmap index: CorpusReader で改行を一括走査し、終了位置の索引を作る
+  （ワーカーにはバイト範囲だけを渡す）
+
+使用例::
+
+    python scripts/benchmark_corpus.py --size-mb 512
+"""
+
+import argparse
+import json
+import pickle
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.infrastructure.corpus_reader import CorpusReader  # noqa: E402
+
+BATCH_SIZE = 64
+RECORD = {
+    "id": 0,
+    "content": "前職では営業を担当しました。土日の面接を希望します。" * 12,
+}
+
+
+def _write_input(path: Path, size: int) -> None:
+    line = json.dumps(RECORD, ensure_ascii=False).encode("utf-8") + b"\n"
+    with path.open("wb") as f:
+        f.write(line * max(1, size // len(line)))
+
+
+def _best_of(function: Callable[[], int], repeat: int) -> tuple[float, int]:
+    """repeat 回実行した中で最短の時間（ミリ秒）と、転送するバイト数を返す"""
+    best = float("inf")
+    payload = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        payload = function()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, payload
+
+
+def readline_batches(path: Path) -> int:
+    """行を反復してバッチを作り、ワーカーに渡す pickle の合計バイト数を返す"""
+    total = 0
+    batch: list[bytes] = []
+    with path.open("rb") as f:
+        for line in f:
+            batch.append(line)
+            if len(batch) >= BATCH_SIZE:
+                total += len(pickle.dumps(batch))
+                batch = []
+    return total + len(pickle.dumps(batch))
+
+
+def mmap_batches(path: Path) -> int:
+    """索引からバイト範囲のバッチを作り、ワーカーに渡す pickle の合計バイト数を返す"""
+    total = 0
+    with CorpusReader(path) as corpus:
+        ends = corpus.record_ends
+        for index in range(0, len(ends), BATCH_SIZE):
+            start = ends[index - 1] if index else 0
+            batch = (start, ends[index : index + BATCH_SIZE].tolist())
+            total += len(pickle.dumps(batch))
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=128)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "corpus.jsonl"
+        _write_input(path, args.size_mb * 1024 * 1024)
+        print("method     |       ms | pickled to workers")
+        for label, function in (
+            ("readline", readline_batches),
+            ("mmap index", mmap_batches),
+        ):
+            elapsed, payload = _best_of(lambda f=function: f(path), args.repeat)
+            print(f"{label:<10} | {elapsed:8.1f} | {payload / 1024 / 1024:10.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+JSON と MessagePack のエンコード・デコードの比較
+
+約 1KB / 100KB / 1MB の日本語テキストについて、
+
+- リクエスト: ボディのバイト列から ScreeningRequest を検証するまで
+  （JSON: ``model_validate_json``、MessagePack: ``unpackb`` + ``model_validate``）
+- レスポンス: ScreeningResponse をバイト列にするまで
+  （JSON: JSONResponse と同じ ``json.dumps``、MessagePack: ``packb``）
+
+の CPU 時間とバイト数を計測します。
+
+使用例::
+
+    python scripts/benchmark_msgpack.py --repeat 50
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.presentation.api.msgpack_codec import packb, unpackb  # noqa: E402
+from app.presentation.api.schemas.screening import (  # noqa: E402
+    ScreeningRequest,
+    ScreeningResponse,
+)
+
+SENTENCE = "男性限定の募集です。経験者歓迎、土日休み、連絡は「担当」まで。\n"
+SIZES = {"1KB": 1_000, "100KB": 100_000, "1MB": 1_000_000}
+
+
+def _japanese_text(size: int) -> str:
+    """UTF-8 で約 size バイトの日本語テキストを作る"""
+    sentence_bytes = len(SENTENCE.encode("utf-8"))
+    return SENTENCE * max(1, size // sentence_bytes)
+
+
+def _best_of(function: Callable[[], object], repeat: int) -> float:
+    """repeat 回実行した中で最短の時間（ミリ秒）を返す"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def _dumps(content: object) -> bytes:
+    """JSONResponse と同じ設定で JSON にエンコードする"""
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def measure(content: str, repeat: int) -> list[tuple[str, str, int, float]]:
+    """1つのテキストについて (経路, 形式, バイト数, ミリ秒) の一覧を返す"""
+    json_body = _dumps({"content": content})
+    msgpack_body = packb({"content": content})
+    response = ScreeningResponse(content=content)
+    return [
+        (
+            "request",
+            "json",
+            len(json_body),
+            _best_of(lambda: ScreeningRequest.model_validate_json(json_body), repeat),
+        ),
+        (
+            "request",
+            "msgpack",
+            len(msgpack_body),
+            _best_of(
+                lambda: ScreeningRequest.model_validate(unpackb(msgpack_body)), repeat
+            ),
+        ),
+        (
+            "response",
+            "json",
+            len(json_body),
+            _best_of(lambda: _dumps(response.model_dump(mode="json")), repeat),
+        ),
+        (
+            "response",
+            "msgpack",
+            len(msgpack_body),
+            _best_of(lambda: packb(response.model_dump(mode="json")), repeat),
+        ),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print("size  | path     | format  |   bytes   |      ms")
+    for label, size in SIZES.items():
+        rows = measure(_japanese_text(size), args.repeat)
+        for path, name, length, elapsed in rows:
+            print(f"{label:<5} | {path:<8} | {name:<7} | {length:9d} | {elapsed:7.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+優先度レーンの有無による interactive のレイテンシと bulk のスループットの比較
+
+処理時間が一定（``--service-ms``）で同時実行数が ``--concurrency`` の
+バックエンドに対して、
+
+- bulk: ``--bulk-workers`` 個のワーカーが応答を待たずに連続して要求を送る
+- interactive: 毎秒 ``--interactive-rps`` 件がポアソン到着する
+
+負荷を ``--duration`` 秒かけ、次の2通りで比較します。
+
+- FIFO: すべての要求を1つの待ち行列で処理（bulk も interactive レーンに入れる）
+- lanes: interactive と bulk を別のレーンに分け、重み付き公平キューイングで処理
+
+HTTP サーバーは介さず、PriorityScheduler を直接使用します。
+
+使用例::
+
+    python scripts/benchmark_priority_lanes.py --bulk-workers 200
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.usecase.priority_scheduler import Priority, PriorityScheduler  # noqa: E402
+
+
+def _percentile(samples: list[float], quantile: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+
+async def run(args: argparse.Namespace, *, lanes: bool) -> tuple[list[float], int]:
+    """負荷をかけ、(interactive のレイテンシ一覧, bulk の完了数) を返す"""
+    scheduler = PriorityScheduler(args.concurrency)
+    bulk_lane = Priority.BULK if lanes else Priority.INTERACTIVE
+    deadline = time.perf_counter() + args.duration
+    latencies: list[float] = []
+    bulk_done = 0
+
+    async def call(priority: Priority) -> None:
+        async with scheduler.slot(priority):
+            await asyncio.sleep(args.service_ms / 1000)
+
+    async def bulk_worker() -> None:
+        nonlocal bulk_done
+        while time.perf_counter() < deadline:
+            await call(bulk_lane)
+            bulk_done += 1
+
+    async def interactive_request() -> None:
+        started = time.perf_counter()
+        await call(Priority.INTERACTIVE)
+        latencies.append(time.perf_counter() - started)
+
+    async def interactive_arrivals() -> None:
+        requests = []
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(random.expovariate(args.interactive_rps))
+            requests.append(asyncio.create_task(interactive_request()))
+        await asyncio.gather(*requests)
+
+    await asyncio.gather(
+        interactive_arrivals(), *(bulk_worker() for _ in range(args.bulk_workers))
+    )
+    return latencies, bulk_done
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--service-ms", type=float, default=5.0)
+    parser.add_argument("--bulk-workers", type=int, default=200)
+    parser.add_argument("--interactive-rps", type=float, default=100.0)
+    args = parser.parse_args()
+
+    print(
+        f"同時実行 {args.concurrency}、処理 {args.service_ms}ms、"
+        f"bulk ワーカー {args.bulk_workers}、interactive {args.interactive_rps}/s"
+    )
+    print("mode  | interactive p50 ms | p95 ms | bulk req/s")
+    for name, lanes in (("FIFO", False), ("lanes", True)):
+        latencies, bulk_done = asyncio.run(run(args, lanes=lanes))
+        print(
+            f"{name:<5} | {_percentile(latencies, 0.5) * 1000:18.1f} | "
+            f"{_percentile(latencies, 0.95) * 1000:6.1f} | "
+            f"{bulk_done / args.duration:10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+レート制限ミドルウェアのオーバーヘッド計測
+
+``--clients`` 件（デフォルト 100,000）の異なるクライアントから順に
+リクエストが届く状況で、
+
+- TokenBucketLimiter.acquire() 1回あたりの時間
+- 何もしない ASGI アプリに対する RateLimitMiddleware 1回あたりの追加時間
+- 全クライアントの状態を保持するのに必要なメモリ
+
+を計測します。ASGI アプリは HTTP サーバーを介さず直接呼び出すため、
+ミドルウェア自身のコストだけが現れます。
+
+使用例::
+
+    python scripts/benchmark_rate_limit.py --clients 100000 --rounds 3
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.infrastructure.token_bucket import TokenBucketLimiter  # noqa: E402
+from app.presentation.api.rate_limit import RateLimitMiddleware  # noqa: E402
+
+
+async def _empty_app(scope, receive, send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _receive() -> dict:
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message) -> None:
+    pass
+
+
+def _scopes(clients: int) -> list[dict]:
+    return [
+        {
+            "type": "http",
+            "path": "/v1/screenings",
+            "headers": [(b"x-api-key", f"client-{index}".encode())],
+            "client": ("127.0.0.1", 50000),
+        }
+        for index in range(clients)
+    ]
+
+
+async def _drive(app, scopes: list[dict], rounds: int) -> float:
+    """全クライアントから rounds 回ずつ呼び出し、1回あたりのマイクロ秒を返す"""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for scope in scopes:
+            await app(scope, _receive, _send)
+    return (time.perf_counter() - started) / (len(scopes) * rounds) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    def new_limiter() -> TokenBucketLimiter:
+        return TokenBucketLimiter(
+            rate=10, burst=args.rounds + 1, max_clients=args.clients
+        )
+
+    keys = [f"key:client-{index}" for index in range(args.clients)]
+
+    # 計測中にバケットが満杯に戻って削除されないよう、時計を止めて計測する
+    tracemalloc.start()
+    limiter = TokenBucketLimiter(
+        rate=10, burst=1, max_clients=args.clients, clock=lambda: 0.0
+    )
+    before = tracemalloc.get_traced_memory()[0]
+    for key in keys:
+        limiter.acquire(key)
+    memory = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    limiter = new_limiter()
+    started = time.perf_counter()
+    for _ in range(args.rounds):
+        for key in keys:
+            limiter.acquire(key)
+    acquire_us = (time.perf_counter() - started) / (args.clients * args.rounds) * 1e6
+
+    scopes = _scopes(args.clients)
+    bare_us = asyncio.run(_drive(_empty_app, scopes, args.rounds))
+    # 生成したAPIキーをすべて登録済みとして扱い、クライアント数ぶんの状態を作る
+    middleware = RateLimitMiddleware(
+        _empty_app, limiter=new_limiter(), key_validator=lambda scope, key: True
+    )
+    limited_us = asyncio.run(_drive(middleware, scopes, args.rounds))
+
+    print(f"{args.clients} クライアント × {args.rounds} 回")
+    print(f"acquire()            : {acquire_us:6.2f} us/req")
+    print(f"ASGI アプリのみ      : {bare_us:6.2f} us/req")
+    print(f"RateLimitMiddleware  : {limited_us:6.2f} us/req")
+    print(f"ミドルウェアの追加分 : {limited_us - bare_us:6.2f} us/req")
+    print(
+        f"状態のメモリ         : {memory / 1024 / 1024:6.1f} MiB "
+        f"({memory / args.clients:.0f} B/クライアント、キー文字列を除く)"
+    )
+
+
+if __name__ == "__main__":
+    main()
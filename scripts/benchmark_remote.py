@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+外部スコアリングAPIアダプターのベンチマーク
+
+ローカルのスコアリングAPIスタブ（``tests/stubs/scoring_server.py``）を起動し、
+RemoteScreeningService の長寿命コネクションプールと、リクエストごとに
+クライアントを作成する素朴な実装のスループットを比較します。
+``--batch-size`` を指定すると、MicroBatchingScreeningService を重ねた
+場合のスループットと達成したバッチサイズも計測します。
+
+使用例::
+
+    python scripts/benchmark_remote.py --requests 2000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.infrastructure.micro_batching_service import (  # noqa: E402
+    MicroBatchingScreeningService,
+)
+from app.infrastructure.remote_screening_service import (  # noqa: E402
+    SCORE_PATH,
+    RemoteScreeningService,
+)
+
+CONTENT = "経験者歓迎。男性限定ではありません。" * 10
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _run(call, requests: int, concurrency: int) -> float:
+    """call() を並行度 concurrency で requests 回実行し、req/s を返す"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            await call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+async def bench_pooled(base_url: str, requests: int, concurrency: int) -> float:
+    """長寿命コネクションプールを共有する RemoteScreeningService"""
+    service = RemoteScreeningService(base_url, max_connections=concurrency)
+    await service.start()
+    try:
+        return await _run(lambda: service.analyze(CONTENT), requests, concurrency)
+    finally:
+        await service.aclose()
+
+
+async def bench_batched(
+    base_url: str, requests: int, concurrency: int, batch_size: int, max_wait_ms: float
+) -> float:
+    """RemoteScreeningService に MicroBatchingScreeningService を重ねた構成"""
+    service = MicroBatchingScreeningService(
+        RemoteScreeningService(base_url, max_connections=concurrency),
+        max_batch_size=batch_size,
+        max_wait_ms=max_wait_ms,
+    )
+    await service.start()
+    try:
+        rps = await _run(lambda: service.analyze(CONTENT), requests, concurrency)
+    finally:
+        await service.aclose()
+    stats = service.stats
+    print(
+        f"{'':20s}  mean batch {stats.mean_batch_size:.1f}, "
+        f"mean queue delay {stats.mean_queue_delay_ms:.2f} ms, "
+        f"max queue delay {stats.max_queue_delay * 1000:.2f} ms"
+    )
+    return rps
+
+
+async def bench_per_request(base_url: str, requests: int, concurrency: int) -> float:
+    """リクエストごとにクライアント（とTCP接続）を作成する実装"""
+
+    async def call() -> None:
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            response = await client.post(SCORE_PATH, json={"content": CONTENT})
+            response.raise_for_status()
+
+    return await _run(call, requests, concurrency)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--batch-size", type=int, default=0)
+    parser.add_argument("--batch-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    port = _free_port()
+    stub = subprocess.Popen(
+        [sys.executable, "-m", "tests.stubs.scoring_server", "--port", str(port)]
+        + ["--latency-ms", str(args.latency_ms)],
+        cwd=project_root,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.post(f"{base_url}{SCORE_PATH}", json={"content": ""})
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+
+        for name, bench in [
+            ("pooled client", bench_pooled),
+            ("client per request", bench_per_request),
+        ]:
+            rps = asyncio.run(bench(base_url, args.requests, args.concurrency))
+            print(f"{name:20s}: {rps:10.1f} req/s")
+        if args.batch_size > 0:
+            rps = asyncio.run(
+                bench_batched(
+                    base_url,
+                    args.requests,
+                    args.concurrency,
+                    args.batch_size,
+                    args.batch_wait_ms,
+                )
+            )
+            print(f"{'micro-batched':20s}: {rps:10.1f} req/s")
+    finally:
+        stub.terminate()
+        stub.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
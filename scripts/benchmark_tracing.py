@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+トレーシング: ユースケースとサービスのスパンのオーバーヘッド
+
+ユースケース → スクリーニングサービス → バックエンドの1回の呼び出しを
+トレーシングなし、標本化率 0（識別子の伝搬のみ）、標本化率 1（全件を
+記録し、バックグラウンドで書き出す）で繰り返し、1回あたりの時間を
+比較します。書き出しは何もしないエクスポーターに対して行います。
+
+使用例::
+
+    python scripts/benchmark_tracing.py --calls 200000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.infrastructure.screening_service_impl import (  # noqa: E402
+    EchoScreeningService,
+)
+from app.infrastructure.traced_screening_service import (  # noqa: E402
+    TracedScreeningService,
+)
+from app.infrastructure.tracing import Tracer  # noqa: E402
+from app.usecase.screening_usecase import ScreeningUsecase  # noqa: E402
+
+
+class NullExporter:
+    def export(self, spans) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _usecase(tracer: Tracer | None) -> ScreeningUsecase:
+    service = EchoScreeningService()
+    if tracer is not None:
+        service = TracedScreeningService(service, tracer, name="screening.backend")
+        service = TracedScreeningService(service, tracer, name="screening.service")
+    return ScreeningUsecase(service, tracer=tracer)
+
+
+async def _measure(usecase: ScreeningUsecase, calls: int) -> float:
+    """1回あたりの時間（マイクロ秒）を返す"""
+    started = time.perf_counter()
+    for _ in range(calls):
+        await usecase.analyze("応募者のテキスト")
+    return (time.perf_counter() - started) / calls * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print("tracing        | us/call | spans exported")
+    for label, ratio in (("off", None), ("sample 0.0", 0.0), ("sample 1.0", 1.0)):
+        tracer = None if ratio is None else Tracer(NullExporter(), sample_ratio=ratio)
+        elapsed = asyncio.run(_measure(_usecase(tracer), args.calls))
+        dropped = 0
+        if tracer is not None:
+            tracer.shutdown()
+            dropped = tracer.processor.dropped
+        exported = 0 if not ratio else 3 * args.calls - dropped
+        print(f"{label:<14} | {elapsed:7.2f} | {exported}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+WebSocket セッションと HTTP Keep-Alive のスループット比較
+
+``main.py`` を起動し、同じ件数の小さなスクリーニングを
+
+- HTTP: Keep-Alive の接続プール上で POST /v1/screenings を並行送信
+- WebSocket: /v1/screenings/ws の少数の接続上で相関ID付きメッセージを
+  パイプライン送信（接続ごとに最大 ``--window`` 件を応答待ちにする）
+
+の2通りで送り、スループットとレイテンシを比較します。
+計測値にはクライアント側（1プロセス）の処理コストも含まれるため、
+絶対値よりも同じ環境での比率を参照してください。
+
+使用例::
+
+    python scripts/benchmark_websocket.py --requests 20000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from websockets.asyncio.client import connect
+
+project_root = Path(__file__).parent.parent
+
+CONTENT = "経験者歓迎。土日休み。"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(samples: list[float], quantile: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+
+async def bench_http(
+    base_url: str, requests: int, concurrency: int
+) -> tuple[float, list[float]]:
+    """Keep-Alive の接続プールで requests 件を送り、(req/s, レイテンシ) を返す"""
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    latencies: list[float] = []
+    remaining = requests
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                response = await client.post(
+                    "/v1/screenings", json={"content": CONTENT}
+                )
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - start), latencies
+
+
+async def bench_websocket(
+    ws_url: str, requests: int, connections: int, window: int
+) -> tuple[float, list[float]]:
+    """接続ごとに最大 window 件をパイプライン送信し、(req/s, レイテンシ) を返す"""
+    latencies: list[float] = []
+    per_connection = [requests // connections] * connections
+    per_connection[0] += requests - sum(per_connection)
+
+    async def session(count: int) -> None:
+        sent_at: dict[str, float] = {}
+        slots = asyncio.Semaphore(window)
+        async with connect(ws_url, max_size=None) as websocket:
+
+            async def send_all() -> None:
+                for index in range(count):
+                    await slots.acquire()
+                    message_id = str(index)
+                    sent_at[message_id] = time.perf_counter()
+                    await websocket.send(
+                        json.dumps({"id": message_id, "content": CONTENT})
+                    )
+
+            sender = asyncio.create_task(send_all())
+            for _ in range(count):
+                reply = json.loads(await websocket.recv())
+                if "error" in reply:
+                    raise RuntimeError(reply["error"])
+                latencies.append(time.perf_counter() - sent_at.pop(reply["id"]))
+                slots.release()
+            await sender
+
+    start = time.perf_counter()
+    await asyncio.gather(*(session(count) for count in per_connection))
+    return requests / (time.perf_counter() - start), latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=64, help="HTTP の並行数")
+    parser.add_argument("--connections", type=int, default=2, help="WebSocket 接続数")
+    parser.add_argument("--window", type=int, default=32, help="接続ごとの応答待ち件数")
+    args = parser.parse_args()
+
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "main.py", "--workers", "1"]
+        + ["--host", "127.0.0.1", "--port", str(port)],
+        cwd=project_root,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(150):
+            try:
+                httpx.get(f"{base_url}/health").raise_for_status()
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+
+        results = {
+            "HTTP keep-alive": asyncio.run(
+                bench_http(base_url, args.requests, args.concurrency)
+            ),
+            "WebSocket": asyncio.run(
+                bench_websocket(
+                    f"ws://127.0.0.1:{port}/v1/screenings/ws",
+                    args.requests,
+                    args.connections,
+                    args.window,
+                )
+            ),
+        }
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+    print(f"{args.requests} 件のスクリーニング（1ワーカー）")
+    print("mode            |      req/s |  p50 ms |  p99 ms")
+    for name, (rps, latencies) in results.items():
+        print(
+            f"{name:<15} | {rps:10.1f} | {_percentile(latencies, 0.5) * 1000:7.2f} | "
+            f"{_percentile(latencies, 0.99) * 1000:7.2f}"
+        )
+    http_rps = results["HTTP keep-alive"][0]
+    print(f"WebSocket / HTTP: {results['WebSocket'][0] / http_rps:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+マルチプロセスサーバーのメモリ・スループットベンチマーク
+
+``main.py`` をワーカー数 1〜N で順に起動し、ワーカーごとの常駐メモリ
+（RSS / PSS / USS）と POST /v1/screenings のスループットを計測します。
+PSS と USS を比較することで、コピーオンライトによる共有ページの効果を確認できます。
+
+使用例::
+
+    python scripts/benchmark_workers.py --max-workers 4 --duration 5
+"""
+
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+project_root = Path(__file__).parent.parent
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def read_memory_kib(pid: int) -> dict[str, int]:
+    """
+    /proc/<pid>/smaps_rollup からメモリ使用量を取得
+
+    Returns:
+        dict: Rss, Pss, USS（Private_Clean + Private_Dirty）を KiB 単位で格納
+    """
+    values: dict[str, int] = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        key, value = line.split(":", 1)
+        values[key] = int(value.split()[0])
+    return {
+        "rss": values["Rss"],
+        "pss": values["Pss"],
+        "uss": values["Private_Clean"] + values["Private_Dirty"],
+    }
+
+
+async def measure_throughput(
+    base_url: str, duration: float, concurrency: int
+) -> tuple[int, float]:
+    """
+    一定時間、並行クライアントでリクエストを送り続けて完了数を数える
+
+    Returns:
+        tuple: (完了リクエスト数, 経過秒数)
+    """
+    limits = httpx.Limits(max_connections=concurrency)
+    payload = {"content": "この求人は素晴らしい機会です。" * 20}
+    completed = 0
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        start = time.perf_counter()
+        deadline = start + duration
+
+        async def worker() -> None:
+            nonlocal completed
+            while time.perf_counter() < deadline:
+                response = await client.post("/v1/screenings", json=payload)
+                response.raise_for_status()
+                completed += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return completed, time.perf_counter() - start
+
+
+def run_benchmark(workers: int, duration: float, concurrency: int) -> dict:
+    """指定ワーカー数でサーバーを起動して計測"""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "main.py", "--workers", str(workers)]
+        + ["--host", "127.0.0.1", "--port", str(port)],
+        cwd=project_root,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(150):
+            try:
+                httpx.get(f"{base_url}/health").raise_for_status()
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+
+        completed, elapsed = asyncio.run(
+            measure_throughput(base_url, duration, concurrency)
+        )
+        if workers > 1:
+            children = Path(f"/proc/{process.pid}/task/{process.pid}/children")
+            cmdline = Path(f"/proc/{process.pid}/cmdline").read_bytes()
+            # resource_tracker 等、ワーカー以外の子プロセスを除外する
+            pids = [
+                int(pid)
+                for pid in children.read_text().split()
+                if Path(f"/proc/{pid}/cmdline").read_bytes() == cmdline
+            ]
+        else:
+            pids = [process.pid]
+        memory = [read_memory_kib(pid) for pid in pids]
+        return {
+            "workers": workers,
+            "rps": completed / elapsed,
+            "rss": sum(m["rss"] for m in memory) / len(memory),
+            "pss": sum(m["pss"] for m in memory) / len(memory),
+            "uss": sum(m["uss"] for m in memory) / len(memory),
+        }
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-workers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    print("workers |      req/s | scaling | RSS/worker | PSS/worker | USS/worker")
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        result = run_benchmark(workers, args.duration, args.concurrency)
+        baseline = baseline or result["rps"]
+        print(
+            f"{result['workers']:7d} | {result['rps']:10.1f} | "
+            f"{result['rps'] / baseline:6.2f}x | "
+            f"{result['rss'] / 1024:7.1f}MiB | {result['pss'] / 1024:7.1f}MiB | "
+            f"{result['uss'] / 1024:7.1f}MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+mmap 形式のスクリーニング成果物のビルド
+
+ルールソース（JSON）や学習済みの n-gram モデル（``.npz``）を、全ワーカーで
+共有できる mmap 形式の成果物ディレクトリに変換します。同じディレクトリへの
+再ビルドはマニフェストの置き換えで原子的に反映されます。
+
+使用例::
+
+    python scripts/build_artifacts.py rules rules/screening.json -o artifacts/rules
+    python scripts/build_artifacts.py ngram models/ngram.npz -o artifacts/ngram
+    python scripts/build_artifacts.py inspect artifacts/rules --verify
+
+    SCREENING_SCREENING_BACKEND=rules \\
+        SCREENING_RULES_ARTIFACT_PATH=artifacts/rules python main.py
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.infrastructure.artifacts import (  # noqa: E402
+    ArtifactError,
+    ArtifactManifest,
+    open_artifact,
+)
+from app.infrastructure.rule_automaton import (  # noqa: E402
+    build_rule_artifact,
+    load_rule_source,
+)
+
+
+def build_rules(args: argparse.Namespace) -> ArtifactManifest:
+    rules = load_rule_source(args.source)
+    manifest = build_rule_artifact(rules, args.output)
+    print(f"{len(rules)} 件のルールをコンパイルしました")
+    return manifest
+
+
+def build_ngram(args: argparse.Namespace) -> ArtifactManifest:
+    # NumPy は任意依存のため、n-gram モデルを変換する場合のみ読み込む
+    from app.infrastructure.ngram_model import NgramLinearModel
+
+    return NgramLinearModel.load(args.source).save_artifact(args.output)
+
+
+def inspect(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    with open_artifact(args.directory, verify=args.verify) as artifact:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        manifest = artifact.manifest
+        print(f"kind:    {manifest.kind}")
+        print(f"version: {manifest.version}")
+        for name, entry in sorted(manifest.arrays.items()):
+            size = entry["length"] * entry["itemsize"]
+            print(f"  {name:<16} {entry['dtype']} x {entry['length']:>10} ({size} B)")
+        if args.metadata:
+            print(json.dumps(manifest.metadata, ensure_ascii=False, indent=2))
+    verified = "（検証済み）" if args.verify else ""
+    print(f"open: {elapsed_ms:.2f} ms{verified}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rules = commands.add_parser("rules", help="ルールソースから成果物を作成")
+    rules.add_argument("source", type=Path, help="ルールソース（JSON）")
+    rules.add_argument("-o", "--output", type=Path, required=True)
+    rules.set_defaults(build=build_rules)
+
+    ngram = commands.add_parser("ngram", help="n-gram モデルから成果物を作成")
+    ngram.add_argument("source", type=Path, help="学習済みモデル（.npz）")
+    ngram.add_argument("-o", "--output", type=Path, required=True)
+    ngram.set_defaults(build=build_ngram)
+
+    inspect_parser = commands.add_parser("inspect", help="成果物の内容を表示")
+    inspect_parser.add_argument("directory", type=Path)
+    inspect_parser.add_argument("--verify", action="store_true")
+    inspect_parser.add_argument("--metadata", action="store_true")
+
+    args = parser.parse_args()
+    try:
+        if args.command == "inspect":
+            inspect(args)
+            return
+        started = time.perf_counter()
+        manifest = args.build(args)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+    except ArtifactError as exc:
+        parser.exit(1, f"error: {exc}\n")
+    print(f"{manifest.kind} 成果物を {args.output} に書き出しました")
+    print(f"version: {manifest.version} ({elapsed_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 """
-OpenAPI 仕様書をYAML形式でエクスポートするスクリプト
+OpenAPI 仕様書をエクスポートするスクリプト
 
 FastAPIアプリケーションからOpenAPI 3.1仕様を取得し、
-YAML形式で openapi.yaml に保存します。
+YAML形式で openapi.yaml に、JSON形式で openapi.json に保存します。
+openapi.json はアプリケーションが実行時生成の代わりにそのまま配信する
+ビルド時成果物です。
+
+``--check`` を指定すると、ファイルを書き換えずに成果物がルートや
+スキーマの現状と一致しているかを検証し、古い場合は終了コード 1 で終了します。
 """
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -13,16 +19,12 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from app.presentation.main import app
-
+from app.presentation.api.openapi_document import serialize_openapi  # noqa: E402
+from app.presentation.main import app  # noqa: E402
 
-def export_openapi_to_yaml(output_path: str = "openapi.yaml") -> None:
-    """
-    OpenAPI仕様をYAML形式でエクスポート
 
-    Args:
-        output_path: 出力ファイルパス（デフォルト: openapi.yaml）
-    """
+def _render_yaml(openapi_schema: dict) -> str:
+    """OpenAPI仕様をYAML文字列に変換"""
     try:
         import yaml
     except ImportError:
@@ -30,6 +32,21 @@ def export_openapi_to_yaml(output_path: str = "openapi.yaml") -> None:
         print("インストール: uv add pyyaml")
         sys.exit(1)
 
+    return yaml.dump(
+        openapi_schema,
+        allow_unicode=True,
+        default_flow_style=False,
+        sort_keys=False,
+    )
+
+
+def export_openapi_to_yaml(output_path: str = "openapi.yaml") -> None:
+    """
+    OpenAPI仕様をYAML形式でエクスポート
+
+    Args:
+        output_path: 出力ファイルパス（デフォルト: openapi.yaml）
+    """
     # OpenAPI仕様を取得
     openapi_schema = app.openapi()
 
@@ -37,14 +54,7 @@ def export_openapi_to_yaml(output_path: str = "openapi.yaml") -> None:
     output_file = project_root / output_path
 
     # YAML形式で保存
-    with open(output_file, "w", encoding="utf-8") as f:
-        yaml.dump(
-            openapi_schema,
-            f,
-            allow_unicode=True,
-            default_flow_style=False,
-            sort_keys=False,
-        )
+    output_file.write_text(_render_yaml(openapi_schema), encoding="utf-8")
 
     print(f"✅ OpenAPI仕様を {output_file} に保存しました")
     print(f"📄 OpenAPIバージョン: {openapi_schema.get('openapi', 'N/A')}")
@@ -53,5 +63,63 @@ def export_openapi_to_yaml(output_path: str = "openapi.yaml") -> None:
     print(f"🛣️  エンドポイント数: {len(openapi_schema.get('paths', {}))}")
 
 
+def export_openapi_to_json(output_path: str = "openapi.json") -> None:
+    """
+    OpenAPI仕様をアプリケーションが配信するJSON成果物としてエクスポート
+
+    Args:
+        output_path: 出力ファイルパス（デフォルト: openapi.json）
+    """
+    output_file = project_root / output_path
+    output_file.write_bytes(serialize_openapi(app.openapi()))
+
+    print(f"✅ OpenAPI仕様を {output_file} に保存しました")
+
+
+def check_openapi_artifacts(
+    json_path: str = "openapi.json", yaml_path: str = "openapi.yaml"
+) -> bool:
+    """
+    成果物が現在のルート・スキーマから生成される内容と一致するか検証
+
+    Args:
+        json_path: 検証するJSON成果物のパス
+        yaml_path: 検証するYAML成果物のパス
+
+    Returns:
+        bool: すべての成果物が最新であれば True
+    """
+    openapi_schema = app.openapi()
+    expected = {
+        json_path: serialize_openapi(openapi_schema),
+        yaml_path: _render_yaml(openapi_schema).encode("utf-8"),
+    }
+
+    up_to_date = True
+    for path, content in expected.items():
+        artifact = project_root / path
+        if not artifact.exists() or artifact.read_bytes() != content:
+            print(f"❌ {artifact} が古くなっています")
+            up_to_date = False
+
+    if up_to_date:
+        print("✅ OpenAPI成果物は最新です")
+    else:
+        print("再生成: python scripts/export_openapi.py")
+    return up_to_date
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="成果物を書き換えずに最新かどうかを検証する",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(0 if check_openapi_artifacts() else 1)
+
     export_openapi_to_yaml()
+    export_openapi_to_json()
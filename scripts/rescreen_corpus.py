@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+ルールセットの変更に伴う保存済みドキュメントの差分の再スクリーニング
+
+結果ストア（SQLite）に保存したドキュメントのうち、前回の実行から
+追加・削除・変更されたルールの語句を含み得るものだけを、新しい
+ルールセットで再スクリーニングします。再スクリーニングした数と
+省いた数を表示します。ストアには ``scripts/screen_bulk.py --store`` で
+ドキュメントを保存します。
+
+``--watch`` を指定すると、ルールセットの更新を監視して更新のたびに
+実行するバックグラウンドジョブとして動作します。
+
+使用例::
+
+    python scripts/rescreen_corpus.py corpus.db --rules artifacts/rules
+    python scripts/rescreen_corpus.py corpus.db --rules-source rules/screening.json
+    python scripts/rescreen_corpus.py corpus.db --rules artifacts/rules --watch 30 &
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.infrastructure.incremental_rescreen import (  # noqa: E402
+    RescreenReport,
+    rescreen_changed,
+)
+from app.infrastructure.reloadable_screening_service import (  # noqa: E402
+    file_fingerprint,
+)
+from app.infrastructure.result_store import ScreeningResultStore  # noqa: E402
+from app.infrastructure.rule_screening_service import (  # noqa: E402
+    RuleScreeningService,
+)
+
+
+def load_service(args: argparse.Namespace) -> RuleScreeningService:
+    if args.rules_source is not None:
+        return RuleScreeningService.compile_source(args.rules_source)
+    return RuleScreeningService.open(args.rules)
+
+
+def print_report(report: RescreenReport, elapsed: float) -> None:
+    terms = "全件" if report.changed_terms is None else f"{report.changed_terms} 語"
+    print(f"version:    {report.version}")
+    print(f"documents:  {report.total}（変更された語句: {terms}）")
+    print(f"rescreened: {report.rescreened}（結果が変わったもの: {report.changed}）")
+    print(f"skipped:    {report.skipped}")
+    print(f"elapsed:    {elapsed:.2f} s")
+
+
+async def run_once(args: argparse.Namespace, store: ScreeningResultStore) -> None:
+    service = load_service(args)
+    try:
+        started = time.perf_counter()
+        report = await rescreen_changed(store, service, batch_size=args.batch_size)
+        print_report(report, time.perf_counter() - started)
+    finally:
+        service.close()
+
+
+async def watch(args: argparse.Namespace, store: ScreeningResultStore) -> None:
+    path = args.rules_source if args.rules_source is not None else args.rules
+    fingerprint = None
+    while True:
+        current = file_fingerprint(path)
+        if current is not None and current != fingerprint:
+            fingerprint = current
+            await run_once(args, store)
+        await asyncio.sleep(args.watch)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("store", type=Path, help="結果ストア（SQLite）")
+    rules = parser.add_mutually_exclusive_group(required=True)
+    rules.add_argument("--rules", type=Path, help="ルールセット成果物のディレクトリ")
+    rules.add_argument("--rules-source", type=Path, help="ルールソース（JSON）")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument(
+        "--watch",
+        type=float,
+        default=0.0,
+        help="ルールセットの更新を確認する間隔（秒）",
+    )
+    args = parser.parse_args()
+
+    with ScreeningResultStore(args.store) as store:
+        try:
+            asyncio.run(watch(args, store) if args.watch > 0 else run_once(args, store))
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+JSONL / CSV ファイルのオフラインの一括スクリーニング
+
+HTTP を経由せずに、入力ファイルのレコードをプロセスプールで
+スクリーニングし、結果を入力の順に JSONL に書き出します。スクリーニングの
+実装は API サーバーと同じ環境変数（``SCREENING_*``）で指定します。
+中断した場合は ``--resume`` で続きから再開できます。``--store`` を
+指定すると本文と結果を結果ストア（SQLite）にも保存し、ルールセットの
+変更時に ``scripts/rescreen_corpus.py`` で差分だけを再スクリーニングできます。
+
+使用例::
+
+    SCREENING_SCREENING_BACKEND=rules SCREENING_RULES_ARTIFACT_PATH=artifacts/rules \\
+        python scripts/screen_bulk.py applicants.jsonl -o results.jsonl --workers 8
+    python scripts/screen_bulk.py applicants.csv -o results.jsonl --content-field body
+    python scripts/screen_bulk.py applicants.jsonl -o results.jsonl --resume
+    python scripts/screen_bulk.py applicants.jsonl -o results.jsonl --store corpus.db
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.presentation.bulk_screening import run_bulk_screening  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("input", type=Path, help="入力ファイル（JSONL または CSV）")
+    parser.add_argument("-o", "--output", type=Path, required=True)
+    parser.add_argument("--format", choices=["jsonl", "csv"], default=None)
+    parser.add_argument("--id-field", default="id")
+    parser.add_argument("--content-field", default="content")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--max-in-flight", type=int, default=None)
+    parser.add_argument(
+        "--resume", action="store_true", help="チェックポイントから再開"
+    )
+    parser.add_argument(
+        "--store", type=Path, default=None, help="本文と結果を保存する結果ストア"
+    )
+    args = parser.parse_args()
+
+    report = run_bulk_screening(
+        args.input,
+        args.output,
+        input_format=args.format,
+        id_field=args.id_field,
+        content_field=args.content_field,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        max_in_flight=args.max_in_flight,
+        resume=args.resume,
+        store_path=args.store,
+    )
+    if report.resumed_from:
+        print(f"オフセット {report.resumed_from} から再開しました")
+    print(
+        f"{report.records} 件（解析できなかったもの {report.errors} 件）を"
+        f" {report.elapsed:.1f} 秒でスクリーニングしました"
+        f"（{report.throughput:.0f} 件/秒）"
+    )
+    if report.degraded:
+        print(
+            f"{report.degraded} 件はフォールバックによる暫定の結果です"
+            '（出力の "degraded": true の行を再スクリーニングしてください）'
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+文字n-gram線形モデルの学習
+
+``{"content": "...", "label": 0|1}`` を1行ずつ含むJSONLファイルから
+NgramLinearModel を学習し、``ngram`` バックエンドで読み込める
+``.npz`` ファイルとして保存します。
+
+使用例::
+
+    python scripts/train_ngram_model.py data/labeled.jsonl -o models/ngram.npz
+    SCREENING_SCREENING_BACKEND=ngram SCREENING_NGRAM_MODEL_PATH=models/ngram.npz \\
+        python main.py
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.infrastructure.ngram_model import (  # noqa: E402
+    HashedNgramVectorizer,
+    NgramLinearModel,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("data", type=Path, help="学習データ（JSONL）")
+    parser.add_argument("-o", "--output", type=Path, required=True)
+    parser.add_argument("--n-features", type=int, default=2**18)
+    parser.add_argument("--ngram-max", type=int, default=3)
+    parser.add_argument("--epochs", type=int, default=300)
+    args = parser.parse_args()
+
+    with args.data.open(encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+
+    model = NgramLinearModel.fit(
+        [record["content"] for record in records],
+        [int(record["label"]) for record in records],
+        vectorizer=HashedNgramVectorizer(args.n_features, 1, args.ngram_max),
+        epochs=args.epochs,
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    model.save(args.output)
+    print(f"{len(records)} 件で学習したモデルを {args.output} に保存しました")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+コールドスタート性能の統合テスト
+
+このモジュールは、``app.presentation.main`` のインポート時間と
+起動から最初のレスポンスまでの時間が予算内に収まることを検証します。
+オートスケールで追加されたPodが素早くトラフィックを受けられるよう、
+重いインフラストラクチャモジュールがインポート時に読み込まれないことも確認します。
+
+計測は新しいPythonプロセスで ``-X importtime`` を使用して行います。
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# インポート時間の予算（秒）: FastAPI 本体を含む累積時間
+IMPORT_TIME_BUDGET_SECONDS = 2.0
+
+# 自プロジェクトモジュールの自己時間合計の予算（秒）
+FIRST_PARTY_SELF_TIME_BUDGET_SECONDS = 0.1
+
+# 起動から最初のレスポンスまでの予算（秒）: steering の起動時間要件（5秒以内）
+STARTUP_TIME_BUDGET_SECONDS = 5.0
+
+# インポート時に読み込まれてはならない重い依存モジュール
+FORBIDDEN_EAGER_MODULES = (
+    "numpy",
+    "httpx",
+    "yaml",
+    "msgpack",
+    "sqlite3",
+    "multiprocessing.shared_memory",
+    "app.infrastructure.screening_service_impl",
+)
+
+STARTUP_SCRIPT = """
+import time
+start = time.perf_counter()
+from fastapi.testclient import TestClient
+from app.presentation.main import app
+with TestClient(app) as client:
+    response = client.get("/health")
+    assert response.status_code == 200
+print(time.perf_counter() - start)
+"""
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    """プロジェクトルートで新しいPythonプロセスを実行します"""
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+
+
+def _parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """
+    ``-X importtime`` の出力をモジュール名ごとの (自己時間, 累積時間) に変換します
+
+    Returns:
+        モジュール名をキー、マイクロ秒単位の (self, cumulative) を値とする辞書
+    """
+    timings: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+@pytest.fixture(scope="module")
+def import_timings() -> dict[str, tuple[int, int]]:
+    """新しいプロセスで app.presentation.main をインポートした際の計測結果"""
+    result = _run_python("-X", "importtime", "-c", "import app.presentation.main")
+    return _parse_importtime(result.stderr)
+
+
+class TestColdStart:
+    """コールドスタート性能のテストクラス"""
+
+    def test_import_time_within_budget(self, import_timings):
+        """app.presentation.main の累積インポート時間が予算内であることをテスト"""
+        _, cumulative_us = import_timings["app.presentation.main"]
+
+        assert cumulative_us / 1_000_000 < IMPORT_TIME_BUDGET_SECONDS
+
+    def test_first_party_self_time_within_budget(self, import_timings):
+        """自プロジェクトモジュールの自己インポート時間が予算内であることをテスト"""
+        first_party_us = sum(
+            self_us
+            for name, (self_us, _) in import_timings.items()
+            if name == "app" or name.startswith("app.")
+        )
+
+        assert first_party_us / 1_000_000 < FIRST_PARTY_SELF_TIME_BUDGET_SECONDS
+
+    @pytest.mark.parametrize("module_name", FORBIDDEN_EAGER_MODULES)
+    def test_heavy_modules_are_not_imported_eagerly(self, import_timings, module_name):
+        """重い依存モジュールがインポート時に読み込まれないことをテスト"""
+        assert module_name not in import_timings
+
+    def test_startup_to_first_response_within_budget(self):
+        """lifespan 起動から最初のレスポンスまでが予算内であることをテスト"""
+        result = _run_python("-c", STARTUP_SCRIPT)
+        elapsed = float(result.stdout.strip().splitlines()[-1])
+
+        assert elapsed < STARTUP_TIME_BUDGET_SECONDS
@@ -0,0 +1,60 @@
+"""
+アンサンブルの統合テスト
+
+このモジュールは、EnsembleScreeningService を app.state のスクリーニング
+サービスとして使用した場合に、すべての実装が持ち時間を超えると
+/v1/screenings が 503 を返し、WebSocket のセッションが unavailable の
+エラーを応答することを検証します。
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.infrastructure.ensemble_screening_service import (
+    EnsembleMember,
+    EnsembleScreeningService,
+)
+from app.presentation.main import app
+
+client = TestClient(app)
+
+
+class SlowService:
+    """持ち時間より遅く応答するサービス"""
+
+    async def screen(self, content: str) -> str:
+        await asyncio.sleep(1.0)
+        return content
+
+
+@pytest.fixture
+def slow_ensemble():
+    """すべての実装が持ち時間を超えるアンサンブルに app.state を一時的に差し替える"""
+    original = getattr(app.state, "screening_service", None)
+    app.state.screening_service = EnsembleScreeningService(
+        [EnsembleMember("a", SlowService()), EnsembleMember("b", SlowService())],
+        timeout=0.05,
+    )
+    yield
+    app.state.screening_service = original
+
+
+def test_all_members_timing_out_returns_503(slow_ensemble):
+    """すべての実装が持ち時間を超えると 503 と Retry-After を返すことをテスト"""
+    response = client.post("/v1/screenings", json={"content": "text"})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert "detail" in response.json()
+
+
+def test_all_members_timing_out_gets_websocket_error(slow_ensemble):
+    """すべての実装が持ち時間を超えると WebSocket で unavailable を応答するかをテスト"""
+    with client.websocket_connect("/v1/screenings/ws") as websocket:
+        websocket.send_json({"id": "slow", "content": "text"})
+        reply = websocket.receive_json()
+
+    assert reply["id"] == "slow"
+    assert reply["error"]["code"] == "unavailable"
@@ -0,0 +1,106 @@
+"""
+ルールセットのホットリロードの統合テスト
+
+このモジュールは、管理用エンドポイントでルールセットを再読み込みすると
+以降のスクリーニングが新しいルールセットで処理されること、結果キャッシュが
+新しいバージョンで引き直されること、および認証トークンの検証を検証します。
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.service_factory import create_screening_service
+from app.presentation.api.dependencies import get_admin_token
+from app.presentation.main import app
+
+client = TestClient(app)
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+def write_rules(path, term: str) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "rules": [
+                    {
+                        "id": "rule",
+                        "kind": "discriminatory_term",
+                        "terms": [term],
+                        "verdict": "block",
+                        "weight": 0.9,
+                        "replacement": "***",
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def source(tmp_path):
+    """ルールソースから組み立てたサービスに app.state を一時的に差し替える"""
+    path = tmp_path / "rules.json"
+    write_rules(path, "男性限定")
+    original = getattr(app.state, "screening_service", None)
+    app.state.screening_service = create_screening_service(
+        Settings(screening_backend="rules", rules_source_path=str(path), cache_size=16)
+    )
+    app.dependency_overrides[get_admin_token] = lambda: "secret"
+    yield path
+    app.dependency_overrides.pop(get_admin_token, None)
+    app.state.screening_service = original
+
+
+def screen(content: str) -> str:
+    response = client.post("/v1/screenings", json={"content": content})
+    assert response.status_code == 200
+    return response.json()["content"]
+
+
+def test_reload_applies_new_rules(source):
+    """再読み込み後は新しいルールセット（とキャッシュの名前空間）で処理されることをテスト"""
+    assert screen("女性限定の募集") == "女性限定の募集"
+
+    write_rules(source, "女性限定")
+    response = client.post("/admin/reload", headers=ADMIN)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["reloaded"] is True
+    assert len(body["version"]) == 64
+    assert screen("女性限定の募集") == "***の募集"
+
+
+def test_reload_without_changes_keeps_version(source):
+    """内容が同じ場合は差し替えないことをテスト"""
+    response = client.post("/admin/reload", headers=ADMIN)
+
+    assert response.json() == {"reloaded": False, "version": None}
+
+
+def test_failed_reload_returns_422_and_keeps_rules(source):
+    """読み込みに失敗すると 422 を返し、現在のルールセットを使い続けることをテスト"""
+    source.write_text("{broken", encoding="utf-8")
+
+    response = client.post("/admin/reload", headers=ADMIN)
+
+    assert response.status_code == 422
+    assert screen("男性限定") == "***"
+
+
+def test_reload_requires_admin_token(source):
+    """認証トークンが一致しない場合は 403 になることをテスト"""
+    assert client.post("/admin/reload").status_code == 403
+    assert (
+        client.post("/admin/reload", headers={"X-Admin-Token": "x"}).status_code == 403
+    )
+
+
+def test_admin_endpoints_disabled_without_token():
+    """認証トークンが未設定の場合は 404 になることをテスト"""
+    assert client.post("/admin/reload", headers=ADMIN).status_code == 404
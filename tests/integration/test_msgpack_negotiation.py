@@ -0,0 +1,160 @@
+"""
+MessagePack のコンテントネゴシエーションの統合テスト
+
+このモジュールは、スクリーニングのエンドポイントが MessagePack の
+リクエストボディを受け付け、Accept ヘッダーに応じて MessagePack で
+応答すること、不正なボディが JSON と同じ 422 になること、および
+ストリーミングと WebSocket のバイナリフレームを検証します。
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.rule import Rule
+from app.domain.screening_result import Verdict
+from app.infrastructure.rule_automaton import RuleAutomaton
+from app.infrastructure.rule_screening_service import RuleScreeningService
+from app.presentation.api.dependencies import (
+    StreamOptions,
+    WebSocketOptions,
+    get_stream_options,
+    get_websocket_options,
+)
+from app.presentation.main import app
+
+msgpack = pytest.importorskip("msgpack")
+
+RULES = (
+    Rule("male-only", "discriminatory_term", ("男性限定",), Verdict.BLOCK, 0.9),
+    Rule("email", "email", ("info@example.com",), Verdict.REVIEW, 0.2, "[EMAIL]"),
+)
+CONTENT = "男性限定、連絡は info@example.com まで"
+MSGPACK = "application/msgpack"
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def rule_service():
+    """app.state のサービスをルールベースの実装に差し替える"""
+    original = getattr(app.state, "screening_service", None)
+    app.state.screening_service = RuleScreeningService(RuleAutomaton.compile(RULES))
+    app.dependency_overrides[get_stream_options] = lambda: StreamOptions(32, 0)
+    app.dependency_overrides[get_websocket_options] = lambda: WebSocketOptions(4)
+    yield
+    app.dependency_overrides.pop(get_stream_options, None)
+    app.dependency_overrides.pop(get_websocket_options, None)
+    app.state.screening_service = original
+
+
+def post_msgpack(url: str, body, **kwargs):
+    return client.post(
+        url,
+        content=msgpack.packb(body),
+        headers={"Content-Type": MSGPACK, **kwargs.pop("headers", {})},
+        **kwargs,
+    )
+
+
+def test_msgpack_request_with_json_response():
+    """MessagePack のリクエストに Accept がなければ JSON で応答することをテスト"""
+    response = post_msgpack("/v1/screenings", {"content": CONTENT})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"content": "男性限定、連絡は [EMAIL] まで"}
+
+
+def test_accept_msgpack_returns_msgpack_response():
+    """Accept: application/msgpack で MessagePack の応答になることをテスト"""
+    response = client.post(
+        "/v1/screenings",
+        params={"mode": "verdict"},
+        json={"content": CONTENT},
+        headers={"Accept": MSGPACK},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == MSGPACK
+    assert "Accept" in response.headers["vary"]
+    data = msgpack.unpackb(response.content)
+    assert data["verdict"] == "block"
+    assert data["findings"] == [
+        {"kind": "discriminatory_term", "start": 0, "end": 4},
+        {"kind": "email", "start": 9, "end": 25},
+    ]
+
+
+def test_msgpack_request_and_response():
+    """MessagePack で送受信できることをテスト"""
+    response = post_msgpack(
+        "/v1/screenings", {"content": CONTENT}, headers={"Accept": MSGPACK}
+    )
+
+    assert response.status_code == 200
+    assert msgpack.unpackb(response.content) == {
+        "content": "男性限定、連絡は [EMAIL] まで"
+    }
+
+
+def test_invalid_msgpack_body_returns_422():
+    """復号できない MessagePack は 422 になることをテスト"""
+    response = client.post(
+        "/v1/screenings", content=b"\xc1", headers={"Content-Type": MSGPACK}
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "msgpack_invalid"
+
+
+def test_msgpack_body_is_validated_like_json():
+    """MessagePack のボディも JSON と同じスキーマで検証されることをテスト"""
+    msgpack_response = post_msgpack("/v1/screenings", {"text": CONTENT})
+    json_response = client.post("/v1/screenings", json={"text": CONTENT})
+
+    assert msgpack_response.status_code == 422
+    assert msgpack_response.json() == json_response.json()
+
+
+def test_stream_in_msgpack():
+    """ストリーミングのイベントを MessagePack の map の列で受け取れることをテスト"""
+    response = post_msgpack(
+        "/v1/screenings/stream", {"content": CONTENT}, headers={"Accept": MSGPACK}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == MSGPACK
+    unpacker = msgpack.Unpacker(raw=False)
+    unpacker.feed(response.content)
+    events = list(unpacker)
+    assert [event["event"] for event in events] == ["findings", "summary"]
+    assert len(events[0]["data"]["findings"]) == 2
+    assert events[-1]["data"]["finding_count"] == 2
+
+
+def test_websocket_binary_frames_use_msgpack():
+    """バイナリフレームには MessagePack のバイナリフレームで応答することをテスト"""
+    with client.websocket_connect("/v1/screenings/ws") as websocket:
+        websocket.send_bytes(
+            msgpack.packb({"id": "m1", "content": CONTENT, "mode": "verdict"})
+        )
+        reply = msgpack.unpackb(websocket.receive_bytes())
+        websocket.send_bytes(msgpack.packb({"id": "bad"}))
+        error = msgpack.unpackb(websocket.receive_bytes())
+        websocket.send_bytes(b"\xc1")
+        undecodable = msgpack.unpackb(websocket.receive_bytes())
+        websocket.send_json({"id": "text", "content": "a"})
+        text_reply = websocket.receive_json()
+
+    assert reply["id"] == "m1"
+    assert reply["result"]["verdict"] == "block"
+    assert error["id"] == "bad"
+    assert error["error"]["code"] == "invalid_message"
+    assert undecodable == {
+        "id": None,
+        "error": {
+            "code": "invalid_message",
+            "detail": "MessagePack として解釈できません",
+        },
+    }
+    assert text_reply == {"id": "text", "result": {"content": "a"}}
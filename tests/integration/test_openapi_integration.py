@@ -0,0 +1,111 @@
+"""
+OpenAPIドキュメント配信の統合テスト
+
+このモジュールは、事前生成済みの openapi.json が配信されること、
+ETag による条件付きリクエストが機能すること、そして成果物が
+現在のルート・スキーマに対して古くなっていないことを検証します。
+"""
+
+import yaml
+from fastapi.testclient import TestClient
+
+from app.presentation.api.openapi_document import (
+    DEFAULT_OPENAPI_PATH,
+    PROJECT_ROOT,
+    OpenAPIDocument,
+    load_openapi_document,
+    serialize_openapi,
+)
+from app.presentation.main import app
+
+client = TestClient(app)
+
+
+class TestOpenAPIArtifact:
+    """OpenAPI成果物の鮮度チェック"""
+
+    def test_json_artifact_is_up_to_date(self):
+        """openapi.json が現在のアプリから生成される内容と一致することをテスト"""
+        assert DEFAULT_OPENAPI_PATH.read_bytes() == serialize_openapi(app.openapi()), (
+            "openapi.json が古くなっています: python scripts/export_openapi.py"
+        )
+
+    def test_yaml_artifact_is_up_to_date(self):
+        """openapi.yaml が現在のアプリのスキーマと一致することをテスト"""
+        with open(PROJECT_ROOT / "openapi.yaml", encoding="utf-8") as f:
+            exported = yaml.safe_load(f)
+
+        assert exported == app.openapi(), (
+            "openapi.yaml が古くなっています: python scripts/export_openapi.py"
+        )
+
+
+class TestOpenAPIEndpoint:
+    """GET /openapi.json エンドポイントの統合テスト"""
+
+    def test_serves_precomputed_bytes(self):
+        """事前生成済みのバイト列がそのまま返されることをテスト"""
+        response = client.get("/openapi.json")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == DEFAULT_OPENAPI_PATH.read_bytes()
+
+    def test_response_has_etag(self):
+        """レスポンスに成果物から算出した ETag が含まれることをテスト"""
+        response = client.get("/openapi.json")
+        expected = OpenAPIDocument(DEFAULT_OPENAPI_PATH.read_bytes()).etag
+
+        assert response.headers["etag"] == expected
+
+    def test_if_none_match_returns_304(self):
+        """If-None-Match が一致する場合に 304 を返すことをテスト"""
+        etag = client.get("/openapi.json").headers["etag"]
+        response = client.get("/openapi.json", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_if_none_match_returns_document(self):
+        """If-None-Match が一致しない場合はドキュメントを返すことをテスト"""
+        response = client.get("/openapi.json", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.json()["info"]["title"] == "Screening API"
+
+    def test_openapi_route_is_not_in_schema(self):
+        """ドキュメント配信ルート自体はスキーマに含まれないことをテスト"""
+        paths = client.get("/openapi.json").json()["paths"]
+
+        assert "/openapi.json" not in paths
+        assert "/docs" not in paths
+
+    def test_docs_and_redoc_reference_precomputed_document(self):
+        """Swagger UI と ReDoc が /openapi.json を参照することをテスト"""
+        for url in ("/docs", "/redoc"):
+            response = client.get(url)
+
+            assert response.status_code == 200
+            assert "/openapi.json" in response.text
+
+
+class TestOpenAPIDocument:
+    """OpenAPIDocument のユニットレベルの動作確認"""
+
+    def test_missing_artifact_falls_back_to_runtime_generation(self, tmp_path):
+        """成果物がない場合に実行時生成へフォールバックすることをテスト"""
+        document = load_openapi_document(app, tmp_path / "missing.json")
+
+        assert document.precomputed is False
+        assert document.body == serialize_openapi(app.openapi())
+
+    def test_matches_weak_and_wildcard_tags(self):
+        """弱いETagとワイルドカードを一致として扱うことをテスト"""
+        document = OpenAPIDocument(b"{}")
+
+        assert document.matches(f"W/{document.etag}")
+        assert document.matches('"other", ' + document.etag)
+        assert document.matches("*")
+        assert not document.matches(None)
+        assert not document.matches('"other"')
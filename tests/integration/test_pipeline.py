@@ -0,0 +1,165 @@
+"""
+スクリーニングパイプラインの統合テスト
+
+このモジュールは、パイプラインを app.state のスクリーニングサービスとして
+使用した場合に /v1/screenings がパイプラインの結果を返すこと、
+/health/pipeline がステージごとの統計を返すこと、および検出箇所が重なる
+場合も mode=patch の編集が full 形式のテキストと一致することを検証します。
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.screening_result import Finding, ScreeningResult, Verdict
+from app.infrastructure.rule_screening_service import RuleScreeningService
+from app.presentation.main import app
+from app.usecase.screening_pipeline import (
+    DetectorStage,
+    NormalizeStage,
+    PrefilterStage,
+    RedactionStage,
+    ScoringStage,
+    ScreeningPipeline,
+)
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    """ルールの検出器を持つパイプラインに app.state を一時的に差し替える"""
+    source = tmp_path / "rules.json"
+    source.write_text(
+        json.dumps(
+            {
+                "rules": [
+                    {
+                        "id": "rule",
+                        "kind": "discriminatory_term",
+                        "terms": ["男性限定"],
+                        "verdict": "block",
+                        "weight": 0.9,
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    rules = RuleScreeningService.compile_source(source)
+    pipeline = ScreeningPipeline(
+        [
+            NormalizeStage(),
+            PrefilterStage(),
+            DetectorStage("rules", rules, halt_at=Verdict.BLOCK),
+            RedactionStage(mask="***"),
+            ScoringStage(),
+        ]
+    )
+    original = getattr(app.state, "screening_service", None)
+    app.state.screening_service = pipeline
+    yield pipeline
+    app.state.screening_service = original
+
+
+def test_screenings_are_served_by_pipeline(pipeline):
+    """/v1/screenings がパイプラインの判定と統計を反映することをテスト"""
+    response = client.post(
+        "/v1/screenings", params={"mode": "verdict"}, json={"content": "男性限定の募集"}
+    )
+    blank = client.post("/v1/screenings", json={"content": "   "})
+
+    assert response.status_code == 200
+    assert response.json()["verdict"] == "block"
+    assert blank.status_code == 200
+    assert blank.json()["content"] == "   "
+    stats = pipeline.stats()
+    assert stats["rules"].calls == 1
+    assert stats["rules"].skipped == 1
+
+
+class FixedFindingsDetector:
+    """決まった検出箇所を返す検出器"""
+
+    def __init__(self, *findings: Finding) -> None:
+        self.findings = findings
+
+    async def screen(self, content: str) -> str:
+        return content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        return ScreeningResult(
+            content=content, score=0.5, verdict=Verdict.REVIEW, findings=self.findings
+        )
+
+
+@pytest.fixture
+def overlapping_pipeline():
+    """同じ位置から始まる検出箇所を返す検出器のパイプラインに差し替える"""
+    pipeline = ScreeningPipeline(
+        [
+            [
+                DetectorStage(
+                    "pii", FixedFindingsDetector(Finding("email", 0, 10, "[EMAIL]"))
+                ),
+                DetectorStage(
+                    "rules",
+                    FixedFindingsDetector(
+                        Finding("term", 0, 4, "XX"), Finding("term", 11, 15)
+                    ),
+                ),
+            ],
+            RedactionStage(mask="***"),
+        ]
+    )
+    original = getattr(app.state, "screening_service", None)
+    app.state.screening_service = pipeline
+    yield pipeline
+    app.state.screening_service = original
+
+
+def test_patch_edits_rebuild_full_content_with_overlaps(overlapping_pipeline):
+    """検出箇所が重なる場合も mode=patch の編集が full 形式と一致することをテスト"""
+    content = "ab@example tail"
+    full = client.post("/v1/screenings", json={"content": content}).json()
+    patch = client.post(
+        "/v1/screenings", params={"mode": "patch"}, json={"content": content}
+    ).json()
+
+    patched = content
+    for edit in sorted(patch["edits"], key=lambda e: e["offset"], reverse=True):
+        start = edit["offset"]
+        patched = (
+            patched[:start] + edit["replacement"] + patched[start + edit["length"] :]
+        )
+    assert full["content"] == "[EMAIL] ***"
+    assert patched == full["content"]
+
+
+def test_health_pipeline_reports_stage_stats(pipeline):
+    """/health/pipeline がステージの順に統計を返すことをテスト"""
+    client.post("/v1/screenings", json={"content": "男性限定の募集"})
+
+    response = client.get("/health/pipeline")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["enabled"] is True
+    assert list(body["stages"]) == [
+        "normalize",
+        "prefilter",
+        "rules",
+        "redaction",
+        "scoring",
+    ]
+    assert body["stages"]["rules"]["calls"] == 1
+    assert body["stages"]["rules"]["hits"] >= 1
+
+
+def test_health_pipeline_disabled_without_pipeline():
+    """パイプラインを使用していない場合は enabled=False を返すことをテスト"""
+    response = client.get("/health/pipeline")
+
+    assert response.status_code == 200
+    assert response.json() == {"enabled": False, "stages": {}}
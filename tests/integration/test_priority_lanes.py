@@ -0,0 +1,84 @@
+"""
+優先度レーンの統合テスト
+
+このモジュールは、X-Screening-Priority ヘッダーで要求の優先度クラスを
+指定できること、スケジューラーが有効な場合にスクリーニングが
+レーンごとに記録されること、および /health/scheduler の統計を検証します。
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.presentation.api.dependencies import get_priority_scheduler
+from app.presentation.main import app
+from app.usecase.priority_scheduler import PriorityScheduler
+
+client = TestClient(app)
+
+
+class EchoService:
+    async def screen(self, content: str) -> str:
+        return content
+
+
+@pytest.fixture
+def scheduler():
+    """app.state のサービスと優先度スケジューラーを一時的に差し替える"""
+    original = getattr(app.state, "screening_service", None)
+    app.state.screening_service = EchoService()
+    scheduler = PriorityScheduler(2)
+    app.dependency_overrides[get_priority_scheduler] = lambda: scheduler
+    yield scheduler
+    app.dependency_overrides.pop(get_priority_scheduler, None)
+    app.state.screening_service = original
+
+
+def test_requests_are_scheduled_by_priority(scheduler):
+    """ヘッダーで指定した優先度クラスのレーンで実行されることをテスト"""
+    for priority in ("bulk", "bulk", "interactive"):
+        response = client.post(
+            "/v1/screenings",
+            json={"content": "a"},
+            headers={"X-Screening-Priority": priority},
+        )
+        assert response.status_code == 200
+    client.post("/v1/screenings", json={"content": "a"})
+
+    stats = client.get("/health/scheduler").json()
+
+    assert stats["enabled"] is True
+    assert stats["lanes"]["bulk"]["admitted"] == 2
+    assert stats["lanes"]["interactive"]["admitted"] == 2
+    assert stats["lanes"]["interactive"]["weight"] == 8.0
+    assert stats["lanes"]["bulk"]["queued"] == 0
+
+
+def test_stream_chunks_are_scheduled(scheduler):
+    """ストリーミングではチャンクごとに実行枠を取得することをテスト"""
+    response = client.post(
+        "/v1/screenings/stream",
+        json={"content": "a\n" * 10000},
+        headers={"X-Screening-Priority": "bulk"},
+    )
+
+    assert response.status_code == 200
+    assert scheduler.stats()["bulk"].admitted > 1
+
+
+def test_invalid_priority_returns_422(scheduler):
+    """未知の優先度クラスは 422 になることをテスト"""
+    response = client.post(
+        "/v1/screenings",
+        json={"content": "a"},
+        headers={"X-Screening-Priority": "urgent"},
+    )
+
+    assert response.status_code == 422
+
+
+def test_scheduler_disabled_by_default():
+    """設定が無効の場合は統計が空であることをテスト"""
+    response = client.get("/health/scheduler")
+
+    assert response.status_code == 200
+    assert response.json() == {"enabled": False, "lanes": {}}
@@ -0,0 +1,109 @@
+"""
+レート制限ミドルウェアの統合テスト
+
+このモジュールは、アプリケーションを RateLimitMiddleware でラップし、
+クライアントごとの制限と 429 レスポンス、RateLimit ヘッダー、
+未登録のAPIキーでは制限を回避できないこと、および対象外のパスと
+WebSocket が制限されないことを検証します。
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.infrastructure.token_bucket import TokenBucketLimiter
+from app.presentation.api.rate_limit import RateLimitMiddleware, registered_api_key
+from app.presentation.main import app
+
+# 登録済みとして扱うAPIキー
+REGISTERED_KEYS = {"one", "two"}
+
+
+class EchoService:
+    async def screen(self, content: str) -> str:
+        return content
+
+
+@pytest.fixture
+def client():
+    """バースト3、毎秒0.01回のレート制限をかけたクライアント"""
+    original = getattr(app.state, "screening_service", None)
+    app.state.screening_service = EchoService()
+    limited = RateLimitMiddleware(
+        app,
+        limiter=TokenBucketLimiter(rate=0.01, burst=3),
+        key_validator=lambda scope, key: key in REGISTERED_KEYS,
+    )
+    yield TestClient(limited)
+    app.state.screening_service = original
+
+
+def screen(client, **headers):
+    return client.post("/v1/screenings", json={"content": "a"}, headers=headers)
+
+
+def test_requests_over_the_limit_get_429(client):
+    """バーストを超えたリクエストに 429 と Retry-After を返すことをテスト"""
+    responses = [screen(client) for _ in range(4)]
+
+    assert [r.status_code for r in responses] == [200, 200, 200, 429]
+    assert [r.headers["ratelimit-remaining"] for r in responses] == [
+        "2",
+        "1",
+        "0",
+        "0",
+    ]
+    assert responses[0].headers["ratelimit-limit"] == "3"
+    assert responses[0].headers["ratelimit-policy"] == "3;w=300"
+    assert int(responses[3].headers["retry-after"]) == 100
+    assert "detail" in responses[3].json()
+
+
+def test_api_keys_are_limited_separately(client):
+    """APIキーごとに別の制限が適用されることをテスト"""
+    for _ in range(3):
+        screen(client, **{"X-API-Key": "one"})
+
+    assert screen(client, **{"X-API-Key": "one"}).status_code == 429
+    assert screen(client, **{"X-API-Key": "two"}).status_code == 200
+    # APIキーのないリクエストは接続元のIPアドレスで識別する
+    assert screen(client).status_code == 200
+
+
+def test_unregistered_api_keys_are_limited_by_ip(client):
+    """未登録のAPIキーを毎回変えても接続元のIPアドレスで制限されることをテスト"""
+    responses = [screen(client, **{"X-API-Key": f"random-{i}"}) for i in range(4)]
+
+    assert [r.status_code for r in responses] == [200, 200, 200, 429]
+    assert screen(client).status_code == 429
+    # 登録済みのキーは IP アドレスとは別に制限される
+    assert screen(client, **{"X-API-Key": "one"}).status_code == 200
+
+
+def test_registered_api_key_consults_tenant_registry():
+    """registered_api_key がアプリのテナントレジストリを参照することをテスト"""
+
+    class Registry:
+        def is_api_key(self, api_key: str) -> bool:
+            return api_key == "acme-key"
+
+    original = getattr(app.state, "tenant_registry", None)
+    app.state.tenant_registry = Registry()
+    try:
+        assert registered_api_key({"app": app}, "acme-key")
+        assert not registered_api_key({"app": app}, "forged")
+    finally:
+        app.state.tenant_registry = original
+    assert not registered_api_key({}, "acme-key")
+
+
+def test_health_and_websocket_are_not_limited(client):
+    """対象外のパスと WebSocket の接続は制限されないことをテスト"""
+    for _ in range(3):
+        screen(client)
+
+    health = client.get("/health")
+    assert health.status_code == 200
+    assert "ratelimit-limit" not in health.headers
+    with client.websocket_connect("/v1/screenings/ws") as websocket:
+        websocket.send_json({"id": "1", "content": "a"})
+        assert websocket.receive_json() == {"id": "1", "result": {"content": "a"}}
@@ -0,0 +1,61 @@
+"""
+外部スコアリングAPIバックエンドの統合テスト
+
+このモジュールは、RemoteScreeningService を組み込んだアプリケーションが
+lifespan でHTTPクライアントを開閉し、スタブ経由でスクリーニングできること、
+バックエンド障害時に 503 を返すことを検証します。
+"""
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.infrastructure.remote_screening_service import RemoteScreeningService
+from app.presentation.main import app
+from tests.stubs.scoring_server import create_stub_app
+
+
+@pytest.fixture
+def use_service():
+    """app.state のスクリーニングサービスを一時的に差し替える"""
+    original = getattr(app.state, "screening_service", None)
+
+    def install(service) -> None:
+        app.state.screening_service = service
+
+    yield install
+    app.state.screening_service = original
+
+
+def test_screening_through_remote_backend(use_service):
+    """リモートバックエンド経由でスクリーニングできることをテスト"""
+    service = RemoteScreeningService(
+        "http://scoring.test", transport=httpx.ASGITransport(app=create_stub_app())
+    )
+    use_service(service)
+
+    with TestClient(app) as client:
+        assert service._client is not None
+        response = client.post("/v1/screenings", json={"content": "女性限定の求人"})
+
+    assert response.status_code == 200
+    assert response.json() == {"content": "女性限定の求人"}
+    # lifespan 終了時にクライアントが閉じられる
+    assert service._client is None
+
+
+def test_backend_failure_returns_503(use_service):
+    """バックエンド障害時に 503 と Retry-After を返すことをテスト"""
+    use_service(
+        RemoteScreeningService(
+            "http://scoring.test",
+            transport=httpx.MockTransport(lambda request: httpx.Response(502)),
+        )
+    )
+
+    with TestClient(app) as client:
+        response = client.post("/v1/screenings", json={"content": "x"})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert "detail" in response.json()
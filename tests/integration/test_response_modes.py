@@ -0,0 +1,101 @@
+"""
+レスポンス形式（mode）の統合テスト
+
+このモジュールは、POST /v1/screenings のレスポンス形式を
+クエリパラメータと X-Response-Mode ヘッダーで切り替えられること、
+デフォルトが従来の full 形式であることを検証します。
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.rule import Rule
+from app.domain.screening_result import Verdict
+from app.infrastructure.rule_automaton import RuleAutomaton
+from app.infrastructure.rule_screening_service import RuleScreeningService
+from app.presentation.main import app
+
+RULES = (
+    Rule("male-only", "discriminatory_term", ("男性限定",), Verdict.BLOCK, 0.9),
+    Rule("email", "email", ("info@example.com",), Verdict.REVIEW, 0.2, "[EMAIL]"),
+)
+CONTENT = "男性限定、連絡は info@example.com まで"
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def rule_service():
+    """app.state のスクリーニングサービスをルールベースの実装に差し替える"""
+    original = getattr(app.state, "screening_service", None)
+    app.state.screening_service = RuleScreeningService(RuleAutomaton.compile(RULES))
+    yield
+    app.state.screening_service = original
+
+
+def test_default_mode_returns_full_content():
+    """mode を指定しない場合は書き換え後のテキストのみを返すことをテスト"""
+    response = client.post("/v1/screenings", json={"content": CONTENT})
+
+    assert response.status_code == 200
+    assert response.json() == {"content": "男性限定、連絡は [EMAIL] まで"}
+    assert "X-Response-Mode" in response.headers["vary"]
+
+
+def test_verdict_mode_omits_content():
+    """mode=verdict ではテキストを返さず判定と検出箇所を返すことをテスト"""
+    response = client.post(
+        "/v1/screenings", params={"mode": "verdict"}, json={"content": CONTENT}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert "content" not in data
+    assert data["verdict"] == "block"
+    assert data["score"] == pytest.approx(1 - 0.1 * 0.8)
+    assert data["findings"] == [
+        {"kind": "discriminatory_term", "start": 0, "end": 4},
+        {"kind": "email", "start": 9, "end": 25},
+    ]
+
+
+def test_patch_mode_returns_edits_that_rebuild_full_content():
+    """mode=patch の編集を入力に適用すると full 形式のテキストになることをテスト"""
+    full = client.post("/v1/screenings", json={"content": CONTENT}).json()
+    response = client.post(
+        "/v1/screenings",
+        headers={"X-Response-Mode": "patch"},
+        json={"content": CONTENT},
+    )
+
+    assert response.status_code == 200
+    edits = response.json()["edits"]
+    assert edits == [{"offset": 9, "length": 16, "replacement": "[EMAIL]"}]
+    patched = CONTENT
+    for edit in reversed(edits):
+        start = edit["offset"]
+        patched = (
+            patched[:start] + edit["replacement"] + patched[start + edit["length"] :]
+        )
+    assert patched == full["content"]
+
+
+def test_query_parameter_takes_precedence_over_header():
+    """クエリパラメータとヘッダーの両方がある場合はクエリパラメータを優先することをテスト"""
+    response = client.post(
+        "/v1/screenings",
+        params={"mode": "full"},
+        headers={"X-Response-Mode": "verdict"},
+        json={"content": CONTENT},
+    )
+
+    assert list(response.json()) == ["content"]
+
+
+def test_unknown_mode_returns_422():
+    """未知のレスポンス形式を 422 で拒否することをテスト"""
+    response = client.post(
+        "/v1/screenings", params={"mode": "summary"}, json={"content": CONTENT}
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,135 @@
+"""
+ストリーミングエンドポイントの統合テスト
+
+このモジュールは、POST /v1/screenings/stream がチャンクごとの findings
+イベントと最後の summary イベントを Server-Sent Events で送信すること、
+ハートビートと途中のエラーの通知を検証します。
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.domain.rule import Rule
+from app.domain.screening_result import ScreeningResult, Verdict
+from app.infrastructure.rule_automaton import RuleAutomaton
+from app.infrastructure.rule_screening_service import RuleScreeningService
+from app.presentation.api.dependencies import StreamOptions, get_stream_options
+from app.presentation.main import app
+
+RULES = (
+    Rule("male-only", "discriminatory_term", ("男性限定",), Verdict.BLOCK, 0.9),
+    Rule("email", "email", ("info@example.com",), Verdict.REVIEW, 0.2, "[EMAIL]"),
+)
+
+client = TestClient(app)
+
+
+def parse_events(body: str) -> list[tuple[str, dict]]:
+    """SSE のレスポンスボディを (イベント名, データ) の列に変換する"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+@pytest.fixture
+def use_service():
+    """app.state のサービスとストリーミングの設定を一時的に差し替える"""
+    original = getattr(app.state, "screening_service", None)
+
+    def install(service, chunk_size: int = 16, heartbeat_interval: float = 0) -> None:
+        app.state.screening_service = service
+        app.dependency_overrides[get_stream_options] = lambda: StreamOptions(
+            chunk_size, heartbeat_interval
+        )
+
+    yield install
+    app.dependency_overrides.pop(get_stream_options, None)
+    app.state.screening_service = original
+
+
+def test_stream_emits_findings_per_chunk_and_summary(use_service):
+    """チャンクごとの検出箇所と最後のサマリーを送信することをテスト"""
+    use_service(RuleScreeningService(RuleAutomaton.compile(RULES)), chunk_size=32)
+    content = (
+        "経験者歓迎の求人です。\n男性限定で募集します。\n連絡は info@example.com まで\n"
+    )
+
+    response = client.post("/v1/screenings/stream", json={"content": content})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_events(response.text)
+    names = [name for name, _ in events]
+    assert names == ["findings", "findings", "summary"]
+
+    findings = [finding for _, data in events[:-1] for finding in data["findings"]]
+    assert [content[f["start"] : f["end"]] for f in findings] == [
+        "男性限定",
+        "info@example.com",
+    ]
+    edits = [edit for _, data in events[:-1] for edit in data["edits"]]
+    assert edits == [
+        {"offset": content.index("info"), "length": 16, "replacement": "[EMAIL]"}
+    ]
+    assert events[-1][1] == {
+        "score": 0.9,
+        "verdict": "block",
+        "finding_count": 2,
+        "chunk_count": 2,
+        "length": len(content),
+    }
+
+
+class SlowService:
+    """analyze() に時間がかかるサービス"""
+
+    async def screen(self, content: str) -> str:
+        return content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        await asyncio.sleep(0.05)
+        return ScreeningResult(content)
+
+
+def test_stream_sends_heartbeat_while_chunk_is_slow(use_service):
+    """チャンクの処理に時間がかかる間はハートビートを送信することをテスト"""
+    use_service(SlowService(), heartbeat_interval=0.01)
+
+    response = client.post("/v1/screenings/stream", json={"content": "abc"})
+
+    names = [name for name, _ in parse_events(response.text)]
+    assert "heartbeat" in names
+    assert names[-1] == "summary"
+
+
+class FailingAfterFirstChunkService:
+    """2回目の呼び出しで利用不可になるサービス"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def screen(self, content: str) -> str:
+        return content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        self.calls += 1
+        if self.calls > 1:
+            raise ScreeningUnavailableError("backend down")
+        return ScreeningResult(content)
+
+
+def test_stream_reports_unavailable_backend_as_error_event(use_service):
+    """途中でサービスが利用不可になると error イベントで終了することをテスト"""
+    use_service(FailingAfterFirstChunkService(), chunk_size=2)
+
+    response = client.post("/v1/screenings/stream", json={"content": "a\nb\nc\n"})
+
+    events = parse_events(response.text)
+    assert [name for name, _ in events] == ["findings", "error"]
+    assert "backend down" not in events[-1][1]["detail"]
@@ -0,0 +1,118 @@
+"""
+WebSocket エンドポイントの統合テスト
+
+このモジュールは、/v1/screenings/ws で相関ID付きのメッセージを
+パイプライン送信でき、完了した順に応答されること、接続ごとの
+同時処理数の上限、および不正なメッセージや障害時のエラー応答を検証します。
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.domain.screening_result import ScreeningResult, Verdict
+from app.presentation.api.dependencies import (
+    WebSocketOptions,
+    get_websocket_options,
+)
+from app.presentation.main import app
+
+client = TestClient(app)
+
+
+class DelayedService:
+    """内容に応じて遅延し、同時実行数の最大値を記録するサービス"""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+
+    async def screen(self, content: str) -> str:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if content == "unavailable":
+                raise ScreeningUnavailableError("backend down")
+            await asyncio.sleep(0.1 if content == "slow" else 0.01)
+            return content.upper()
+        finally:
+            self.active -= 1
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        return ScreeningResult(await self.screen(content), 0.5, Verdict.REVIEW)
+
+
+@pytest.fixture
+def service():
+    """app.state のサービスと WebSocket の設定を一時的に差し替える"""
+    original = getattr(app.state, "screening_service", None)
+    app.state.screening_service = DelayedService()
+    app.dependency_overrides[get_websocket_options] = lambda: WebSocketOptions(4)
+    yield app.state.screening_service
+    app.dependency_overrides.pop(get_websocket_options, None)
+    app.state.screening_service = original
+
+
+def receive(websocket, count: int) -> list[dict]:
+    return [json.loads(websocket.receive_text()) for _ in range(count)]
+
+
+def test_pipelined_messages_are_answered_by_id(service):
+    """応答を待たずに送ったメッセージにすべて相関ID付きで応答することをテスト"""
+    with client.websocket_connect("/v1/screenings/ws") as websocket:
+        for index in range(20):
+            websocket.send_json({"id": f"m{index}", "content": f"text{index}"})
+        replies = receive(websocket, 20)
+
+    assert {reply["id"]: reply["result"] for reply in replies} == {
+        f"m{index}": {"content": f"TEXT{index}"} for index in range(20)
+    }
+
+
+def test_replies_are_sent_in_completion_order(service):
+    """先に終わったメッセージの応答が先に届くことをテスト"""
+    with client.websocket_connect("/v1/screenings/ws") as websocket:
+        websocket.send_json({"id": "slow", "content": "slow"})
+        websocket.send_json({"id": "fast", "content": "fast", "mode": "verdict"})
+        replies = receive(websocket, 2)
+
+    assert [reply["id"] for reply in replies] == ["fast", "slow"]
+    assert replies[0]["result"] == {"score": 0.5, "verdict": "review", "findings": []}
+
+
+def test_in_flight_messages_are_limited_per_connection(service):
+    """1接続で同時に処理するメッセージ数が上限を超えないことをテスト"""
+    with client.websocket_connect("/v1/screenings/ws") as websocket:
+        for index in range(12):
+            websocket.send_json({"id": str(index), "content": "x"})
+        receive(websocket, 12)
+
+    assert service.max_active == 4
+
+
+def test_invalid_message_gets_error_reply(service):
+    """不正なメッセージにはエラーを応答し、接続を維持することをテスト"""
+    with client.websocket_connect("/v1/screenings/ws") as websocket:
+        websocket.send_json({"id": "bad", "mode": "verdict"})
+        websocket.send_text("not json")
+        errors = receive(websocket, 2)
+        websocket.send_json({"id": "ok", "content": "a"})
+        (reply,) = receive(websocket, 1)
+
+    assert all(error["error"]["code"] == "invalid_message" for error in errors)
+    assert sorted(str(error["id"]) for error in errors) == ["None", "bad"]
+    assert reply == {"id": "ok", "result": {"content": "A"}}
+
+
+def test_unavailable_backend_gets_error_reply(service):
+    """サービスが利用不可の場合はそのメッセージにだけエラーを応答することをテスト"""
+    with client.websocket_connect("/v1/screenings/ws") as websocket:
+        websocket.send_json({"id": "down", "content": "unavailable"})
+        (reply,) = receive(websocket, 1)
+
+    assert reply["id"] == "down"
+    assert reply["error"]["code"] == "unavailable"
+    assert "backend down" not in reply["error"]["detail"]
@@ -0,0 +1,223 @@
+"""
+本番サーバーランチャー（main.py）の統合テスト
+
+このモジュールは、設定値と引数の解析、共有 listen ソケットの作成、
+そして実際にワーカーをフォークしてリクエストを処理し、
+SIGTERM で全ワーカーが停止するまでの一連の動作を検証します。
+"""
+
+import asyncio
+import gc
+import signal
+import socket
+import subprocess
+import sys
+import time
+from itertools import pairwise
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.infrastructure.config.settings import Settings
+from main import PreforkSupervisor, bind_socket, parse_args
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _free_port() -> int:
+    """空いているTCPポートを返します"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_healthy(base_url: str, timeout: float = 15.0) -> None:
+    """サーバーが /health に応答するまで待機します"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise TimeoutError(f"{base_url} が起動しませんでした")
+
+
+def _worker_pids(pid: int) -> list[int]:
+    """
+    /proc からフォークされたワーカーのPID一覧を取得します
+
+    フォークしたワーカーはマスターと同じコマンドラインを持つため、
+    それ以外の子プロセス（multiprocessing の resource_tracker 等）は除外します。
+    """
+    cmdline = Path(f"/proc/{pid}/cmdline").read_bytes()
+    children = Path(f"/proc/{pid}/task/{pid}/children").read_text().split()
+    return [
+        int(child)
+        for child in children
+        if Path(f"/proc/{child}/cmdline").read_bytes() == cmdline
+    ]
+
+
+class TestParseArgs:
+    """引数解析のテストクラス"""
+
+    def test_defaults_come_from_settings(self):
+        """デフォルト値が Settings から取得されることをテスト"""
+        settings = Settings(
+            workers=3, backlog=128, timeout_keep_alive=7, limit_concurrency=50
+        )
+
+        args = parse_args([], settings)
+
+        assert args.workers == 3
+        assert args.backlog == 128
+        assert args.timeout_keep_alive == 7
+        assert args.limit_concurrency == 50
+
+    def test_command_line_overrides_settings(self):
+        """コマンドライン引数が Settings を上書きすることをテスト"""
+        args = parse_args(
+            ["--workers", "2", "--backlog", "64", "--port", "9000"],
+            Settings(workers=8),
+        )
+
+        assert args.workers == 2
+        assert args.backlog == 64
+        assert args.port == 9000
+
+    def test_workers_must_be_positive(self):
+        """ワーカー数に 1 未満を指定するとエラーになることをテスト"""
+        with pytest.raises(SystemExit):
+            parse_args(["--workers", "0"], Settings())
+
+    def test_settings_read_from_environment(self, monkeypatch):
+        """SCREENING_ 接頭辞の環境変数から設定が読み込まれることをテスト"""
+        monkeypatch.setenv("SCREENING_WORKERS", "5")
+        monkeypatch.setenv("SCREENING_BACKLOG", "256")
+
+        settings = Settings()
+
+        assert settings.workers == 5
+        assert settings.backlog == 256
+
+
+class TestBindSocket:
+    """共有 listen ソケットのテストクラス"""
+
+    def test_socket_is_listening_and_inheritable(self):
+        """ソケットが listen 状態で、子プロセスに継承可能であることをテスト"""
+        sock = bind_socket("127.0.0.1", 0, backlog=16)
+        try:
+            assert sock.get_inheritable()
+            with socket.create_connection(sock.getsockname()[:2], timeout=1.0):
+                pass
+        finally:
+            sock.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fork が必要")
+class TestPreforkServer:
+    """マルチプロセスサーバーのテストクラス"""
+
+    def test_workers_serve_requests_and_stop_on_sigterm(self):
+        """複数ワーカーがリクエストを処理し、SIGTERM で停止することをテスト"""
+        port = _free_port()
+        process = subprocess.Popen(
+            [sys.executable, "main.py", "--workers", "2", "--host", "127.0.0.1"]
+            + ["--port", str(port)],
+            cwd=PROJECT_ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            _wait_until_healthy(base_url)
+
+            response = httpx.post(
+                f"{base_url}/v1/screenings", json={"content": "ワーカー"}
+            )
+            assert response.json() == {"content": "ワーカー"}
+            assert len(_worker_pids(process.pid)) == 2
+
+            process.send_signal(signal.SIGTERM)
+            assert process.wait(timeout=15) == 0
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+    def test_failing_workers_are_restarted_with_backoff_then_given_up(
+        self, monkeypatch
+    ):
+        """失敗し続けるワーカーを間隔を空けて再起動し、諦めると 1 で戻ることをテスト"""
+
+        class FailingServer:
+            def run(self, sockets):
+                raise RuntimeError("起動に失敗")
+
+        monkeypatch.setattr(
+            "main.build_server", lambda app, args, sock: FailingServer()
+        )
+        spawned: list[float] = []
+        spawn = PreforkSupervisor._spawn
+
+        def record_spawn(self, index):
+            spawned.append(time.monotonic())
+            spawn(self, index)
+
+        monkeypatch.setattr(PreforkSupervisor, "_spawn", record_spawn)
+        handlers = {
+            signum: signal.getsignal(signum)
+            for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP)
+        }
+        sock = bind_socket("127.0.0.1", 0, backlog=16)
+        supervisor = PreforkSupervisor(
+            None,
+            parse_args(["--workers", "1"], Settings()),
+            sock,
+            restart_delay=0.05,
+            max_restart_delay=0.1,
+            max_restarts=3,
+        )
+        try:
+            exit_code = supervisor.run()
+        finally:
+            sock.close()
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
+
+        assert exit_code == 1
+        assert len(spawned) == 4
+        gaps = [later - earlier for earlier, later in pairwise(spawned)]
+        assert gaps[0] >= 0.05
+        assert gaps[1] >= 0.1 and gaps[2] >= 0.1
+
+    def test_sighup_reloads_master_before_forwarding(self):
+        """SIGHUP でマスターを再読み込みし、古いバックエンドの解放も待つことをテスト"""
+        events: list[str] = []
+
+        class ReloadableService:
+            async def reload(self, *, force: bool = False) -> str | None:
+                events.append(f"reload(force={force})")
+                asyncio.get_running_loop().create_task(self._dispose())
+                return "v2"
+
+            async def _dispose(self) -> None:
+                await asyncio.sleep(0.01)
+                events.append("disposed")
+
+        app = SimpleNamespace(
+            state=SimpleNamespace(screening_service=ReloadableService())
+        )
+        supervisor = PreforkSupervisor(
+            app, parse_args(["--workers", "2"], Settings()), None
+        )
+        try:
+            supervisor._handle_reload(signal.SIGHUP, None)
+        finally:
+            gc.unfreeze()
+
+        assert events == ["reload(force=True)", "disposed"]
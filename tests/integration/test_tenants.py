@@ -0,0 +1,80 @@
+"""
+マルチテナントの統合テスト
+
+このモジュールは、APIキーまたは X-Tenant-ID ヘッダーで解決した
+テナントのサービスでスクリーニングされること、テナントを指定しない
+要求は共通のサービスで処理されること、および設定にないテナントIDが
+404 になることを検証します。
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.tenant_registry import TenantConfig, TenantRegistry
+from app.presentation.main import app
+
+client = TestClient(app)
+
+
+class TaggingService:
+    def __init__(self, tag: str) -> None:
+        self.tag = tag
+
+    async def screen(self, content: str) -> str:
+        return f"{self.tag}:{content}"
+
+
+@pytest.fixture
+def registry():
+    """app.state のサービスとテナントのレジストリを一時的に差し替える"""
+    original = getattr(app.state, "screening_service", None)
+    app.state.screening_service = TaggingService("default")
+    registry = TenantRegistry(
+        Settings(),
+        [
+            TenantConfig("acme", ("acme-key",), {"screening_backend": "rules"}),
+            TenantConfig("globex"),
+        ],
+        factory=lambda settings: TaggingService(settings.screening_backend),
+    )
+    app.state.tenant_registry = registry
+    yield registry
+    del app.state.tenant_registry
+    app.state.screening_service = original
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"X-API-Key": "acme-key"}, "rules:a"),
+        ({"X-Tenant-ID": "globex"}, "echo:a"),
+        ({}, "default:a"),
+    ],
+)
+def test_request_is_screened_by_tenant_service(registry, headers, expected):
+    """ヘッダーで解決したテナントのサービスで処理されることをテスト"""
+    response = client.post("/v1/screenings", json={"content": "a"}, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["content"] == expected
+
+
+def test_tenant_service_is_built_on_first_use(registry):
+    """テナントのサービスは最初の要求で構築されることをテスト"""
+    assert registry.cached == ()
+
+    client.post(
+        "/v1/screenings", json={"content": "a"}, headers={"X-Tenant-ID": "globex"}
+    )
+
+    assert registry.cached == ("globex",)
+
+
+def test_unknown_tenant_returns_404(registry):
+    """設定にないテナントIDは 404 になることをテスト"""
+    response = client.post(
+        "/v1/screenings", json={"content": "a"}, headers={"X-Tenant-ID": "initech"}
+    )
+
+    assert response.status_code == 404
@@ -0,0 +1,88 @@
+"""
+トレーシングの統合テスト
+
+このモジュールは、トレーシングを有効にしたアプリケーションに
+traceparent 付きのリクエストを送り、サーバー → ユースケース →
+スクリーニングサービス → 外部スコアリングAPIの呼び出しが1つのトレースの
+親子のスパンとしてファイルに書き出されること、外部APIに traceparent が
+伝搬することを検証します。
+"""
+
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.remote_screening_service import RemoteScreeningService
+from app.infrastructure.traced_screening_service import TracedScreeningService
+from app.infrastructure.tracing import SpanKind, get_tracer
+from app.presentation.main import app
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+TRACEPARENT = f"00-{TRACE_ID}-00f067aa0ba902b7-01"
+
+
+@pytest.fixture
+def tracer(tmp_path, monkeypatch):
+    """ファイルに書き出すプロセス共有のトレーサー"""
+    monkeypatch.setenv("SCREENING_TRACING_EXPORTER", "file")
+    monkeypatch.setenv("SCREENING_TRACING_FILE_PATH", str(tmp_path / "traces.jsonl"))
+    get_settings.cache_clear()
+    get_tracer.cache_clear()
+    # ミドルウェアは最初のリクエストで構築されるため、設定を変えたら作り直す
+    app.middleware_stack = None
+    yield get_tracer()
+    get_tracer().shutdown()
+    get_settings.cache_clear()
+    get_tracer.cache_clear()
+    app.middleware_stack = None
+
+
+def test_request_is_traced_across_layers(tracer, tmp_path):
+    """1つのリクエストのスパンが層をまたいで親子になることをテスト"""
+    received: list[httpx.Request] = []
+
+    def score(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        return httpx.Response(200, json={"content": "ok", "verdict": "pass"})
+
+    original = getattr(app.state, "screening_service", None)
+    app.state.screening_service = TracedScreeningService(
+        RemoteScreeningService(
+            "http://scoring.test", transport=httpx.MockTransport(score)
+        ),
+        tracer,
+        name="screening.backend",
+        kind=SpanKind.CLIENT,
+        backend="remote",
+    )
+    try:
+        client = TestClient(app)
+        response = client.post(
+            "/v1/screenings",
+            json={"content": "応募者"},
+            headers={"traceparent": TRACEPARENT},
+        )
+    finally:
+        app.state.screening_service = original
+    tracer.force_flush()
+
+    assert response.status_code == 200
+    lines = (tmp_path / "traces.jsonl").read_text(encoding="utf-8").splitlines()
+    spans = {span["name"]: span for span in map(json.loads, lines)}
+    server = spans["POST /v1/screenings"]
+    usecase = next(
+        s for name, s in spans.items() if name.startswith("ScreeningUsecase")
+    )
+    backend = spans["screening.backend.analyze"]
+    assert {span["traceId"] for span in spans.values()} == {TRACE_ID}
+    assert server["parentSpanId"] == "00f067aa0ba902b7"
+    assert server["attributes"]["http.response.status_code"] == 200
+    assert server["attributes"]["http.route"] == "/v1/screenings"
+    assert usecase["parentSpanId"] == server["spanId"]
+    assert backend["parentSpanId"] == usecase["spanId"]
+    assert received[0].headers["traceparent"] == (
+        f"00-{TRACE_ID}-{backend['spanId']}-01"
+    )
@@ -0,0 +1,5 @@
+"""
+テスト・ベンチマーク用のスタブサーバーパッケージ
+
+このパッケージは、外部システムを模倣するローカルスタブを含みます。
+"""
@@ -0,0 +1,163 @@
+"""
+外部スコアリングAPIのローカルスタブサーバー
+
+RemoteScreeningService のテストとベンチマークのために、
+スコアリングAPIの契約（POST /v1/score, /v1/score:batch）を満たす最小限の FastAPI
+アプリケーションを提供します。固定の語句を検出し、その件数からスコアを算出します。
+FaultInjection により、一定の確率でエラー応答や遅延応答を返すこともできます。
+
+テストでは ``httpx.ASGITransport`` を介してプロセス内で呼び出し、
+ベンチマークでは実際のサーバーとして起動します::
+
+    python -m tests.stubs.scoring_server --port 9000 --latency-ms 5 \\
+        --error-rate 0.05 --slow-rate 0.02 --slow-latency-ms 500
+"""
+
+import argparse
+import asyncio
+import random
+import re
+from dataclasses import dataclass, field
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+# スタブが検出する語句
+STUB_FLAGGED_TERMS = ("年齢不問", "男性限定", "女性限定")
+
+_FLAGGED_PATTERN = re.compile("|".join(map(re.escape, STUB_FLAGGED_TERMS)))
+
+
+@dataclass
+class FaultInjection:
+    """
+    スタブに注入する障害の設定
+
+    テスト中に属性を書き換えると、以降のリクエストに反映されます。
+
+    Attributes:
+        error_rate: 503 を返すリクエストの割合（0.0〜1.0）
+        slow_rate: slow_latency だけ追加で遅延させるリクエストの割合
+        slow_latency: 遅延させるリクエストに加える時間（秒）
+        seed: 乱数のシード（再現性のため）
+    """
+
+    error_rate: float = 0.0
+    slow_rate: float = 0.0
+    slow_latency: float = 0.0
+    seed: int = 0
+    _random: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.seed)
+
+    async def apply(self) -> None:
+        """設定に従って遅延またはエラー応答を発生させる"""
+        if self.slow_rate > 0 and self._random.random() < self.slow_rate:
+            await asyncio.sleep(self.slow_latency)
+        if self.error_rate > 0 and self._random.random() < self.error_rate:
+            raise HTTPException(status_code=503, detail="injected fault")
+
+
+class ScoreRequest(BaseModel):
+    """スコアリングリクエスト"""
+
+    content: str
+
+
+class BatchScoreRequest(BaseModel):
+    """一括スコアリングリクエスト"""
+
+    contents: list[str]
+
+
+def score_content(content: str) -> dict:
+    """
+    スタブのスコアリングロジック
+
+    Args:
+        content: スコアリング対象のテキスト
+
+    Returns:
+        dict: スコアリングAPIのレスポンスJSON
+    """
+    findings = [
+        {
+            "kind": "flagged_term",
+            "start": match.start(),
+            "end": match.end(),
+            "replacement": None,
+        }
+        for match in _FLAGGED_PATTERN.finditer(content)
+    ]
+    return {
+        "content": content,
+        "score": min(1.0, 0.25 * len(findings)),
+        "verdict": "review" if findings else "pass",
+        "findings": findings,
+    }
+
+
+def create_stub_app(
+    latency: float = 0.0, faults: FaultInjection | None = None
+) -> FastAPI:
+    """
+    スタブのスコアリングAPIアプリケーションを作成します
+
+    Args:
+        latency: 各リクエストに加える人工的な遅延（秒）
+        faults: 注入する障害（None なら障害なし。``stub.state.faults`` で参照可能）
+
+    Returns:
+        FastAPI: スタブアプリケーション
+    """
+    stub = FastAPI(title="Scoring API Stub")
+    stub.state.requests = 0
+    stub.state.batch_sizes = []
+    stub.state.faults = faults or FaultInjection()
+
+    @stub.post("/v1/score")
+    async def score(request: ScoreRequest) -> dict:
+        stub.state.requests += 1
+        if latency > 0:
+            await asyncio.sleep(latency)
+        await stub.state.faults.apply()
+        return score_content(request.content)
+
+    @stub.post("/v1/score:batch")
+    async def score_batch(request: BatchScoreRequest) -> dict:
+        stub.state.requests += 1
+        stub.state.batch_sizes.append(len(request.contents))
+        if latency > 0:
+            await asyncio.sleep(latency)
+        await stub.state.faults.apply()
+        return {"results": [score_content(content) for content in request.contents]}
+
+    return stub
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="スコアリングAPIスタブ")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0)
+    parser.add_argument("--slow-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        create_stub_app(
+            args.latency_ms / 1000,
+            FaultInjection(
+                error_rate=args.error_rate,
+                slow_rate=args.slow_rate,
+                slow_latency=args.slow_latency_ms / 1000,
+            ),
+        ),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
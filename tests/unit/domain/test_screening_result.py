@@ -0,0 +1,100 @@
+"""
+ScreeningResult と analyze_content のユニットテスト
+
+このモジュールは、スクリーニング結果の値オブジェクトのデフォルト値と不変性、
+検出箇所の置換の適用、および ScreeningAnalyzer を実装しないサービスへの
+フォールバックを検証します。
+"""
+
+import asyncio
+import dataclasses
+
+import pytest
+
+from app.domain.screening_result import (
+    Finding,
+    ScreeningResult,
+    Verdict,
+    apply_replacements,
+)
+from app.domain.screening_service import analyze_content
+
+
+class ScreenOnlyService:
+    """screen() のみを実装するサービス"""
+
+    async def screen(self, content: str) -> str:
+        return content.upper()
+
+
+class AnalyzingService:
+    """analyze() も実装するサービス"""
+
+    async def screen(self, content: str) -> str:
+        return content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        return ScreeningResult(content=content, score=0.9, verdict=Verdict.BLOCK)
+
+
+def test_result_defaults():
+    """ScreeningResult のデフォルト値をテスト"""
+    result = ScreeningResult(content="text")
+
+    assert result.score == 0.0
+    assert result.verdict is Verdict.PASS
+    assert result.findings == ()
+
+
+def test_result_is_immutable():
+    """ScreeningResult が変更不可であることをテスト"""
+    result = ScreeningResult(content="text")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.score = 1.0
+
+
+def test_verdict_severity_orders_verdicts():
+    """判定の重さが PASS < REVIEW < BLOCK の順であることをテスト"""
+    ordered = sorted(Verdict, key=lambda verdict: verdict.severity)
+
+    assert ordered == [Verdict.PASS, Verdict.REVIEW, Verdict.BLOCK]
+
+
+def test_finding_equality():
+    """同じ値を持つ Finding が等価であることをテスト"""
+    assert Finding("email", 0, 5, "[EMAIL]") == Finding("email", 0, 5, "[EMAIL]")
+
+
+def test_apply_replacements_prefers_leftmost_finding():
+    """置換を1回で適用し、重なる検出箇所は左のものを優先することをテスト"""
+    findings = [
+        Finding("email", 0, 6, "[EMAIL]"),
+        Finding("word", 3, 8, "[WORD]"),
+        Finding("score", 9, 10),
+        Finding("phone", 11, 14, "[PHONE]"),
+    ]
+
+    assert apply_replacements("a@b.jp 様 x 090", findings) == "[EMAIL] 様 x [PHONE]"
+
+
+def test_apply_replacements_without_replacement_returns_content():
+    """置換がなければ入力と同じ文字列を返すことをテスト"""
+    content = "text"
+
+    assert apply_replacements(content, [Finding("score", 0, 4)]) is content
+
+
+def test_analyze_content_falls_back_to_screen():
+    """analyze() を持たないサービスでは screen() の結果を包むことをテスト"""
+    result = asyncio.run(analyze_content(ScreenOnlyService(), "abc"))
+
+    assert result == ScreeningResult(content="ABC")
+
+
+def test_analyze_content_prefers_analyze():
+    """analyze() を持つサービスではその結果をそのまま返すことをテスト"""
+    result = asyncio.run(analyze_content(AnalyzingService(), "abc"))
+
+    assert result.verdict is Verdict.BLOCK
+    assert result.score == 0.9
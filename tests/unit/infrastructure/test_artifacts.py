@@ -0,0 +1,124 @@
+"""
+mmap 形式の成果物のユニットテスト
+
+このモジュールは、配列とメタデータの保存・読み込み、内容から計算される
+version、破損の検出、および同じディレクトリへの再ビルドが既存の
+マッピングを壊さず、直前のビルドの配列ファイルを次の再ビルドまで
+残すことを検証します。
+"""
+
+from array import array
+
+import pytest
+
+from app.infrastructure.artifacts import (
+    MANIFEST_NAME,
+    ArtifactError,
+    open_artifact,
+    read_manifest,
+    write_artifact,
+)
+
+
+def build(directory, values=(1, 2, 3), metadata=None):
+    """int32 と float64 の配列を持つ成果物を書き出す"""
+    return write_artifact(
+        directory,
+        "test",
+        {"ints": array("i", values), "floats": array("d", [0.5, -1.5])},
+        metadata or {"name": "sample"},
+    )
+
+
+def test_roundtrip_arrays_and_metadata(tmp_path):
+    """書き出した配列とメタデータがそのまま読み込めることをテスト"""
+    build(tmp_path)
+
+    with open_artifact(tmp_path, kind="test") as artifact:
+        assert list(artifact.array("ints")) == [1, 2, 3]
+        assert list(artifact.array("floats")) == [0.5, -1.5]
+        assert artifact.array("ints").readonly
+        assert artifact.metadata == {"name": "sample"}
+
+
+def test_empty_array_roundtrip(tmp_path):
+    """要素数0の配列も保存・読み込みできることをテスト"""
+    write_artifact(tmp_path, "test", {"empty": array("i")})
+
+    with open_artifact(tmp_path) as artifact:
+        assert len(artifact.array("empty")) == 0
+
+
+def test_version_is_deterministic_and_tracks_content(tmp_path):
+    """version が内容だけで決まり、配列やメタデータの変更で変わることをテスト"""
+    first = build(tmp_path / "a")
+    same = build(tmp_path / "b")
+    changed_array = build(tmp_path / "c", values=(1, 2, 4))
+    changed_metadata = build(tmp_path / "d", metadata={"name": "other"})
+
+    assert first.version == same.version
+    assert first.version != changed_array.version
+    assert first.version != changed_metadata.version
+
+
+def test_verify_detects_corruption(tmp_path):
+    """verify=True で配列ファイルの改ざんを検出することをテスト"""
+    manifest = build(tmp_path)
+    path = tmp_path / manifest.arrays["ints"]["file"]
+    data = bytearray(path.read_bytes())
+    data[0] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ArtifactError, match="ハッシュ"):
+        open_artifact(tmp_path, verify=True)
+
+
+def test_rebuild_keeps_existing_mapping_readable(tmp_path):
+    """再ビルド後も既存のマッピングが古い内容を読めることをテスト"""
+    build(tmp_path)
+    artifact = open_artifact(tmp_path)
+
+    new = build(tmp_path, values=(7, 8, 9))
+
+    assert list(artifact.array("ints")) == [1, 2, 3]
+    assert read_manifest(tmp_path).version == new.version
+    with open_artifact(tmp_path) as reopened:
+        assert list(reopened.array("ints")) == [7, 8, 9]
+    artifact.close()
+
+
+def test_rebuild_keeps_previous_files_until_next_build(tmp_path):
+    """直前のビルドの配列ファイルは次の再ビルドまで残すことをテスト"""
+    first = build(tmp_path)
+    second = build(tmp_path, values=(4, 5, 6))
+
+    # 置き換えの直前に古いマニフェストを読んだプロセスも配列を開ける
+    assert (tmp_path / first.arrays["ints"]["file"]).exists()
+
+    third = build(tmp_path, values=(7, 8, 9))
+
+    assert not (tmp_path / first.arrays["ints"]["file"]).exists()
+    assert {path.name for path in tmp_path.glob("ints-*.bin")} == {
+        second.arrays["ints"]["file"],
+        third.arrays["ints"]["file"],
+    }
+
+
+def test_kind_mismatch_raises(tmp_path):
+    """期待と異なる種類の成果物を開くと ArtifactError になることをテスト"""
+    build(tmp_path)
+
+    with pytest.raises(ArtifactError, match="ruleset"):
+        open_artifact(tmp_path, kind="ruleset")
+
+
+def test_missing_manifest_raises(tmp_path):
+    """マニフェストがないディレクトリを開くと ArtifactError になることをテスト"""
+    with pytest.raises(ArtifactError, match=MANIFEST_NAME):
+        open_artifact(tmp_path)
+
+
+def test_unsupported_format_is_rejected(tmp_path):
+    """保存できない要素型の配列を拒否することをテスト"""
+    with pytest.raises(ArtifactError):
+        write_artifact(tmp_path, "test", {"text": array("u", "abc")})
@@ -0,0 +1,150 @@
+"""
+CachedScreeningService のユニットテスト
+
+このモジュールは、L1（プロセス内LRU）と L2（共有メモリ）の2段キャッシュが
+下位サービスの呼び出しを省略すること、名前空間でキーが分離されることを検証します。
+"""
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.cached_screening_service import CachedScreeningService
+from app.infrastructure.shared_memory_cache import SharedMemoryResultCache
+
+
+class CountingScreeningService:
+    """呼び出し回数を記録するテスト用サービス"""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def screen(self, content: str) -> str:
+        self.calls.append(content)
+        return content.upper()
+
+
+@pytest.fixture
+def inner():
+    """呼び出し回数を記録する下位サービス"""
+    return CountingScreeningService()
+
+
+@pytest.fixture
+def l2():
+    """テスト用の共有メモリキャッシュ"""
+    cache = SharedMemoryResultCache(64, slot_size=256)
+    yield cache
+    cache.close()
+
+
+def test_l1_hit_skips_inner_service(inner):
+    """2回目の呼び出しが L1 ヒットとなり下位サービスを呼ばないことをテスト"""
+    service = CachedScreeningService(inner, l1_size=8)
+
+    first = asyncio.run(service.screen("abc"))
+    second = asyncio.run(service.screen("abc"))
+
+    assert first == second == "ABC"
+    assert inner.calls == ["abc"]
+    assert service.stats.l1_hits == 1
+    assert service.stats.misses == 1
+
+
+def test_l1_evicts_least_recently_used_entry(inner):
+    """L1 が容量を超えると最も古いエントリを追い出すことをテスト"""
+    service = CachedScreeningService(inner, l1_size=2)
+
+    for content in ["a", "b", "a", "c", "b"]:
+        asyncio.run(service.screen(content))
+
+    # b は c の追加時に追い出されているため再計算される
+    assert inner.calls == ["a", "b", "c", "b"]
+
+
+def test_l2_is_shared_between_service_instances(inner, l2):
+    """別インスタンス（別ワーカー相当）の結果を L2 から取得できることをテスト"""
+    worker_a = CachedScreeningService(inner, l1_size=8, l2=l2)
+    worker_b = CachedScreeningService(inner, l1_size=8, l2=l2)
+
+    asyncio.run(worker_a.screen("共有"))
+    result = asyncio.run(worker_b.screen("共有"))
+
+    assert result == "共有".upper()
+    assert inner.calls == ["共有"]
+    assert worker_b.stats.l2_hits == 1
+
+
+def test_l2_hit_populates_l1(inner, l2):
+    """L2 ヒットした結果が L1 にも格納されることをテスト"""
+    asyncio.run(CachedScreeningService(inner, l2=l2).screen("x"))
+    service = CachedScreeningService(inner, l2=l2)
+
+    asyncio.run(service.screen("x"))
+    asyncio.run(service.screen("x"))
+
+    assert service.stats.l2_hits == 1
+    assert service.stats.l1_hits == 1
+
+
+def test_namespace_separates_cache_keys(inner, l2):
+    """名前空間が異なるとキャッシュを共有しないことをテスト"""
+    v1 = CachedScreeningService(inner, l2=l2, namespace="rules-v1")
+    v2 = CachedScreeningService(inner, l2=l2, namespace="rules-v2")
+
+    assert v1.cache_key("same") != v2.cache_key("same")
+    asyncio.run(v1.screen("same"))
+    asyncio.run(v2.screen("same"))
+
+    assert inner.calls == ["same", "same"]
+
+
+def test_disabled_l1_always_calls_inner_without_l2(inner):
+    """L1 無効かつ L2 なしの場合は毎回下位サービスを呼ぶことをテスト"""
+    service = CachedScreeningService(inner, l1_size=0)
+
+    asyncio.run(service.screen("a"))
+    asyncio.run(service.screen("a"))
+
+    assert inner.calls == ["a", "a"]
+
+
+def test_reload_switches_namespace_to_new_version(inner, l2):
+    """下位サービスが差し替わると新しいバージョンのキーで参照することをテスト"""
+
+    class VersionedService(CountingScreeningService):
+        async def reload(self, *, force: bool = False) -> str | None:
+            return "rules-v2"
+
+    versioned = VersionedService()
+    service = CachedScreeningService(versioned, l2=l2, namespace="rules-v1")
+    key_before = service.cache_key("same")
+
+    async def run() -> str | None:
+        await service.screen("same")
+        version = await service.reload()
+        await service.screen("same")
+        return version
+
+    assert asyncio.run(run()) == "rules-v2"
+    assert service.cache_key("same") != key_before
+    assert service.cache_key("same") == CachedScreeningService(
+        versioned, namespace="rules-v2"
+    ).cache_key("same")
+    assert versioned.calls == ["same", "same"]
+
+
+def test_lone_surrogates_are_cached_in_l1_and_l2(inner, l2):
+    """孤立サロゲートを含むテキストも L1・L2 にキャッシュできることをテスト"""
+    content = "a\ud800b"
+    worker_a = CachedScreeningService(inner, l2=l2)
+    worker_b = CachedScreeningService(inner, l2=l2)
+
+    asyncio.run(worker_a.screen(content))
+    asyncio.run(worker_a.screen(content))
+    result = asyncio.run(worker_b.screen(content))
+
+    assert result == content.upper()
+    assert inner.calls == [content]
+    assert worker_a.stats.l1_hits == 1
+    assert worker_b.stats.l2_hits == 1
@@ -0,0 +1,258 @@
+"""
+CircuitBreakerScreeningService のユニットテスト
+
+このモジュールは、障害を注入したスコアリングAPIスタブに対して、
+失敗率や遅延がしきい値を超えるとサーキットが開き、即座に失敗または
+フォールバックすること、reset_timeout 後の試行で回復することを検証します。
+フォールバックの暫定の結果がキャッシュに残らないことも確認します。
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.domain.screening_result import ScreeningResult, Verdict
+from app.infrastructure.cached_screening_service import CachedScreeningService
+from app.infrastructure.circuit_breaker_service import (
+    CircuitBreakerScreeningService,
+    CircuitOpenError,
+    CircuitState,
+)
+from app.infrastructure.remote_screening_service import RemoteScreeningService
+from app.infrastructure.screening_service_impl import EchoScreeningService
+from tests.stubs.scoring_server import FaultInjection, create_stub_app
+
+
+class FakeClock:
+    """テスト用の手動で進める時計"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def stub():
+    """障害注入可能なスコアリングAPIスタブ"""
+    return create_stub_app(faults=FaultInjection())
+
+
+@pytest.fixture
+def remote(stub):
+    """スタブに接続する RemoteScreeningService"""
+    return RemoteScreeningService(
+        "http://scoring.test", transport=httpx.ASGITransport(app=stub)
+    )
+
+
+async def _screen_all(service, contents):
+    return await asyncio.gather(
+        *(service.screen(content) for content in contents), return_exceptions=True
+    )
+
+
+def test_opens_after_failure_rate_threshold(stub, remote):
+    """失敗率がしきい値を超えるとサーキットが開き、呼び出しを遮断することをテスト"""
+    stub.state.faults.error_rate = 1.0
+    service = CircuitBreakerScreeningService(
+        remote, failure_rate_threshold=0.5, window=4, min_calls=4
+    )
+
+    async def run():
+        results = [await _screen_all(service, ["x"]) for _ in range(6)]
+        await service.aclose()
+        return [result for batch in results for result in batch]
+
+    results = asyncio.run(run())
+
+    assert service.state is CircuitState.OPEN
+    assert stub.state.requests == 4
+    assert service.stats.rejected == 2
+    assert all(isinstance(r, ScreeningUnavailableError) for r in results)
+    assert all(isinstance(r, CircuitOpenError) for r in results[4:])
+
+
+def test_falls_back_to_local_service_while_open(stub, remote):
+    """フォールバック指定時は遮断中もローカル実装で応答することをテスト"""
+    stub.state.faults.error_rate = 1.0
+    service = CircuitBreakerScreeningService(
+        remote, fallback=EchoScreeningService(), window=2, min_calls=2
+    )
+
+    async def run():
+        try:
+            return [await service.screen(f"t{i}") for i in range(5)]
+        finally:
+            await service.aclose()
+
+    assert asyncio.run(run()) == [f"t{i}" for i in range(5)]
+    assert service.state is CircuitState.OPEN
+    assert stub.state.requests == 2
+    assert service.stats.fallbacks == 5
+
+
+def test_slow_calls_count_as_failures(stub, remote):
+    """slow_call_threshold を超えた呼び出しが失敗として数えられることをテスト"""
+    stub.state.faults.slow_rate = 1.0
+    stub.state.faults.slow_latency = 0.02
+    service = CircuitBreakerScreeningService(
+        remote, slow_call_threshold=0.005, window=3, min_calls=3
+    )
+
+    async def run():
+        try:
+            for _ in range(3):
+                await service.screen("slow")
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+
+    assert service.stats.slow_calls == 3
+    assert service.state is CircuitState.OPEN
+
+
+def test_half_open_probe_closes_circuit_after_recovery(stub, remote):
+    """reset_timeout 後の試行が成功するとサーキットが閉じることをテスト"""
+    clock = FakeClock()
+    stub.state.faults.error_rate = 1.0
+    service = CircuitBreakerScreeningService(
+        remote, window=2, min_calls=2, reset_timeout=5.0, clock=clock
+    )
+
+    async def run():
+        await _screen_all(service, ["a"])
+        await _screen_all(service, ["b"])
+        assert service.state is CircuitState.OPEN
+
+        stub.state.faults.error_rate = 0.0
+        clock.now = 5.0
+        assert service.state is CircuitState.HALF_OPEN
+        result = await service.screen("recovered")
+        await service.aclose()
+        return result
+
+    assert asyncio.run(run()) == "recovered"
+    assert service.state is CircuitState.CLOSED
+
+
+def test_failed_half_open_probe_reopens_circuit(stub, remote):
+    """reset_timeout 後の試行が失敗すると再びサーキットが開くことをテスト"""
+    clock = FakeClock()
+    stub.state.faults.error_rate = 1.0
+    service = CircuitBreakerScreeningService(
+        remote, window=2, min_calls=2, reset_timeout=5.0, clock=clock
+    )
+
+    async def run():
+        await _screen_all(service, ["a", "b"])
+        clock.now = 5.0
+        probe = await _screen_all(service, ["probe"])
+        await service.aclose()
+        return probe
+
+    (probe,) = asyncio.run(run())
+
+    assert not isinstance(probe, CircuitOpenError)
+    assert service.state is CircuitState.OPEN
+    assert service.stats.opened == 2
+
+
+def test_successful_calls_keep_circuit_closed(remote):
+    """障害がなければサーキットが閉じたままであることをテスト"""
+    service = CircuitBreakerScreeningService(remote, window=4, min_calls=4)
+
+    async def run():
+        try:
+            return await service.analyze_many(["女性限定", "歓迎"])
+        finally:
+            await service.aclose()
+
+    results = asyncio.run(run())
+
+    assert [result.content for result in results] == ["女性限定", "歓迎"]
+    assert service.state is CircuitState.CLOSED
+    assert service.stats.calls == 1
+
+
+class FlakyBlockingService:
+    """failing の間は失敗し、それ以外は BLOCK を返すサービス"""
+
+    def __init__(self) -> None:
+        self.failing = True
+
+    async def screen(self, content: str) -> str:
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        if self.failing:
+            raise ScreeningUnavailableError("障害中")
+        return ScreeningResult(content=content, score=1.0, verdict=Verdict.BLOCK)
+
+
+def test_fallback_results_are_not_cached():
+    """障害中のフォールバックの結果を回復後にキャッシュから返さないことをテスト"""
+    clock = FakeClock()
+    backend = FlakyBlockingService()
+    service = CachedScreeningService(
+        CircuitBreakerScreeningService(
+            backend,
+            fallback=EchoScreeningService(),
+            window=1,
+            min_calls=1,
+            reset_timeout=5.0,
+            clock=clock,
+        ),
+        l1_size=16,
+    )
+
+    during = asyncio.run(service.analyze("男性のみ募集"))
+    backend.failing = False
+    clock.now = 5.0
+    after = asyncio.run(service.analyze("男性のみ募集"))
+
+    assert (during.verdict, during.degraded) == (Verdict.PASS, True)
+    assert (after.verdict, after.degraded) == (Verdict.BLOCK, False)
+    assert service.stats.misses == 2
+
+
+def test_cancelled_half_open_probe_releases_its_slot():
+    """キャンセルされた試行が実行枠を返し、次の試行が通ることをテスト"""
+    clock = FakeClock()
+    backend = FlakyBlockingService()
+    service = CircuitBreakerScreeningService(
+        backend, window=1, min_calls=1, reset_timeout=5.0, clock=clock
+    )
+    hang = asyncio.Event()
+
+    async def run():
+        with pytest.raises(ScreeningUnavailableError):
+            await service.analyze("a")
+        assert service.state is CircuitState.OPEN
+
+        clock.now = 5.0
+        original = backend.analyze
+
+        async def hanging(content):
+            await hang.wait()
+            return await original(content)
+
+        backend.analyze = hanging
+        probe = asyncio.create_task(service.analyze("probe"))
+        await asyncio.sleep(0)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        backend.analyze = original
+        backend.failing = False
+        return await service.analyze("retry")
+
+    result = asyncio.run(run())
+
+    assert result.verdict is Verdict.BLOCK
+    assert service.state is CircuitState.CLOSED
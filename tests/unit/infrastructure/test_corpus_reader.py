@@ -0,0 +1,65 @@
+"""
+CorpusReader のユニットテスト
+
+このモジュールは、JSONL の改行と CSV の引用符の外の改行でレコードの
+終了位置の索引を作ること、ブロックの境界をまたぐ引用符の状態を
+引き継ぐこと、NumPy がない場合も同じ索引になること、範囲をコピーせずに
+読めることを検証します。
+"""
+
+import sys
+
+import pytest
+
+from app.infrastructure import corpus_reader
+from app.infrastructure.corpus_reader import CorpusReader
+
+CSV = b'id,body\n1,"a\nb"\n2,"x ""y"""\n3,z'
+
+
+def test_jsonl_index_and_zero_copy_view(tmp_path):
+    """JSONL の各行の終了位置を返し、範囲を memoryview で読めることをテスト"""
+    path = tmp_path / "in.jsonl"
+    path.write_bytes(b'{"a":1}\n\n{"b":2}')
+
+    with CorpusReader(path) as corpus:
+        assert list(corpus.record_ends) == [8, 9, 16]
+        view = corpus.view(9, 16)
+        assert isinstance(view, memoryview)
+        assert str(view, "utf-8") == '{"b":2}'
+        view.release()
+
+
+def test_csv_newlines_inside_quotes_are_not_boundaries(tmp_path, monkeypatch):
+    """CSV の引用符内の改行で分割せず、ブロックの境界をまたいでも同じことをテスト"""
+    path = tmp_path / "in.csv"
+    path.write_bytes(CSV)
+
+    with CorpusReader(path, corpus_format="csv") as corpus:
+        assert list(corpus.record_ends) == [8, 16, 28, 31]
+    monkeypatch.setattr(corpus_reader, "_SCAN_BLOCK", 3)
+    with CorpusReader(path, corpus_format="csv") as corpus:
+        assert list(corpus.record_ends) == [8, 16, 28, 31]
+
+
+@pytest.mark.parametrize("corpus_format", ["jsonl", "csv"])
+def test_index_without_numpy_is_identical(tmp_path, monkeypatch, corpus_format):
+    """NumPy がない場合も同じ索引を作ることをテスト"""
+    path = tmp_path / "in.csv"
+    path.write_bytes(CSV * 50)
+    with CorpusReader(path, corpus_format=corpus_format) as corpus:
+        expected = list(corpus.record_ends)
+
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with CorpusReader(path, corpus_format=corpus_format) as corpus:
+        assert list(corpus.record_ends) == expected
+
+
+def test_empty_file_has_no_records(tmp_path):
+    """空のファイルはレコードのない索引になることをテスト"""
+    path = tmp_path / "empty.jsonl"
+    path.write_bytes(b"")
+
+    with CorpusReader(path) as corpus:
+        assert list(corpus.record_ends) == []
+        assert bytes(corpus.view(0, 0)) == b""
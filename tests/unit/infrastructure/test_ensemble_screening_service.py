@@ -0,0 +1,294 @@
+"""
+EnsembleScreeningService のユニットテスト
+
+このモジュールは、実装を並行に呼び出して判定・スコア・検出箇所を統合すること、
+decisive な実装の BLOCK や多数決の確定で残りの呼び出しをキャンセルすること、
+持ち時間を超えた実装や失敗した実装を棄権として扱い、棄権や暫定の結果を
+含む統合結果を degraded としてキャッシュしないこと、および設定から
+アンサンブルを組み立てることを検証します。
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.domain.screening_result import Finding, ScreeningResult, Verdict
+from app.infrastructure.cached_screening_service import CachedScreeningService
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.ensemble_screening_service import (
+    EnsembleMember,
+    EnsembleScreeningService,
+)
+from app.infrastructure.screening_service_impl import EchoScreeningService
+from app.infrastructure.service_factory import create_screening_service
+
+
+class FixedService:
+    """遅延の後に決まった結果を返し、キャンセルを記録するサービス"""
+
+    def __init__(
+        self,
+        verdict: Verdict = Verdict.PASS,
+        score: float = 0.0,
+        *,
+        delay: float = 0.0,
+        findings: tuple[Finding, ...] = (),
+        error: Exception | None = None,
+        degraded: bool = False,
+    ) -> None:
+        self.verdict = verdict
+        self.score = score
+        self.delay = delay
+        self.findings = findings
+        self.error = error
+        self.degraded = degraded
+        self.calls = 0
+        self.cancelled = 0
+
+    async def screen(self, content: str) -> str:
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return ScreeningResult(
+            content=content,
+            score=self.score,
+            verdict=self.verdict,
+            findings=self.findings,
+            degraded=self.degraded,
+        )
+
+
+def test_members_run_concurrently_and_max_strategy_combines():
+    """実装を並行に呼び出し、最も重い判定・最大のスコア・検出箇所の和集合を返すことをテスト"""
+    first = Finding(kind="a", start=0, end=2, replacement="**")
+    second = Finding(kind="b", start=3, end=5)
+    service = EnsembleScreeningService(
+        [
+            EnsembleMember(
+                "a", FixedService(Verdict.REVIEW, 0.6, delay=0.1, findings=(first,))
+            ),
+            EnsembleMember(
+                "b", FixedService(Verdict.PASS, 0.2, delay=0.1, findings=(second,))
+            ),
+        ]
+    )
+
+    started = time.perf_counter()
+    result = asyncio.run(service.analyze("ab cd"))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.18
+    assert result.verdict is Verdict.REVIEW
+    assert result.score == pytest.approx(0.6)
+    assert result.findings == (first, second)
+    assert result.content == "** cd"
+
+
+def test_decisive_block_cancels_remaining_members():
+    """decisive な実装の BLOCK で確定し、残りの呼び出しをキャンセルすることをテスト"""
+    rules = FixedService(Verdict.BLOCK, 0.9)
+    model = FixedService(Verdict.PASS, 0.1, delay=1.0)
+    service = EnsembleScreeningService(
+        [EnsembleMember("rules", rules, decisive=True), EnsembleMember("model", model)],
+        strategy="vote",
+    )
+
+    started = time.perf_counter()
+    result = asyncio.run(service.analyze("text"))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert result.verdict is Verdict.BLOCK
+    assert model.cancelled == 1
+    assert service.stats.early_exits == 1
+    # 早期終了でキャンセルした実装は棄権ではない
+    assert not result.degraded
+
+
+def test_decisive_member_is_floor_of_vote():
+    """decisive な実装の BLOCK は多数決で負けても統合後の判定の下限になることをテスト"""
+    service = EnsembleScreeningService(
+        [
+            EnsembleMember(
+                "rules", FixedService(Verdict.BLOCK, 0.9, delay=0.05), decisive=True
+            ),
+            EnsembleMember("a", FixedService(Verdict.PASS, 0.0)),
+            EnsembleMember("b", FixedService(Verdict.PASS, 0.0)),
+        ],
+        strategy="vote",
+    )
+
+    result = asyncio.run(service.analyze("text"))
+
+    assert result.verdict is Verdict.BLOCK
+    # 多数決が先に確定しても、decisive な実装は打ち切られない
+    assert service.stats.early_exits == 0
+
+
+def test_vote_settles_when_remaining_weight_cannot_overturn():
+    """残りの実装の票で逆転できなくなった時点で確定することをテスト"""
+    slow = FixedService(Verdict.BLOCK, 1.0, delay=1.0)
+    service = EnsembleScreeningService(
+        [
+            EnsembleMember("a", FixedService(Verdict.REVIEW, 0.6), weight=2.0),
+            EnsembleMember("b", FixedService(Verdict.REVIEW, 0.4), weight=2.0),
+            EnsembleMember("slow", slow, weight=1.0),
+        ],
+        strategy="vote",
+    )
+
+    result = asyncio.run(service.analyze("text"))
+
+    assert result.verdict is Verdict.REVIEW
+    assert result.score == pytest.approx(0.5)
+    assert slow.cancelled == 1
+    assert service.stats.early_exits == 1
+
+
+def test_vote_tie_prefers_more_severe_verdict():
+    """多数決が同数の場合は重い判定を採用し、スコアは重み付き平均になることをテスト"""
+    service = EnsembleScreeningService(
+        [
+            EnsembleMember("a", FixedService(Verdict.PASS, 0.2)),
+            EnsembleMember("b", FixedService(Verdict.REVIEW, 0.6)),
+        ],
+        strategy="vote",
+    )
+
+    result = asyncio.run(service.analyze("text"))
+
+    assert result.verdict is Verdict.REVIEW
+    assert result.score == pytest.approx(0.4)
+
+
+def test_slow_and_failing_members_abstain():
+    """持ち時間を超えた実装と失敗した実装を棄権として扱うことをテスト"""
+    slow = FixedService(Verdict.BLOCK, 1.0, delay=1.0)
+    service = EnsembleScreeningService(
+        [
+            EnsembleMember("fast", FixedService(Verdict.REVIEW, 0.5)),
+            EnsembleMember("slow", slow, timeout=0.05),
+            EnsembleMember("broken", FixedService(error=RuntimeError("down"))),
+        ],
+        timeout=1.0,
+    )
+
+    started = time.perf_counter()
+    result = asyncio.run(service.analyze("text"))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert result.verdict is Verdict.REVIEW
+    assert slow.cancelled == 1
+    assert service.stats.timeouts == 1
+    assert service.stats.errors == 1
+
+
+def test_abstention_marks_result_degraded_and_uncached():
+    """棄権した実装がある結果は degraded になり、キャッシュされないことをテスト"""
+    fast = FixedService(Verdict.PASS, 0.1)
+    service = CachedScreeningService(
+        EnsembleScreeningService(
+            [
+                EnsembleMember("fast", fast),
+                EnsembleMember("slow", FixedService(Verdict.BLOCK, 1.0, delay=1.0)),
+            ],
+            timeout=0.05,
+        ),
+        l1_size=16,
+    )
+
+    first = asyncio.run(service.analyze("text"))
+    second = asyncio.run(service.analyze("text"))
+
+    assert (first.verdict, first.degraded) == (Verdict.PASS, True)
+    assert second.degraded
+    assert fast.calls == 2
+    assert service.stats.misses == 2
+
+
+def test_degraded_member_marks_result_degraded_and_uncached():
+    """暫定の結果を返した実装がある結果は degraded でキャッシュされないことをテスト"""
+    model = FixedService(Verdict.PASS, 0.1, degraded=True)
+    ensemble = EnsembleScreeningService(
+        [
+            EnsembleMember("rules", FixedService(Verdict.PASS, 0.0)),
+            EnsembleMember("model", model),
+        ]
+    )
+    service = CachedScreeningService(ensemble, l1_size=16)
+
+    first = asyncio.run(service.analyze("text"))
+    second = asyncio.run(service.analyze("text"))
+    (batch,) = asyncio.run(ensemble.analyze_many(["text"]))
+
+    assert first.degraded and second.degraded
+    assert batch.degraded
+    assert model.calls == 3
+    assert service.stats.misses == 2
+
+
+def test_all_members_abstaining_raises():
+    """すべての実装が棄権した場合は ScreeningUnavailableError を送出することをテスト"""
+    service = EnsembleScreeningService(
+        [
+            EnsembleMember("slow", FixedService(delay=1.0)),
+            EnsembleMember("broken", FixedService(error=RuntimeError("down"))),
+        ],
+        timeout=0.05,
+    )
+
+    with pytest.raises(ScreeningUnavailableError) as excinfo:
+        asyncio.run(service.analyze("text"))
+    with pytest.raises(ScreeningUnavailableError):
+        asyncio.run(service.analyze_many(["text"]))
+
+    assert isinstance(excinfo.value.__cause__, TimeoutError | RuntimeError)
+
+
+def test_analyze_many_combines_per_content():
+    """analyze_many() が各実装のバッチ結果をテキストごとに統合することをテスト"""
+    service = EnsembleScreeningService(
+        [
+            EnsembleMember("echo", EchoScreeningService()),
+            EnsembleMember("review", FixedService(Verdict.REVIEW, 0.5)),
+        ]
+    )
+
+    results = asyncio.run(service.analyze_many(["a", "b"]))
+
+    assert [result.content for result in results] == ["a", "b"]
+    assert all(result.verdict is Verdict.REVIEW for result in results)
+
+
+def test_invalid_members_are_rejected():
+    """実装がない、名前の重複、正でない重みは ValueError になることをテスト"""
+    echo = EchoScreeningService()
+    with pytest.raises(ValueError):
+        EnsembleScreeningService([])
+    with pytest.raises(ValueError):
+        EnsembleScreeningService([EnsembleMember("a", echo), EnsembleMember("a", echo)])
+    with pytest.raises(ValueError):
+        EnsembleScreeningService([EnsembleMember("a", echo, weight=0.0)])
+
+
+def test_factory_builds_ensemble_from_settings():
+    """ensemble_backends を指定すると設定からアンサンブルを組み立てることをテスト"""
+    service = create_screening_service(
+        Settings(ensemble_backends=["echo"], ensemble_strategy="vote", cache_size=0)
+    )
+
+    assert isinstance(service, EnsembleScreeningService)
+    assert asyncio.run(service.screen("text")) == "text"
+    with pytest.raises(ValueError):
+        create_screening_service(Settings(ensemble_backends=["echo", "echo"]))
@@ -0,0 +1,122 @@
+"""
+HedgedScreeningService のユニットテスト
+
+このモジュールは、呼び出しがヘッジ遅延を超えると重複呼び出しが発行され、
+先に成功した結果が採用されること、ヘッジ遅延がレイテンシの
+パーセンタイルに追従することを検証します。
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.domain.screening_result import ScreeningResult
+from app.infrastructure.hedged_screening_service import HedgedScreeningService
+from app.infrastructure.remote_screening_service import RemoteScreeningService
+from tests.stubs.scoring_server import FaultInjection, create_stub_app
+
+
+class ScriptedService:
+    """呼び出しごとに指定した遅延・例外で応答するテスト用サービス"""
+
+    def __init__(self, script: list[float | Exception]) -> None:
+        self.script = list(script)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def screen(self, content: str) -> str:
+        self.calls += 1
+        call = self.calls
+        step = self.script[(call - 1) % len(self.script)]
+        if isinstance(step, Exception):
+            raise step
+        try:
+            await asyncio.sleep(step)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"{content}#{call}"
+
+
+def test_fast_call_is_not_hedged():
+    """ヘッジ遅延内に完了した呼び出しは重複発行されないことをテスト"""
+    inner = ScriptedService([0.0])
+    service = HedgedScreeningService(inner, initial_delay=0.5)
+
+    assert asyncio.run(service.screen("a")) == "a#1"
+    assert inner.calls == 1
+    assert service.stats.hedged == 0
+
+
+def test_slow_call_is_hedged_and_loser_cancelled():
+    """遅い呼び出しが重複発行され、先に完了した結果が採用されることをテスト"""
+    inner = ScriptedService([1.0, 0.0])
+    service = HedgedScreeningService(inner, initial_delay=0.01)
+
+    result = asyncio.run(asyncio.wait_for(service.analyze("a"), timeout=0.5))
+
+    assert result == ScreeningResult("a#2")
+    assert inner.calls == 2
+    assert inner.cancelled == 1
+    assert service.stats.hedged == 1
+    assert service.stats.hedge_wins == 1
+
+
+def test_failure_of_one_attempt_waits_for_the_other():
+    """一方が失敗しても、もう一方の成功結果を返すことをテスト"""
+    inner = ScriptedService([0.05, RuntimeError("boom")])
+    service = HedgedScreeningService(inner, initial_delay=0.01)
+
+    assert asyncio.run(service.screen("a")) == "a#1"
+    assert service.stats.hedged == 1
+    assert service.stats.hedge_wins == 0
+
+
+def test_error_is_raised_when_all_attempts_fail():
+    """すべての呼び出しが失敗した場合に例外を送出することをテスト"""
+    inner = ScriptedService([RuntimeError("boom")])
+    service = HedgedScreeningService(inner, initial_delay=0.01)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(service.screen("a"))
+
+
+def test_hedge_delay_tracks_latency_quantile():
+    """ヘッジ遅延が成功した呼び出しのパーセンタイルに更新されることをテスト"""
+    service = HedgedScreeningService(
+        ScriptedService([0.0]), quantile=0.9, min_samples=20, min_delay=0.0
+    )
+
+    for latency in range(1, 21):
+        service._record(latency / 1000)
+
+    assert service.hedge_delay == pytest.approx(0.019)
+
+
+def test_hedging_cuts_tail_latency_against_fault_injecting_stub():
+    """遅延を注入したスタブで、ヘッジにより最悪レイテンシが抑えられることをテスト"""
+    stub = create_stub_app(
+        faults=FaultInjection(slow_rate=0.2, slow_latency=0.3, seed=8)
+    )
+    remote = RemoteScreeningService(
+        "http://scoring.test", transport=httpx.ASGITransport(app=stub)
+    )
+    service = HedgedScreeningService(remote, initial_delay=0.02, min_samples=1000)
+
+    async def run() -> float:
+        worst = 0.0
+        try:
+            for _ in range(20):
+                loop = asyncio.get_running_loop()
+                started = loop.time()
+                await service.screen("男性限定")
+                worst = max(worst, loop.time() - started)
+        finally:
+            await service.aclose()
+        return worst
+
+    worst = asyncio.run(run())
+
+    assert service.stats.hedged > 0
+    assert worst < 0.3
@@ -0,0 +1,145 @@
+"""
+ScreeningResultStore と差分の再スクリーニングのユニットテスト
+
+このモジュールは、ストアの転置索引がルールの照合と同じ正規化で語句を
+含み得るドキュメントを返すこと、ルールセットの変更で影響を受け得る
+ドキュメントだけを再スクリーニングして残りを省くこと、途中で追加された
+ドキュメントや記録のないストアは全件を再スクリーニングすることを検証します。
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.domain.rule import Rule
+from app.domain.screening_result import ScreeningResult, Verdict
+from app.infrastructure.incremental_rescreen import changed_terms, rescreen_changed
+from app.infrastructure.result_store import ScreeningResultStore
+from app.infrastructure.rule_screening_service import RuleScreeningService
+
+DOCUMENTS = {
+    "male": "男性限定の募集です。",
+    "young": "３０歳以下の方を募集します。",
+    "plain": "経験者歓迎の職場です。",
+    "english": "We are hiring ENGINEERS.",
+}
+
+RULES = [
+    {"id": "male", "kind": "gender", "terms": ["男性限定"], "verdict": "block"},
+    {"id": "age", "kind": "age", "terms": ["30歳以下"], "verdict": "review"},
+]
+
+
+def compile_rules(tmp_path, rules) -> RuleScreeningService:
+    path = tmp_path / f"rules-{len(list(tmp_path.iterdir()))}.json"
+    path.write_text(json.dumps({"rules": rules}, ensure_ascii=False))
+    return RuleScreeningService.compile_source(path)
+
+
+def populate(store: ScreeningResultStore, service: RuleScreeningService) -> None:
+    store.put_many(
+        (
+            (doc_id, content, service.evaluate(content))
+            for doc_id, content in DOCUMENTS.items()
+        ),
+        version=service.version,
+    )
+
+
+def test_candidates_use_rule_normalization():
+    """全角・半角や大文字・小文字を正規化して語句を含み得る文書を返すことをテスト"""
+    store = ScreeningResultStore()
+    for doc_id, content in DOCUMENTS.items():
+        store.put(doc_id, content, ScreeningResult(content), version="v1")
+
+    assert store.candidates(["30歳以下"]) == {"young"}
+    assert store.candidates(["engineer"]) == {"english"}
+    assert store.candidates(["。"]) == {"male", "young", "plain"}
+    assert store.candidates(["女性限定", ""]) == set()
+
+
+def test_put_replaces_document_and_its_index():
+    """同じ識別子で保存すると本文と索引を置き換えることをテスト"""
+    store = ScreeningResultStore()
+    store.put("doc", "男性限定", ScreeningResult("男性限定"), version="v1")
+    store.put("doc", "経験者歓迎", ScreeningResult("経験者歓迎"), version="v2")
+
+    assert len(store) == 1
+    assert store.candidates(["男性"]) == set()
+    assert store.get("doc").content == "経験者歓迎"
+    assert store.get("doc").version == "v2"
+    assert store.get("missing") is None
+
+
+def test_store_accepts_lone_surrogates():
+    """孤立サロゲートを含む本文を保存し、索引で検索できることをテスト"""
+    content = "abc\ud800def"
+    store = ScreeningResultStore()
+    store.put("d1", content, ScreeningResult(content), version="v1")
+
+    assert store.get("d1").content == content
+    assert store.get("d1").result.content == content
+    assert store.candidates(["c\ud800d"]) == {"d1"}
+    assert store.candidates(["\ud800"]) == {"d1"}
+    assert store.candidates(["\ud801"]) == set()
+
+
+def test_changed_terms_include_old_and_new_terms():
+    """追加・削除・変更されたルールの変更前後の語句を返すことをテスト"""
+    old = [
+        Rule("keep", "k", ("残す",)),
+        Rule("edit", "k", ("変更前",)),
+        Rule("drop", "k", ("削除",)),
+    ]
+    new = [
+        Rule("keep", "k", ("残す",)),
+        Rule("edit", "k", ("変更後",), verdict=Verdict.BLOCK),
+        Rule("add", "k", ("追加",)),
+    ]
+
+    assert changed_terms(old, new) == {"変更前", "変更後", "削除", "追加"}
+
+
+def test_rescreens_only_documents_affected_by_rule_change(tmp_path):
+    """変更されたルールの語句を含み得る文書だけを再スクリーニングすることをテスト"""
+    store = ScreeningResultStore(tmp_path / "corpus.db")
+    old = compile_rules(tmp_path, RULES)
+    populate(store, old)
+    assert asyncio.run(rescreen_changed(store, old)).rescreened == 0
+
+    new = compile_rules(
+        tmp_path,
+        [
+            RULES[0],
+            {"id": "age", "kind": "age", "terms": ["30歳以下"], "verdict": "block"},
+            {"id": "engineer", "kind": "job", "terms": ["engineers"]},
+        ],
+    )
+    report = asyncio.run(rescreen_changed(store, new))
+
+    assert (report.rescreened, report.skipped, report.changed) == (2, 2, 2)
+    assert report.changed_terms == 2
+    assert store.get("young").result.verdict is Verdict.BLOCK
+    assert store.get("english").result.findings[0].kind == "job"
+    assert store.get("male").version == new.version
+    assert store.ruleset()[0] == new.version
+    store.close()
+
+
+def test_store_without_ruleset_and_new_documents_are_rescreened(tmp_path):
+    """記録のないストアは全件を、後から追加された文書は常に再スクリーニングすることをテスト"""
+    store = ScreeningResultStore()
+    old = compile_rules(tmp_path, RULES)
+    for doc_id, content in DOCUMENTS.items():
+        store.put(doc_id, content, ScreeningResult(content), version="unknown")
+
+    first = asyncio.run(rescreen_changed(store, old, batch_size=1))
+    store.put("late", "経験者歓迎", ScreeningResult("経験者歓迎"), version="unknown")
+    second = asyncio.run(rescreen_changed(store, old))
+
+    assert (first.rescreened, first.skipped, first.changed) == (4, 0, 2)
+    assert first.changed_terms is None
+    assert (second.rescreened, second.skipped) == (1, 4)
+    with pytest.raises(ValueError):
+        asyncio.run(rescreen_changed(store, old, batch_size=0))
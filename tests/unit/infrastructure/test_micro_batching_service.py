@@ -0,0 +1,207 @@
+"""
+MicroBatchingScreeningService のユニットテスト
+
+このモジュールは、並行する呼び出しがバッチにまとめられること、件数または
+待ち時間のどちらかでバッチが送出されること、結果と例外が各呼び出し元に
+正しく返されることを検証します。
+"""
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.domain.screening_result import ScreeningResult
+from app.infrastructure.micro_batching_service import MicroBatchingScreeningService
+
+
+class RecordingBatchService:
+    """受け取ったバッチを記録するテスト用サービス"""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.batches: list[list[str]] = []
+        self.fail = fail
+        self.closed = False
+
+    async def screen(self, content: str) -> str:
+        return content.upper()
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        self.batches.append(list(contents))
+        if self.fail:
+            raise RuntimeError("backend down")
+        return [ScreeningResult(content.upper()) for content in contents]
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class ShortResultService:
+    """バッチより少ない件数の結果を返すテスト用サービス"""
+
+    async def screen(self, content: str) -> str:
+        return content
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        return [ScreeningResult(content) for content in contents[:-1]]
+
+
+class HangingService:
+    """バッチの処理が終わらないテスト用サービス"""
+
+    async def screen(self, content: str) -> str:
+        return content
+
+    async def analyze_many(self, contents: Sequence[str]) -> list[ScreeningResult]:
+        await asyncio.Event().wait()
+        raise AssertionError("到達しない")
+
+
+class SingleItemService:
+    """analyze_many() を持たないテスト用サービス"""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def screen(self, content: str) -> str:
+        self.calls.append(content)
+        return content[::-1]
+
+
+def test_concurrent_calls_are_grouped_into_one_batch():
+    """同時に到着した呼び出しが1バッチにまとめられることをテスト"""
+    inner = RecordingBatchService()
+    service = MicroBatchingScreeningService(inner, max_batch_size=16, max_wait_ms=5)
+
+    async def run() -> list[str]:
+        return await asyncio.gather(*(service.screen(f"t{i}") for i in range(5)))
+
+    results = asyncio.run(run())
+
+    assert results == [f"T{i}" for i in range(5)]
+    assert inner.batches == [[f"t{i}" for i in range(5)]]
+    assert service.stats.batches == 1
+    assert service.stats.mean_batch_size == 5
+
+
+def test_batch_is_dispatched_when_max_batch_size_is_reached():
+    """件数が上限に達するとタイマーを待たずにバッチが送出されることをテスト"""
+    inner = RecordingBatchService()
+    service = MicroBatchingScreeningService(inner, max_batch_size=3, max_wait_ms=10_000)
+
+    async def run() -> list[str]:
+        return await asyncio.gather(*(service.screen(str(i)) for i in range(6)))
+
+    results = asyncio.run(asyncio.wait_for(run(), timeout=2))
+
+    assert results == [str(i) for i in range(6)]
+    assert inner.batches == [["0", "1", "2"], ["3", "4", "5"]]
+    assert dict(service.stats.batch_sizes) == {3: 2}
+
+
+def test_partial_batch_is_dispatched_after_max_wait():
+    """件数が上限に満たなくても待ち時間の経過で送出されることをテスト"""
+    inner = RecordingBatchService()
+    service = MicroBatchingScreeningService(inner, max_batch_size=100, max_wait_ms=1)
+
+    result = asyncio.run(asyncio.wait_for(service.analyze("x"), timeout=2))
+
+    assert result == ScreeningResult("X")
+    assert inner.batches == [["x"]]
+    assert service.stats.max_queue_delay > 0
+    assert service.stats.mean_queue_delay_ms > 0
+
+
+def test_backend_error_is_propagated_to_every_caller():
+    """バッチ処理の例外がバッチ内の全呼び出し元に伝播することをテスト"""
+    inner = RecordingBatchService(fail=True)
+    service = MicroBatchingScreeningService(inner, max_batch_size=8, max_wait_ms=1)
+
+    async def run() -> list:
+        return await asyncio.gather(
+            *(service.screen(str(i)) for i in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert len(inner.batches) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_short_result_list_fails_every_caller():
+    """結果の件数がバッチと合わない場合に全呼び出し元が失敗することをテスト"""
+    service = MicroBatchingScreeningService(
+        ShortResultService(), max_batch_size=8, max_wait_ms=1
+    )
+
+    async def run() -> list:
+        return await asyncio.gather(
+            *(service.screen(str(i)) for i in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(asyncio.wait_for(run(), timeout=2))
+
+    assert all(isinstance(r, ScreeningUnavailableError) for r in results)
+
+
+def test_cancelled_batch_resolves_every_caller():
+    """処理中のバッチが取り消されても呼び出し元が待ち続けないことをテスト"""
+    service = MicroBatchingScreeningService(
+        HangingService(), max_batch_size=2, max_wait_ms=10_000
+    )
+
+    async def run() -> list:
+        callers = [asyncio.ensure_future(service.screen(str(i))) for i in range(2)]
+        await asyncio.sleep(0.01)
+        for task in service._in_flight:
+            task.cancel()
+        return await asyncio.gather(*callers, return_exceptions=True)
+
+    results = asyncio.run(asyncio.wait_for(run(), timeout=2))
+
+    assert all(isinstance(r, ScreeningUnavailableError) for r in results)
+
+
+def test_falls_back_to_single_calls_without_analyze_many():
+    """下位サービスが analyze_many() を持たない場合も結果を返せることをテスト"""
+    inner = SingleItemService()
+    service = MicroBatchingScreeningService(inner, max_batch_size=4, max_wait_ms=1)
+
+    async def run() -> list[str]:
+        return await asyncio.gather(*(service.screen(s) for s in ["ab", "cd"]))
+
+    assert asyncio.run(run()) == ["ba", "dc"]
+    assert sorted(inner.calls) == ["ab", "cd"]
+    assert service.stats.batches == 1
+
+
+def test_aclose_flushes_pending_calls_and_closes_inner_service():
+    """aclose() が待ち行列を送出してから下位サービスを閉じることをテスト"""
+    inner = RecordingBatchService()
+    service = MicroBatchingScreeningService(
+        inner, max_batch_size=100, max_wait_ms=10_000
+    )
+
+    async def run() -> str:
+        pending = asyncio.create_task(service.screen("late"))
+        await asyncio.sleep(0)
+        await service.aclose()
+        return await pending
+
+    assert asyncio.run(asyncio.wait_for(run(), timeout=2)) == "LATE"
+    assert inner.closed
+
+
+@pytest.mark.parametrize(
+    ("max_batch_size", "max_wait_ms"),
+    [(0, 1.0), (1, -1.0)],
+)
+def test_rejects_invalid_limits(max_batch_size, max_wait_ms):
+    """不正な上限値で初期化すると ValueError になることをテスト"""
+    with pytest.raises(ValueError):
+        MicroBatchingScreeningService(
+            RecordingBatchService(),
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+        )
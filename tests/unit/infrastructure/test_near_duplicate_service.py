@@ -0,0 +1,259 @@
+"""
+MinHash/LSH 索引と NearDuplicateScreeningService のユニットテスト
+
+このモジュールは、MinHash 署名が近似重複を高い類似度で推定すること、
+LSH 索引が件数の上限と時間窓で古い登録を追い出すこと、近似重複では
+変更された行だけを下位サービスでスクリーニングし、変わらない行の
+検出箇所を位置をずらして引き継ぐこと、差分が大きい場合と reload() 後は
+全体をスクリーニングすることを検証します。
+"""
+
+import asyncio
+import re
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.domain.screening_result import Finding, ScreeningResult, Verdict  # noqa: E402
+from app.infrastructure.config.settings import Settings  # noqa: E402
+from app.infrastructure.minhash import LshIndex, MinHasher  # noqa: E402
+from app.infrastructure.near_duplicate_service import (  # noqa: E402
+    NearDuplicateScreeningService,
+)
+from app.infrastructure.service_factory import create_screening_service  # noqa: E402
+
+RESUME = "".join(
+    f"{year}年 株式会社サンプル{year} 入社。営業部で法人顧客を担当しました。\n"
+    for year in range(2001, 2021)
+)
+
+
+class TermService:
+    """「男性限定」を検出して BLOCK とし、受け取ったテキストを記録するサービス"""
+
+    def __init__(self, pattern: str = "男性限定", *, degraded: bool = False) -> None:
+        self.calls: list[str] = []
+        self.version = "v1"
+        self.pattern = pattern
+        self.degraded = degraded
+
+    async def screen(self, content: str) -> str:
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        self.calls.append(content)
+        findings = tuple(
+            Finding("term", match.start(), match.end(), "[NG]")
+            for match in re.finditer(self.pattern, content)
+        )
+        return ScreeningResult(
+            content=re.sub(self.pattern, "[NG]", content),
+            score=1.0 if findings else 0.0,
+            verdict=Verdict.BLOCK if findings else Verdict.PASS,
+            findings=findings,
+            degraded=self.degraded,
+        )
+
+    async def reload(self, *, force: bool = False) -> str | None:
+        self.version = "v2"
+        return self.version
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_signature_estimates_similarity_of_near_duplicates():
+    """近似重複の類似度は高く、無関係なテキストの類似度は低いことをテスト"""
+    hasher = MinHasher()
+    original = hasher.signature(RESUME)
+
+    edited = hasher.signature(RESUME.replace("2005年", "2006年"))
+    unrelated = hasher.signature("".join(f"無関係な文章 {i}。\n" for i in range(300)))
+
+    assert original.dtype == np.uint32
+    assert original.shape == (128,)
+    assert MinHasher.similarity(original, hasher.signature(RESUME)) == 1.0
+    assert MinHasher.similarity(original, edited) > 0.9
+    assert MinHasher.similarity(original, unrelated) < 0.2
+
+
+def test_index_returns_most_similar_entry_above_threshold():
+    """閾値以上の登録のうち最も類似したものを返すことをテスト"""
+    hasher = MinHasher()
+    index = LshIndex(num_perm=128, bands=16)
+    index.add("resume", hasher.signature(RESUME), "result")
+
+    match = index.query(hasher.signature(RESUME + "追記。\n"), threshold=0.9)
+
+    assert match is not None
+    assert match.key == "resume"
+    assert match.value == "result"
+    assert (
+        index.query(hasher.signature("まったく別の文章です。"), threshold=0.9) is None
+    )
+
+
+def test_index_evicts_by_capacity_and_window():
+    """件数の上限と時間窓を超えた登録を古いものから追い出すことをテスト"""
+    hasher = MinHasher()
+    clock = FakeClock()
+    index = LshIndex(capacity=2, window=10.0, clock=clock)
+    signatures = [hasher.signature(f"{i}番目の応募書類です。" * 20) for i in range(3)]
+    for i, signature in enumerate(signatures):
+        index.add(f"doc-{i}", signature, i)
+
+    assert len(index) == 2
+    assert index.query(signatures[2], threshold=1.0).key == "doc-2"
+
+    clock.now = 11.0
+    assert index.query(signatures[2], threshold=0.5) is None
+    assert len(index) == 0
+
+
+def test_invalid_index_parameters_are_rejected():
+    """帯の数が署名の長さを割り切らない場合は ValueError になることをテスト"""
+    with pytest.raises(ValueError):
+        LshIndex(num_perm=128, bands=7)
+    with pytest.raises(ValueError):
+        LshIndex(capacity=0)
+    with pytest.raises(ValueError):
+        LshIndex(num_perm=64).add("key", MinHasher().signature("text"), None)
+
+
+def test_near_duplicate_screens_only_changed_lines():
+    """近似重複では変更行と前後の行だけをスクリーニングし、検出箇所を引き継ぐことをテスト"""
+    backend = TermService()
+    service = NearDuplicateScreeningService(backend)
+    original = "男性限定の求人に応募しました。\n" + RESUME
+    edited = original.replace("2010年", "2010年 男性限定")
+
+    first = asyncio.run(service.analyze(original))
+    second = asyncio.run(service.analyze(edited))
+
+    assert backend.calls[0] == original
+    assert backend.calls[1:] == [
+        "".join(
+            line
+            for line in edited.splitlines(keepends=True)
+            if line.startswith(("2009年", "2010年", "2011年"))
+        )
+    ]
+    assert first.verdict is Verdict.BLOCK
+    assert second == asyncio.run(TermService().analyze(edited))
+    assert service.stats.near_hits == 1
+    assert service.stats.screened_chars == len(original) + len(backend.calls[1])
+
+
+@pytest.mark.parametrize(
+    ("original", "edited"),
+    [
+        # 変更した行の末尾と、変わらない次の行の先頭にまたがる
+        (
+            RESUME + "営業部は女性\n限定の求人です。\n",
+            RESUME + "営業部は男性\n限定の求人です。\n",
+        ),
+        # 間の行を削除して隣り合った2行にまたがる
+        (
+            RESUME + "男性\n削除する行\n限定の求人です。\n",
+            RESUME + "男性\n限定の求人です。\n",
+        ),
+    ],
+    ids=["changed-line", "deleted-line"],
+)
+def test_near_duplicate_finds_matches_across_line_boundaries(original, edited):
+    """行の境目をまたぐ検出を、全体のスクリーニングと同じく見つけることをテスト"""
+    backend = TermService(r"男性\n限定")
+    service = NearDuplicateScreeningService(backend)
+
+    first = asyncio.run(service.analyze(original))
+    second = asyncio.run(service.analyze(edited))
+
+    assert first.verdict is Verdict.PASS
+    assert service.stats.near_hits == 1
+    assert second == asyncio.run(TermService(r"男性\n限定").analyze(edited))
+
+
+def test_degraded_results_are_not_indexed():
+    """フォールバックによる暫定の結果は近似重複の基準にしないことをテスト"""
+    backend = TermService(degraded=True)
+    service = NearDuplicateScreeningService(backend)
+    asyncio.run(service.analyze(RESUME))
+
+    backend.degraded = False
+    asyncio.run(service.analyze(RESUME + "追記。\n"))
+
+    assert backend.calls == [RESUME, RESUME + "追記。\n"]
+    assert service.stats.near_hits == 0
+
+
+def test_lone_surrogates_are_indexed():
+    """孤立サロゲートを含むテキストも署名を計算して登録できることをテスト"""
+    backend = TermService()
+    service = NearDuplicateScreeningService(backend)
+    original = RESUME + "壊れた文字\ud800\n"
+
+    asyncio.run(service.analyze(original))
+    result = asyncio.run(service.analyze(original + "追記。\n"))
+
+    assert result.content == original + "追記。\n"
+    assert service.stats.near_hits == 1
+
+
+def test_near_duplicate_keeps_prior_verdict():
+    """違反を含む行を削除しても判定は過去の結果より軽くならないことをテスト"""
+    backend = TermService()
+    service = NearDuplicateScreeningService(backend)
+    original = RESUME + "男性限定\n"
+
+    asyncio.run(service.analyze(original))
+    result = asyncio.run(service.analyze(RESUME + "女性も歓迎\n"))
+
+    assert result.verdict is Verdict.BLOCK
+    assert result.findings == ()
+    assert result.content == RESUME + "女性も歓迎\n"
+
+
+def test_large_change_and_short_text_are_screened_in_full():
+    """差分が大きい場合と短いテキストは全体をスクリーニングすることをテスト"""
+    backend = TermService()
+    service = NearDuplicateScreeningService(backend, threshold=0.5)
+    asyncio.run(service.analyze(RESUME))
+    rewritten = RESUME.replace("営業部", "開発部").replace("法人", "個人")
+
+    asyncio.run(service.analyze(rewritten))
+    asyncio.run(service.analyze("短い"))
+    asyncio.run(service.analyze("短い"))
+
+    assert backend.calls == [RESUME, rewritten, "短い", "短い"]
+    assert service.stats.near_hits == 0
+
+
+def test_reload_clears_index():
+    """下位サービスが差し替わると過去の結果を引き継がないことをテスト"""
+    backend = TermService()
+    service = NearDuplicateScreeningService(backend)
+    asyncio.run(service.analyze(RESUME))
+
+    assert asyncio.run(service.reload()) == "v2"
+    asyncio.run(service.analyze(RESUME + "追記。\n"))
+
+    assert backend.calls == [RESUME, RESUME + "追記。\n"]
+
+
+def test_factory_wraps_when_capacity_is_set():
+    """near_duplicate_capacity を指定するとデコレーターで包むことをテスト"""
+    service = create_screening_service(
+        Settings(near_duplicate_capacity=16, cache_size=0)
+    )
+
+    assert isinstance(service, NearDuplicateScreeningService)
+    assert not isinstance(
+        create_screening_service(Settings(cache_size=0)),
+        NearDuplicateScreeningService,
+    )
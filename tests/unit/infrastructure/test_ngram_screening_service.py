@@ -0,0 +1,171 @@
+"""
+NgramScreeningService と文字n-gramモデルのユニットテスト
+
+このモジュールは、ハッシュ特徴量がドキュメント境界をまたがないこと、
+バッチと1件ずつのスコアが一致すること、学習・保存・読み込みと
+しきい値による判定を検証します。
+"""
+
+import asyncio
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.domain.screening_result import Verdict  # noqa: E402
+from app.infrastructure.ngram_model import (  # noqa: E402
+    HashedNgramVectorizer,
+    NgramLinearModel,
+    normalize_text,
+)
+from app.infrastructure.ngram_screening_service import (  # noqa: E402
+    NgramScreeningService,
+)
+
+TRAINING_TEXTS = [
+    "男性限定の募集です",
+    "女性限定の職場です",
+    "男性のみ採用",
+    "経験者歓迎の募集です",
+    "未経験者歓迎の職場です",
+    "土日休みで採用",
+]
+TRAINING_LABELS = [1, 1, 1, 0, 0, 0]
+
+
+@pytest.fixture(scope="module")
+def model():
+    """小さな学習データで学習したモデル"""
+    return NgramLinearModel.fit(
+        TRAINING_TEXTS,
+        TRAINING_LABELS,
+        vectorizer=HashedNgramVectorizer(n_features=2**12),
+    )
+
+
+def test_normalize_text_unifies_width_and_case():
+    """全角英数字と大文字が正規化されることをテスト"""
+    assert normalize_text("ＡＢＣ１２３ｶﾅ") == "abc123カナ"
+
+
+def test_features_do_not_cross_document_boundaries():
+    """バッチ内の隣接ドキュメントにまたがるn-gramが生成されないことをテスト"""
+    vectorizer = HashedNgramVectorizer(n_features=2**16)
+
+    alone = vectorizer.transform(["ab"])
+    batched = vectorizer.transform(["xa", "b", "ab"])
+
+    # "ab" 単独の特徴量と、バッチ内の3番目の特徴量が一致する
+    third = batched.doc == 2
+    assert sorted(batched.feature[third]) == sorted(alone.feature)
+    # "b" は1文字なので unigram の1特徴量のみ
+    assert (batched.doc == 1).sum() == 1
+
+
+def test_lone_surrogates_are_vectorized():
+    """孤立サロゲートを含むテキストも特徴量に変換できることをテスト"""
+    vectorizer = HashedNgramVectorizer(n_features=2**12)
+
+    features = vectorizer.transform(["応募\ud800者", "\udfff"])
+
+    assert (features.doc == 0).sum() > 0
+    assert (features.doc == 1).sum() == 1
+
+
+def test_features_are_l2_normalized():
+    """各ドキュメントの特徴量ベクトルがL2正規化されていることをテスト"""
+    features = HashedNgramVectorizer().transform(["男性限定", "歓迎"])
+
+    norms = np.bincount(features.doc, weights=features.value**2)
+
+    assert norms == pytest.approx([1.0, 1.0])
+
+
+def test_batch_scores_match_single_scores(model):
+    """バッチでのスコアが1件ずつのスコアと一致することをテスト"""
+    texts = ["男性限定", "", "経験者歓迎", "女性限定の募集"]
+
+    batched = model.predict_proba(texts)
+    single = [model.predict_proba([text])[0] for text in texts]
+
+    assert batched == pytest.approx(single)
+
+
+def test_fit_separates_training_labels(model):
+    """学習したモデルが学習データのラベルを分離できることをテスト"""
+    scores = model.predict_proba(TRAINING_TEXTS)
+
+    assert all(scores[:3] > 0.5)
+    assert all(scores[3:] < 0.5)
+
+
+def test_save_and_load_roundtrip(model, tmp_path):
+    """保存したモデルを読み込むと同じスコアになることをテスト"""
+    path = tmp_path / "model.npz"
+    model.save(path)
+
+    loaded = NgramLinearModel.load(path)
+
+    assert loaded.vectorizer == model.vectorizer
+    assert loaded.predict_proba(TRAINING_TEXTS) == pytest.approx(
+        model.predict_proba(TRAINING_TEXTS)
+    )
+
+
+def test_artifact_roundtrip_maps_weights_read_only(model, tmp_path):
+    """mmap 形式の成果物から読み込んだモデルが同じスコアになることをテスト"""
+    model.save_artifact(tmp_path / "ngram")
+
+    loaded = NgramLinearModel.load_artifact(tmp_path / "ngram", verify=True)
+
+    assert loaded.vectorizer == model.vectorizer
+    assert not loaded.weights.flags.writeable
+    assert loaded.predict_proba(TRAINING_TEXTS) == pytest.approx(
+        model.predict_proba(TRAINING_TEXTS)
+    )
+
+
+def test_service_analyze_many_returns_scores_and_verdicts(model):
+    """analyze_many() がスコアとしきい値による判定を返すことをテスト"""
+    service = NgramScreeningService(model)
+
+    results = asyncio.run(service.analyze_many(["男性限定の募集", "経験者歓迎"]))
+
+    assert [result.content for result in results] == ["男性限定の募集", "経験者歓迎"]
+    assert results[0].verdict in (Verdict.REVIEW, Verdict.BLOCK)
+    assert results[1].verdict is Verdict.PASS
+    assert results[0].score > results[1].score
+
+
+def test_service_analyze_matches_batch(model):
+    """analyze() が analyze_many() と同じ結果を返すことをテスト"""
+    service = NgramScreeningService(model)
+
+    single = asyncio.run(service.analyze("女性限定"))
+    (batched,) = asyncio.run(service.analyze_many(["女性限定"]))
+
+    assert single == batched
+    assert asyncio.run(service.screen("女性限定")) == "女性限定"
+    assert asyncio.run(service.analyze_many([])) == []
+
+
+def test_service_threshold_overrides(model):
+    """しきい値を指定するとモデルのしきい値の代わりに使われることをテスト"""
+    strict = NgramScreeningService(model, review_threshold=0.0, block_threshold=0.0)
+    lenient = NgramScreeningService(model, review_threshold=1.0, block_threshold=1.0)
+
+    (blocked,) = asyncio.run(strict.analyze_many(["経験者歓迎"]))
+    (passed,) = asyncio.run(lenient.analyze_many(["男性限定の募集"]))
+
+    assert blocked.verdict is Verdict.BLOCK
+    assert passed.verdict is Verdict.PASS
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"n_features": 1000}, {"ngram_min": 0}, {"ngram_min": 3, "ngram_max": 2}],
+)
+def test_vectorizer_rejects_invalid_parameters(kwargs):
+    """不正なパラメータで ValueError になることをテスト"""
+    with pytest.raises(ValueError):
+        HashedNgramVectorizer(**kwargs)
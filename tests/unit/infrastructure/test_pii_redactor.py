@@ -0,0 +1,122 @@
+"""
+PiiRedactor と PiiScreeningService のユニットテスト
+
+このモジュールは、すべての種類の個人情報を1回の走査で検出して置換すること、
+全角で書かれた番号を検出すること、マイナンバーのチェックデジットを
+検証すること、種類ごとの re.sub を順に適用した場合と同じ出力になること、
+およびサービスが置換後のテキストと検出箇所を返すことを検証します。
+"""
+
+import asyncio
+import re
+
+import pytest
+
+from app.domain.screening_result import Verdict
+from app.infrastructure.pii_redactor import (
+    DEFAULT_PII_PATTERNS,
+    PiiPattern,
+    PiiRedactor,
+    is_valid_my_number,
+)
+from app.infrastructure.pii_screening_service import PiiScreeningService
+
+APPLICANT = (
+    "連絡先は taro.yamada@example.co.jp / 090-1234-5678 です。"
+    "〒100-0005 東京都千代田区丸の内1-2-3 在住、マイナンバーは 1234 5678 9018。"
+)
+
+
+def test_redacts_every_kind_in_one_pass():
+    """すべての種類の個人情報を検出し、置換したテキストを返すことをテスト"""
+    redacted, findings = PiiRedactor().redact(APPLICANT)
+
+    assert redacted == (
+        "連絡先は [EMAIL] / [PHONE] です。"
+        "[POSTAL_CODE] [ADDRESS] 在住、マイナンバーは [MY_NUMBER]。"
+    )
+    assert [finding.kind for finding in findings] == [
+        "email",
+        "phone",
+        "postal_code",
+        "address",
+        "my_number",
+    ]
+    for finding in findings:
+        assert finding.replacement is not None
+        assert APPLICANT[finding.start : finding.end].strip() != ""
+
+
+def test_detects_full_width_numbers():
+    """全角で書かれた電話番号・郵便番号を検出することをテスト"""
+    redacted, _ = PiiRedactor().redact(
+        "電話 ０９０－１２３４－５６７８、〒１００－０００５"
+    )
+
+    assert redacted == "電話 [PHONE]、[POSTAL_CODE]"
+
+
+def test_my_number_requires_valid_check_digit():
+    """チェックデジットが正しくない12桁の数字はマイナンバーとしないことをテスト"""
+    assert is_valid_my_number("123456789018")
+    assert not is_valid_my_number("123456789012")
+    assert not is_valid_my_number("12345678901")
+
+    assert PiiRedactor().find("受付番号 123456789012") == []
+
+
+def test_text_without_pii_is_returned_unchanged():
+    """個人情報がなければ入力と同じ文字列を返すことをテスト"""
+    text = "東京都の会社で3年勤務しました。"
+
+    redacted, findings = PiiRedactor().redact(text)
+
+    assert redacted is text
+    assert findings == []
+
+
+def test_matches_per_pattern_sub_chain():
+    """種類ごとの re.sub を順に適用した場合と同じ出力になることをテスト"""
+    text = APPLICANT * 50
+    expected = text
+    for pattern in DEFAULT_PII_PATTERNS:
+        expected = re.sub(
+            pattern.pattern,
+            lambda match, p=pattern: (
+                p.replacement
+                if p.validate is None or p.validate(match.group())
+                else match.group()
+            ),
+            expected,
+        )
+
+    assert PiiRedactor().redact(text)[0] == expected
+
+
+def test_custom_patterns_without_first_chars():
+    """先頭の文字を指定しないパターンでも検出できることをテスト"""
+    redactor = PiiRedactor([PiiPattern("employee_id", r"EMP-\d{6}", "[ID]")])
+
+    assert redactor.redact("社員番号 EMP-123456")[0] == "社員番号 [ID]"
+
+
+def test_invalid_patterns_are_rejected():
+    """パターンがない、または正規表現が不正な場合は ValueError になることをテスト"""
+    with pytest.raises(ValueError):
+        PiiRedactor([])
+    with pytest.raises(ValueError):
+        PiiRedactor([PiiPattern("broken", "(", "[X]")])
+
+
+def test_service_returns_redacted_content_and_findings():
+    """サービスが置換後のテキストと検出箇所を返し、判定は PASS とすることをテスト"""
+    service = PiiScreeningService()
+
+    result = asyncio.run(service.analyze("連絡先: taro@example.com"))
+    results = asyncio.run(service.analyze_many(["a@b.jp", "なし"]))
+
+    assert result.content == "連絡先: [EMAIL]"
+    assert result.verdict is Verdict.PASS
+    assert result.score == 0.0
+    assert [finding.kind for finding in result.findings] == ["email"]
+    assert [r.content for r in results] == ["[EMAIL]", "なし"]
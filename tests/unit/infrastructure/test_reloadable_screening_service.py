@@ -0,0 +1,202 @@
+"""
+ReloadableScreeningService のユニットテスト
+
+このモジュールは、入力が更新された場合だけ新しいバックエンドに
+差し替えること、差し替え前に始まった呼び出しが古いバージョンで完了し、
+その後で古いバックエンドを閉じること、同じバージョンへの差し替えを
+省くこと、および構築に失敗した場合に現在のバックエンドを使い続けることを検証します。
+"""
+
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from app.domain.screening_result import Verdict
+from app.infrastructure.reloadable_screening_service import (
+    ReloadableScreeningService,
+    file_fingerprint,
+)
+from app.infrastructure.rule_screening_service import RuleScreeningService
+
+
+def write_rules(path, term: str) -> None:
+    """term を BLOCK にする1件のルールを書き込み、更新時刻を進める"""
+    path.write_text(
+        json.dumps(
+            {
+                "rules": [
+                    {
+                        "id": "rule",
+                        "kind": "discriminatory_term",
+                        "terms": [term],
+                        "verdict": "block",
+                        "weight": 0.9,
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    # 同じ時刻の書き込みでも更新として検出されるように時刻をずらす
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class VersionedService:
+    """バージョンと start/aclose/close の呼び出しを記録するサービス"""
+
+    def __init__(self, version: str, gate: asyncio.Event | None = None) -> None:
+        self.version = version
+        self.gate = gate
+        self.events: list[str] = []
+
+    async def screen(self, content: str) -> str:
+        if self.gate is not None:
+            await self.gate.wait()
+        return f"{self.version}:{content}"
+
+    async def start(self) -> None:
+        self.events.append("start")
+
+    async def aclose(self) -> None:
+        self.events.append("aclose")
+
+    def close(self) -> None:
+        self.events.append("close")
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "rules.json"
+    write_rules(path, "男性限定")
+    return path
+
+
+def test_reload_swaps_only_when_source_changes(source):
+    """入力が更新された場合だけ新しいバックエンドに差し替えることをテスト"""
+    service = ReloadableScreeningService(
+        lambda: RuleScreeningService.compile_source(source), watch=source
+    )
+    first_version = service.version
+
+    async def run():
+        unchanged = await service.reload()
+        before = await service.analyze("女性限定")
+        write_rules(source, "女性限定")
+        version = await service.reload()
+        after = await service.analyze("女性限定")
+        return unchanged, before, version, after
+
+    unchanged, before, version, after = asyncio.run(run())
+
+    assert unchanged is None
+    assert before.verdict is Verdict.PASS
+    assert version == service.version != first_version
+    assert after.verdict is Verdict.BLOCK
+    assert service.reloads == 1
+
+
+def test_in_flight_call_finishes_on_old_version():
+    """差し替え前に始まった呼び出しは古いバージョンで完了し、その後で閉じることをテスト"""
+    old = VersionedService("v1")
+    new = VersionedService("v2")
+    loaded = iter([old, new])
+    service = ReloadableScreeningService(lambda: next(loaded))
+
+    async def run():
+        old.gate = asyncio.Event()
+        in_flight = asyncio.create_task(service.screen("a"))
+        await asyncio.sleep(0)
+        version = await service.reload(force=True)
+        during = list(old.events)
+        new_result = await service.screen("b")
+        old.gate.set()
+        old_result = await in_flight
+        await service.aclose()
+        return version, during, new_result, old_result
+
+    version, during, new_result, old_result = asyncio.run(run())
+
+    assert version == "v2"
+    assert during == []
+    assert new_result == "v2:b"
+    assert old_result == "v1:a"
+    assert old.events == ["aclose", "close"]
+    assert new.events == ["start", "aclose"]
+
+
+def test_slow_build_does_not_block_event_loop():
+    """構築に時間がかかっても、その間に他の呼び出しが処理されることをテスト"""
+    loaded = iter([VersionedService("v1"), None])
+
+    def loader():
+        service = next(loaded)
+        if service is None:
+            time.sleep(0.2)
+            service = VersionedService("v2")
+        return service
+
+    service = ReloadableScreeningService(loader)
+
+    async def run():
+        reload = asyncio.create_task(service.reload(force=True))
+        served = []
+        while not reload.done():
+            served.append(await service.screen("x"))
+            await asyncio.sleep(0.01)
+        return await reload, served
+
+    version, served = asyncio.run(run())
+
+    assert version == "v2"
+    assert len(served) >= 5
+    assert served[0] == "v1:x"
+
+
+def test_same_version_is_not_swapped():
+    """同じバージョンが読み込まれた場合は差し替えずに閉じることをテスト"""
+    created: list[VersionedService] = []
+
+    def loader():
+        created.append(VersionedService("v1"))
+        return created[-1]
+
+    service = ReloadableScreeningService(loader)
+
+    assert asyncio.run(service.reload(force=True)) is None
+    assert service.reloads == 0
+    assert created[1].events == ["close"]
+    assert created[0].events == []
+
+
+def test_failed_build_keeps_current_backend(source):
+    """構築に失敗した場合は例外を送出し、現在のバックエンドを使い続けることをテスト"""
+    service = ReloadableScreeningService(
+        lambda: RuleScreeningService.compile_source(source), watch=source
+    )
+    version = service.version
+    source.write_text("{not json", encoding="utf-8")
+
+    async def run():
+        with pytest.raises(ValueError):
+            await service.reload()
+        # 同じ入力では再試行しない
+        return await service.reload(), await service.analyze("男性限定")
+
+    retried, result = asyncio.run(run())
+
+    assert retried is None
+    assert service.version == version
+    assert result.verdict is Verdict.BLOCK
+
+
+def test_file_fingerprint_of_artifact_uses_manifest(tmp_path):
+    """成果物のディレクトリはマニフェストの指紋を返すことをテスト"""
+    assert file_fingerprint(tmp_path / "missing") is None
+    assert file_fingerprint(tmp_path) is None
+    (tmp_path / "manifest.json").write_text("{}")
+
+    assert file_fingerprint(tmp_path) == file_fingerprint(tmp_path / "manifest.json")
@@ -0,0 +1,215 @@
+"""
+RemoteScreeningService のユニットテスト
+
+このモジュールは、ローカルのスコアリングAPIスタブに対して
+RemoteScreeningService が結果を変換できること、HTTPクライアントの
+ライフサイクル、孤立サロゲートを含むテキストの送信、そして障害時の
+例外変換を検証します。
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.domain.screening_result import Finding, Verdict
+from app.infrastructure.remote_screening_service import (
+    RemoteScreeningService,
+    RemoteScreeningServiceError,
+    parse_result,
+)
+from tests.stubs.scoring_server import create_stub_app
+
+
+@pytest.fixture
+def stub():
+    """スコアリングAPIスタブ"""
+    return create_stub_app()
+
+
+@pytest.fixture
+def service(stub):
+    """スタブに接続する RemoteScreeningService"""
+    return RemoteScreeningService(
+        "http://scoring.test", transport=httpx.ASGITransport(app=stub)
+    )
+
+
+async def _analyze(service: RemoteScreeningService, content: str):
+    await service.start()
+    try:
+        return await service.analyze(content)
+    finally:
+        await service.aclose()
+
+
+def test_analyze_returns_score_and_findings(service):
+    """スタブの応答が ScreeningResult に変換されることをテスト"""
+    result = asyncio.run(_analyze(service, "経験者歓迎、男性限定"))
+
+    assert result.content == "経験者歓迎、男性限定"
+    assert result.score == 0.25
+    assert result.verdict is Verdict.REVIEW
+    assert result.findings == (Finding(kind="flagged_term", start=6, end=10),)
+
+
+def test_screen_returns_content(service):
+    """screen() が結果のテキストを返すことをテスト"""
+
+    async def run() -> str:
+        await service.start()
+        try:
+            return await service.screen("テキスト")
+        finally:
+            await service.aclose()
+
+    assert asyncio.run(run()) == "テキスト"
+
+
+def test_client_is_reused_across_calls(service, stub):
+    """start() で作成したクライアントが複数回の呼び出しで再利用されることをテスト"""
+
+    async def run() -> tuple[object, object]:
+        await service.start()
+        first = service._client
+        await service.analyze("a")
+        await service.analyze("b")
+        second = service._client
+        await service.aclose()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first is second
+    assert stub.state.requests == 2
+    assert service._client is None
+
+
+def test_client_is_created_lazily_without_start(service):
+    """start() を呼ばなくても初回呼び出しでクライアントが作成されることをテスト"""
+
+    async def run():
+        try:
+            return await service.analyze("遅延作成")
+        finally:
+            await service.aclose()
+
+    assert asyncio.run(run()).content == "遅延作成"
+
+
+def test_analyze_many_uses_single_batch_request(service, stub):
+    """analyze_many() が1回の一括リクエストで順序どおりの結果を返すことをテスト"""
+
+    async def run():
+        try:
+            return await service.analyze_many(["女性限定", "歓迎", "年齢不問"])
+        finally:
+            await service.aclose()
+
+    results = asyncio.run(run())
+
+    assert [result.content for result in results] == ["女性限定", "歓迎", "年齢不問"]
+    assert [result.verdict for result in results] == [
+        Verdict.REVIEW,
+        Verdict.PASS,
+        Verdict.REVIEW,
+    ]
+    assert stub.state.batch_sizes == [3]
+
+
+@pytest.mark.parametrize("results", [3, "ab", {"a": {}, "b": {}}, None])
+def test_analyze_many_rejects_non_list_results(results):
+    """一括応答の results が配列でなければ例外を送出することをテスト"""
+    service = RemoteScreeningService(
+        "http://scoring.test",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"results": results})
+        ),
+    )
+
+    async def run():
+        try:
+            return await service.analyze_many(["a", "b"])
+        finally:
+            await service.aclose()
+
+    with pytest.raises(RemoteScreeningServiceError):
+        asyncio.run(run())
+
+
+def test_transport_error_is_converted(stub):
+    """通信エラーが ScreeningUnavailableError として送出されることをテスト"""
+
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    service = RemoteScreeningService(
+        "http://scoring.test", transport=httpx.MockTransport(refuse)
+    )
+
+    with pytest.raises(ScreeningUnavailableError):
+        asyncio.run(_analyze(service, "x"))
+
+
+def test_http_error_status_is_converted():
+    """5xx 応答が RemoteScreeningServiceError として送出されることをテスト"""
+    service = RemoteScreeningService(
+        "http://scoring.test",
+        transport=httpx.MockTransport(lambda request: httpx.Response(500)),
+    )
+
+    with pytest.raises(RemoteScreeningServiceError):
+        asyncio.run(_analyze(service, "x"))
+
+
+def test_lone_surrogate_is_sent_escaped():
+    """孤立サロゲートを含むテキストをエスケープして送信できることをテスト"""
+    sent = []
+
+    def echo(request: httpx.Request) -> httpx.Response:
+        sent.append(request.content)
+        body = json.loads(request.content)
+        return httpx.Response(
+            200, content=json.dumps({"content": body["content"]}).encode()
+        )
+
+    service = RemoteScreeningService(
+        "http://scoring.test", transport=httpx.MockTransport(echo)
+    )
+
+    result = asyncio.run(_analyze(service, "abc\ud800def"))
+
+    assert result.content == "abc\ud800def"
+    assert sent == [b'{"content":"abc\\ud800def"}']
+
+
+def test_invalid_json_response_is_converted():
+    """JSON でない応答が RemoteScreeningServiceError として送出されることをテスト"""
+    service = RemoteScreeningService(
+        "http://scoring.test",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, text="<")),
+    )
+
+    with pytest.raises(RemoteScreeningServiceError):
+        asyncio.run(_analyze(service, "x"))
+
+
+def test_http2_disabled_when_h2_missing(monkeypatch):
+    """h2 がインストールされていない場合は HTTP/2 を無効化することをテスト"""
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+
+    service = RemoteScreeningService("http://scoring.test", http2=True)
+
+    assert service._http2 is False
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [{}, {"content": "x", "findings": [{"kind": "a"}]}, {"content": "x", "score": "?"}],
+)
+def test_parse_result_rejects_malformed_payload(payload):
+    """不正な応答で RemoteScreeningServiceError を送出することをテスト"""
+    with pytest.raises(RemoteScreeningServiceError):
+        parse_result(payload)
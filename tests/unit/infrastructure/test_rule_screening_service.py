@@ -0,0 +1,167 @@
+"""
+RuleScreeningService とルールオートマトンのユニットテスト
+
+このモジュールは、全角・半角や大文字・小文字を吸収した照合、
+左端・最長優先の一致の選択、置換・判定・スコアの計算、
+成果物からの読み込み、およびルールソースの検証を検証します。
+"""
+
+import asyncio
+
+import pytest
+
+from app.domain.rule import Rule
+from app.domain.screening_result import Finding, Verdict
+from app.infrastructure.rule_automaton import (
+    RuleAutomaton,
+    RuleMatch,
+    build_rule_artifact,
+    compile_rules,
+    parse_rules,
+)
+from app.infrastructure.rule_screening_service import RuleScreeningService
+
+RULES = (
+    Rule("male-only", "discriminatory_term", ("男性限定", "男性"), Verdict.BLOCK, 0.9),
+    Rule("age", "age_limit", ("35歳以下",), Verdict.REVIEW, 0.5),
+    Rule("email", "email", ("info@example.com",), Verdict.REVIEW, 0.2, "[EMAIL]"),
+)
+
+
+@pytest.fixture
+def service():
+    """メモリ上でコンパイルしたルールのサービス"""
+    return RuleScreeningService(RuleAutomaton.compile(RULES))
+
+
+def test_find_folds_width_and_case():
+    """全角英数字と大文字を含むテキストでも元の位置で一致することをテスト"""
+    automaton = RuleAutomaton.compile(RULES)
+
+    matches = automaton.find("連絡先: ＩＮＦＯ@Example.com")
+
+    assert matches == [RuleMatch(5, 21, 2)]
+
+
+def test_find_prefers_leftmost_longest():
+    """重なる語句のうち最も長いものが選ばれることをテスト"""
+    automaton = RuleAutomaton.compile(RULES)
+
+    matches = automaton.find("男性限定・男性歓迎")
+
+    assert matches == [RuleMatch(0, 4, 0), RuleMatch(5, 7, 0)]
+
+
+def test_find_returns_nothing_without_matches():
+    """一致がない場合に空のリストを返すことをテスト"""
+    assert RuleAutomaton.compile(RULES).find("経験者歓迎の募集です") == []
+
+
+def test_transition_table_grows_with_terms_not_alphabet():
+    """遷移表の大きさが文字の種類ではなく語句の長さの合計に比例することをテスト"""
+    rules = tuple(
+        Rule(f"r{i}", "term", (chr(0x4E00 + 2 * i) + chr(0x4E01 + 2 * i),))
+        for i in range(2000)
+    )
+
+    arrays = compile_rules(rules)
+    automaton = RuleAutomaton(arrays, rules)
+
+    n_classes = len(arrays["root"])
+    n_states = len(arrays["fail"])
+    assert (n_classes, n_states) == (4001, 4001)
+    # 失敗遷移を展開した完全なDFAなら 4001 × 4001 要素になる
+    assert len(arrays["check"]) < 3 * n_classes
+    assert automaton.find("求人の" + chr(0x4E00 + 10) + chr(0x4E01 + 10)) == [
+        RuleMatch(3, 5, 5)
+    ]
+
+
+def test_evaluate_applies_replacements_and_verdict(service):
+    """置換、最も重い判定、noisy-OR のスコアを返すことをテスト"""
+    result = service.evaluate("男性限定、35歳以下、info@example.com まで")
+
+    assert result.content == "男性限定、35歳以下、[EMAIL] まで"
+    assert result.verdict is Verdict.BLOCK
+    assert result.score == pytest.approx(1 - 0.1 * 0.5 * 0.8)
+    assert result.findings == (
+        Finding("discriminatory_term", 0, 4, None),
+        Finding("age_limit", 5, 10, None),
+        Finding("email", 11, 27, "[EMAIL]"),
+    )
+
+
+def test_evaluate_passes_clean_text(service):
+    """一致がない場合に PASS と元のテキストを返すことをテスト"""
+    result = asyncio.run(service.analyze("経験者歓迎"))
+
+    assert result.verdict is Verdict.PASS
+    assert result.content == "経験者歓迎"
+    assert result.findings == ()
+
+
+def test_screen_and_analyze_many(service):
+    """screen() と analyze_many() が evaluate() と同じ結果を返すことをテスト"""
+    contents = ["info@example.com", "男性"]
+
+    assert asyncio.run(service.screen(contents[0])) == "[EMAIL]"
+    results = asyncio.run(service.analyze_many(contents))
+    assert [result.verdict for result in results] == [Verdict.REVIEW, Verdict.BLOCK]
+
+
+def test_open_artifact_matches_compiled(tmp_path):
+    """成果物から開いたサービスがメモリ上のコンパイルと同じ結果を返すことをテスト"""
+    manifest = build_rule_artifact(RULES, tmp_path)
+    text = "男性限定、35歳以下、ＩＮＦＯ@example.com"
+
+    service = RuleScreeningService.open(tmp_path)
+    try:
+        assert service.version == manifest.version
+        expected = RuleScreeningService(RuleAutomaton.compile(RULES)).evaluate(text)
+        assert service.evaluate(text) == expected
+    finally:
+        service.close()
+
+
+def test_compile_source_versions_by_content(tmp_path):
+    """ルールソースをコンパイルでき、内容が同じならバージョンも同じことをテスト"""
+    source = tmp_path / "rules.json"
+    source.write_text(
+        '{"rules": [{"id": "male-only", "kind": "discriminatory_term",'
+        ' "terms": ["男性限定"], "verdict": "block", "weight": 0.9}]}',
+        encoding="utf-8",
+    )
+
+    first = RuleScreeningService.compile_source(source)
+    second = RuleScreeningService.compile_source(source)
+
+    assert first.version == second.version != ""
+    assert first.evaluate("男性限定の募集").verdict is Verdict.BLOCK
+
+
+def test_parse_rules_builds_domain_rules():
+    """JSON 形式のルールソースから Rule を作成することをテスト"""
+    rules = parse_rules(
+        {"rules": [{"id": "r1", "kind": "k", "terms": ["a"], "verdict": "block"}]}
+    )
+
+    assert rules == (Rule("r1", "k", ("a",), Verdict.BLOCK),)
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        {"rules": [{"id": "r1", "kind": "k", "terms": []}]},
+        {"rules": [{"id": "r1", "kind": "k", "terms": ["a"], "weight": 2.0}]},
+        {
+            "rules": [
+                {"id": "r1", "kind": "k", "terms": ["a"]},
+                {"id": "r1", "kind": "k", "terms": ["b"]},
+            ]
+        },
+    ],
+)
+def test_parse_rules_rejects_invalid_source(source):
+    """空の語句、範囲外の weight、重複した id を拒否することをテスト"""
+    with pytest.raises(ValueError):
+        parse_rules(source)
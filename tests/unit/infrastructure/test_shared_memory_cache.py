@@ -0,0 +1,115 @@
+"""
+SharedMemoryResultCache のユニットテスト
+
+このモジュールは、共有メモリ上のハッシュテーブルの格納・取得、
+セット内LRUによる追い出し、フォークしたプロセス間での共有を検証します。
+"""
+
+import hashlib
+import multiprocessing
+import sys
+
+import pytest
+
+from app.infrastructure.shared_memory_cache import SharedMemoryResultCache
+
+
+def _key(text: str) -> bytes:
+    """テスト用の 16 バイトキー"""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+@pytest.fixture
+def cache():
+    """容量 64 の共有メモリキャッシュ"""
+    instance = SharedMemoryResultCache(64, slot_size=256, ways=4, stripes=4)
+    yield instance
+    instance.close()
+
+
+def test_get_returns_none_for_missing_key(cache):
+    """未登録のキーで None を返すことをテスト"""
+    assert cache.get(_key("missing")) is None
+
+
+def test_put_then_get_returns_value(cache):
+    """格納した値を取得できることをテスト"""
+    assert cache.put(_key("a"), "結果A".encode()) is True
+
+    assert cache.get(_key("a")) == "結果A".encode()
+
+
+def test_put_overwrites_existing_key(cache):
+    """同じキーへの格納で値が上書きされることをテスト"""
+    cache.put(_key("a"), b"old")
+    cache.put(_key("a"), b"new")
+
+    assert cache.get(_key("a")) == b"new"
+
+
+def test_oversized_value_is_not_cached(cache):
+    """スロットに収まらない値は格納されないことをテスト"""
+    value = b"x" * (cache.max_value_size + 1)
+
+    assert cache.put(_key("big"), value) is False
+    assert cache.get(_key("big")) is None
+
+
+def test_capacity_rounded_up_to_ways():
+    """容量がウェイ数の倍数に切り上げられることをテスト"""
+    instance = SharedMemoryResultCache(10, ways=4)
+    try:
+        assert instance.capacity == 12
+    finally:
+        instance.close()
+
+
+def test_least_recently_used_slot_is_evicted():
+    """セットが満杯の場合に最も参照されていないスロットが追い出されることをテスト"""
+    # セット1つ・2ウェイのテーブル
+    instance = SharedMemoryResultCache(2, slot_size=128, ways=2)
+    try:
+        instance.put(_key("a"), b"A")
+        instance.put(_key("b"), b"B")
+        # a を参照して b を最も古いエントリにする
+        assert instance.get(_key("a")) == b"A"
+
+        instance.put(_key("c"), b"C")
+
+        assert instance.get(_key("a")) == b"A"
+        assert instance.get(_key("b")) is None
+        assert instance.get(_key("c")) == b"C"
+    finally:
+        instance.close()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"capacity": 0}, {"capacity": 8, "ways": 0}, {"capacity": 8, "slot_size": 8}],
+)
+def test_invalid_configuration_raises_value_error(kwargs):
+    """不正な設定で ValueError を送出することをテスト"""
+    with pytest.raises(ValueError):
+        SharedMemoryResultCache(**kwargs)
+
+
+def _write_from_child(cache: SharedMemoryResultCache, count: int) -> None:
+    for i in range(count):
+        cache.put(_key(f"child-{i}"), f"value-{i}".encode())
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fork が必要")
+def test_entries_are_shared_with_forked_processes(cache):
+    """フォークした子プロセスの書き込みを親プロセスから読めることをテスト"""
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_write_from_child, args=(cache, 8)) for _ in range(2)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=10)
+        assert process.exitcode == 0
+
+    assert cache.get(_key("child-0")) == b"value-0"
+    assert cache.get(_key("child-7")) == b"value-7"
@@ -0,0 +1,305 @@
+"""
+TenantRegistry のユニットテスト
+
+このモジュールは、テナント設定の読み込みと検証、ヘッダーによる
+テナントの解決、同時要求での1回だけの構築（single-flight）、
+LRU とアイドル時間による解放、preload のテナントが解放されないこと、
+および実行中の呼び出しが終わってからサービスを閉じることを検証します。
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.tenant_registry import (
+    TenantConfig,
+    TenantRegistry,
+    UnknownTenantError,
+    load_tenant_configs,
+    tenant_settings,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingService:
+    """構築時の設定と start/aclose/close の呼び出しを記録するサービス"""
+
+    def __init__(self, settings: Settings, gate: asyncio.Event | None) -> None:
+        self.settings = settings
+        self.events: list[str] = []
+        self.gate = gate
+
+    async def screen(self, content: str) -> str:
+        if self.gate is not None:
+            await self.gate.wait()
+        return f"{self.settings.screening_backend}:{content}"
+
+    async def start(self) -> None:
+        self.events.append("start")
+
+    async def aclose(self) -> None:
+        self.events.append("aclose")
+
+    def close(self) -> None:
+        self.events.append("close")
+
+
+class RecordingFactory:
+    def __init__(self) -> None:
+        self.built: list[RecordingService] = []
+        self.gate: asyncio.Event | None = None
+        self._lock = threading.Lock()
+
+    def __call__(self, settings: Settings) -> RecordingService:
+        service = RecordingService(settings, self.gate)
+        with self._lock:
+            self.built.append(service)
+        return service
+
+
+def make_registry(*tenants: TenantConfig, **kwargs) -> TenantRegistry:
+    kwargs.setdefault("factory", RecordingFactory())
+    return TenantRegistry(Settings(cache_size=0), tenants, **kwargs)
+
+
+def test_load_tenant_configs(tmp_path):
+    """JSON のテナント設定を読み込めることをテスト"""
+    path = tmp_path / "tenants.json"
+    path.write_text(
+        json.dumps(
+            {
+                "tenants": {
+                    "acme": {
+                        "api_keys": ["k1"],
+                        "preload": True,
+                        "settings": {"screening_backend": "rules"},
+                    },
+                    "globex": {},
+                }
+            }
+        )
+    )
+
+    acme, globex = load_tenant_configs(path)
+
+    assert acme == TenantConfig(
+        "acme", ("k1",), {"screening_backend": "rules"}, preload=True
+    )
+    assert globex == TenantConfig("globex")
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        [],
+        {"tenants": []},
+        {"tenants": {"a": []}},
+        {"tenants": {"a": {"api_keys": "k1"}}},
+        {"tenants": {"a": {"settings": []}}},
+    ],
+)
+def test_load_tenant_configs_rejects_invalid(tmp_path, raw):
+    """形式が不正なテナント設定で ValueError になることをテスト"""
+    path = tmp_path / "tenants.json"
+    path.write_text(json.dumps(raw))
+
+    with pytest.raises(ValueError):
+        load_tenant_configs(path)
+
+
+def test_tenant_settings_applies_overrides():
+    """上書き値が適用され、共有メモリキャッシュは無効になることをテスト"""
+    base = Settings(workers=2, shared_cache_capacity=100)
+
+    settings = tenant_settings(base, {"ngram_block_threshold": 0.9})
+
+    assert settings.ngram_block_threshold == 0.9
+    assert settings.workers == 2
+    assert settings.shared_cache_capacity == 0
+    with pytest.raises(ValueError):
+        tenant_settings(base, {"no_such_field": 1})
+    with pytest.raises(ValueError):
+        tenant_settings(base, {"ngram_block_threshold": 2.0})
+
+
+def test_registry_rejects_duplicate_api_keys():
+    """同じAPIキーを複数のテナントに指定すると ValueError になることをテスト"""
+    with pytest.raises(ValueError):
+        make_registry(TenantConfig("a", ("k",)), TenantConfig("b", ("k",)))
+
+
+def test_resolve_prefers_api_key_over_header():
+    """APIキー、テナントIDのヘッダーの順に解決することをテスト"""
+    registry = make_registry(TenantConfig("a", ("key-a",)), TenantConfig("b"))
+
+    assert registry.resolve({"x-api-key": "key-a", "x-tenant-id": "b"}) == "a"
+    assert registry.resolve({"x-api-key": "other", "x-tenant-id": "b"}) == "b"
+    assert registry.resolve({}) is None
+    with pytest.raises(UnknownTenantError):
+        registry.resolve({"x-tenant-id": "c"})
+    with pytest.raises(UnknownTenantError):
+        registry.service("c")
+
+
+def test_concurrent_requests_build_once():
+    """同じテナントへの同時要求でサービスを1回だけ構築することをテスト"""
+    factory = RecordingFactory()
+    registry = make_registry(TenantConfig("a"), factory=factory)
+
+    async def run() -> list[str]:
+        service = registry.service("a")
+        return await asyncio.gather(*(service.screen(str(n)) for n in range(20)))
+
+    results = asyncio.run(run())
+
+    assert results == [f"echo:{n}" for n in range(20)]
+    assert len(factory.built) == 1
+    assert factory.built[0].events == ["start"]
+
+
+def test_cancelled_caller_does_not_cancel_build():
+    """構築を待つ呼び出しが取り消されても、構築は他の呼び出しのために続くことをテスト"""
+    factory = RecordingFactory()
+    registry = make_registry(TenantConfig("a"), factory=factory)
+
+    async def run() -> str:
+        service = registry.service("a")
+        first = asyncio.create_task(service.screen("x"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(service.screen("y"))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == "echo:y"
+    assert len(factory.built) == 1
+
+
+def test_least_recently_used_tenant_is_evicted():
+    """保持数を超えると最も長く使われていないテナントを解放することをテスト"""
+    factory = RecordingFactory()
+    registry = make_registry(
+        TenantConfig("a"),
+        TenantConfig("b"),
+        TenantConfig("c"),
+        max_instances=2,
+        factory=factory,
+    )
+
+    async def run() -> None:
+        for tenant_id in ("a", "b", "a", "c"):
+            await registry.service(tenant_id).screen("x")
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+
+    assert registry.cached == ("c", "a")
+    built_b = factory.built[1]
+    assert built_b.events == ["start", "aclose", "close"]
+
+
+def test_idle_tenant_is_evicted():
+    """idle_timeout を過ぎて使われていないテナントを解放することをテスト"""
+    clock = FakeClock()
+    registry = make_registry(
+        TenantConfig("a"), TenantConfig("b"), idle_timeout=60, clock=clock
+    )
+
+    async def run() -> None:
+        await registry.service("a").screen("x")
+        clock.now = 30
+        await registry.service("b").screen("x")
+        clock.now = 70
+        await registry.service("b").screen("x")
+
+    asyncio.run(run())
+
+    assert registry.cached == ("b",)
+
+
+def test_preloaded_tenant_is_never_evicted():
+    """preload のテナントは起動時に構築し、解放しないことをテスト"""
+    clock = FakeClock()
+    factory = RecordingFactory()
+    registry = make_registry(
+        TenantConfig("hot", preload=True),
+        TenantConfig("a"),
+        TenantConfig("b"),
+        max_instances=1,
+        idle_timeout=1,
+        factory=factory,
+        clock=clock,
+    )
+    registry.preload()
+
+    async def run() -> None:
+        await registry.start()
+        for tenant_id in ("a", "b"):
+            clock.now += 10
+            await registry.service(tenant_id).screen("x")
+        await registry.service("hot").screen("x")
+
+    asyncio.run(run())
+
+    assert registry.cached == ("hot", "b")
+    assert len(factory.built) == 3
+    assert factory.built[0].events == ["start"]
+
+
+def test_evicted_service_closes_after_in_flight_call():
+    """解放したサービスは実行中の呼び出しが終わってから閉じることをテスト"""
+    factory = RecordingFactory()
+    registry = make_registry(
+        TenantConfig("a"), TenantConfig("b"), max_instances=1, factory=factory
+    )
+
+    async def run() -> tuple[list[str], str]:
+        gate = factory.gate = asyncio.Event()
+        slow = asyncio.create_task(registry.service("a").screen("x"))
+        while not factory.built or not factory.built[0].events:
+            await asyncio.sleep(0.001)
+        factory.gate = None
+        await registry.service("b").screen("x")
+        await asyncio.sleep(0)
+        during = list(factory.built[0].events)
+        gate.set()
+        result = await slow
+        await asyncio.sleep(0)
+        return during, result
+
+    during, result = asyncio.run(run())
+
+    assert during == ["start"]
+    assert result == "echo:x"
+    assert factory.built[0].events == ["start", "aclose", "close"]
+
+
+def test_aclose_disposes_every_service():
+    """aclose() と close() ですべてのサービスのフックを呼び出すことをテスト"""
+    factory = RecordingFactory()
+    registry = make_registry(
+        TenantConfig("hot", preload=True), TenantConfig("a"), factory=factory
+    )
+
+    async def run() -> None:
+        await registry.start()
+        await registry.service("a").screen("x")
+        await registry.aclose()
+
+    asyncio.run(run())
+    registry.close()
+
+    hot, lazy = factory.built
+    assert hot.events == ["start", "aclose", "close"]
+    assert lazy.events == ["start", "aclose", "close"]
+    assert registry.cached == ()
@@ -0,0 +1,116 @@
+"""
+TokenBucketLimiter のユニットテスト
+
+このモジュールは、バーストまでの許可と補充レートに従った回復、
+拒否時の再試行までの時間、および満杯に戻ったバケットの削除と
+クライアント数の上限を検証します。
+"""
+
+import pytest
+
+from app.infrastructure.token_bucket import TokenBucketLimiter
+
+
+class FakeClock:
+    """テスト用の手動で進める時計"""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_allows_burst_then_rejects(clock):
+    """容量分を連続して許可し、その後は拒否することをテスト"""
+    limiter = TokenBucketLimiter(rate=2, burst=3, clock=clock)
+
+    decisions = [limiter.acquire("a") for _ in range(4)]
+
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+    assert [d.remaining for d in decisions] == [2, 1, 0, 0]
+    assert decisions[2].reset_after == pytest.approx(1.5)
+    assert decisions[3].retry_after == pytest.approx(0.5)
+
+
+def test_tokens_refill_lazily(clock):
+    """経過時間に応じてトークンが補充されることをテスト"""
+    limiter = TokenBucketLimiter(rate=2, burst=3, clock=clock)
+    for _ in range(3):
+        limiter.acquire("a")
+
+    clock.now += 0.5
+    assert limiter.acquire("a").allowed
+    assert not limiter.acquire("a").allowed
+
+    clock.now += 10
+    assert limiter.acquire("a").remaining == 2
+
+
+def test_rejection_does_not_consume_tokens(clock):
+    """拒否されたリクエストはトークンを消費しないことをテスト"""
+    limiter = TokenBucketLimiter(rate=1, burst=1, clock=clock)
+    limiter.acquire("a")
+    for _ in range(5):
+        assert not limiter.acquire("a").allowed
+
+    clock.now += 1
+    assert limiter.acquire("a").allowed
+
+
+def test_clients_are_independent(clock):
+    """クライアントごとに別のバケットを持つことをテスト"""
+    limiter = TokenBucketLimiter(rate=1, burst=1, clock=clock)
+
+    assert limiter.acquire("a").allowed
+    assert not limiter.acquire("a").allowed
+    assert limiter.acquire("b").allowed
+
+
+def test_full_buckets_are_evicted(clock):
+    """満杯に戻ったバケットが削除されることをテスト"""
+    limiter = TokenBucketLimiter(rate=10, burst=5, clock=clock)
+    for index in range(100):
+        limiter.acquire(f"client{index}")
+    assert len(limiter) == 100
+
+    clock.now += 1
+    # 1回の判定で最大2件ずつ削除する
+    limiter.acquire("new")
+    assert len(limiter) == 99
+    for _ in range(49):
+        limiter.acquire("new")
+
+    assert len(limiter) == 1
+
+
+def test_max_clients_evicts_least_recently_used(clock):
+    """上限を超えると最も長く利用されていないクライアントを削除することをテスト"""
+    limiter = TokenBucketLimiter(rate=1, burst=1, max_clients=2, clock=clock)
+    limiter.acquire("a")
+    limiter.acquire("b")
+    limiter.acquire("c")
+
+    assert len(limiter) == 2
+    # 削除された a は満杯のバケットから再開する
+    assert limiter.acquire("a").allowed
+    assert not limiter.acquire("c").allowed
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"rate": 0, "burst": 1},
+        {"rate": 1, "burst": 0},
+        {"rate": 1, "burst": 1, "max_clients": 0},
+    ],
+)
+def test_invalid_arguments(kwargs):
+    """不正な引数で ValueError を送出することをテスト"""
+    with pytest.raises(ValueError):
+        TokenBucketLimiter(**kwargs)
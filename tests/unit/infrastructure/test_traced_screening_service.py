@@ -0,0 +1,91 @@
+"""
+TracedScreeningService のユニットテスト
+
+このモジュールは、呼び出しごとのスパンに入力と結果の要約を記録すること、
+下位サービスのスパンが子として記録されること、例外をエラーとして
+記録して再送出することを検証します。
+"""
+
+import asyncio
+
+import pytest
+
+from app.domain.screening_result import Finding, ScreeningResult, Verdict
+from app.infrastructure.traced_screening_service import TracedScreeningService
+from app.infrastructure.tracing import SpanKind, Tracer, current_traceparent
+
+
+class RecordingExporter:
+    def __init__(self):
+        self.spans: list[dict] = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+    def shutdown(self):
+        pass
+
+
+class ReviewService:
+    def __init__(self):
+        self.traceparents: list[str | None] = []
+
+    async def screen(self, content: str) -> str:
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        self.traceparents.append(current_traceparent())
+        if content == "error":
+            raise RuntimeError("バックエンドの障害")
+        return ScreeningResult(
+            content=content,
+            score=0.5,
+            verdict=Verdict.REVIEW,
+            findings=(Finding(kind="age", start=0, end=1),),
+        )
+
+
+def test_calls_are_recorded_with_result_summary():
+    """呼び出しごとのスパンに入力と結果の要約を記録することをテスト"""
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter)
+    backend = ReviewService()
+    service = TracedScreeningService(
+        backend, tracer, name="screening.backend", kind=SpanKind.CLIENT, backend="x"
+    )
+
+    asyncio.run(service.screen("abc"))
+    results = asyncio.run(service.analyze_many(["a", "b"]))
+    tracer.force_flush()
+
+    assert [r.verdict for r in results] == [Verdict.REVIEW, Verdict.REVIEW]
+    single, *children, batch = exporter.spans
+    assert single["name"] == "screening.backend.analyze"
+    assert single["kind"] == "SPAN_KIND_CLIENT"
+    assert single["attributes"] == {
+        "screening.backend": "x",
+        "screening.content_length": 3,
+        "screening.verdict": "review",
+        "screening.score": 0.5,
+        "screening.findings": 1,
+    }
+    # 下位サービスからの外部呼び出しには自身のスパンが伝搬する
+    assert backend.traceparents[0].split("-")[2] == single["spanId"]
+    assert batch["name"] == "screening.backend.analyze_many"
+    assert batch["attributes"]["screening.batch_size"] == 2
+    assert children == []
+
+
+def test_failures_are_recorded_and_reraised():
+    """下位サービスの例外をエラーとして記録して再送出することをテスト"""
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter)
+    service = TracedScreeningService(ReviewService(), tracer, name="svc")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(service.analyze("error"))
+    tracer.force_flush()
+
+    (span,) = exporter.spans
+    assert span["status"]["code"] == "STATUS_CODE_ERROR"
+    assert span["attributes"]["exception.type"] == "RuntimeError"
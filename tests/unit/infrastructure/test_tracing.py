@@ -0,0 +1,172 @@
+"""
+トレーサーのユニットテスト
+
+このモジュールは、traceparent の解析と生成、入れ子のスパンの親子関係、
+受信した traceparent と sample_ratio による標本化、例外のエラーとしての
+記録、キューの上限とバックグラウンドでの一括の書き出し、JSON Lines の
+ファイルへの追記を検証します。
+"""
+
+import json
+import time
+
+import pytest
+
+from app.infrastructure.tracing import (
+    FileSpanExporter,
+    SpanContext,
+    SpanKind,
+    Tracer,
+    current_traceparent,
+    parse_traceparent,
+)
+
+TRACEPARENT = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+
+class RecordingExporter:
+    def __init__(self):
+        self.spans: list[dict] = []
+        self.closed = False
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+    def shutdown(self):
+        self.closed = True
+
+
+def test_traceparent_round_trip():
+    """traceparent を解析して同じ値を生成できることをテスト"""
+    context = parse_traceparent(TRACEPARENT)
+
+    assert context == SpanContext(
+        0x4BF92F3577B34DA6A3CE929D0E0E4736, 0x00F067AA0BA902B7, True
+    )
+    assert context.traceparent == TRACEPARENT
+    # 将来のバージョンは先頭の4フィールドを解釈する
+    assert parse_traceparent("01" + TRACEPARENT[2:] + "-extra") is not None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7",
+        "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01-extra",
+        "ff-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01",
+        "00-00000000000000000000000000000000-00f067aa0ba902b7-01",
+        "00-4bf92f3577b34da6a3ce929d0e0e4736-0000000000000000-01",
+        "00-4BF92F3577B34DA6A3CE929D0E0E4736-00f067aa0ba902b7-01",
+        "00-4bf92f3577b34da6a3ce929d0e0e473-00f067aa0ba902b7-01",
+    ],
+)
+def test_invalid_traceparent_is_ignored(value):
+    """形式が不正な traceparent は None になることをテスト"""
+    assert parse_traceparent(value) is None
+
+
+def test_nested_spans_share_the_trace():
+    """入れ子のスパンが同じトレースの親子として書き出されることをテスト"""
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter, service_name="test")
+
+    with tracer.start_span("outer", kind=SpanKind.SERVER) as outer:
+        with tracer.start_span("inner", {"key": "value"}) as inner:
+            assert current_traceparent() == inner.context.traceparent
+        assert current_traceparent() == outer.context.traceparent
+    assert current_traceparent() is None
+    tracer.force_flush()
+
+    inner_data, outer_data = exporter.spans
+    assert inner_data["traceId"] == outer_data["traceId"]
+    assert inner_data["parentSpanId"] == outer_data["spanId"]
+    assert outer_data["parentSpanId"] == ""
+    assert outer_data["kind"] == "SPAN_KIND_SERVER"
+    assert inner_data["attributes"] == {"key": "value"}
+    assert inner_data["resource"] == {"service.name": "test"}
+    assert outer_data["startTimeUnixNano"] <= inner_data["startTimeUnixNano"]
+    assert inner_data["endTimeUnixNano"] <= outer_data["endTimeUnixNano"]
+
+
+def test_sampling_follows_the_remote_parent():
+    """受信した traceparent の sampled フラグに従って標本化することをテスト"""
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter, sample_ratio=0.0)
+    sampled = parse_traceparent(TRACEPARENT)
+    unsampled = parse_traceparent(TRACEPARENT[:-2] + "00")
+
+    with tracer.start_span("kept", parent=sampled) as span:
+        assert span.context.trace_id == sampled.trace_id
+    with tracer.start_span("dropped", parent=unsampled) as span:
+        # 標本化しないスパンもトレースIDは伝搬する
+        assert current_traceparent().endswith("-00")
+        assert span.context.trace_id == unsampled.trace_id
+    tracer.force_flush()
+
+    assert [s["name"] for s in exporter.spans] == ["kept"]
+    assert exporter.spans[0]["parentSpanId"] == "00f067aa0ba902b7"
+
+
+def test_unsampled_root_records_nothing():
+    """sample_ratio が 0 の場合は子のスパンも記録しないことをテスト"""
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter, sample_ratio=0.0)
+
+    with tracer.start_span("root") as root:
+        with tracer.start_span("child") as child:
+            child.set_attribute("ignored", 1)
+    tracer.force_flush()
+
+    assert exporter.spans == []
+    assert child.context.trace_id == root.context.trace_id
+    assert not child.recording and child.attributes == {}
+
+
+def test_exception_is_recorded_as_error():
+    """ブロックから送出された例外をエラーとして記録して再送出することをテスト"""
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter)
+
+    with pytest.raises(ValueError):
+        with tracer.start_span("failing"):
+            raise ValueError("壊れた入力")
+    tracer.force_flush()
+
+    (span,) = exporter.spans
+    assert span["status"] == {"code": "STATUS_CODE_ERROR", "message": "壊れた入力"}
+    assert span["attributes"]["exception.type"] == "ValueError"
+
+
+def test_spans_are_exported_in_background_batches():
+    """キューが一杯の分は捨て、バッチがたまると裏で書き出すことをテスト"""
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter, max_queue_size=4, max_batch_size=2, schedule_delay=60)
+
+    for i in range(6):
+        with tracer.start_span(f"span-{i}"):
+            pass
+    deadline = time.monotonic() + 5
+    while len(exporter.spans) < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    tracer.shutdown()
+
+    assert len(exporter.spans) + tracer.processor.dropped == 6
+    assert len(exporter.spans) >= 4
+    assert exporter.closed
+
+
+def test_file_exporter_appends_json_lines(tmp_path):
+    """FileSpanExporter がスパンを JSON Lines として追記することをテスト"""
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(FileSpanExporter(path))
+
+    with tracer.start_span("first"):
+        pass
+    tracer.force_flush()
+    with tracer.start_span("二番目"):
+        pass
+    tracer.shutdown()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["first", "二番目"]
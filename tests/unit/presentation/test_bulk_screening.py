@@ -0,0 +1,214 @@
+"""
+オフラインの一括スクリーニングのユニットテスト
+
+このモジュールは、JSONL と CSV（引用符内の改行を含む）のレコードを
+入力の順にスクリーニングして識別子付きで書き出すこと、解析できない
+レコードはエラーとして書き出して処理を続けること、チェックポイントから
+再開すると途中まで書き出した出力を切り詰めて続きから処理すること、
+結果ストアに本文と結果を保存すること、およびフォールバックによる暫定の
+結果に degraded を書き出すことを検証します。
+"""
+
+import json
+
+import pytest
+
+from app.domain.exceptions import ScreeningUnavailableError
+from app.infrastructure.circuit_breaker_service import (
+    CircuitBreakerScreeningService,
+)
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.corpus_reader import CorpusReader
+from app.infrastructure.result_store import ScreeningResultStore
+from app.infrastructure.screening_service_impl import EchoScreeningService
+from app.presentation import bulk_screening
+from app.presentation.bulk_screening import CHECKPOINT_SUFFIX, run_bulk_screening
+
+
+def read_output(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def write_jsonl(path, count: int) -> None:
+    path.write_text(
+        "".join(
+            json.dumps({"id": f"r{i}", "content": f"応募者{i}"}, ensure_ascii=False)
+            + "\n"
+            for i in range(count)
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_jsonl_results_are_written_in_input_order(tmp_path):
+    """JSONL のレコードを入力の順に識別子付きで書き出すことをテスト"""
+    source, output = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_jsonl(source, 50)
+
+    report = run_bulk_screening(
+        source, output, workers=2, batch_size=3, max_in_flight=2
+    )
+
+    results = read_output(output)
+    assert report.records == 50
+    assert [r["id"] for r in results] == [f"r{i}" for i in range(50)]
+    assert results[7] == {
+        "id": "r7",
+        "content": "応募者7",
+        "score": 0.0,
+        "verdict": "pass",
+        "findings": [],
+    }
+    assert not (tmp_path / ("out.jsonl" + CHECKPOINT_SUFFIX)).exists()
+
+
+def test_csv_records_may_contain_quoted_newlines(tmp_path):
+    """CSV の引用符内の改行を1つのレコードとして扱うことをテスト"""
+    source, output = tmp_path / "in.csv", tmp_path / "out.jsonl"
+    source.write_text(
+        'id,body\n1,"1行目\n2行目"\n2,"引用符 ""あり"""\n3,なし\n', encoding="utf-8"
+    )
+
+    run_bulk_screening(source, output, content_field="body", workers=1)
+
+    assert [(r["id"], r["content"]) for r in read_output(output)] == [
+        ("1", "1行目\n2行目"),
+        ("2", '引用符 "あり"'),
+        ("3", "なし"),
+    ]
+
+
+def test_invalid_records_are_reported_and_skipped(tmp_path):
+    """解析できないレコードはエラーとして書き出し、処理を続けることをテスト"""
+    source, output = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    source.write_text('{"content": "a"}\n\nnot json\n{"id": 9}\n', encoding="utf-8")
+
+    report = run_bulk_screening(source, output, workers=1)
+
+    results = read_output(output)
+    assert (report.records, report.errors) == (1, 2)
+    assert results[0] == {
+        "id": 0,
+        "content": "a",
+        "score": 0.0,
+        "verdict": "pass",
+        "findings": [],
+    }
+    assert results[1]["id"] == len('{"content": "a"}\n\n')
+    assert "error" in results[1]
+    assert results[2] == {"id": 9, "error": "missing field: content"}
+
+
+def test_resume_continues_from_checkpoint(tmp_path):
+    """チェックポイントから再開し、途中の出力を切り詰めて続きを処理することをテスト"""
+    source, output = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_jsonl(source, 20)
+    run_bulk_screening(source, output, workers=1)
+    expected = output.read_bytes()
+
+    # 10 件を書き出した後、11 件目の途中で中断した状態を作る
+    lines = expected.splitlines(keepends=True)
+    done = b"".join(lines[:10])
+    output.write_bytes(done + lines[10][:5])
+    input_offset = len(b"".join(source.read_bytes().splitlines(keepends=True)[:10]))
+    (tmp_path / ("out.jsonl" + CHECKPOINT_SUFFIX)).write_text(
+        json.dumps({"input_offset": input_offset, "output_offset": len(done)})
+    )
+
+    report = run_bulk_screening(source, output, workers=2, resume=True)
+
+    assert report.resumed_from == input_offset
+    assert report.records == 10
+    assert output.read_bytes() == expected
+
+
+def test_results_are_saved_to_store(tmp_path):
+    """store_path を指定すると本文と結果を結果ストアに保存することをテスト"""
+    source, output = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_jsonl(source, 5)
+
+    run_bulk_screening(
+        source, output, workers=1, batch_size=2, store_path=tmp_path / "corpus.db"
+    )
+
+    with ScreeningResultStore(tmp_path / "corpus.db") as store:
+        assert len(store) == 5
+        assert store.get("r3").content == "応募者3"
+        assert store.get("r3").result.verdict.value == "pass"
+        assert store.candidates(["応募者4"]) == {"r4"}
+
+
+def test_invalid_options_are_rejected(tmp_path):
+    """batch_size 等が 1 未満の場合は ValueError になることをテスト"""
+    with pytest.raises(ValueError):
+        run_bulk_screening(tmp_path / "in.jsonl", tmp_path / "out.jsonl", batch_size=0)
+
+
+def test_worker_skips_shared_cache_and_closes_service(tmp_path, monkeypatch):
+    """ワーカーは共有メモリキャッシュを確保せず、終了時にサービスを閉じることをテスト"""
+    source = tmp_path / "in.jsonl"
+    write_jsonl(source, 1)
+    built = []
+
+    class ClosingService:
+        stopped = closed = False
+
+        async def screen(self, content: str) -> str:
+            return content
+
+        async def aclose(self) -> None:
+            self.stopped = True
+
+        def close(self) -> None:
+            self.closed = True
+
+    def create(settings):
+        built.append((settings, ClosingService()))
+        return built[-1][1]
+
+    monkeypatch.setenv("SCREENING_SHARED_CACHE_CAPACITY", "64")
+    monkeypatch.setattr(
+        "app.infrastructure.service_factory.create_screening_service", create
+    )
+    get_settings.cache_clear()
+    try:
+        bulk_screening._init_worker(str(source), "jsonl", None, "id", "content")
+        bulk_screening._close_worker()
+    finally:
+        get_settings.cache_clear()
+
+    ((settings, service),) = built
+    assert settings.shared_cache_capacity == 0
+    assert service.stopped and service.closed
+
+
+def test_fallback_results_are_marked_degraded(tmp_path, monkeypatch):
+    """フォールバックの結果は degraded を書き出し、ストアに保存しないことをテスト"""
+    source = tmp_path / "in.jsonl"
+    write_jsonl(source, 3)
+
+    class DownService:
+        async def screen(self, content: str) -> str:
+            raise ScreeningUnavailableError("down")
+
+    def create(settings):
+        return CircuitBreakerScreeningService(
+            DownService(), fallback=EchoScreeningService()
+        )
+
+    monkeypatch.setattr(
+        "app.infrastructure.service_factory.create_screening_service", create
+    )
+    with CorpusReader(source) as corpus:
+        ends = corpus.record_ends.tolist()
+    bulk_screening._init_worker(str(source), "jsonl", None, "id", "content", True)
+    try:
+        outcome = bulk_screening._screen_batch(0, ends)
+    finally:
+        bulk_screening._close_worker()
+
+    results = [json.loads(line) for line in outcome.lines.splitlines()]
+    assert [r["degraded"] for r in results] == [True, True, True]
+    assert results[0]["verdict"] == "pass"
+    assert (outcome.screened, outcome.degraded) == (3, 3)
+    assert outcome.stored == []
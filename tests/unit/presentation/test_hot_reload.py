@@ -0,0 +1,79 @@
+"""
+HotReloader のユニットテスト
+
+このモジュールは、ファイルの監視で定期的に再読み込みを確認すること、
+SIGHUP で入力の更新を確認せずに再読み込みすること、および
+再読み込みの失敗で監視が止まらないことを検証します。
+"""
+
+import asyncio
+import os
+import signal
+from types import SimpleNamespace
+
+import pytest
+
+from app.presentation.api.hot_reload import HotReloader, reload_services
+
+
+class ReloadRecorder:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.calls: list[bool] = []
+        self.fail = fail
+
+    async def screen(self, content: str) -> str:
+        return content
+
+    async def reload(self, *, force: bool = False) -> str | None:
+        self.calls.append(force)
+        if self.fail:
+            raise ValueError("broken")
+        return "v2" if force else None
+
+
+def test_reload_services_forwards_to_tenants():
+    """共通のサービスとテナントのレジストリに転送することをテスト"""
+    service = ReloadRecorder()
+    tenants = ReloadRecorder()
+    state = SimpleNamespace(screening_service=service, tenant_registry=tenants)
+
+    version = asyncio.run(reload_services(state, force=True))
+
+    assert version == "v2"
+    assert service.calls == tenants.calls == [True]
+
+
+def test_watcher_polls_and_survives_failures():
+    """監視間隔ごとに更新を確認し、失敗しても監視を続けることをテスト"""
+    service = ReloadRecorder(fail=True)
+    reloader = HotReloader(SimpleNamespace(screening_service=service), interval=0.01)
+
+    async def run() -> None:
+        await reloader.start()
+        await asyncio.sleep(0.1)
+        await reloader.aclose()
+
+    asyncio.run(run())
+
+    assert len(service.calls) >= 3
+    assert not any(service.calls)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="SIGHUP がない環境")
+def test_sighup_forces_reload():
+    """SIGHUP で入力の更新を確認せずに再読み込みすることをテスト"""
+    service = ReloadRecorder()
+    reloader = HotReloader(SimpleNamespace(screening_service=service), interval=0)
+
+    async def run() -> None:
+        await reloader.start()
+        os.kill(os.getpid(), signal.SIGHUP)
+        for _ in range(100):
+            if service.calls:
+                break
+            await asyncio.sleep(0.01)
+        await reloader.aclose()
+
+    asyncio.run(run())
+
+    assert service.calls == [True]
@@ -0,0 +1,94 @@
+"""
+MessagePack コーデックのユニットテスト
+
+このモジュールは、Accept ヘッダーによる MessagePack の選択、
+Content-Type の判定、エンコード・デコード、およびストリーミングの
+イベントのエンコードを検証します。
+"""
+
+import pytest
+
+from app.presentation.api.msgpack_codec import (
+    MsgPackResponse,
+    is_msgpack,
+    pack_event,
+    packb,
+    prefers_msgpack,
+    unpackb,
+)
+
+msgpack = pytest.importorskip("msgpack")
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        ("application/msgpack", True),
+        ("application/x-msgpack", True),
+        ("application/msgpack, application/json", True),
+        ("application/json;q=0.9, application/msgpack", True),
+        ("application/json", False),
+        ("*/*", False),
+        ("*/*, application/msgpack;q=0.5", False),
+        ("application/msgpack;q=0", False),
+        ("application/msgpack;q=abc", False),
+        (None, False),
+        ("", False),
+    ],
+)
+def test_prefers_msgpack(accept, expected):
+    """MessagePack が明示され JSON 以上の品質値の場合にだけ選ぶことをテスト"""
+    assert prefers_msgpack(accept) is expected
+
+
+@pytest.mark.parametrize(
+    ("content_type", "expected"),
+    [
+        ("application/msgpack", True),
+        ("Application/MsgPack; charset=binary", True),
+        ("application/vnd.msgpack", True),
+        ("application/json", False),
+        (None, False),
+    ],
+)
+def test_is_msgpack(content_type, expected):
+    """Content-Type のパラメータと大文字小文字を無視して判定することをテスト"""
+    assert is_msgpack(content_type) is expected
+
+
+def test_packb_roundtrip_keeps_japanese_text():
+    """日本語を含むオブジェクトをエンコードして元に戻せることをテスト"""
+    data = {"content": "男性限定の募集です", "score": 0.5, "findings": []}
+
+    assert unpackb(packb(data)) == data
+
+
+def test_unpackb_raises_value_error_for_invalid_data():
+    """不正な MessagePack は ValueError になることをテスト"""
+    with pytest.raises(ValueError):
+        unpackb(b"\xc1")
+    with pytest.raises(ValueError):
+        unpackb(b"\x01\x02")
+
+
+def test_pack_event_is_self_delimiting():
+    """連結したイベントを Unpacker で順に取り出せることをテスト"""
+    stream = pack_event("findings", {"findings": []}, event_id="0") + pack_event(
+        "summary", {"verdict": "pass"}
+    )
+
+    unpacker = msgpack.Unpacker(raw=False)
+    unpacker.feed(stream)
+
+    assert list(unpacker) == [
+        {"event": "findings", "id": "0", "data": {"findings": []}},
+        {"event": "summary", "data": {"verdict": "pass"}},
+    ]
+
+
+def test_msgpack_response_sets_media_type():
+    """MsgPackResponse が MessagePack のメディアタイプで応答することをテスト"""
+    response = MsgPackResponse({"content": "abc"})
+
+    assert response.media_type == "application/msgpack"
+    assert unpackb(response.body) == {"content": "abc"}
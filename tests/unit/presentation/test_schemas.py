@@ -8,10 +8,29 @@ Pydantic スキーマのユニットテスト
 import pytest
 from pydantic import ValidationError
 
+from app.domain.screening_result import (
+    Finding,
+    ScreeningResult,
+    Verdict,
+    apply_replacements,
+)
 from app.presentation.api.schemas.screening import (
     HealthResponse,
+    ScreeningPatchResponse,
     ScreeningRequest,
     ScreeningResponse,
+    ScreeningVerdictResponse,
+)
+
+# 書き換えを伴う検出と伴わない検出を含む結果
+RESULT = ScreeningResult(
+    content="[EMAIL] 男性限定",
+    score=0.92,
+    verdict=Verdict.BLOCK,
+    findings=(
+        Finding("email", 0, 16, "[EMAIL]"),
+        Finding("discriminatory_term", 17, 21),
+    ),
 )
 
 
@@ -239,6 +258,52 @@ class TestHealthResponse:
         assert data == {"status": "ready"}
 
 
+class TestCompactResponses:
+    """verdict / patch 形式のレスポンススキーマのテストクラス"""
+
+    def test_verdict_response_from_result(self):
+        """判定レスポンスが検出箇所を含み、テキストを含まないことをテスト"""
+        response = ScreeningVerdictResponse.from_result(RESULT)
+
+        assert response.model_dump(mode="json") == {
+            "score": 0.92,
+            "verdict": "block",
+            "findings": [
+                {"kind": "email", "start": 0, "end": 16},
+                {"kind": "discriminatory_term", "start": 17, "end": 21},
+            ],
+        }
+
+    def test_patch_response_contains_only_rewrites(self):
+        """差分レスポンスが置換を伴う検出箇所だけを編集として含むことをテスト"""
+        response = ScreeningPatchResponse.from_result(RESULT)
+
+        assert [edit.model_dump() for edit in response.edits] == [
+            {"offset": 0, "length": 16, "replacement": "[EMAIL]"}
+        ]
+        assert response.verdict is Verdict.BLOCK
+
+    def test_patch_reproduces_full_content_with_overlapping_findings(self):
+        """重なる検出箇所でも編集を適用すると full 形式の content になることをテスト"""
+        findings = (Finding("a", 0, 4, "X"), Finding("b", 2, 6, "Y"))
+        content = apply_replacements("abcdef", findings)
+        result = ScreeningResult(content, verdict=Verdict.REVIEW, findings=findings)
+
+        response = ScreeningPatchResponse.from_result(result)
+
+        patched = "abcdef"
+        for edit in reversed(response.edits):
+            end = edit.offset + edit.length
+            patched = patched[: edit.offset] + edit.replacement + patched[end:]
+        assert patched == content == "Xef"
+        assert len(response.edits) == 1
+
+    def test_verdict_response_rejects_out_of_range_score(self):
+        """範囲外のスコアでバリデーションエラーが発生することをテスト"""
+        with pytest.raises(ValidationError):
+            ScreeningVerdictResponse(score=1.5, verdict=Verdict.PASS)
+
+
 class TestSchemaIntegration:
     """スキーマ統合テストクラス"""
 
@@ -0,0 +1,85 @@
+"""
+Server-Sent Events ヘルパーのユニットテスト
+
+このモジュールは、イベントの整形と、イベントの間隔が空いたときの
+ハートビートの挿入、および途中で閉じられた場合の後始末を検証します。
+"""
+
+import asyncio
+
+from app.presentation.api.sse import HEARTBEAT_EVENT, format_event, with_heartbeat
+
+
+async def collect(iterator) -> list[bytes]:
+    return [event async for event in iterator]
+
+
+def test_format_event_with_json_and_id():
+    """JSONデータとイベントIDを含むイベントを整形することをテスト"""
+    event = format_event("summary", {"verdict": "pass", "text": "日本語"}, event_id="3")
+
+    assert (
+        event
+        == (
+            'event: summary\nid: 3\ndata: {"verdict":"pass","text":"日本語"}\n\n'
+        ).encode()
+    )
+
+
+def test_format_event_splits_multiline_data():
+    """改行を含む文字列データを複数の data フィールドに分けることをテスト"""
+    assert format_event("message", "a\nb") == b"event: message\ndata: a\ndata: b\n\n"
+
+
+def test_with_heartbeat_inserts_heartbeats_while_waiting():
+    """イベントの間隔が空くとハートビートが挟まることをテスト"""
+
+    async def slow_events():
+        yield b"first"
+        await asyncio.sleep(0.05)
+        yield b"second"
+
+    events = asyncio.run(collect(with_heartbeat(slow_events(), 0.01)))
+
+    assert events[0] == b"first"
+    assert events[-1] == b"second"
+    heartbeats = events[1:-1]
+    assert heartbeats
+    assert all(HEARTBEAT_EVENT.encode() in event for event in heartbeats)
+
+
+def test_with_heartbeat_disabled_passes_events_through():
+    """interval が 0 ならイベントをそのまま返すことをテスト"""
+
+    async def events():
+        yield b"a"
+        yield b"b"
+
+    assert asyncio.run(collect(with_heartbeat(events(), 0))) == [b"a", b"b"]
+
+
+def test_with_heartbeat_closes_source_when_closed_early():
+    """途中で閉じると処理中の生成を取り消して元のイテレーターを閉じることをテスト"""
+    state = {"cancelled": False, "closed": False}
+
+    async def events():
+        try:
+            yield b"a"
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                state["cancelled"] = True
+                raise
+            yield b"b"
+        finally:
+            state["closed"] = True
+
+    async def consume_one_and_heartbeat() -> None:
+        stream = with_heartbeat(events(), 0.01)
+        assert await anext(stream) == b"a"
+        assert HEARTBEAT_EVENT.encode() in await anext(stream)
+        await stream.aclose()
+
+    asyncio.run(consume_one_and_heartbeat())
+
+    assert state == {"cancelled": True, "closed": True}
@@ -0,0 +1,185 @@
+"""
+PriorityScheduler のユニットテスト
+
+このモジュールは、同時実行数の上限、重みに比例したレーン間の配分、
+待ちのなかったレーンが配分を取り返さないこと、待機中の取り消し、
+およびレーンごとの統計を検証します。
+"""
+
+import asyncio
+
+import pytest
+
+from app.domain.screening_result import Verdict
+from app.usecase.priority_scheduler import (
+    PrioritizedScreeningService,
+    Priority,
+    PriorityScheduler,
+)
+
+INTERACTIVE = Priority.INTERACTIVE
+BULK = Priority.BULK
+
+
+async def drain_order(scheduler: PriorityScheduler, lanes: list[Priority]) -> str:
+    """実行枠を塞いだ状態で lanes の順に待たせ、実行枠を得た順を返す"""
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    async def hold() -> None:
+        async with scheduler.slot(INTERACTIVE):
+            await gate.wait()
+
+    async def wait(priority: Priority) -> None:
+        async with scheduler.slot(priority):
+            order.append("I" if priority is INTERACTIVE else "B")
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(wait(priority)) for priority in lanes]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(holder, *tasks)
+    return "".join(order)
+
+
+def test_concurrency_is_limited():
+    """同時に実行される要求が max_concurrency を超えないことをテスト"""
+    scheduler = PriorityScheduler(3)
+    active = 0
+    peak = 0
+
+    async def job(priority: Priority) -> None:
+        nonlocal active, peak
+        async with scheduler.slot(priority):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+
+    async def run() -> None:
+        await asyncio.gather(*(job(INTERACTIVE if n % 2 else BULK) for n in range(20)))
+
+    asyncio.run(run())
+
+    assert peak == 3
+    stats = scheduler.stats()
+    assert stats[INTERACTIVE].admitted + stats[BULK].admitted == 20
+    assert (
+        stats[INTERACTIVE].queued
+        == stats[BULK].queued
+        == stats[INTERACTIVE].running
+        == 0
+    )
+
+
+def test_lanes_share_slots_by_weight():
+    """待ちのあるレーンに重みに比例して実行枠を配分することをテスト"""
+    scheduler = PriorityScheduler(1, weights={INTERACTIVE: 3, BULK: 1})
+
+    order = asyncio.run(drain_order(scheduler, [BULK] * 8 + [INTERACTIVE] * 12))
+
+    # 最初の16件は 3:1 で配分され、interactive が尽きると bulk が残りを使う
+    assert order[:16].count("I") == 12
+    assert order.endswith("BBBB")
+    assert sorted(order) == sorted("I" * 12 + "B" * 8)
+
+
+def test_idle_lane_does_not_bank_credit():
+    """待ちのなかったレーンが空いていた間の配分を取り返さないことをテスト"""
+    scheduler = PriorityScheduler(1, weights={INTERACTIVE: 3, BULK: 1})
+
+    async def run() -> str:
+        # bulk だけが混雑している間に bulk の仮想時刻が進む
+        await drain_order(scheduler, [BULK] * 50)
+        return await drain_order(scheduler, [BULK] * 10 + [INTERACTIVE] * 30)
+
+    order = asyncio.run(run())
+
+    assert order[:8].count("B") == 2
+
+
+def test_cancelled_waiter_leaves_queue():
+    """待機中に取り消された要求が待ち行列から外れ、実行枠も失われないことをテスト"""
+    scheduler = PriorityScheduler(1)
+
+    async def run() -> list[int]:
+        gate = asyncio.Event()
+
+        async def hold() -> None:
+            async with scheduler.slot(INTERACTIVE):
+                await gate.wait()
+
+        async def wait() -> None:
+            async with scheduler.slot(BULK):
+                pass
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(wait())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        queued = scheduler.stats()[BULK].queued
+        gate.set()
+        await holder
+        async with scheduler.slot(BULK):
+            running = scheduler.stats()[BULK].running
+        return [queued, running]
+
+    assert asyncio.run(asyncio.wait_for(run(), timeout=1)) == [0, 1]
+
+
+def test_stats_record_wait_times():
+    """待った要求の待ち時間が統計に記録されることをテスト"""
+    scheduler = PriorityScheduler(1)
+
+    async def run() -> None:
+        async def job() -> None:
+            async with scheduler.slot(BULK):
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(job(), job())
+
+    asyncio.run(run())
+
+    stats = scheduler.stats()[BULK]
+    assert stats.admitted == 2
+    assert stats.max_wait_ms >= 5
+    assert stats.p95_wait_ms == stats.max_wait_ms
+    assert stats.weight == 1.0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_concurrency": 0},
+        {"max_concurrency": 1, "weights": {INTERACTIVE: 1.0}},
+        {"max_concurrency": 1, "weights": {INTERACTIVE: 1.0, BULK: 0.0}},
+    ],
+)
+def test_invalid_arguments(kwargs):
+    """不正な引数で ValueError を送出することをテスト"""
+    with pytest.raises(ValueError):
+        PriorityScheduler(**kwargs)
+
+
+def test_prioritized_service_falls_back_to_screen():
+    """analyze() を持たないサービスも実行枠を取得して呼び出せることをテスト"""
+
+    class EchoService:
+        async def screen(self, content: str) -> str:
+            return content
+
+    scheduler = PriorityScheduler(1)
+    service = PrioritizedScreeningService(EchoService(), scheduler, BULK)
+
+    async def run():
+        return await service.screen("a"), await service.analyze("b")
+
+    screened, result = asyncio.run(run())
+
+    assert screened == "a"
+    assert result.content == "b"
+    assert result.verdict is Verdict.PASS
+    assert scheduler.stats()[BULK].admitted == 2
@@ -0,0 +1,307 @@
+"""
+ScreeningPipeline のユニットテスト
+
+このモジュールは、正規化が文字数を保つこと、前処理フィルタと検出器の判定で
+以降のステージを打ち切ること（置換とスコアの統合は打ち切り後も実行すること）、
+ステージの列を並行に実行すること、置換とスコアの統合、ステージごとの統計、
+検出器の暫定の結果の伝播、および検出器のサービスへのライフサイクル
+フックの転送を検証します。
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.domain.screening_result import Finding, ScreeningResult, Verdict
+from app.usecase.screening_pipeline import (
+    DetectorStage,
+    NormalizeStage,
+    PrefilterStage,
+    RedactionStage,
+    ScoringStage,
+    ScreeningPipeline,
+    fold_text,
+)
+
+
+class FakeDetector:
+    """決まった結果を返し、呼び出しとフックを記録する検出器"""
+
+    def __init__(
+        self,
+        term: str = "",
+        *,
+        verdict: Verdict = Verdict.REVIEW,
+        score: float = 0.5,
+        replacement: str | None = None,
+        delay: float = 0.0,
+        degraded: bool = False,
+    ) -> None:
+        self.term = term
+        self.verdict = verdict
+        self.score = score
+        self.replacement = replacement
+        self.delay = delay
+        self.degraded = degraded
+        self.version = "v1"
+        self.seen: list[str] = []
+        self.events: list[str] = []
+
+    async def screen(self, content: str) -> str:
+        return (await self.analyze(content)).content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        self.seen.append(content)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        start = content.find(self.term) if self.term else -1
+        if start < 0:
+            return ScreeningResult(
+                content=content,
+                score=0.0,
+                verdict=Verdict.PASS,
+                degraded=self.degraded,
+            )
+        finding = Finding(
+            kind="term",
+            start=start,
+            end=start + len(self.term),
+            replacement=self.replacement,
+        )
+        return ScreeningResult(
+            content=content,
+            score=self.score,
+            verdict=self.verdict,
+            findings=(finding,),
+            degraded=self.degraded,
+        )
+
+    async def start(self) -> None:
+        self.events.append("start")
+
+    async def aclose(self) -> None:
+        self.events.append("aclose")
+
+    def close(self) -> None:
+        self.events.append("close")
+
+    async def reload(self, *, force: bool = False) -> str | None:
+        self.events.append(f"reload:{force}")
+        if not force:
+            return None
+        self.version = "v2"
+        return self.version
+
+
+def test_fold_text_preserves_length():
+    """正規化が全角・大文字を吸収し、文字数を変えないことをテスト"""
+    assert fold_text("ＡＢＣ株式会社") == "abc株式会社"
+    # NFKC で複数文字になる文字はそのまま残す
+    assert fold_text("㈱ＸＹＺ") == "㈱xyz"
+
+
+def test_normalize_stage_rejects_length_change():
+    """文字数を変える正規化関数は ValueError になることをテスト"""
+    pipeline = ScreeningPipeline([NormalizeStage(lambda text: text + "!")])
+
+    with pytest.raises(ValueError):
+        asyncio.run(pipeline.analyze("abc"))
+
+
+def test_detectors_see_normalized_text_and_positions_map_to_input():
+    """検出器は正規化後のテキストで照合し、置換は入力テキストに適用されることをテスト"""
+    detector = FakeDetector("male only", replacement="***")
+    pipeline = ScreeningPipeline(
+        [NormalizeStage(), DetectorStage("rules", detector), RedactionStage()]
+    )
+
+    result = asyncio.run(pipeline.analyze("募集：ＭＡＬＥ ＯＮＬＹ です"))
+
+    assert detector.seen == ["募集:male only です"]
+    assert result.content == "募集：*** です"
+    assert result.verdict is Verdict.REVIEW
+
+
+def test_prefilter_short_circuits_blank_text():
+    """空白だけのテキストは検出器を呼ばずに PASS とすることをテスト"""
+    detector = FakeDetector("x")
+    pipeline = ScreeningPipeline(
+        [PrefilterStage(), DetectorStage("rules", detector), ScoringStage()]
+    )
+
+    result = asyncio.run(pipeline.analyze("   "))
+    stats = pipeline.stats()
+
+    assert result.verdict is Verdict.PASS
+    assert result.content == "   "
+    assert detector.seen == []
+    assert stats["prefilter"].hits == 1
+    assert stats["rules"].calls == 0
+    assert stats["rules"].skipped == 1
+    assert stats["scoring"].calls == 1
+
+
+def test_block_halts_later_detectors_but_finalizers_run():
+    """BLOCK で重い検出器を打ち切り、置換とスコアの統合は実行することをテスト"""
+    rules = FakeDetector("NG", verdict=Verdict.BLOCK, score=0.9, replacement="**")
+    heavy = FakeDetector("NG")
+    pipeline = ScreeningPipeline(
+        [
+            DetectorStage("rules", rules, halt_at=Verdict.BLOCK),
+            [DetectorStage("heavy", heavy)],
+            RedactionStage(),
+            ScoringStage(),
+        ]
+    )
+
+    result = asyncio.run(pipeline.analyze("xNGx"))
+    stats = pipeline.stats()
+
+    assert heavy.seen == []
+    assert result.verdict is Verdict.BLOCK
+    assert result.content == "x**x"
+    assert result.score == pytest.approx(0.9)
+    assert stats["heavy"].skipped == 1
+    assert stats["redaction"].hits == 1
+
+
+def test_group_runs_detectors_concurrently():
+    """列の中の検出器が並行に実行され、結果が統合されることをテスト"""
+    first = FakeDetector("a", score=0.5, delay=0.1)
+    second = FakeDetector("b", score=0.5, delay=0.1)
+    pipeline = ScreeningPipeline(
+        [[DetectorStage("first", first), DetectorStage("second", second)]]
+    )
+
+    started = time.perf_counter()
+    result = asyncio.run(pipeline.analyze("ab"))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.18
+    assert [(f.start, f.end) for f in result.findings] == [(0, 1), (1, 2)]
+    assert result.score == pytest.approx(0.5)
+
+
+def test_redaction_prefers_leftmost_and_uses_mask():
+    """重なった検出箇所は左のものを優先し、置換のない検出箇所はマスクすることをテスト"""
+    pipeline = ScreeningPipeline(
+        [
+            DetectorStage("long", FakeDetector("abcd", replacement="[L]")),
+            DetectorStage("inner", FakeDetector("cde", replacement="[I]")),
+            DetectorStage("plain", FakeDetector("z")),
+            RedactionStage(mask="#"),
+        ]
+    )
+
+    result = asyncio.run(pipeline.analyze("abcdefz"))
+
+    assert result.content == "[L]ef#"
+    assert pipeline.stats()["redaction"].hits == 2
+
+
+def test_scoring_combines_with_noisy_or():
+    """スコアを noisy-OR で統合し、しきい値で判定を引き上げることをテスト"""
+    pipeline = ScreeningPipeline(
+        [
+            DetectorStage("a", FakeDetector("x", score=0.5)),
+            DetectorStage("b", FakeDetector("x", score=0.5)),
+            ScoringStage(review_threshold=0.5, block_threshold=0.7),
+        ]
+    )
+
+    result = asyncio.run(pipeline.analyze("x"))
+
+    assert result.score == pytest.approx(0.75)
+    assert result.verdict is Verdict.BLOCK
+
+
+def test_stats_record_calls_hits_and_time():
+    """ステージごとに呼び出し数・ヒット数・処理時間を記録することをテスト"""
+    pipeline = ScreeningPipeline([DetectorStage("slow", FakeDetector("x", delay=0.02))])
+
+    async def run():
+        await pipeline.analyze("x")
+        await pipeline.analyze("y")
+
+    asyncio.run(run())
+    stats = pipeline.stats()["slow"]
+
+    assert stats.calls == 2
+    assert stats.hits == 1
+    assert stats.skipped == 0
+    assert stats.max_ms >= 20
+    assert 0 < stats.mean_ms <= stats.max_ms
+
+
+def test_invalid_stage_lists_are_rejected():
+    """ステージがない、空の列、名前の重複は ValueError になることをテスト"""
+    with pytest.raises(ValueError):
+        ScreeningPipeline([])
+    with pytest.raises(ValueError):
+        ScreeningPipeline([NormalizeStage(), []])
+    with pytest.raises(ValueError):
+        ScreeningPipeline([NormalizeStage(), NormalizeStage()])
+
+
+def test_degraded_detector_result_marks_pipeline_result():
+    """いずれかの検出器の結果が暫定なら、パイプラインの結果も暫定になることをテスト"""
+    pipeline = ScreeningPipeline(
+        [
+            [
+                DetectorStage("rules", FakeDetector("a")),
+                DetectorStage("model", FakeDetector(degraded=True)),
+            ],
+            ScoringStage(),
+        ]
+    )
+    healthy = ScreeningPipeline([DetectorStage("rules", FakeDetector("a"))])
+
+    assert asyncio.run(pipeline.analyze("abc")).degraded
+    assert not asyncio.run(healthy.analyze("abc")).degraded
+
+
+def test_lifecycle_hooks_are_forwarded_to_detectors():
+    """検出器のサービスにライフサイクルフックを転送することをテスト"""
+    first = FakeDetector()
+    second = FakeDetector()
+    pipeline = ScreeningPipeline(
+        [NormalizeStage(), [DetectorStage("a", first), DetectorStage("b", second)]]
+    )
+
+    async def run():
+        await pipeline.start()
+        unchanged = await pipeline.reload()
+        version = await pipeline.reload(force=True)
+        await pipeline.aclose()
+        return unchanged, version
+
+    unchanged, version = asyncio.run(run())
+    pipeline.close()
+
+    assert unchanged is None
+    assert version == "a=v2;b=v2"
+    assert pipeline.version == version
+    expected = ["start", "reload:False", "reload:True", "aclose", "close"]
+    assert first.events == expected
+    assert second.events == expected
+
+
+def test_masked_findings_are_hidden_from_later_detectors():
+    """mask_char を指定した検出器の検出箇所は、以降の検出器に渡さないことをテスト"""
+    pii = FakeDetector("090-1234", replacement="[PHONE]")
+    model = FakeDetector("x")
+    pipeline = ScreeningPipeline(
+        [
+            DetectorStage("pii", pii, mask_char="*"),
+            DetectorStage("model", model),
+            RedactionStage(),
+        ]
+    )
+
+    result = asyncio.run(pipeline.analyze("tel 090-1234 x"))
+
+    assert model.seen == ["tel ******** x"]
+    assert result.content == "tel [PHONE] x"
+    with pytest.raises(ValueError):
+        DetectorStage("pii", pii, mask_char="**")
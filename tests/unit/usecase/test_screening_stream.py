@@ -0,0 +1,91 @@
+"""
+ScreeningUsecase.stream() とチャンク分割のユニットテスト
+
+このモジュールは、テキストを改行優先でチャンクに分けること、
+チャンクの検出位置が文書全体のオフセットに変換されること、
+および呼び出し元が要求した分だけチャンクが処理されることを検証します。
+"""
+
+import asyncio
+
+import pytest
+
+from app.domain.screening_result import Finding, ScreeningResult, Verdict
+from app.usecase.screening_usecase import ScreeningChunk, ScreeningUsecase, split_chunks
+
+
+class RecordingService:
+    """文字 x の位置を検出し、呼び出された入力を記録するサービス"""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def screen(self, content: str) -> str:
+        return content
+
+    async def analyze(self, content: str) -> ScreeningResult:
+        self.calls.append(content)
+        findings = tuple(
+            Finding("x", index, index + 1)
+            for index, char in enumerate(content)
+            if char == "x"
+        )
+        verdict = Verdict.REVIEW if findings else Verdict.PASS
+        return ScreeningResult(content, float(bool(findings)), verdict, findings)
+
+
+async def collect(iterator) -> list[ScreeningChunk]:
+    return [chunk async for chunk in iterator]
+
+
+@pytest.mark.parametrize(
+    ("content", "chunk_size", "expected"),
+    [
+        ("", 4, []),
+        ("abc", 4, [(0, 3)]),
+        ("ab\ncd\nef", 4, [(0, 3), (3, 6), (6, 8)]),
+        ("abcdefgh", 3, [(0, 3), (3, 6), (6, 8)]),
+        ("a\nbcdefg\nh", 4, [(0, 2), (2, 6), (6, 10)]),
+    ],
+)
+def test_split_chunks(content, chunk_size, expected):
+    """改行の直後を優先し、改行がなければ文字数で区切ることをテスト"""
+    assert list(split_chunks(content, chunk_size)) == expected
+
+
+def test_split_chunks_rejects_non_positive_size():
+    """chunk_size が1未満なら ValueError になることをテスト"""
+    with pytest.raises(ValueError):
+        list(split_chunks("abc", 0))
+
+
+def test_stream_shifts_findings_to_document_offsets():
+    """チャンクの検出位置が文書全体のオフセットで返ることをテスト"""
+    usecase = ScreeningUsecase(RecordingService())
+
+    chunks = asyncio.run(collect(usecase.stream("ax\nbx\ncc", chunk_size=3)))
+
+    assert [(chunk.start, chunk.end) for chunk in chunks] == [(0, 3), (3, 6), (6, 8)]
+    assert [finding.start for chunk in chunks for finding in chunk.result.findings] == [
+        1,
+        4,
+    ]
+    assert chunks[2].result.verdict is Verdict.PASS
+
+
+def test_stream_processes_chunks_on_demand():
+    """次のチャンクは呼び出し元が要求するまで処理されないことをテスト"""
+    service = RecordingService()
+    usecase = ScreeningUsecase(service)
+
+    async def take_first() -> ScreeningChunk:
+        stream = usecase.stream("a\nb\nc\n", chunk_size=2)
+        try:
+            return await anext(stream)
+        finally:
+            await stream.aclose()
+
+    first = asyncio.run(take_first())
+
+    assert first.result.content == "a\n"
+    assert service.calls == ["a\n"]
@@ -5,6 +5,8 @@ ScreeningUsecase のユニットテスト
 ScreeningServiceをモック化して、ユースケースの動作を実装から分離してテストします。
 """
 
+import asyncio
+from contextlib import contextmanager
 from unittest.mock import MagicMock
 
 import pytest
@@ -226,3 +228,32 @@ def test_usecase_maintains_service_reference(mock_service):
 
     # 同じモックサービスが使用されたことを確認
     assert mock_service.screen.call_count == 2
+
+
+def test_operations_are_recorded_as_spans_when_tracer_is_given():
+    """
+    トレーサーを渡した場合に各操作のスパンを記録することをテスト
+    """
+
+    class EchoService:
+        async def screen(self, content: str) -> str:
+            return content
+
+    class RecordingTracer:
+        def __init__(self):
+            self.spans = []
+
+        @contextmanager
+        def start_span(self, name, attributes=None):
+            self.spans.append((name, dict(attributes or {})))
+            yield
+
+    tracer = RecordingTracer()
+    usecase = ScreeningUsecase(EchoService(), tracer=tracer)
+
+    assert asyncio.run(usecase.execute("abc")) == "abc"
+    assert asyncio.run(usecase.analyze("abcd")).content == "abcd"
+    assert tracer.spans == [
+        ("ScreeningUsecase.execute", {"screening.content_length": 3}),
+        ("ScreeningUsecase.analyze", {"screening.content_length": 4}),
+    ]